@@ -1,12 +1,36 @@
-from celery import Celery
-from celery.signals import worker_process_init
+import os
+import time
+import uuid
+from typing import Optional
+from celery import Celery, states
+from celery.result import AsyncResult
+from celery.signals import (
+    before_task_publish,
+    worker_init,
+    worker_process_init,
+    worker_process_shutdown,
+    task_prerun,
+    task_postrun,
+)
+from celery_batches import Batches
+from kombu import Queue
 from app.config import settings
 from app.db import SessionLocal, neo4j_driver
 from app.models.article import Article, Summary
-from app.services.summarizer import summarize_text
-from app.services.graph import update_article_graph
+from app.services.graph import update_articles_graph
+from app.services.related_index import index_article_entities
 from app.services.pipelines.model_loader import warm_up_models
+from app.services.pipelines.entities import load_company_dict_from_db, company_dict_reloader
+from app.utils.cache import get_redis_client
 from app.utils.logging import setup_logging
+from app.utils.metrics import (
+    CELERY_QUEUE_LATENCY_SECONDS,
+    CELERY_TASK_SECONDS,
+    start_worker_metrics_server,
+    mark_worker_process_dead,
+)
+from app.utils.query_stats import start_query_stats, finish_query_stats
+from app.utils.task_events import publish_task_event, EVENT_PROGRESS, EVENT_DONE, EVENT_FAILED
 import logging
 
 # 로깅 설정
@@ -21,14 +45,96 @@ celery_app = Celery(
     backend=settings.CELERY_RESULT_BACKEND
 )
 
+# 작업 큐
+# - interactive: 사용자 요청(/api/article/parse) 전용, 전용 워커가 소비
+# - bulk: 백필/일괄 분석 (analyze_article 기본 큐)
+# - graph: Neo4j 그래프 업데이트 (I/O 위주)
+QUEUE_INTERACTIVE = "interactive"
+QUEUE_BULK = "bulk"
+QUEUE_GRAPH = "graph"
+
+# 큐별 기본 우선순위 (Redis 브로커: 0이 가장 높음)
+QUEUE_PRIORITIES = {
+    QUEUE_INTERACTIVE: 0,
+    QUEUE_GRAPH: 5,
+    QUEUE_BULK: 9,
+}
+
+# 중복 요청 병합용 키 (큐별 article_id → 진행 중인 task_id)
+# 큐마다 따로 두어 interactive 요청이 bulk 대기열의 같은 기사 작업에 묶이지 않도록 함
+ANALYZE_INFLIGHT_KEY = "celery:analyze_article:inflight:{queue}:{article_id}"
+
+# 키 값이 ARGV[1](이전 task_id)일 때만 ARGV[2]로 교체 (compare-and-set)
+_INFLIGHT_SWAP_SCRIPT = """
+if redis.call('GET', KEYS[1]) == ARGV[1] then
+    redis.call('SET', KEYS[1], ARGV[2], 'EX', ARGV[3])
+    return 1
+end
+return 0
+"""
+
+# 키 값이 ARGV[1](자신의 task_id)일 때만 삭제 (compare-and-delete)
+_INFLIGHT_RELEASE_SCRIPT = """
+if redis.call('GET', KEYS[1]) == ARGV[1] then
+    return redis.call('DEL', KEYS[1])
+end
+return 0
+"""
+
+# 경쟁으로 키가 계속 바뀌는 경우 재시도 횟수 (초과 시 새 작업 등록)
+_INFLIGHT_CLAIM_ATTEMPTS = 3
+
 celery_app.conf.update(
     task_serializer='json',
     accept_content=['json'],
     result_serializer='json',
     timezone='UTC',
     enable_utc=True,
+    task_queues=[
+        Queue(QUEUE_INTERACTIVE),
+        Queue(QUEUE_BULK),
+        Queue(QUEUE_GRAPH),
+    ],
+    task_default_queue=QUEUE_BULK,
+    task_default_priority=QUEUE_PRIORITIES[QUEUE_BULK],
+    task_routes={
+        "analyze_article": {"queue": QUEUE_BULK},
+        "analyze_article_batch": {"queue": QUEUE_BULK},
+        "update_article_graph": {"queue": QUEUE_GRAPH},
+    },
+    broker_transport_options={
+        "priority_steps": list(range(10)),
+        "queue_order_strategy": "priority",
+    },
+    # 긴 작업을 미리 가져가 대기시키지 않도록 한 번에 1개만 prefetch
+    # (bulk 워커는 배치 크기만큼 모을 수 있도록 --prefetch-multiplier로 재지정)
+    worker_prefetch_multiplier=1,
+    task_acks_late=True,
+    # 결과는 클라이언트가 SSE/status로 가져가면 충분하므로 짧게 보관
+    result_expires=settings.CELERY_RESULT_EXPIRES,
 )
 
+# 워커 메인 프로세스: 메트릭 HTTP 서버 (prefork 자식 프로세스 값은 multiprocess 디렉터리로 합산)
+@worker_init.connect
+def on_worker_init(**kwargs):
+    """Celery 워커 시작 시 메트릭 서버 시작"""
+    start_worker_metrics_server(settings.CELERY_METRICS_PORT)
+
+
+@worker_process_shutdown.connect
+def on_worker_process_shutdown(pid=None, **kwargs):
+    """prefork 자식 프로세스 종료 시 메트릭 정리"""
+    mark_worker_process_dead(pid or os.getpid())
+
+
+# 큐 대기 시간 측정용 발행 시각 헤더
+@before_task_publish.connect
+def on_before_task_publish(headers=None, **kwargs):
+    """작업 발행 시각을 메시지 헤더에 기록"""
+    if headers is not None:
+        headers.setdefault("published_at", time.time())
+
+
 # Celery 워커 시작 시 모델 Warm-up
 @worker_process_init.connect
 def on_worker_process_init(**kwargs):
@@ -37,10 +143,218 @@ def on_worker_process_init(**kwargs):
     logger.info("Celery 워커 시작 중...")
     logger.info("=" * 50)
     warm_up_models()
+    # 기업명 딕셔너리 로딩 + 무중단 갱신 스레드 (prefork 자식 프로세스마다 실행)
+    load_company_dict_from_db()
+    company_dict_reloader.start()
     logger.info("Celery 워커 준비 완료")
     logger.info("=" * 50)
 
 
+# 작업 단위 SQL 통계 token / 시작 시각 (task_id 기준, 같은 스레드에서 시작/종료)
+_task_query_stats = {}
+_task_started_at = {}
+
+
+@task_prerun.connect
+def on_task_prerun(task_id=None, task=None, **kwargs):
+    """작업 단위 SQL 통계 집계 시작 + 큐 대기 시간 기록"""
+    _task_query_stats[task_id] = start_query_stats()
+    _task_started_at[task_id] = time.perf_counter()
+    
+    published_at = getattr(task.request, "published_at", None) if task else None
+    if published_at:
+        queue = (task.request.delivery_info or {}).get("routing_key") or "unknown"
+        CELERY_QUEUE_LATENCY_SECONDS.labels(queue=queue, task=task.name).observe(
+            max(time.time() - float(published_at), 0.0)
+        )
+
+
+@task_postrun.connect
+def on_task_postrun(task_id=None, task=None, state=None, **kwargs):
+    """작업 단위 SQL 통계 집계 종료 (N+1 의심 시 경고 로그) + 실행 시간 기록"""
+    token = _task_query_stats.pop(task_id, None)
+    if token is not None:
+        finish_query_stats(token, f"task {task.name if task else task_id}")
+    started_at = _task_started_at.pop(task_id, None)
+    if started_at is not None and task is not None:
+        CELERY_TASK_SECONDS.labels(task=task.name, state=state or "UNKNOWN").observe(
+            time.perf_counter() - started_at
+        )
+
+
+def _claim_inflight(client, key: str, task_id: str) -> Optional[str]:
+    """
+    중복 병합 키 선점
+
+    Returns:
+        None이면 task_id로 선점 성공 (새 작업 등록), 아니면 대기/진행 중인 기존 task_id
+    """
+    ttl = settings.CELERY_INFLIGHT_TTL
+    for _ in range(_INFLIGHT_CLAIM_ATTEMPTS):
+        if client.set(key, task_id, nx=True, ex=ttl):
+            return None
+        existing_id = client.get(key)
+        if not existing_id:
+            # 그 사이 키가 만료/해제됨 → 다시 선점 시도
+            continue
+        if AsyncResult(existing_id, app=celery_app).state not in states.READY_STATES:
+            return existing_id
+        # 이전 작업이 이미 끝남 → 그 작업 id일 때만 교체 (동시 요청 중 하나만 성공)
+        if client.eval(_INFLIGHT_SWAP_SCRIPT, 1, key, existing_id, task_id, ttl):
+            return None
+    logger.warning(f"중복 병합 키 선점 실패, 새 작업 등록 ({key})")
+    return None
+
+
+def submit_analyze_article(article_id: int, text: str, queue: str = QUEUE_BULK) -> AsyncResult:
+    """
+    기사 분석 작업 등록 (큐별 article_id 기준 멱등)
+    
+    같은 큐에서 같은 article_id의 분석이 이미 대기/진행 중이면 새 작업을 만들지 않고
+    기존 작업을 반환합니다. 다른 큐의 작업과는 병합하지 않으므로 interactive 요청은
+    bulk 대기열에 같은 기사가 있어도 interactive 큐로 등록됩니다.
+    Redis를 사용할 수 없으면 항상 새 작업을 등록합니다.
+    bulk 큐 요청은 analyze_article_batch(마이크로 배치)로 등록됩니다.
+    
+    Args:
+        article_id: 기사 ID
+        text: 기사 본문 텍스트
+        queue: 대상 큐 (QUEUE_INTERACTIVE / QUEUE_BULK)
+    
+    Returns:
+        AsyncResult (기존 작업 또는 새 작업)
+    """
+    if queue not in (QUEUE_INTERACTIVE, QUEUE_BULK):
+        raise ValueError(f"알 수 없는 큐: {queue}")
+    
+    task_id = str(uuid.uuid4())
+    key = ANALYZE_INFLIGHT_KEY.format(queue=queue, article_id=article_id)
+    client = get_redis_client()
+    
+    if client:
+        try:
+            existing_id = _claim_inflight(client, key, task_id)
+            if existing_id:
+                logger.info(f"기사 분석 중복 요청 병합 (article_id={article_id}, queue={queue}, task_id={existing_id})")
+                return AsyncResult(existing_id, app=celery_app)
+        except Exception as e:
+            logger.warning(f"중복 요청 확인 실패, 새 작업 등록 (article_id={article_id}): {e}")
+    
+    # bulk 큐는 마이크로 배치 작업으로, interactive 큐는 단건 작업으로 처리 (지연 최소화)
+    task = analyze_article_batch_task if queue == QUEUE_BULK else analyze_article_task
+    try:
+        return task.apply_async(
+            args=(article_id, text),
+            task_id=task_id,
+            queue=queue,
+            priority=QUEUE_PRIORITIES[queue],
+        )
+    except Exception:
+        # 등록 실패 시 선점한 키 해제 (발행되지 않은 task_id는 PENDING으로 남아 이후 요청이 병합되는 것 방지)
+        if client:
+            try:
+                client.eval(_INFLIGHT_RELEASE_SCRIPT, 1, key, task_id)
+            except Exception as e:
+                logger.warning(f"중복 병합 키 해제 실패 ({key}): {e}")
+        raise
+
+
+def _release_inflight(article_id: int, task_id: str):
+    """작업 종료 시 중복 병합 키 해제 (자신이 등록한 키인 경우만)"""
+    client = get_redis_client()
+    if not client:
+        return
+    for queue in (QUEUE_INTERACTIVE, QUEUE_BULK):
+        key = ANALYZE_INFLIGHT_KEY.format(queue=queue, article_id=article_id)
+        try:
+            client.eval(_INFLIGHT_RELEASE_SCRIPT, 1, key, task_id)
+        except Exception as e:
+            logger.debug(f"중복 병합 키 해제 실패 ({key}): {e}")
+
+
+def _save_summary(db, article_id: int, summary_result: dict):
+    """요약 결과 DB 저장 (있으면 업데이트, 없으면 생성)"""
+    existing_summary = db.query(Summary).filter(Summary.article_id == article_id).first()
+    
+    # 키워드 검증 및 로깅
+    keywords = summary_result.get("keywords", [])
+    if not isinstance(keywords, list):
+        logger.warning(f"키워드가 리스트가 아님: {type(keywords)}, 빈 배열로 변환")
+        keywords = []
+    
+    logger.info(f"DB 저장 전 키워드 확인: {len(keywords)}개 - {keywords[:3] if keywords else '없음'}")
+    
+    if existing_summary:
+        # 업데이트
+        existing_summary.summary = summary_result.get("summary", "")
+        existing_summary.keywords = keywords
+        existing_summary.entities = summary_result.get("entities", {})
+        existing_summary.bullet_points = summary_result.get("bullet_points", [])
+        existing_summary.sentiment = summary_result.get("sentiment", "neutral")
+        summary = existing_summary
+    else:
+        # 생성
+        summary = Summary(
+            article_id=article_id,
+            summary=summary_result.get("summary", ""),
+            keywords=keywords,
+            entities=summary_result.get("entities", {}),
+            bullet_points=summary_result.get("bullet_points", []),
+            sentiment=summary_result.get("sentiment", "neutral")
+        )
+        db.add(summary)
+    
+    db.commit()
+    db.refresh(summary)
+    
+    # 저장 후 검증
+    logger.info(f"DB 저장 완료 - 키워드: {len(summary.keywords) if summary.keywords else 0}개")
+    
+    # 연관 기사 추천 인덱스 증분 갱신 (실패해도 요약 저장은 유지)
+    try:
+        index_article_entities(db, article_id, summary_result.get("entities", {}))
+        db.commit()
+    except Exception as e:
+        db.rollback()
+        logger.warning(f"연관 기사 인덱스 갱신 실패 (article_id={article_id}): {e}")
+
+
+def _enqueue_graph_update(article_id: int, summary_result: dict):
+    """
+    Neo4j 그래프 업데이트를 graph 큐의 후속 작업으로 등록
+    
+    추론 워커는 그래프 왕복을 기다리지 않고 바로 다음 작업으로 넘어갑니다.
+    등록 실패해도 분석 결과는 유지됩니다.
+    """
+    try:
+        update_graph_task.apply_async(
+            args=(article_id, summary_result.get("entities", {}), summary_result.get("keywords", [])),
+            queue=QUEUE_GRAPH,
+            priority=QUEUE_PRIORITIES[QUEUE_GRAPH],
+        )
+    except Exception as e:
+        logger.warning(f"그래프 업데이트 작업 등록 실패 (article_id={article_id}): {e}")
+
+
+def _report_progress(task, progress: int, message: str):
+    """진행 상태 기록 (status 조회용) + 이벤트 발행 (SSE 구독자용)"""
+    task.update_state(state='PROGRESS', meta={'progress': progress, 'message': message})
+    publish_task_event(task.request.id, EVENT_PROGRESS, progress, message)
+
+
+def _build_result(article_id: int, summary_result: dict) -> dict:
+    """작업 결과 (Celery result backend에 저장되는 값)"""
+    return {
+        "article_id": article_id,
+        "summary": summary_result.get("summary", ""),
+        "keywords": summary_result.get("keywords", []),
+        "entities": summary_result.get("entities", {}),
+        "bullet_points": summary_result.get("bullet_points", []),
+        "sentiment": summary_result.get("sentiment", "neutral"),
+        "status": "success"
+    }
+
+
 @celery_app.task(name="analyze_article", bind=True)
 def analyze_article_task(self, article_id: int, text: str):
     """
@@ -53,12 +367,15 @@ def analyze_article_task(self, article_id: int, text: str):
     Returns:
         분석 결과
     """
+    # 요약 파이프라인(torch/transformers)은 워커에서만 필요하므로 지연 import
+    # (API 프로세스가 이 모듈을 import 해도 ML 모듈이 로드되지 않도록)
+    from app.services.summarizer import summarize_text
+    
     db = SessionLocal()
-    neo4j_session = None
     
     try:
         # 진행 상태 업데이트
-        self.update_state(state='PROGRESS', meta={'progress': 10, 'message': 'AI 요약 시작'})
+        _report_progress(self, 10, 'AI 요약 시작')
         
         # AI 요약 실행
         summary_result = summarize_text(text)
@@ -66,76 +383,112 @@ def analyze_article_task(self, article_id: int, text: str):
         if not summary_result:
             raise Exception("AI 요약 실패")
         
-        self.update_state(state='PROGRESS', meta={'progress': 50, 'message': '데이터베이스 저장 중'})
+        _report_progress(self, 50, '데이터베이스 저장 중')
         
         # 요약 결과 DB 저장
-        existing_summary = db.query(Summary).filter(Summary.article_id == article_id).first()
-        
-        # 키워드 검증 및 로깅
-        keywords = summary_result.get("keywords", [])
-        if not isinstance(keywords, list):
-            logger.warning(f"키워드가 리스트가 아님: {type(keywords)}, 빈 배열로 변환")
-            keywords = []
-        
-        logger.info(f"DB 저장 전 키워드 확인: {len(keywords)}개 - {keywords[:3] if keywords else '없음'}")
-        
-        if existing_summary:
-            # 업데이트
-            existing_summary.summary = summary_result.get("summary", "")
-            existing_summary.keywords = keywords
-            existing_summary.entities = summary_result.get("entities", {})
-            existing_summary.bullet_points = summary_result.get("bullet_points", [])
-            existing_summary.sentiment = summary_result.get("sentiment", "neutral")
-            summary = existing_summary
-        else:
-            # 생성
-            summary = Summary(
-                article_id=article_id,
-                summary=summary_result.get("summary", ""),
-                keywords=keywords,
-                entities=summary_result.get("entities", {}),
-                bullet_points=summary_result.get("bullet_points", []),
-                sentiment=summary_result.get("sentiment", "neutral")
-            )
-            db.add(summary)
-        
-        db.commit()
-        db.refresh(summary)
-        
-        # 저장 후 검증
-        logger.info(f"DB 저장 완료 - 키워드: {len(summary.keywords) if summary.keywords else 0}개")
+        _save_summary(db, article_id, summary_result)
         
-        self.update_state(state='PROGRESS', meta={'progress': 80, 'message': '그래프 업데이트 중'})
+        # Neo4j 그래프 업데이트 (graph 큐 후속 작업)
+        _enqueue_graph_update(article_id, summary_result)
         
-        # Neo4j 그래프 업데이트
-        try:
-            neo4j_session = neo4j_driver.get_driver().session()
-            update_article_graph(
-                neo4j_session,
-                article_id,
-                summary_result.get("entities", {}),
-                summary_result.get("keywords", [])
-            )
-        except Exception as e:
-            logger.warning(f"그래프 업데이트 실패 (계속 진행): {e}")
+        result = _build_result(article_id, summary_result)
+        publish_task_event(self.request.id, EVENT_DONE, 100, '완료', result)
         
-        self.update_state(state='PROGRESS', meta={'progress': 100, 'message': '완료'})
-        
-        return {
-            "article_id": article_id,
-            "summary": summary_result.get("summary", ""),
-            "keywords": summary_result.get("keywords", []),
-            "entities": summary_result.get("entities", {}),
-            "bullet_points": summary_result.get("bullet_points", []),
-            "sentiment": summary_result.get("sentiment", "neutral"),
-            "status": "success"
-        }
+        return result
         
     except Exception as e:
         logger.error(f"기사 분석 실패 (article_id={article_id}): {e}")
+        publish_task_event(self.request.id, EVENT_FAILED, 0, str(e))
         raise
     finally:
         db.close()
+        _release_inflight(article_id, self.request.id)
+
+
+@celery_app.task(
+    name="analyze_article_batch",
+    base=Batches,
+    flush_every=settings.ANALYZE_BATCH_SIZE,
+    flush_interval=settings.ANALYZE_BATCH_INTERVAL_MS / 1000,
+)
+def analyze_article_batch_task(requests):
+    """
+    기사 분석 마이크로 배치 작업 (bulk 큐)
+    
+    최대 ANALYZE_BATCH_SIZE개 메시지가 모이거나 ANALYZE_BATCH_INTERVAL_MS가 지나면
+    모인 메시지를 한 번에 처리합니다. 모델 추론(키워드/KoBART/감성)은 배치로 실행하고,
+    DB 저장과 결과 기록은 메시지별로 수행하여 각 task_id가 자기 결과를 갖습니다.
+    한가할 때는 메시지 1개도 flush 주기 안에 바로 처리되므로 지연이 늘지 않습니다.
+    
+    Args:
+        requests: celery_batches SimpleRequest 리스트 (args = (article_id, text))
+    """
+    from app.services.summarizer import summarize_texts
+    
+    requests = list(requests)
+    logger.info(f"기사 분석 배치 시작: {len(requests)}개")
+    for request in requests:
+        publish_task_event(request.id, EVENT_PROGRESS, 10, f'AI 요약 시작 (배치 {len(requests)}개)')
+    
+    summary_results = summarize_texts([request.args[1] for request in requests])
+    
+    db = SessionLocal()
+    try:
+        for request, summary_result in zip(requests, summary_results):
+            article_id = request.args[0]
+            try:
+                if not summary_result:
+                    raise Exception("AI 요약 실패")
+                _save_summary(db, article_id, summary_result)
+                _enqueue_graph_update(article_id, summary_result)
+                result = _build_result(article_id, summary_result)
+                celery_app.backend.mark_as_done(request.id, result, request=request)
+                publish_task_event(request.id, EVENT_DONE, 100, '완료', result)
+            except Exception as e:
+                db.rollback()
+                logger.error(f"기사 분석 실패 (article_id={article_id}): {e}")
+                celery_app.backend.mark_as_failure(request.id, e, request=request)
+                publish_task_event(request.id, EVENT_FAILED, 0, str(e))
+            finally:
+                _release_inflight(article_id, request.id)
+    finally:
+        db.close()
+
+
+@celery_app.task(
+    name="update_article_graph",
+    base=Batches,
+    flush_every=settings.GRAPH_BATCH_SIZE,
+    flush_interval=settings.GRAPH_BATCH_INTERVAL_MS / 1000,
+    ignore_result=True,
+)
+def update_graph_task(requests):
+    """
+    Neo4j 그래프 업데이트 배치 작업 (graph 큐, I/O 워커 풀)
+    
+    모인 기사들을 하나의 쓰기 트랜잭션으로 반영합니다.
+    배치 트랜잭션이 실패하면 기사별로 다시 시도하여 문제 기사만 제외합니다.
+    
+    Args:
+        requests: celery_batches SimpleRequest 리스트 (args = (article_id, entities, keywords))
+    """
+    articles = [
+        {"article_id": request.args[0], "entities": request.args[1], "keywords": request.args[2]}
+        for request in requests
+    ]
+    
+    neo4j_session = None
+    try:
+        neo4j_session = neo4j_driver.get_driver().session()
+        if update_articles_graph(neo4j_session, articles):
+            return
+        
+        if len(articles) > 1:
+            logger.warning(f"그래프 배치 업데이트 실패, 기사별 재시도: {len(articles)}개")
+            for article in articles:
+                update_articles_graph(neo4j_session, [article])
+    except Exception as e:
+        logger.warning(f"그래프 업데이트 실패 ({len(articles)}개 기사): {e}")
+    finally:
         if neo4j_session:
             neo4j_session.close()
-
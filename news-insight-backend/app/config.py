@@ -18,6 +18,11 @@ class Settings(BaseSettings):
     POSTGRES_HOST: str = os.getenv("POSTGRES_HOST", "localhost")
     POSTGRES_PORT: str = os.getenv("POSTGRES_PORT", "5432")
     POSTGRES_DB: str = os.getenv("POSTGRES_DB", "newsdb")
+    # 비동기 엔진(asyncpg) 커넥션 풀: async 라우트 전용 (동기 엔진 풀과 별도)
+    ASYNC_DB_POOL_SIZE: int = int(os.getenv("ASYNC_DB_POOL_SIZE", "20"))
+    ASYNC_DB_MAX_OVERFLOW: int = int(os.getenv("ASYNC_DB_MAX_OVERFLOW", "30"))
+    # SQL 실행 통계: 요청/작업 하나에서 같은 형태의 statement가 이 횟수 이상 실행되면 N+1 의심 경고
+    SQL_REPEAT_WARN_THRESHOLD: int = int(os.getenv("SQL_REPEAT_WARN_THRESHOLD", "10"))
     
     @property
     def POSTGRES_URL(self) -> str:
@@ -52,6 +57,39 @@ class Settings(BaseSettings):
     # Celery & Redis 설정
     CELERY_BROKER_URL: str = os.getenv("CELERY_BROKER_URL", "redis://localhost:6379/0")
     CELERY_RESULT_BACKEND: str = os.getenv("CELERY_RESULT_BACKEND", "redis://localhost:6379/0")
+    # 같은 기사 분석 요청 병합 키 유지 시간 (초, 작업 종료 시 즉시 해제)
+    CELERY_INFLIGHT_TTL: int = int(os.getenv("CELERY_INFLIGHT_TTL", "1800"))
+    # Celery 워커 Prometheus 메트릭 포트 (0이면 비활성화, prefork 워커는 PROMETHEUS_MULTIPROC_DIR 필요)
+    CELERY_METRICS_PORT: int = int(os.getenv("CELERY_METRICS_PORT", "9808"))
+    # bulk 큐 마이크로 배치: 최대 메시지 수 / 최대 대기 시간 (밀리초)
+    ANALYZE_BATCH_SIZE: int = int(os.getenv("ANALYZE_BATCH_SIZE", "16"))
+    ANALYZE_BATCH_INTERVAL_MS: int = int(os.getenv("ANALYZE_BATCH_INTERVAL_MS", "200"))
+    # graph 큐 배치: 한 트랜잭션으로 반영할 최대 기사 수 / 최대 대기 시간 (밀리초)
+    GRAPH_BATCH_SIZE: int = int(os.getenv("GRAPH_BATCH_SIZE", "50"))
+    GRAPH_BATCH_INTERVAL_MS: int = int(os.getenv("GRAPH_BATCH_INTERVAL_MS", "500"))
+    # 작업 결과 보관 시간 (초, Celery result backend)
+    CELERY_RESULT_EXPIRES: int = int(os.getenv("CELERY_RESULT_EXPIRES", "3600"))
+    # 작업 진행 이벤트 (SSE): 마지막 이벤트 보관 시간 / 스트림 최대 유지 시간 (초)
+    TASK_EVENT_TTL: int = int(os.getenv("TASK_EVENT_TTL", "600"))
+    TASK_EVENT_STREAM_TIMEOUT: int = int(os.getenv("TASK_EVENT_STREAM_TIMEOUT", "300"))
+    
+    # 서버 시작 설정
+    # - background: 서버는 즉시 시작, 모델은 백그라운드 스레드에서 warm-up (readiness는 완료 후 ready)
+    # - blocking: 모델 warm-up 완료 후 요청 수신 (기존 동작)
+    # - lazy: warm-up 없이 첫 사용 시 모델 로드
+    MODEL_WARMUP_MODE: str = os.getenv("MODEL_WARMUP_MODE", "background").lower()
+    
+    # Kiwi 형태소 분석기 배치 처리 스레드 수 (0이면 가용 코어 전체)
+    KIWI_NUM_WORKERS: int = int(os.getenv("KIWI_NUM_WORKERS", "0"))
+    
+    # 기업명 딕셔너리 증분 갱신 주기 (초, 0이면 Redis 알림 수신 시에만 갱신)
+    COMPANY_DICT_REFRESH_INTERVAL: int = int(os.getenv("COMPANY_DICT_REFRESH_INTERVAL", "300"))
+    # KG 스냅샷 (시나리오 API): edge 버전 확인 주기 / 강제 재로딩 주기 (초, 0이면 버전 변경 시에만)
+    KG_SNAPSHOT_CHECK_INTERVAL: int = int(os.getenv("KG_SNAPSHOT_CHECK_INTERVAL", "5"))
+    KG_SNAPSHOT_REFRESH_INTERVAL: int = int(os.getenv("KG_SNAPSHOT_REFRESH_INTERVAL", "600"))
+    # 시나리오 응답 캐시 TTL (초, 키에 KG edge 버전 포함) / 버전 변경 시 미리 계산할 인기 변수 수 (0이면 비활성화)
+    SCENARIO_CACHE_TTL: int = int(os.getenv("SCENARIO_CACHE_TTL", "86400"))
+    SCENARIO_PREWARM_TOP_N: int = int(os.getenv("SCENARIO_PREWARM_TOP_N", "10"))
     
     # CORS 설정
     CORS_ORIGINS: List[str] = [
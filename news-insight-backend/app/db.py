@@ -1,7 +1,11 @@
 from sqlalchemy import create_engine
 from sqlalchemy.engine.url import URL
 from sqlalchemy.orm import sessionmaker, declarative_base
+from sqlalchemy.pool import QueuePool, AsyncAdaptedQueuePool
+from sqlalchemy.ext.asyncio import create_async_engine, async_sessionmaker, AsyncSession
 from app.config import settings
+from app.utils.query_stats import install_query_instrumentation
+from app.utils.metrics import timed_pool_class
 from neo4j import GraphDatabase
 import logging
 
@@ -30,6 +34,7 @@ try:
     engine = create_engine(
         database_url,
         pool_pre_ping=True,
+        poolclass=timed_pool_class(QueuePool, "sync"),  # checkout 대기 시간 메트릭
         pool_size=10,
         max_overflow=20,
         # psycopg2에 직접 전달되는 인자들
@@ -51,6 +56,56 @@ except Exception as e:
 
 SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
 
+# PostgreSQL 비동기 엔진 (asyncpg, 지연 생성)
+# async def 라우트 전용: 대기 중인 요청이 스레드를 점유하지 않으므로
+# 워커 1개로 느린 요청 수백 개를 동시에 처리 가능 (Celery/스크립트는 동기 엔진 사용)
+# app.db를 import하는 Celery 워커/스크립트는 asyncpg 없이도 동작하도록 첫 사용 시 생성
+async_database_url = database_url.set(drivername="postgresql+asyncpg", query={})
+
+async_engine = None
+AsyncSessionLocal = None
+
+# 요청/작업 단위 SQL 통계 (N+1 탐지)
+install_query_instrumentation(engine)
+
+
+def get_async_engine():
+    """비동기 엔진 가져오기 (지연 생성)"""
+    global async_engine, AsyncSessionLocal
+    if async_engine is None:
+        async_engine = create_async_engine(
+            async_database_url,
+            pool_pre_ping=True,
+            poolclass=timed_pool_class(AsyncAdaptedQueuePool, "async"),
+            pool_size=settings.ASYNC_DB_POOL_SIZE,
+            max_overflow=settings.ASYNC_DB_MAX_OVERFLOW,
+            # asyncpg는 client_encoding 쿼리 파라미터 대신 server_settings로 전달
+            connect_args={
+                "server_settings": {"client_encoding": "utf8"}
+            },
+            echo=False,
+        )
+        install_query_instrumentation(async_engine.sync_engine)
+        # commit 후에도 객체 속성을 추가 조회 없이 사용할 수 있도록 expire_on_commit=False
+        AsyncSessionLocal = async_sessionmaker(
+            async_engine,
+            class_=AsyncSession,
+            autoflush=False,
+            expire_on_commit=False,
+        )
+        logger.info("PostgreSQL 비동기 엔진 생성")
+    return async_engine
+
+
+async def dispose_async_engine():
+    """비동기 엔진 연결 풀 정리 (생성된 경우에만)"""
+    global async_engine, AsyncSessionLocal
+    if async_engine is not None:
+        await async_engine.dispose()
+        async_engine = None
+        AsyncSessionLocal = None
+
+
 # SQLAlchemy Base 클래스
 Base = declarative_base()
 
@@ -104,6 +159,13 @@ def get_db():
         db.close()
 
 
+async def get_async_db():
+    """비동기 데이터베이스 세션 의존성 (async def 라우트용)"""
+    get_async_engine()
+    async with AsyncSessionLocal() as db:
+        yield db
+
+
 def get_neo4j():
     """Neo4j 드라이버 의존성"""
     driver = neo4j_driver.get_driver()
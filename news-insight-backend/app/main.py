@@ -5,13 +5,13 @@ os.environ['TF_CPP_MIN_LOG_LEVEL'] = '3'  # TensorFlow 경고 숨김
 
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.responses import JSONResponse, Response
 from contextlib import asynccontextmanager
 from app.config import settings
-from app.routes import feed, article, insight, scenario
-from app.db import Base, engine
+from app.utils.startup import startup_state, STATUS_DEFERRED
 from app.utils.logging import setup_logging
-from app.services.pipelines.entities import load_company_dict_from_db
-from app.services.pipelines.model_loader import warm_up_models
+from app.utils.query_stats import QueryStatsMiddleware
+from app.utils.metrics import render_metrics
 import logging
 
 logger = logging.getLogger(__name__)
@@ -19,13 +19,63 @@ logger = logging.getLogger(__name__)
 # 로깅 설정
 setup_logging()
 
-# 데이터베이스 테이블 생성 (연결 실패 시에도 서버는 시작됨)
-try:
+# 라우트 import (ML 모듈은 첫 사용 시 지연 로딩되므로 여기서는 가벼운 모듈만 로드됨)
+with startup_state.phase("import routes"):
+    from app.routes import feed, article, insight, scenario
+
+from app.db import Base, engine, dispose_async_engine, neo4j_driver
+from app.services.graph import ensure_graph_schema
+from app.services.pipelines.entities import (
+    load_company_dict_from_db,
+    company_dict_reloader,
+    get_company_dict_info,
+)
+from app.services.pipelines.model_loader import warm_up_models
+from app.services.kg_snapshot import load_kg_snapshot, kg_snapshot_reloader, get_kg_snapshot_info
+from app.services.scenario_cache import prewarm_scenario_cache
+
+
+def init_database():
+    """데이터베이스 테이블 생성 (import 시점이 아닌 서버 시작 시 실행)"""
     Base.metadata.create_all(bind=engine)
     logger.info("데이터베이스 테이블 생성 완료")
-except Exception as e:
-    logger.warning(f"데이터베이스 테이블 생성 실패 (서버는 계속 시작됨): {e}")
-    logger.warning("PostgreSQL 서버가 실행 중인지 확인해주세요. (docker-compose up db 또는 PostgreSQL 직접 설치)")
+
+
+def init_graph_schema():
+    """Neo4j 제약 조건/인덱스 생성 (Article.id, 엔티티/키워드 name)"""
+    with neo4j_driver.get_driver().session() as session:
+        return ensure_graph_schema(session)
+
+
+def run_startup_components(warm_up: bool):
+    """
+    DB 초기화 → 그래프 스키마 → 기업명 딕셔너리 → KG 스냅샷 → (선택) AI 모델 Warm-up 순서로 실행
+
+    각 단계의 실패는 readiness 상태에만 반영되고 서버(liveness)는 계속 동작합니다.
+    """
+    if not startup_state.run_component("database", init_database):
+        logger.warning("PostgreSQL 서버가 실행 중인지 확인해주세요. (docker-compose up db 또는 PostgreSQL 직접 설치)")
+
+    # Neo4j 미연결 시에도 서버는 계속 동작 (연관 기사 조회만 느려짐)
+    startup_state.run_component("graph_schema", init_graph_schema)
+
+    # DB 연결 실패 시에도 서버는 계속 동작 (로딩 실패는 False로 반환되어 readiness에만 반영)
+    startup_state.run_component("company_dict", load_company_dict_from_db)
+    # 이후 변경 사항은 Redis 알림 / watermark 주기 확인으로 무중단 갱신
+    company_dict_reloader.start()
+
+    # 시나리오 API용 KG 스냅샷 (실패 시 시나리오 API는 DB 조회로 동작)
+    if startup_state.run_component("kg_snapshot", load_kg_snapshot):
+        prewarm_scenario_cache()
+    # 이후 edge 버전(kg:edge_version) 변경 시 무중단 재로딩 + 인기 변수 시나리오 캐시 사전 계산
+    kg_snapshot_reloader.add_listener(prewarm_scenario_cache)
+    kg_snapshot_reloader.start()
+
+    if warm_up:
+        if not startup_state.run_component("models", warm_up_models):
+            logger.error("첫 요청 시 모델 로드로 인한 지연이 발생할 수 있습니다.")
+
+    logger.info(f"시작 컴포넌트 로드 완료 (ready={startup_state.is_ready()})")
 
 
 @asynccontextmanager
@@ -36,22 +86,29 @@ async def lifespan(app: FastAPI):
     logger.info("서버 시작 중...")
     logger.info("=" * 50)
     
-    # 기업명 딕셔너리 로딩 (서버 시작 시 1회만)
-    # DB 연결 실패 시에도 서버는 계속 시작됨 (load_company_dict_from_db 내부에서 예외 처리됨)
-    logger.info("기업명 딕셔너리 로딩 시작...")
-    try:
-        load_company_dict_from_db()
-    except Exception as e:
-        logger.warning(f"기업명 딕셔너리 로딩 실패 (서버는 계속 시작됨): {e}")
-        logger.warning("DB 연결이 실패해도 서버는 정상 작동하지만, 엔티티 추출 기능이 제한될 수 있습니다.")
+    # MODEL_WARMUP_MODE
+    # - background: DB/딕셔너리/모델을 백그라운드 스레드에서 로드 (liveness는 즉시 healthy)
+    # - blocking: 모든 컴포넌트 로드 후 요청 수신
+    # - lazy: 모델 warm-up 생략, 첫 사용 시 로드
+    mode = settings.MODEL_WARMUP_MODE
+    startup_state.register("database")
+    startup_state.register("graph_schema", required=False)
+    startup_state.register("company_dict")
+    startup_state.register("kg_snapshot", required=False)
+    startup_state.register("models", required=(mode != "lazy"))
     
-    # AI 모델 Warm-up (첫 요청 지연 방지)
-    logger.info("AI 모델 Warm-up 시작...")
-    try:
-        warm_up_models()
-    except Exception as e:
-        logger.error(f"AI 모델 Warm-up 실패: {e}")
-        logger.error("첫 요청 시 모델 로드로 인한 지연이 발생할 수 있습니다.")
+    if mode == "lazy":
+        startup_state.set_status("models", STATUS_DEFERRED)
+    
+    if mode == "blocking":
+        with startup_state.phase("startup components"):
+            run_startup_components(warm_up=True)
+    else:
+        logger.info(f"시작 컴포넌트 백그라운드 로드 시작 (mode={mode})")
+        startup_state.run_in_background(
+            "startup",
+            lambda: run_startup_components(warm_up=(mode == "background"))
+        )
     
     logger.info("서버 시작 완료")
     logger.info("=" * 50)
@@ -60,6 +117,9 @@ async def lifespan(app: FastAPI):
     
     # 서버 종료 시 (필요시 정리 작업)
     logger.info("서버 종료 중...")
+    company_dict_reloader.stop()
+    kg_snapshot_reloader.stop()
+    await dispose_async_engine()
 
 
 app = FastAPI(
@@ -81,6 +141,9 @@ app.add_middleware(
     allow_headers=["*"],
 )
 
+# 요청 단위 SQL 통계 (N+1 경고, DEBUG 모드에서는 X-DB-Query-* 응답 헤더)
+app.add_middleware(QueryStatsMiddleware)
+
 
 # 라우트 등록
 app.include_router(feed.router, prefix="/api", tags=["Feed"])
@@ -101,13 +164,42 @@ def root():
 
 @app.get("/health")
 def health_check():
-    """헬스 체크 엔드포인트"""
+    """헬스 체크 엔드포인트 (liveness: 프로세스 응답 가능 여부만 확인)"""
     return {
         "status": "healthy",
         "service": "news-insight-backend"
     }
 
 
+@app.get("/ready")
+def readiness_check():
+    """
+    준비 상태 엔드포인트 (readiness)
+    
+    DB, 기업명 딕셔너리, AI 모델 등 필수 컴포넌트가 준비되지 않았으면 503을 반환합니다.
+    """
+    readiness = startup_state.readiness()
+    status_code = 200 if readiness["ready"] else 503
+    return JSONResponse(status_code=status_code, content=readiness)
+
+
+@app.get("/health/startup")
+def startup_report():
+    """서버 시작 프로파일 (단계별 소요 시간, 컴포넌트 상태, 로드된 ML 모듈)"""
+    return {
+        **startup_state.report(),
+        "company_dict": get_company_dict_info(),
+        "kg_snapshot": get_kg_snapshot_info(),
+    }
+
+
+@app.get("/metrics", include_in_schema=False)
+def metrics():
+    """Prometheus 메트릭 (요약 단계, RSS/중복 제거, 캐시, DB 풀 대기, 모델 로드 시간)"""
+    body, content_type = render_metrics()
+    return Response(content=body, media_type=content_type)
+
+
 if __name__ == "__main__":
     import uvicorn
     # Docker 환경에서는 reload 사용 안 함
@@ -1,4 +1,4 @@
-from app.models.article import Article, Summary
+from app.models.article import Article, Summary, ArticleEntity, ArticleCoMention
 from app.models.user import UserInsight
 from app.models.stock import Stock
 
@@ -24,6 +24,7 @@ from app.models.stock_price import StockPrice
 # Axis 5: Logic & Links (The KG Layer)
 from app.models.edge import Edge
 from app.models.industry_edge import IndustryEdge
+from app.models.kg_edge_fingerprint import KGEdgeFingerprint
 
 # 보완 테이블: Traceability
 from app.models.processing_log import ProcessingLog
@@ -32,6 +33,8 @@ from app.models.broker_report import BrokerReport
 __all__ = [
     "Article", 
     "Summary", 
+    "ArticleEntity",
+    "ArticleCoMention",
     "UserInsight", 
     "Stock",
     # Axis 1
@@ -52,6 +55,7 @@ __all__ = [
     # Axis 5
     "Edge",
     "IndustryEdge",
+    "KGEdgeFingerprint",
     # 보완
     "ProcessingLog",
     "BrokerReport",
@@ -1,4 +1,4 @@
-from sqlalchemy import Column, Integer, String, Text, DateTime, JSON, ForeignKey
+from sqlalchemy import Column, Integer, String, Text, DateTime, JSON, ForeignKey, Float, Index
 from sqlalchemy.orm import relationship
 from sqlalchemy.dialects.postgresql import JSONB
 from datetime import datetime
@@ -47,3 +47,38 @@ class Summary(Base):
     def __repr__(self):
         return f"<Summary(article_id={self.article_id})>"
 
+
+
+class ArticleEntity(Base):
+    """엔티티 → 기사 역색인 (연관 기사 추천용, 요약 저장 시 증분 갱신)"""
+    __tablename__ = "article_entities"
+    
+    entity_name = Column(String(200), primary_key=True)
+    article_id = Column(Integer, ForeignKey("articles.id", ondelete="CASCADE"), primary_key=True)
+    entity_type = Column(String(20))  # ORG, PERSON, LOCATION
+    weight = Column(Float, nullable=False, default=1.0)  # 1 / 기사 엔티티 수 (기사가 해당 엔티티에 집중할수록 높음)
+    
+    __table_args__ = (
+        Index('idx_article_entities_article', 'article_id'),
+    )
+    
+    def __repr__(self):
+        return f"<ArticleEntity({self.entity_name} -> {self.article_id})>"
+
+
+class ArticleCoMention(Base):
+    """기사 → 기사 공동 언급 점수 (양방향 저장, 공유 엔티티 Jaccard)"""
+    __tablename__ = "article_co_mentions"
+    
+    article_id = Column(Integer, ForeignKey("articles.id", ondelete="CASCADE"), primary_key=True)
+    related_article_id = Column(Integer, ForeignKey("articles.id", ondelete="CASCADE"), primary_key=True)
+    shared_count = Column(Integer, nullable=False)
+    score = Column(Float, nullable=False)
+    updated_at = Column(DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
+    
+    __table_args__ = (
+        Index('idx_article_co_mentions_score', 'article_id', 'score'),
+    )
+    
+    def __repr__(self):
+        return f"<ArticleCoMention({self.article_id} ~ {self.related_article_id}, score={self.score:.3f})>"
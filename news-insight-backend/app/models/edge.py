@@ -2,7 +2,7 @@
 Axis 5: Logic & Links (The KG Layer)
 Knowledge Graph 관계 모델
 """
-from sqlalchemy import Column, String, Float, DateTime, ForeignKey, Index
+from sqlalchemy import Column, Computed, String, Text, Float, DateTime, ForeignKey, Index
 from sqlalchemy.dialects.postgresql import JSONB
 from sqlalchemy.orm import relationship
 from datetime import datetime
@@ -26,6 +26,16 @@ class Edge(Base):
     properties = Column(JSONB, default=dict, nullable=True)  # {"driver_tags": [...], "weight": 0.8, ...}
     
     weight = Column(Float, default=1.0)  # 관계 강도 (0.0 ~ 1.0)
+    
+    # ⭐ properties 타입 컬럼 (DB generated column, 읽기 전용 - properties만 쓰면 자동 동기화)
+    mechanism = Column(Text, Computed("properties->>'mechanism'", persisted=True))
+    polarity = Column(Text, Computed("properties->>'polarity'", persisted=True))
+    text_match_weight = Column(Float, Computed(
+        "CASE WHEN jsonb_typeof(properties->'text_match_weight') = 'number' "
+        "THEN (properties->'text_match_weight')::double precision ELSE 0 END",
+        persisted=True
+    ))
+    
     evidence = Column(JSONB, nullable=True)  # 증거 정보 (구조화된 JSON 데이터)
     source = Column(String(50))  # 예: "DART", "LLM", "RULE_BASED"
     direction = Column(String(10), default="DIRECTED")  # DIRECTED, UNDIRECTED
@@ -38,6 +48,15 @@ class Edge(Base):
         Index('idx_edges_relation_type', 'relation_type'),
         Index('idx_edges_source_type', 'source_type'),
         Index('idx_edges_target_type', 'target_type'),
+        # 시나리오 조회 커버링 인덱스 (index-only scan)
+        Index(
+            'idx_edges_relation_target_weight', 'relation_type', 'target_id', weight.desc(),
+            postgresql_include=['source_id', 'mechanism', 'polarity', 'text_match_weight']
+        ),
+        Index(
+            'idx_edges_relation_source_weight', 'relation_type', 'source_id', weight.desc(),
+            postgresql_include=['target_id', 'mechanism', 'polarity', 'text_match_weight']
+        ),
     )
     
     def __repr__(self):
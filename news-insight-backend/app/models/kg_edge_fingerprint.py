@@ -0,0 +1,21 @@
+"""
+KG edge 빌드 fingerprint (증분 재빌드용)
+"""
+from sqlalchemy import Column, Integer, String, DateTime
+from sqlalchemy.dialects.postgresql import JSONB
+from datetime import datetime
+from app.db import Base
+
+
+class KGEdgeFingerprint(Base):
+    """기업별 인과 구조/분류 입력 fingerprint + 마지막으로 생성한 edge id 목록"""
+    __tablename__ = "kg_edge_fingerprints"
+    
+    ticker = Column(String(20), primary_key=True)
+    fingerprint = Column(String(64), nullable=False)  # sha256(빌더 버전 + 인과 구조 + 섹터)
+    edge_ids = Column(JSONB, nullable=False, default=list)  # 마지막 빌드 edge id (stale edge 삭제 기준)
+    edge_count = Column(Integer, default=0)
+    built_at = Column(DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
+    
+    def __repr__(self):
+        return f"<KGEdgeFingerprint({self.ticker}, edges={self.edge_count})>"
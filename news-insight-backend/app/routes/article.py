@@ -1,12 +1,13 @@
 from fastapi import APIRouter, Depends, HTTPException
+from fastapi.responses import StreamingResponse
 from sqlalchemy.orm import Session
 from pydantic import BaseModel
 from typing import Optional
 from app.db import get_db
 from app.models.article import Article, Summary
 from app.services.parser import parse_article_content
-from app.services.summarizer import summarize_text
-from app.celery_worker import analyze_article_task
+from app.celery_worker import submit_analyze_article, QUEUE_INTERACTIVE
+from app.utils.task_events import get_last_task_event, stream_task_events, EVENT_PROGRESS, EVENT_DONE
 import logging
 
 logger = logging.getLogger(__name__)
@@ -74,8 +75,8 @@ def parse_article(
             if not text:
                 raise HTTPException(status_code=400, detail="기사 본문을 추출할 수 없습니다.")
         
-        # Celery 작업 시작 (비동기)
-        task = analyze_article_task.delay(article.id, text)
+        # Celery 작업 시작 (비동기, interactive 큐 / 같은 기사 분석이 진행 중이면 기존 작업 반환)
+        task = submit_analyze_article(article.id, text, queue=QUEUE_INTERACTIVE)
         
         return {
             "task_id": task.id,
@@ -101,6 +102,21 @@ def get_task_status(task_id: str):
     Returns:
         작업 상태
     """
+    # 워커가 발행한 마지막 이벤트가 있으면 result backend 조회 없이 응답
+    event = get_last_task_event(task_id)
+    if event and event["state"] == EVENT_PROGRESS:
+        return {
+            'status': 'processing',
+            'message': '분석 진행 중',
+            'progress': event.get('progress', 0)
+        }
+    if event and event["state"] == EVENT_DONE:
+        return {
+            'status': 'done',
+            'message': '분석 완료',
+            'result': event.get('result')
+        }
+    
     from celery.result import AsyncResult
     from app.celery_worker import celery_app
     
@@ -132,6 +148,29 @@ def get_task_status(task_id: str):
     return response
 
 
+@router.get("/events/{task_id}")
+async def stream_task_status(task_id: str):
+    """
+    비동기 작업 진행 이벤트 스트림 (Server-Sent Events)
+    
+    /status 폴링 대신 워커가 Redis pub/sub으로 발행하는 단계별 이벤트와
+    최종 결과를 푸시합니다. done/failed 이벤트 후 스트림이 종료됩니다.
+    스트림은 비동기 제너레이터라 연결을 유지하는 동안 스레드 풀을 점유하지 않습니다.
+    
+    이벤트 형식:
+        event: progress | done | failed | timeout
+        data: {"task_id", "state", "progress", "message", "result"(done일 때)}
+    
+    Args:
+        task_id: Celery 작업 ID
+    """
+    return StreamingResponse(
+        stream_task_events(task_id),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"},
+    )
+
+
 @router.get("/{article_id}")
 def get_article(
     article_id: int,
@@ -254,7 +293,8 @@ def test_summarize(request: TestSummarizeRequest):
                 detail="텍스트가 너무 짧습니다. 최소 100자 이상 입력해주세요."
             )
         
-        # 요약 실행
+        # 요약 실행 (ML 모듈은 첫 사용 시 지연 로딩)
+        from app.services.summarizer import summarize_text
         result = summarize_text(request.text)
         
         if not result:
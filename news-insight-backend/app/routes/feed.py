@@ -1,13 +1,16 @@
 from fastapi import APIRouter, Depends, HTTPException, Query
-from sqlalchemy.orm import Session
-from typing import List, Optional
+from fastapi.concurrency import run_in_threadpool
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
+from typing import Dict, List, Optional
 from urllib.parse import urlparse
-from app.db import get_db
+from app.db import get_async_db
 from app.config import settings
 from app.services.rss_collector import fetch_rss_articles
 from app.services.deduplicator import deduplicate_articles
-from app.models.article import Article
+from app.models.article import Article, Summary
 from app.utils.cache import get_from_cache, set_to_cache, get_cache_key
+from app.utils.metrics import DEDUP_SECONDS, DEDUP_ARTICLES, observe_seconds
 from datetime import datetime
 import logging
 import html
@@ -17,14 +20,14 @@ logger = logging.getLogger(__name__)
 router = APIRouter(prefix="/feed", tags=["Feed"])
 
 
-def format_article_response(article: Article, cluster_info: dict = None, db: Session = None) -> dict:
+def format_article_response(article: Article, cluster_info: dict = None, summaries: Dict[int, Summary] = None) -> dict:
     """
     기사 응답 포맷 통일
     
     Args:
         article: Article 모델 객체
         cluster_info: 클러스터 정보 (cluster_id, representative)
-        db: 데이터베이스 세션 (AI 분석 여부 확인용)
+        summaries: article_id → Summary 매핑 (AI 분석 여부 확인용, 호출자가 한 번에 조회)
     
     Returns:
         통일된 형식의 기사 데이터
@@ -40,14 +43,9 @@ def format_article_response(article: Article, cluster_info: dict = None, db: Ses
     title = html.unescape(article.title or "")
     
     # AI 분석 완료 여부 확인
-    ai_summary_exists = False
-    summary = None
-    if db:
-        from app.models.article import Summary
-        summary_data = db.query(Summary).filter(Summary.article_id == article.id).first()
-        if summary_data:
-            ai_summary_exists = True
-            summary = summary_data.summary
+    summary_data = (summaries or {}).get(article.id)
+    ai_summary_exists = summary_data is not None
+    summary = summary_data.summary if summary_data else None
 
     return {
         "id": article.id,
@@ -65,15 +63,76 @@ def format_article_response(article: Article, cluster_info: dict = None, db: Ses
     }
 
 
+async def _load_summaries(db: AsyncSession, article_ids: List[int]) -> Dict[int, Summary]:
+    """기사 ID 목록의 AI 요약을 한 번에 조회"""
+    if not article_ids:
+        return {}
+    result = await db.scalars(select(Summary).where(Summary.article_id.in_(article_ids)))
+    return {s.article_id: s for s in result}
+
+
+def _collect_articles(
+    source: Optional[str],
+    deduplicate: bool,
+    similarity_threshold: float,
+    enable_bert: bool,
+    limit: int
+) -> tuple:
+    """
+    RSS 수집 + 중복 제거 (네트워크/CPU 작업, 스레드 풀에서 실행)
+    
+    Returns:
+        (중복 제거된 기사 목록, 원본 기사 수, link → 클러스터 정보)
+    """
+    # RSS에서 기사 수집
+    articles_data = fetch_rss_articles(settings.RSS_FEEDS)
+    
+    # 필터링
+    if source:
+        articles_data = [a for a in articles_data if source in a.get("source", "")]
+    
+    original_count = len(articles_data)
+    
+    # 중복 제거 적용
+    cluster_info_map = {}  # 클러스터 정보 저장용
+    if deduplicate and len(articles_data) > 1:
+        logger.info(f"중복 제거 시작: {len(articles_data)}개 기사")
+        # 모든 기사에 대해 중복 제거 수행 (충분히 큰 max_results 설정)
+        with observe_seconds(DEDUP_SECONDS):
+            articles_data = deduplicate_articles(
+                articles_data,
+                similarity_threshold=similarity_threshold,
+                max_results=max(limit * 10, 500),  # 충분히 큰 값으로 설정 (최소 500개 이상)
+                enable_bert=enable_bert,
+                tfidf_weight=settings.TFIDF_WEIGHT,
+                bert_weight=settings.BERT_WEIGHT,
+                max_same_source=settings.MAX_SAME_SOURCE
+            )
+        DEDUP_ARTICLES.labels(stage="input").inc(original_count)
+        DEDUP_ARTICLES.labels(stage="output").inc(len(articles_data))
+        logger.info(f"중복 제거 완료: {original_count} -> {len(articles_data)}개 기사")
+        
+        # 클러스터 정보 추출
+        for article in articles_data:
+            if "cluster_id" in article and "representative" in article:
+                cluster_info_map[article.get("link")] = {
+                    "cluster_id": article.get("cluster_id"),
+                    "representative": article.get("representative"),
+                    "related_articles": article.get("related_articles", []),
+                }
+    
+    return articles_data, original_count, cluster_info_map
+
+
 @router.get("/")
-def get_feed(
+async def get_feed(
     limit: int = 20,
     offset: int = 0,
     source: Optional[str] = None,
     deduplicate: bool = True,
     similarity_threshold: float = Query(0.75, ge=0.0, le=1.0, description="유사도 임계값 (0.0~1.0)"),
     enable_bert: bool = Query(True, description="BERT Embedding 사용 여부"),
-    db: Session = Depends(get_db)
+    db: AsyncSession = Depends(get_async_db)
 ):
     """
     RSS 피드에서 최신 뉴스 기사 수집 및 반환 (중복 제거 및 다양성 확보)
@@ -99,13 +158,13 @@ def get_feed(
             enable_bert=enable_bert
         )
         
-        # 캐시에서 가져오기 시도
-        cached_result = get_from_cache(cache_key)
+        # 캐시에서 가져오기 시도 (동기 Redis 클라이언트 → 스레드 풀)
+        cached_result = await run_in_threadpool(get_from_cache, cache_key)
         if cached_result:
             logger.info(f"캐시 히트: {cache_key}")
             # DB에서 최신 정보 가져오기 (ID 기준)
             article_ids = [a["id"] for a in cached_result["articles"]]
-            saved_articles = db.query(Article).filter(Article.id.in_(article_ids)).all()
+            saved_articles = (await db.scalars(select(Article).where(Article.id.in_(article_ids)))).all()
             
             # ID 순서 유지
             article_dict = {a.id: a for a in saved_articles}
@@ -116,9 +175,7 @@ def get_feed(
             cached_articles_dict = {a["id"]: a for a in cached_result["articles"]}
             
             # 캐시된 데이터에서 AI 분석 여부 확인
-            from app.models.article import Summary
-            article_ids = [a.id for a in saved_articles]
-            summaries = {s.article_id: s for s in db.query(Summary).filter(Summary.article_id.in_(article_ids)).all()}
+            summaries = await _load_summaries(db, [a.id for a in saved_articles])
             
             return {
                 "articles": [
@@ -149,39 +206,9 @@ def get_feed(
         
         logger.info(f"캐시 미스: {cache_key}. 새로 수집 시작.")
         
-        # RSS에서 기사 수집
-        articles_data = fetch_rss_articles(settings.RSS_FEEDS)
-        
-        # 필터링
-        if source:
-            articles_data = [a for a in articles_data if source in a.get("source", "")]
-        
-        original_count = len(articles_data)
-        
-        # 중복 제거 적용
-        cluster_info_map = {}  # 클러스터 정보 저장용
-        if deduplicate and len(articles_data) > 1:
-            logger.info(f"중복 제거 시작: {len(articles_data)}개 기사")
-            # 모든 기사에 대해 중복 제거 수행 (충분히 큰 max_results 설정)
-            articles_data = deduplicate_articles(
-                articles_data,
-                similarity_threshold=similarity_threshold,
-                max_results=max(limit * 10, 500),  # 충분히 큰 값으로 설정 (최소 500개 이상)
-                enable_bert=enable_bert,
-                tfidf_weight=settings.TFIDF_WEIGHT,
-                bert_weight=settings.BERT_WEIGHT,
-                max_same_source=settings.MAX_SAME_SOURCE
-            )
-            logger.info(f"중복 제거 완료: {original_count} -> {len(articles_data)}개 기사")
-            
-            # 클러스터 정보 추출
-            for article in articles_data:
-                if "cluster_id" in article and "representative" in article:
-                    cluster_info_map[article.get("link")] = {
-                        "cluster_id": article.get("cluster_id"),
-                        "representative": article.get("representative"),
-                        "related_articles": article.get("related_articles", []),
-                    }
+        articles_data, original_count, cluster_info_map = await run_in_threadpool(
+            _collect_articles, source, deduplicate, similarity_threshold, enable_bert, limit
+        )
         
         # 페이징
         paginated = articles_data[offset:offset + limit]
@@ -191,6 +218,15 @@ def get_feed(
         article_cluster_info = {}  # DB 저장 후 ID 기준 클러스터 정보
         article_image_map = {}  # 이미지 URL 매핑 (link -> image_url)
         
+        # 기존 기사 한 번에 조회 (link 기준)
+        links = [a.get("link") for a in paginated]
+        existing_map = {}
+        if links:
+            existing_map = {
+                a.link: a
+                for a in await db.scalars(select(Article).where(Article.link.in_(links)))
+            }
+        
         for article_data in paginated:
             # 이미지 URL 저장
             image_url = article_data.get("image_url")
@@ -202,7 +238,7 @@ def get_feed(
                 article_image_map[link] = None
             
             # 이미 존재하는지 확인
-            existing = db.query(Article).filter(Article.link == link).first()
+            existing = existing_map.get(link)
             
             if not existing:
                 # 새 기사 저장
@@ -215,21 +251,21 @@ def get_feed(
                     published_at=datetime.fromisoformat(article_data["published_at"])
                 )
                 db.add(article)
-                db.commit()
-                db.refresh(article)
-                saved_articles.append(article)
+                existing_map[link] = article
             else:
                 # 기존 기사가 있으면 이미지 URL 업데이트 (없는 경우에만)
                 if image_url and not existing.image_url:
                     existing.image_url = image_url
-                    db.commit()
-                    db.refresh(existing)
-                saved_articles.append(existing)
+                article = existing
+            saved_articles.append(article)
         
-            # 클러스터 정보 저장 (link -> id 매핑)
-            if link in cluster_info_map:
-                article_id = existing.id if existing else article.id
-                article_cluster_info[article_id] = cluster_info_map[link]
+        # 신규/변경 기사 일괄 반영 (ID 발급)
+        await db.commit()
+        
+        # 클러스터 정보 저장 (link -> id 매핑)
+        for article in saved_articles:
+            if article.link in cluster_info_map:
+                article_cluster_info[article.id] = cluster_info_map[article.link]
         
         # 이미지 URL 확인 (DB에 저장된 것이 우선, 없으면 RSS에서 가져온 것 사용)
         for article in saved_articles:
@@ -240,9 +276,10 @@ def get_feed(
             if article.image_url:
                 article_image_map[article.link] = article.image_url
         
-        # 응답 형식 통일
+        # 응답 형식 통일 (AI 요약은 한 번에 조회)
+        summaries = await _load_summaries(db, [a.id for a in saved_articles])
         formatted_articles = [
-            format_article_response(a, article_cluster_info.get(a.id, {}), db)
+            format_article_response(a, article_cluster_info.get(a.id, {}), summaries)
                 for a in saved_articles
         ]
         
@@ -258,7 +295,7 @@ def get_feed(
         }
         
         # 캐시 저장 (TTL: 10분) - 이미지 URL 포함
-        set_to_cache(cache_key, {
+        await run_in_threadpool(set_to_cache, cache_key, {
             "articles": formatted_articles,
             "total": len(articles_data),
             "original_count": original_count,
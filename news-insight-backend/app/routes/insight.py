@@ -1,11 +1,12 @@
 from fastapi import APIRouter, Depends, HTTPException
-from sqlalchemy.orm import Session
+from sqlalchemy import select, func
+from sqlalchemy.ext.asyncio import AsyncSession
 from pydantic import BaseModel
 from typing import List, Optional
-from app.db import get_db, get_neo4j
+from app.db import get_async_db
 from app.models.article import Article, Summary
 from app.models.user import UserInsight
-from app.services.graph import get_related_articles
+from app.services.related_index import get_related_by_entity, get_related_by_article
 import logging
 
 logger = logging.getLogger(__name__)
@@ -21,10 +22,10 @@ class FeedbackRequest(BaseModel):
 
 
 @router.get("/")
-def list_insights(
+async def list_insights(
     limit: int = 20,
     offset: int = 0,
-    db: Session = Depends(get_db)
+    db: AsyncSession = Depends(get_async_db)
 ):
     """
     내 인사이트 목록 조회
@@ -37,30 +38,39 @@ def list_insights(
     Returns:
         인사이트 목록
     """
-    summaries = db.query(Summary).join(Article).order_by(Summary.created_at.desc()).offset(offset).limit(limit).all()
+    # 기사 제목을 함께 조회 (async 세션은 lazy loading 불가)
+    result = await db.execute(
+        select(Summary, Article.title)
+        .join(Article)
+        .order_by(Summary.created_at.desc())
+        .offset(offset)
+        .limit(limit)
+    )
+    rows = result.all()
+    total = await db.scalar(select(func.count()).select_from(Summary))
     
     return {
         "insights": [
             {
                 "article_id": s.article_id,
-                "title": s.article.title if s.article else None,
+                "title": title,
                 "summary": s.summary,
                 "keywords": s.keywords or [],
                 "sentiment": s.sentiment,
                 "created_at": s.created_at.isoformat(),
             }
-            for s in summaries
+            for s, title in rows
         ],
-        "total": db.query(Summary).count(),
+        "total": total,
         "limit": limit,
         "offset": offset
     }
 
 
 @router.get("/{article_id}")
-def get_insight(
+async def get_insight(
     article_id: int,
-    db: Session = Depends(get_db)
+    db: AsyncSession = Depends(get_async_db)
 ):
     """
     특정 기사의 인사이트 조회
@@ -72,13 +82,15 @@ def get_insight(
     Returns:
         인사이트 정보
     """
-    summary = db.query(Summary).filter(Summary.article_id == article_id).first()
+    summary = await db.scalar(select(Summary).where(Summary.article_id == article_id))
     
     if not summary:
         raise HTTPException(status_code=404, detail="인사이트를 찾을 수 없습니다.")
     
-    article = db.query(Article).filter(Article.id == article_id).first()
-    user_insight = db.query(UserInsight).filter(UserInsight.article_id == article_id).first()
+    article = await db.get(Article, article_id)
+    user_insight = await db.scalar(
+        select(UserInsight).where(UserInsight.article_id == article_id).limit(1)
+    )
     
     return {
         "article_id": article_id,
@@ -102,9 +114,9 @@ def get_insight(
 
 
 @router.post("/feedback")
-def add_feedback(
+async def add_feedback(
     request: FeedbackRequest,
-    db: Session = Depends(get_db)
+    db: AsyncSession = Depends(get_async_db)
 ):
     """
     태그/메모 추가 (피드백)
@@ -117,12 +129,14 @@ def add_feedback(
         업데이트 결과
     """
     # 기사 존재 확인
-    article = db.query(Article).filter(Article.id == request.article_id).first()
+    article = await db.get(Article, request.article_id)
     if not article:
         raise HTTPException(status_code=404, detail="기사를 찾을 수 없습니다.")
     
     # 기존 피드백 확인
-    user_insight = db.query(UserInsight).filter(UserInsight.article_id == request.article_id).first()
+    user_insight = await db.scalar(
+        select(UserInsight).where(UserInsight.article_id == request.article_id).limit(1)
+    )
     
     if user_insight:
         # 업데이트
@@ -130,8 +144,8 @@ def add_feedback(
             user_insight.memo = request.memo
         if request.tags is not None:
             user_insight.tags = request.tags
-        db.commit()
-        db.refresh(user_insight)
+        await db.commit()
+        await db.refresh(user_insight)
     else:
         # 생성
         user_insight = UserInsight(
@@ -140,8 +154,8 @@ def add_feedback(
             tags=request.tags
         )
         db.add(user_insight)
-        db.commit()
-        db.refresh(user_insight)
+        await db.commit()
+        await db.refresh(user_insight)
     
     return {
         "updated": True,
@@ -154,58 +168,45 @@ def add_feedback(
 
 
 @router.get("/recommend/related")
-def get_related_recommendations(
-    entity: str,
+async def get_related_recommendations(
+    entity: Optional[str] = None,
+    article_id: Optional[int] = None,
     limit: int = 10,
-    db: Session = Depends(get_db)
+    db: AsyncSession = Depends(get_async_db)
 ):
     """
-    연관 뉴스 추천 (엔티티 기반)
+    연관 뉴스 추천 (사전 계산된 인덱스 기반)
+    
+    - entity: 엔티티를 언급한 기사 (기사 내 엔티티 비중 → 최신순)
+    - article_id: 해당 기사와 엔티티를 많이 공유하는 기사 (공동 언급 점수순)
     
     Args:
         entity: 엔티티 이름
+        article_id: 기준 기사 ID
         limit: 최대 반환 개수
         db: 데이터베이스 세션
     
     Returns:
         연관 기사 목록
     """
+    if not entity and article_id is None:
+        raise HTTPException(status_code=400, detail="entity 또는 article_id가 필요합니다.")
+    
     try:
-        # Neo4j에서 관련 기사 ID 조회
-        neo4j_session = next(get_neo4j())
-        article_ids = get_related_articles(neo4j_session, entity, limit)
-        neo4j_session.close()
-        
-        if not article_ids:
-            return {
-                "entity": entity,
-                "articles": [],
-                "message": "관련 기사를 찾을 수 없습니다."
-            }
+        if article_id is not None:
+            articles = await get_related_by_article(db, article_id, limit)
+        else:
+            articles = await get_related_by_entity(db, entity, limit)
         
-        # PostgreSQL에서 기사 정보 조회
-        articles = db.query(Article).filter(Article.id.in_(article_ids)).all()
-        summaries = db.query(Summary).filter(Summary.article_id.in_(article_ids)).all()
-        
-        summary_dict = {s.article_id: s for s in summaries}
-        
-        return {
+        response = {
             "entity": entity,
-            "articles": [
-                {
-                    "id": a.id,
-                    "title": a.title,
-                    "source": a.source,
-                    "link": a.link,
-                    "summary": summary_dict.get(a.id).summary if summary_dict.get(a.id) else None,
-                    "keywords": summary_dict.get(a.id).keywords if summary_dict.get(a.id) else [],
-                    "published_at": a.published_at.isoformat() if a.published_at else None,
-                }
-                for a in articles
-            ]
+            "article_id": article_id,
+            "articles": articles
         }
+        if not articles:
+            response["message"] = "관련 기사를 찾을 수 없습니다."
+        return response
         
     except Exception as e:
         logger.error(f"연관 뉴스 추천 실패: {e}")
         raise HTTPException(status_code=500, detail=f"추천 실패: {str(e)}")
-
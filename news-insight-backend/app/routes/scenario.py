@@ -8,29 +8,43 @@ Scenario API - KG V1.5.3
 - 환율 시나리오: GET /api/v1/scenario/exchange_rate
 - 기업 인사이트: GET /api/v1/scenario/company/{ticker}
 - 비교 분석: GET /api/v1/scenario/compare/{variable}  (V1.5.3)
+- k-hop 전파: GET /api/v1/scenario/propagate/{variable}
+- 복합 충격: POST /api/v1/scenario/shock
 """
 
 from fastapi import APIRouter, Depends, HTTPException, Query
-from sqlalchemy.orm import Session
+from fastapi.concurrency import run_in_threadpool
+from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy import text
-from pydantic import BaseModel
+from pydantic import BaseModel, Field
 from typing import List, Optional, Dict, Any
-from app.db import get_db
+from app.db import get_async_db
+from app.services.kg_snapshot import get_kg_snapshot
+from app.services.kg_exposure_matrix import get_exposure_matrix
+from app.services.scenario_cache import (
+    lookup_scenario_cache,
+    render_comparison,
+    render_driver_scenario,
+    render_scenario_v153,
+    store_scenario_cache,
+)
+from app.services.kg_propagation import (
+    DEFAULT_HOP_DECAY,
+    DEFAULT_MAX_HOPS,
+    MAX_HOPS_LIMIT,
+    KGPropagationEngine,
+    get_propagation_engine,
+)
 from app.services.kg_explanation_layer import (
-    generate_scenario_json,
-    generate_oil_scenario_json,
-    generate_interest_rate_scenario_json,
     generate_company_insight_json,
     generate_mechanism_explanation,
     generate_2hop_story,
+    generate_path_story,
     get_variable_korean_name,
-    generate_comparison_output,
-    generate_scenario_json_v153,
     calculate_exposure_level,
     get_evidence_snippets,
 )
 import logging
-import json
 
 logger = logging.getLogger(__name__)
 
@@ -82,18 +96,27 @@ class ScenarioResponse(BaseModel):
     kg_version: str
 
 
+class ShockRequest(BaseModel):
+    shocks: Dict[str, float] = Field(..., description="Driver code → change (+1.0 = UP, -1.0 = DOWN)")
+    limit: int = Field(20, ge=1, le=200, description="Number of companies")
+
+
 # =============================================================================
 # Helper Functions
 # =============================================================================
 
-def get_affected_companies_by_driver(
-    db: Session,
+async def get_affected_companies_by_driver(
+    db: AsyncSession,
     driver_code: str,
     limit: int = 20,
     min_weight: float = 0.5
 ) -> List[Dict]:
-    """특정 드라이버에 영향받는 기업 조회"""
-    result = db.execute(text('''
+    """특정 드라이버에 영향받는 기업 조회 (KG 스냅샷 우선, 로딩 전이면 DB)"""
+    snapshot = get_kg_snapshot()
+    if snapshot is not None:
+        return snapshot.affected_companies(driver_code, limit, min_weight)
+    
+    result = await db.execute(text('''
         SELECT 
             e.source_id as ticker,
             s.stock_name as name,
@@ -101,7 +124,9 @@ def get_affected_companies_by_driver(
             i.sector_l1,
             i.value_chain,
             e.weight,
-            e.properties
+            e.mechanism,
+            e.polarity,
+            e.text_match_weight
         FROM edges e
         JOIN stocks s ON e.source_id = s.ticker
         JOIN investor_sector i ON e.source_id = i.ticker AND i.is_primary = true
@@ -118,7 +143,6 @@ def get_affected_companies_by_driver(
     
     companies = []
     for row in result:
-        props = row[6] if isinstance(row[6], dict) else (json.loads(row[6]) if row[6] else {})
         companies.append({
             'ticker': row[0],
             'name': row[1],
@@ -126,25 +150,31 @@ def get_affected_companies_by_driver(
             'sector_l1': row[3],
             'value_chain': row[4],
             'weight': float(row[5]) if row[5] else 0.5,
-            'mechanism': props.get('mechanism', 'DEMAND'),
-            'polarity': props.get('polarity', 'MIXED'),
-            'text_match_weight': props.get('text_match_weight', 0),
+            'mechanism': row[6] or 'DEMAND',
+            'polarity': row[7] or 'MIXED',
+            'text_match_weight': row[8] or 0,
         })
     
     return companies
 
 
-def get_company_drivers(
-    db: Session,
+async def get_company_drivers(
+    db: AsyncSession,
     ticker: str,
     limit: int = 10
 ) -> List[Dict]:
-    """특정 기업의 드라이버 조회"""
-    result = db.execute(text('''
+    """특정 기업의 드라이버 조회 (KG 스냅샷 우선, 로딩 전이면 DB)"""
+    snapshot = get_kg_snapshot()
+    if snapshot is not None:
+        return snapshot.company_drivers(ticker, limit)
+    
+    result = await db.execute(text('''
         SELECT 
             e.target_id as driver_code,
             e.weight,
-            e.properties
+            e.mechanism,
+            e.polarity,
+            e.text_match_weight
         FROM edges e
         WHERE e.source_id = :ticker
         AND e.relation_type = 'DRIVEN_BY'
@@ -157,21 +187,39 @@ def get_company_drivers(
     
     drivers = []
     for row in result:
-        props = row[2] if isinstance(row[2], dict) else (json.loads(row[2]) if row[2] else {})
         drivers.append({
             'driver_code': row[0],
             'weight': float(row[1]) if row[1] else 0.5,
-            'mechanism': props.get('mechanism', 'DEMAND'),
-            'polarity': props.get('polarity', 'MIXED'),
-            'text_match_weight': props.get('text_match_weight', 0),
+            'mechanism': row[2] or 'DEMAND',
+            'polarity': row[3] or 'MIXED',
+            'text_match_weight': row[4] or 0,
         })
     
     return drivers
 
 
-def get_company_info(db: Session, ticker: str) -> Optional[Dict]:
-    """기업 정보 조회"""
-    result = db.execute(text('''
+async def get_cached_response(endpoint: str, variable: str, params: Dict, build) -> Any:
+    """
+    KG 버전 캐시 조회 → miss면 build() 결과를 저장하여 반환
+
+    HTTPException(404 등)은 캐시하지 않습니다.
+    """
+    key, cached = await run_in_threadpool(lookup_scenario_cache, endpoint, variable, params)
+    if cached is not None:
+        return cached
+    
+    result = await build()
+    await run_in_threadpool(store_scenario_cache, key, result)
+    return result
+
+
+async def get_company_info(db: AsyncSession, ticker: str) -> Optional[Dict]:
+    """기업 정보 조회 (KG 스냅샷 우선, 로딩 전이면 DB)"""
+    snapshot = get_kg_snapshot()
+    if snapshot is not None:
+        return snapshot.company_info(ticker)
+    
+    result = await db.execute(text('''
         SELECT 
             s.ticker,
             s.stock_name,
@@ -198,11 +246,11 @@ def get_company_info(db: Session, ticker: str) -> Optional[Dict]:
 # =============================================================================
 
 @router.get("/oil_price", response_model=ScenarioResponse)
-def get_oil_price_scenario(
+async def get_oil_price_scenario(
     direction: str = Query("UP", description="UP or DOWN"),
     limit: int = Query(20, description="Number of companies"),
     min_weight: float = Query(0.5, description="Minimum weight threshold"),
-    db: Session = Depends(get_db)
+    db: AsyncSession = Depends(get_async_db)
 ):
     """
     유가 변동 시나리오 분석
@@ -214,14 +262,17 @@ def get_oil_price_scenario(
     Returns:
         영향받는 기업 목록과 설명
     """
-    try:
-        companies = get_affected_companies_by_driver(db, 'OIL_PRICE', limit, min_weight)
+    async def build():
+        companies = await get_affected_companies_by_driver(db, 'OIL_PRICE', limit, min_weight)
         
         if not companies:
             raise HTTPException(status_code=404, detail="영향받는 기업을 찾을 수 없습니다.")
         
-        result = generate_oil_scenario_json(direction.upper(), companies)
-        return result
+        return render_driver_scenario('OIL_PRICE', direction.upper(), companies)
+    
+    try:
+        params = {'variable': 'OIL_PRICE', 'direction': direction.upper(), 'limit': limit, 'min_weight': min_weight}
+        return await get_cached_response('driver', 'OIL_PRICE', params, build)
         
     except HTTPException:
         raise
@@ -231,11 +282,11 @@ def get_oil_price_scenario(
 
 
 @router.get("/interest_rate", response_model=ScenarioResponse)
-def get_interest_rate_scenario(
+async def get_interest_rate_scenario(
     direction: str = Query("UP", description="UP or DOWN"),
     limit: int = Query(20, description="Number of companies"),
     min_weight: float = Query(0.5, description="Minimum weight threshold"),
-    db: Session = Depends(get_db)
+    db: AsyncSession = Depends(get_async_db)
 ):
     """
     금리 변동 시나리오 분석
@@ -247,14 +298,17 @@ def get_interest_rate_scenario(
     Returns:
         영향받는 기업 목록과 설명
     """
-    try:
-        companies = get_affected_companies_by_driver(db, 'INTEREST_RATE', limit, min_weight)
+    async def build():
+        companies = await get_affected_companies_by_driver(db, 'INTEREST_RATE', limit, min_weight)
         
         if not companies:
             raise HTTPException(status_code=404, detail="영향받는 기업을 찾을 수 없습니다.")
         
-        result = generate_interest_rate_scenario_json(direction.upper(), companies)
-        return result
+        return render_driver_scenario('INTEREST_RATE', direction.upper(), companies)
+    
+    try:
+        params = {'variable': 'INTEREST_RATE', 'direction': direction.upper(), 'limit': limit, 'min_weight': min_weight}
+        return await get_cached_response('driver', 'INTEREST_RATE', params, build)
         
     except HTTPException:
         raise
@@ -264,11 +318,11 @@ def get_interest_rate_scenario(
 
 
 @router.get("/exchange_rate")
-def get_exchange_rate_scenario(
+async def get_exchange_rate_scenario(
     direction: str = Query("UP", description="UP or DOWN"),
     limit: int = Query(20, description="Number of companies"),
     min_weight: float = Query(0.5, description="Minimum weight threshold"),
-    db: Session = Depends(get_db)
+    db: AsyncSession = Depends(get_async_db)
 ):
     """
     환율 변동 시나리오 분석
@@ -280,14 +334,17 @@ def get_exchange_rate_scenario(
     Returns:
         영향받는 기업 목록과 설명
     """
-    try:
-        companies = get_affected_companies_by_driver(db, 'EXCHANGE_RATE_USD_KRW', limit, min_weight)
+    async def build():
+        companies = await get_affected_companies_by_driver(db, 'EXCHANGE_RATE_USD_KRW', limit, min_weight)
         
         if not companies:
             raise HTTPException(status_code=404, detail="영향받는 기업을 찾을 수 없습니다.")
         
-        result = generate_scenario_json('EXCHANGE_RATE_USD_KRW', direction.upper(), companies)
-        return result
+        return render_driver_scenario('EXCHANGE_RATE_USD_KRW', direction.upper(), companies)
+    
+    try:
+        params = {'variable': 'EXCHANGE_RATE_USD_KRW', 'direction': direction.upper(), 'limit': limit, 'min_weight': min_weight}
+        return await get_cached_response('driver', 'EXCHANGE_RATE_USD_KRW', params, build)
         
     except HTTPException:
         raise
@@ -297,10 +354,10 @@ def get_exchange_rate_scenario(
 
 
 @router.get("/company/{ticker}")
-def get_company_insight(
+async def get_company_insight(
     ticker: str,
     limit: int = Query(10, description="Number of drivers"),
-    db: Session = Depends(get_db)
+    db: AsyncSession = Depends(get_async_db)
 ):
     """
     특정 기업의 드라이버 분석
@@ -312,12 +369,12 @@ def get_company_insight(
         기업에 영향을 주는 드라이버 목록과 설명
     """
     try:
-        company_info = get_company_info(db, ticker)
+        company_info = await get_company_info(db, ticker)
         
         if not company_info:
             raise HTTPException(status_code=404, detail=f"기업을 찾을 수 없습니다: {ticker}")
         
-        drivers = get_company_drivers(db, ticker, limit)
+        drivers = await get_company_drivers(db, ticker, limit)
         
         if not drivers:
             raise HTTPException(status_code=404, detail="드라이버 정보를 찾을 수 없습니다.")
@@ -339,14 +396,14 @@ def get_company_insight(
 
 
 @router.get("/2hop/{var1}/{var2}/{ticker}")
-def get_2hop_analysis(
+async def get_2hop_analysis(
     var1: str,
     var2: str,
     ticker: str,
-    db: Session = Depends(get_db)
+    db: AsyncSession = Depends(get_async_db)
 ):
     """
-    2-hop 경로 분석
+    2-hop 경로 분석 (지정한 단일 경로, 전체 기업 순위는 /propagate/{variable} 사용)
     
     예: /2hop/OIL_PRICE/INTEREST_RATE/035420
     (유가 → 금리 → 네이버 경로 분석)
@@ -360,28 +417,37 @@ def get_2hop_analysis(
     """
     try:
         # 회사 정보 조회
-        company_info = get_company_info(db, ticker)
+        company_info = await get_company_info(db, ticker)
         if not company_info:
             raise HTTPException(status_code=404, detail=f"기업을 찾을 수 없습니다: {ticker}")
         
-        # Macro Link 조회 (var1 → var2)
-        result = db.execute(text('''
-            SELECT properties->>'relation' as relation
-            FROM edges
-            WHERE source_id = :var1 AND target_id = :var2 AND relation_type = 'MACRO_LINK'
-        '''), {'var1': var1, 'var2': var2})
-        
-        macro_row = result.fetchone()
-        macro_relation = macro_row[0] if macro_row else 'CONTEXT_LINK'
-        
-        # Company Driver 조회 (var2 → company)
-        result = db.execute(text('''
-            SELECT properties->>'mechanism' as mech, properties->>'polarity' as pol
-            FROM edges
-            WHERE source_id = :ticker AND target_id = :var2 AND relation_type = 'DRIVEN_BY'
-        '''), {'ticker': ticker, 'var2': var2})
+        snapshot = get_kg_snapshot()
+        if snapshot is not None:
+            # KG 스냅샷에서 Macro Link (var1 → var2), Company Driver (var2 → company) 조회
+            found, macro_relation = snapshot.macro_link(var1, var2)
+            if not found:
+                macro_relation = 'CONTEXT_LINK'
+            driver_row = snapshot.driver_edge(ticker, var2)
+        else:
+            # Macro Link 조회 (var1 → var2)
+            result = await db.execute(text('''
+                SELECT properties->>'relation' as relation
+                FROM edges
+                WHERE source_id = :var1 AND target_id = :var2 AND relation_type = 'MACRO_LINK'
+            '''), {'var1': var1, 'var2': var2})
+            
+            macro_row = result.fetchone()
+            macro_relation = macro_row[0] if macro_row else 'CONTEXT_LINK'
+            
+            # Company Driver 조회 (var2 → company)
+            result = await db.execute(text('''
+                SELECT mechanism, polarity
+                FROM edges
+                WHERE source_id = :ticker AND target_id = :var2 AND relation_type = 'DRIVEN_BY'
+            '''), {'ticker': ticker, 'var2': var2})
+            
+            driver_row = result.fetchone()
         
-        driver_row = result.fetchone()
         if not driver_row:
             raise HTTPException(status_code=404, detail=f"기업과 {var2} 간의 연결을 찾을 수 없습니다.")
         
@@ -418,24 +484,163 @@ def get_2hop_analysis(
         raise HTTPException(status_code=500, detail=f"분석 실패: {str(e)}")
 
 
+def propagate_with_stories(
+    engine: KGPropagationEngine,
+    shocks: Dict[str, float],
+    max_hops: int,
+    decay: float,
+    limit: int,
+    paths: int
+) -> List[Dict]:
+    """k-hop 전파 후 기업별 경로에 설명(generate_path_story)을 붙임 (동기, 스레드풀용)"""
+    companies = engine.propagate(shocks, max_hops, decay, limit, paths)
+    for company in companies:
+        for path in company['paths']:
+            path.update(generate_path_story(
+                path['variables'],
+                path['relations'],
+                path['mechanism'],
+                path['polarity'],
+                company['name'] or company['ticker']
+            ))
+    return companies
+
+
+@router.get("/propagate/{variable}")
+async def get_propagation_analysis(
+    variable: str,
+    direction: str = Query("UP", description="UP or DOWN"),
+    max_hops: int = Query(DEFAULT_MAX_HOPS, ge=1, le=MAX_HOPS_LIMIT, description="Max hops (macro links + company link)"),
+    decay: float = Query(DEFAULT_HOP_DECAY, gt=0, le=1, description="Decay per macro hop"),
+    limit: int = Query(20, ge=1, le=200, description="Number of companies"),
+    paths: int = Query(3, ge=0, le=10, description="Top paths per company"),
+):
+    """
+    k-hop 매크로 전파 분석
+    
+    변수 충격이 MACRO_LINK → ... → DRIVEN_BY 경로로 전체 기업에 미치는 영향을 계산하여
+    노출도(exposure) 순으로 반환합니다.
+    
+    예: /propagate/OIL_PRICE?max_hops=3
+    (유가 → 물가 → 금리 → 기업 경로까지 포함)
+    
+    - **variable**: 충격 변수 (예: OIL_PRICE)
+    - **direction**: UP (상승) or DOWN (하락)
+    - **max_hops**: 최대 hop 수 (2 = 기존 2-hop 분석)
+    - **decay**: Macro Link hop당 감쇠 계수
+    - **paths**: 기업별 상위 기여 경로 수
+    
+    Returns:
+        기업 순위 (영향 방향, 점수, 경로 설명)
+    """
+    # 스냅샷 교체 직후에는 희소 행렬 생성이 필요하므로 스레드풀에서 조회
+    engine = await run_in_threadpool(get_propagation_engine)
+    if engine is None:
+        raise HTTPException(status_code=503, detail="KG 스냅샷을 로딩 중입니다. 잠시 후 다시 시도해주세요.")
+    if variable not in engine.snapshot.driver_index:
+        raise HTTPException(status_code=404, detail=f"변수를 찾을 수 없습니다: {variable}")
+    
+    try:
+        shock = -1.0 if direction.upper() == 'DOWN' else 1.0
+        # 행렬 전파 + 경로 설명 생성은 CPU 작업이므로 이벤트 루프 밖에서 실행
+        companies = await run_in_threadpool(
+            propagate_with_stories, engine, {variable: shock}, max_hops, decay, limit, paths
+        )
+        
+        return {
+            'scenario': {
+                'variable': variable,
+                'variable_kr': get_variable_korean_name(variable),
+                'direction': 'DOWN' if shock < 0 else 'UP',
+                'max_hops': max_hops,
+                'decay': decay,
+            },
+            'companies': companies,
+            'total': len(companies),
+            'kg_snapshot_version': engine.snapshot.version,
+        }
+        
+    except Exception as e:
+        logger.error(f"k-hop 전파 분석 실패: {e}")
+        raise HTTPException(status_code=500, detail=f"분석 실패: {str(e)}")
+
+
+@router.post("/shock")
+async def simulate_shock(request: ShockRequest):
+    """
+    복합 충격 시뮬레이션
+    
+    여러 변수의 동시 변화를 기업 × 드라이버 노출도 행렬과 곱해 합산 영향을 계산합니다.
+    
+    예: {"shocks": {"OIL_PRICE": 1.0, "INTEREST_RATE": -0.5}, "limit": 20}
+    (유가 상승 + 금리 소폭 하락)
+    
+    - **shocks**: 드라이버 코드 → 변화량 (+1.0 = 상승, -1.0 = 하락)
+    - **limit**: 반환할 기업 수
+    
+    Returns:
+        합산 영향 절댓값 순 기업 목록 (드라이버별 기여 포함)
+    """
+    shocks = {code: value for code, value in request.shocks.items() if value}
+    if not shocks:
+        raise HTTPException(status_code=400, detail="충격 변수를 1개 이상 지정해주세요.")
+    
+    # 스냅샷 교체 직후에는 행렬 증분 재계산이 필요하므로 스레드풀에서 조회
+    matrix = await run_in_threadpool(get_exposure_matrix)
+    if matrix is None:
+        raise HTTPException(status_code=503, detail="KG 스냅샷을 로딩 중입니다. 잠시 후 다시 시도해주세요.")
+    
+    unknown = sorted(code for code in shocks if code not in matrix.driver_index)
+    if unknown:
+        raise HTTPException(status_code=404, detail=f"변수를 찾을 수 없습니다: {', '.join(unknown)}")
+    
+    try:
+        companies = matrix.simulate(shocks, request.limit)
+        
+        return {
+            'scenario': {
+                'shocks': [
+                    {
+                        'variable': code,
+                        'variable_kr': get_variable_korean_name(code),
+                        'change': value,
+                        'direction': 'UP' if value > 0 else 'DOWN',
+                    }
+                    for code, value in shocks.items()
+                ],
+            },
+            'companies': companies,
+            'total': len(companies),
+            'kg_snapshot_version': matrix.snapshot.version,
+        }
+        
+    except Exception as e:
+        logger.error(f"복합 충격 시뮬레이션 실패: {e}")
+        raise HTTPException(status_code=500, detail=f"분석 실패: {str(e)}")
+
+
 @router.get("/variables")
-def list_available_variables(db: Session = Depends(get_db)):
+async def list_available_variables(db: AsyncSession = Depends(get_async_db)):
     """
     분석 가능한 경제 변수 목록
     
     Returns:
         변수 코드와 한국어 이름 목록
     """
-    result = db.execute(text('''
-        SELECT DISTINCT target_id
-        FROM edges
-        WHERE relation_type = 'DRIVEN_BY'
-        ORDER BY target_id
-    '''))
+    snapshot = get_kg_snapshot()
+    if snapshot is not None:
+        var_codes = snapshot.driver_codes()
+    else:
+        result = await db.execute(text('''
+            SELECT DISTINCT target_id
+            FROM edges
+            WHERE relation_type = 'DRIVEN_BY'
+            ORDER BY target_id
+        '''))
+        var_codes = [row[0] for row in result]
     
     variables = []
-    for row in result:
-        var_code = row[0]
+    for var_code in var_codes:
         variables.append({
             'code': var_code,
             'name_kr': get_variable_korean_name(var_code),
@@ -452,13 +657,13 @@ def list_available_variables(db: Session = Depends(get_db)):
 # =============================================================================
 
 @router.get("/compare/{variable}")
-def get_comparison_analysis(
+async def get_comparison_analysis(
     variable: str,
     direction: str = Query("UP", description="UP or DOWN"),
     top_n: int = Query(3, description="Top N for each category"),
     limit: int = Query(50, description="Maximum companies to analyze"),
     min_weight: float = Query(0.3, description="Minimum weight threshold"),
-    db: Session = Depends(get_db)
+    db: AsyncSession = Depends(get_async_db)
 ):
     """
     [V1.5.3] 변수별 기업 비교 분석
@@ -473,41 +678,19 @@ def get_comparison_analysis(
     Returns:
         수혜주/피해주/양면성 비교 및 차이점 설명
     """
+    async def build():
+        companies = await get_affected_companies_by_driver(db, variable, limit, min_weight)
+        return render_comparison(variable, direction.upper(), companies, top_n)
+    
     try:
-        companies = get_affected_companies_by_driver(db, variable, limit, min_weight)
-        
-        if not companies:
-            # Empty State 처리 (V1.5.3)
-            return {
-                'variable': {
-                    'code': variable,
-                    'name_kr': get_variable_korean_name(variable),
-                },
-                'status': 'no_data',
-                'message': f"'{get_variable_korean_name(variable)}' 변수에 연결된 기업을 찾을 수 없습니다.",
-                'suggestion': "해당 변수가 KG에 등록되어 있는지 확인해주세요. GET /api/v1/scenario/variables로 사용 가능한 변수 목록을 확인할 수 있습니다.",
-                'positive_impact': [],
-                'negative_impact': [],
-                'mixed_impact': [],
-                'comparison_summary': '',
-                'kg_version': 'v1.5.3',
-            }
-        
-        comparison = generate_comparison_output(variable, companies, top_n)
-        
-        # 방향에 따른 해석 추가
-        direction_kr = '상승' if direction.upper() == 'UP' else '하락'
-        var_name = get_variable_korean_name(variable)
-        
-        return {
-            **comparison,
-            'scenario_context': {
-                'direction': direction.upper(),
-                'direction_kr': direction_kr,
-                'interpretation': f"{var_name} {direction_kr} 시나리오에서의 영향 분석",
-            },
-            'kg_version': 'v1.5.3',
+        params = {
+            'variable': variable,
+            'direction': direction.upper(),
+            'top_n': top_n,
+            'limit': limit,
+            'min_weight': min_weight,
         }
+        return await get_cached_response('compare', variable, params, build)
         
     except Exception as e:
         logger.error(f"비교 분석 실패: {e}")
@@ -515,13 +698,13 @@ def get_comparison_analysis(
 
 
 @router.get("/v153/scenario/{variable}")
-def get_scenario_v153(
+async def get_scenario_v153(
     variable: str,
     direction: str = Query("UP", description="UP or DOWN"),
     limit: int = Query(20, description="Number of companies"),
     min_weight: float = Query(0.5, description="Minimum weight threshold"),
     include_comparison: bool = Query(True, description="Include comparison output"),
-    db: Session = Depends(get_db)
+    db: AsyncSession = Depends(get_async_db)
 ):
     """
     [V1.5.3] 업그레이드된 시나리오 분석
@@ -535,54 +718,46 @@ def get_scenario_v153(
     Returns:
         강화된 시나리오 분석 (증거 문장, 노출도, 비교)
     """
+    async def build():
+        companies = await get_affected_companies_by_driver_v153(db, variable, limit, min_weight)
+        return render_scenario_v153(variable, direction.upper(), companies, include_comparison)
+    
     try:
-        companies = get_affected_companies_by_driver_v153(db, variable, limit, min_weight)
-        
-        if not companies:
-            # Empty State 처리
-            return {
-                'scenario': {
-                    'variable': variable,
-                    'variable_kr': get_variable_korean_name(variable),
-                    'direction': direction.upper(),
-                    'direction_kr': '상승' if direction.upper() == 'UP' else '하락',
-                    'title': f"{get_variable_korean_name(variable)} 시나리오",
-                },
-                'status': 'no_data',
-                'message': "분석할 데이터가 부족합니다.",
-                'suggestion': "해당 변수에 연결된 기업이 없거나, 최소 가중치 조건을 충족하는 기업이 없습니다. min_weight를 낮춰서 다시 시도해보세요.",
-                'affected_companies': [],
-                'kg_version': 'v1.5.3',
-            }
-        
-        result = generate_scenario_json_v153(
-            variable,
-            direction.upper(),
-            companies,
-            include_comparison
-        )
-        return result
+        params = {
+            'variable': variable,
+            'direction': direction.upper(),
+            'limit': limit,
+            'min_weight': min_weight,
+            'include_comparison': include_comparison,
+        }
+        return await get_cached_response('v153', variable, params, build)
         
     except Exception as e:
         logger.error(f"V1.5.3 시나리오 분석 실패: {e}")
         raise HTTPException(status_code=500, detail=f"분석 실패: {str(e)}")
 
 
-def get_affected_companies_by_driver_v153(
-    db: Session,
+async def get_affected_companies_by_driver_v153(
+    db: AsyncSession,
     driver_code: str,
     limit: int = 20,
     min_weight: float = 0.5
 ) -> List[Dict]:
-    """V1.5.3 - biz_summary 포함된 기업 조회"""
-    result = db.execute(text('''
+    """V1.5.3 - biz_summary 포함된 기업 조회 (KG 스냅샷 우선, 로딩 전이면 DB)"""
+    snapshot = get_kg_snapshot()
+    if snapshot is not None:
+        return snapshot.affected_companies(driver_code, limit, min_weight, with_biz_summary=True)
+    
+    result = await db.execute(text('''
         SELECT 
             e.source_id as ticker,
             s.stock_name as name,
             i.sector_l1,
             i.value_chain,
             e.weight,
-            e.properties,
+            e.mechanism,
+            e.polarity,
+            e.text_match_weight,
             cd.biz_summary
         FROM edges e
         JOIN stocks s ON e.source_id = s.ticker
@@ -601,17 +776,16 @@ def get_affected_companies_by_driver_v153(
     
     companies = []
     for row in result:
-        props = row[5] if isinstance(row[5], dict) else (json.loads(row[5]) if row[5] else {})
         companies.append({
             'ticker': row[0],
             'name': row[1],
             'sector_l1': row[2],
             'value_chain': row[3],
             'weight': float(row[4]) if row[4] else 0.5,
-            'mechanism': props.get('mechanism', 'DEMAND'),
-            'polarity': props.get('polarity', 'MIXED'),
-            'text_match_weight': props.get('text_match_weight', 0),
-            'biz_summary': row[6] or '',  # V1.5.3: Evidence Snippet용
+            'mechanism': row[5] or 'DEMAND',
+            'polarity': row[6] or 'MIXED',
+            'text_match_weight': row[7] or 0,
+            'biz_summary': row[8] or '',  # V1.5.3: Evidence Snippet용
         })
     
     return companies
@@ -622,10 +796,10 @@ def get_affected_companies_by_driver_v153(
 # =============================================================================
 
 @router.get("/company/{ticker}/v153")
-def get_company_insight_v153(
+async def get_company_insight_v153(
     ticker: str,
     limit: int = Query(10, description="Number of drivers"),
-    db: Session = Depends(get_db)
+    db: AsyncSession = Depends(get_async_db)
 ):
     """
     [V1.5.3] 기업 인사이트 (Exposure + Evidence 포함)
@@ -637,7 +811,7 @@ def get_company_insight_v153(
         기업의 드라이버 분석 (노출도, 증거 문장 포함)
     """
     try:
-        company_info = get_company_info(db, ticker)
+        company_info = await get_company_info(db, ticker)
         
         # Empty State: 기업이 없는 경우
         if not company_info:
@@ -651,7 +825,7 @@ def get_company_insight_v153(
                 'kg_version': 'v1.5.3',
             }
         
-        drivers = get_company_drivers(db, ticker, limit)
+        drivers = await get_company_drivers(db, ticker, limit)
         
         # Empty State: 드라이버가 없는 경우
         if not drivers:
@@ -665,11 +839,17 @@ def get_company_insight_v153(
             }
         
         # biz_summary 조회
-        result = db.execute(text('''
-            SELECT biz_summary FROM company_details WHERE ticker = :ticker
-        '''), {'ticker': ticker})
-        biz_row = result.fetchone()
-        biz_summary = biz_row[0] if biz_row else ''
+        snapshot = get_kg_snapshot()
+        evidence_index = None
+        if snapshot is not None:
+            biz_summary = snapshot.biz_summary(ticker)
+            evidence_index = snapshot.evidence_index(ticker)
+        else:
+            result = await db.execute(text('''
+                SELECT biz_summary FROM company_details WHERE ticker = :ticker
+            '''), {'ticker': ticker})
+            biz_row = result.fetchone()
+            biz_summary = biz_row[0] if biz_row else ''
         
         # 드라이버별 Exposure + Evidence 계산
         enriched_drivers = []
@@ -684,7 +864,8 @@ def get_company_insight_v153(
                 driver['driver_code'],
                 driver['mechanism'],
                 driver['polarity'],
-                biz_summary
+                biz_summary,
+                evidence_index=evidence_index
             )
             
             enriched_drivers.append({
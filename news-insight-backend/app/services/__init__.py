@@ -1,27 +1,36 @@
 # Services module
+# 하위 모듈 import 시(app.services.parser 등) torch/langchain/pandas가 함께 로드되지 않도록
+# 패키지 레벨 export는 실제 접근 시점에 지연 로딩합니다.
+import importlib
 
 # 새로운 서비스 모듈 (DART 파싱 및 LLM 처리)
-from app.services.dart_parser import DartParser
-from app.services.embedding_filter import (
-    ensure_embedding_model,
-    select_relevant_chunks,
-    semantic_select_sections
-)
-from app.services.retry_handler import (
-    retry_dart_api,
-    retry_llm_api,
-    retry_with_custom_config,
-    RateLimiter,
-    dart_rate_limiter,
-    llm_rate_limiter
-)
-from app.services.llm_handler import LLMHandler
-from app.services.memory_manager import (
-    MemoryManager,
-    memory_manager,
-    cleanup_after_batch,
-    log_memory_usage
-)
+_LAZY_EXPORTS = {
+    "DartParser": "app.services.dart_parser",
+    "ensure_embedding_model": "app.services.embedding_filter",
+    "select_relevant_chunks": "app.services.embedding_filter",
+    "semantic_select_sections": "app.services.embedding_filter",
+    "retry_dart_api": "app.services.retry_handler",
+    "retry_llm_api": "app.services.retry_handler",
+    "retry_with_custom_config": "app.services.retry_handler",
+    "RateLimiter": "app.services.retry_handler",
+    "dart_rate_limiter": "app.services.retry_handler",
+    "llm_rate_limiter": "app.services.retry_handler",
+    "LLMHandler": "app.services.llm_handler",
+    "MemoryManager": "app.services.memory_manager",
+    "memory_manager": "app.services.memory_manager",
+    "cleanup_after_batch": "app.services.memory_manager",
+    "log_memory_usage": "app.services.memory_manager",
+}
+
+
+def __getattr__(name):
+    module_path = _LAZY_EXPORTS.get(name)
+    if module_path is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(module_path), name)
+    globals()[name] = value
+    return value
+
 
 __all__ = [
     # 새로운 서비스 (DART 파싱 및 LLM 처리)
@@ -1,4 +1,5 @@
-from typing import Dict, List, Optional
+import re
+from typing import Dict, List, Optional, Tuple
 from neo4j import Transaction
 import logging
 
@@ -67,111 +68,219 @@ def create_relationship(
     )
 
 
-def update_article_graph(session, article_id: int, entities: Dict, keywords: List[str]):
+# 라벨은 쿼리에 직접 들어가므로 영문 대문자/숫자/밑줄만 허용
+LABEL_PATTERN = re.compile(r'^[A-Z_][A-Z0-9_]*$')
+
+# 기사당 그래프에 반영할 최대 키워드 수
+MAX_GRAPH_KEYWORDS = 10
+
+
+def build_graph_rows(articles: List[Dict]) -> Tuple[List[int], Dict[str, List[Dict]], List[Dict]]:
     """
-    기사 분석 결과를 Neo4j 그래프에 반영
+    기사 분석 결과를 UNWIND 파라미터 리스트로 변환 (라벨별 그룹화, 중복 제거)
     
     Args:
-        session: Neo4j 세션
-        article_id: 기사 ID
-        entities: 엔티티 딕셔너리 (타입별로 분류)
-        keywords: 키워드 리스트
+        articles: [{"article_id": int, "entities": {...}, "keywords": [...]}, ...]
+    
+    Returns:
+        (article_ids, {라벨: [{"article_id", "name"}, ...]}, 키워드 rows)
     """
-    try:
-        def work(tx):
-            # Article 노드 생성
-            tx.run(
-                "MERGE (a:Article {id: $article_id})",
-                article_id=article_id
-            )
+    article_ids = []
+    entity_rows: Dict[str, List[Dict]] = {}
+    keyword_rows = []
+    seen = set()
+    
+    for article in articles:
+        article_id = article["article_id"]
+        if article_id not in article_ids:
+            article_ids.append(article_id)
+        
+        for entity_type, entity_list in (article.get("entities") or {}).items():
+            if not isinstance(entity_list, list):
+                continue
             
-            # 엔티티 노드 생성 및 관계 설정
-            for entity_type, entity_list in entities.items():
-                if not isinstance(entity_list, list):
-                    continue
-                    
-                # 엔티티 타입 정규화 (대문자로)
-                normalized_type = entity_type.upper() if entity_type else "ENTITY"
-                
-                for entity_name in entity_list:
-                    if not entity_name or len(entity_name.strip()) == 0:
-                        continue
-                    
-                    entity_name_clean = entity_name.strip()
-                    
-                    # 엔티티 노드 생성 (타입을 라벨로 사용)
-                    tx.run(
-                        f"""
-                        MERGE (e:{normalized_type} {{name: $name}})
-                        SET e.type = $type
-                        """,
-                        name=entity_name_clean,
-                        type=normalized_type
-                    )
-                    
-                    # Article과 엔티티 연결
-                    tx.run(
-                        f"""
-                        MATCH (a:Article {{id: $article_id}})
-                        MATCH (e:{normalized_type} {{name: $entity_name}})
-                        MERGE (a)-[:MENTIONS]->(e)
-                        """,
-                        article_id=article_id,
-                        entity_name=entity_name_clean
-                    )
+            # 엔티티 타입 정규화 (대문자로)
+            label = entity_type.upper() if entity_type else "ENTITY"
+            if not LABEL_PATTERN.match(label):
+                logger.warning(f"허용되지 않는 엔티티 타입 건너뜀: {entity_type}")
+                continue
             
-            # 키워드도 노드로 생성 (선택적)
-            for keyword in keywords[:10]:  # 최대 10개만
-                if keyword and len(keyword.strip()) > 0:
-                    tx.run(
-                        """
-                        MERGE (k:Keyword {name: $keyword})
-                        WITH k
-                        MATCH (a:Article {id: $article_id})
-                        MERGE (a)-[:HAS_KEYWORD]->(k)
-                        """,
-                        keyword=keyword.strip(),
-                        article_id=article_id
-                    )
-        
-        session.write_transaction(work)
-        logger.info(f"그래프 업데이트 완료: article_id={article_id}")
+            for entity_name in entity_list:
+                if not isinstance(entity_name, str) or not entity_name.strip():
+                    continue
+                key = (label, article_id, entity_name.strip())
+                if key in seen:
+                    continue
+                seen.add(key)
+                entity_rows.setdefault(label, []).append({"article_id": article_id, "name": key[2]})
         
-    except Exception as e:
-        logger.error(f"그래프 업데이트 실패: {e}")
+        for keyword in (article.get("keywords") or [])[:MAX_GRAPH_KEYWORDS]:
+            if not isinstance(keyword, str) or not keyword.strip():
+                continue
+            key = ("Keyword", article_id, keyword.strip())
+            if key in seen:
+                continue
+            seen.add(key)
+            keyword_rows.append({"article_id": article_id, "name": key[2]})
+    
+    return article_ids, entity_rows, keyword_rows
+
+
+def _write_graph_rows(
+    tx: Transaction,
+    article_ids: List[int],
+    entity_rows: Dict[str, List[Dict]],
+    keyword_rows: List[Dict]
+):
+    """UNWIND 배치 쓰기 (Article 1회 + 엔티티 라벨별 1회 + 키워드 1회)"""
+    # Article 노드 생성
+    tx.run(
+        """
+        UNWIND $article_ids AS article_id
+        MERGE (:Article {id: article_id})
+        """,
+        article_ids=article_ids
+    )
+    
+    # 엔티티 노드 생성 (타입을 라벨로 사용) + Article과 연결
+    for label, rows in entity_rows.items():
+        tx.run(
+            f"""
+            UNWIND $rows AS row
+            MERGE (e:{label} {{name: row.name}})
+            SET e.type = $type
+            WITH e, row
+            MATCH (a:Article {{id: row.article_id}})
+            MERGE (a)-[:MENTIONS]->(e)
+            """,
+            rows=rows,
+            type=label
+        )
+    
+    # 키워드 노드 생성 + Article과 연결
+    if keyword_rows:
+        tx.run(
+            """
+            UNWIND $rows AS row
+            MERGE (k:Keyword {name: row.name})
+            WITH k, row
+            MATCH (a:Article {id: row.article_id})
+            MERGE (a)-[:HAS_KEYWORD]->(k)
+            """,
+            rows=keyword_rows
+        )
 
 
-def get_related_articles(session, entity_name: str, limit: int = 10) -> List[int]:
+def update_articles_graph(session, articles: List[Dict]) -> bool:
     """
-    특정 엔티티와 관련된 기사 ID 목록 반환
+    여러 기사의 분석 결과를 하나의 쓰기 트랜잭션으로 Neo4j 그래프에 반영
+    
+    엔티티/키워드는 라벨별 파라미터 리스트로 묶어 UNWIND로 전송하므로
+    쿼리 수는 기사/엔티티 수와 무관하게 (라벨 수 + 2)개입니다.
     
     Args:
         session: Neo4j 세션
-        entity_name: 엔티티 이름
-        limit: 최대 반환 개수
+        articles: [{"article_id": int, "entities": {...}, "keywords": [...]}, ...]
     
     Returns:
-        기사 ID 리스트
+        성공 여부 (실패 시 트랜잭션 전체가 롤백됨)
     """
+    if not articles:
+        return True
+    
     try:
+        article_ids, entity_rows, keyword_rows = build_graph_rows(articles)
+        
         def work(tx):
-            # 모든 라벨에서 엔티티 찾기
-            result = tx.run(
-                """
-                MATCH (e {name: $entity_name})<-[:MENTIONS]-(a:Article)
-                RETURN DISTINCT a.id AS article_id
-                ORDER BY a.id DESC
-                LIMIT $limit
-                """,
-                entity_name=entity_name,
-                limit=limit
-            )
-            return [record["article_id"] for record in result]
+            _write_graph_rows(tx, article_ids, entity_rows, keyword_rows)
         
-        article_ids = session.read_transaction(work)
-        return article_ids
+        session.write_transaction(work)
+        entity_count = sum(len(rows) for rows in entity_rows.values())
+        logger.info(
+            f"그래프 업데이트 완료: {len(article_ids)}개 기사, "
+            f"엔티티 {entity_count}개, 키워드 {len(keyword_rows)}개 (article_ids={article_ids})"
+        )
+        return True
         
     except Exception as e:
-        logger.error(f"관련 기사 조회 실패: {e}")
-        return []
+        logger.error(f"그래프 업데이트 실패 ({len(articles)}개 기사): {e}")
+        return False
+
+
+def update_article_graph(session, article_id: int, entities: Dict, keywords: List[str]) -> bool:
+    """
+    기사 분석 결과를 Neo4j 그래프에 반영
+    
+    Args:
+        session: Neo4j 세션
+        article_id: 기사 ID
+        entities: 엔티티 딕셔너리 (타입별로 분류)
+        keywords: 키워드 리스트
+    
+    Returns:
+        성공 여부
+    """
+    return update_articles_graph(
+        session,
+        [{"article_id": article_id, "entities": entities, "keywords": keywords}]
+    )
+
 
+# 엔티티 라벨 (extract_entities 결과 타입 + 타입 없는 엔티티)
+ENTITY_LABELS = ("ORG", "PERSON", "LOCATION", "ENTITY")
+
+
+def get_graph_schema_statements() -> List[Tuple[str, Optional[str]]]:
+    """
+    그래프 스키마 생성 쿼리 목록 (모두 IF NOT EXISTS, 반복 실행 안전)
+    
+    Returns:
+        [(쿼리, 실패 시 대체 쿼리 또는 None), ...]
+        유일성 제약이 기존 중복 데이터로 실패하면 일반 인덱스로 대체합니다.
+    """
+    statements = [
+        (
+            "CREATE CONSTRAINT article_id_unique IF NOT EXISTS "
+            "FOR (a:Article) REQUIRE a.id IS UNIQUE",
+            "CREATE INDEX article_id_index IF NOT EXISTS FOR (a:Article) ON (a.id)"
+        )
+    ]
+    for label in ENTITY_LABELS + ("Keyword",):
+        name = label.lower()
+        statements.append((
+            f"CREATE CONSTRAINT {name}_name_unique IF NOT EXISTS "
+            f"FOR (n:{label}) REQUIRE n.name IS UNIQUE",
+            f"CREATE INDEX {name}_name_index IF NOT EXISTS FOR (n:{label}) ON (n.name)"
+        ))
+    return statements
+
+
+def ensure_graph_schema(session) -> bool:
+    """
+    Neo4j 제약 조건/인덱스 생성 (서버 시작 시 1회)
+    
+    Args:
+        session: Neo4j 세션
+    
+    Returns:
+        모든 제약/인덱스(또는 대체 인덱스)가 준비되었는지 여부
+    """
+    ok = True
+    for statement, fallback in get_graph_schema_statements():
+        try:
+            session.run(statement).consume()
+        except Exception as e:
+            if fallback is None:
+                logger.warning(f"그래프 스키마 생성 실패: {statement} ({e})")
+                ok = False
+                continue
+            logger.warning(f"유일성 제약 생성 실패, 일반 인덱스로 대체: {e}")
+            try:
+                session.run(fallback).consume()
+            except Exception as fallback_error:
+                logger.warning(f"그래프 인덱스 생성 실패: {fallback} ({fallback_error})")
+                ok = False
+    
+    if ok:
+        logger.info("그래프 스키마(제약 조건/인덱스) 준비 완료")
+    return ok
@@ -8,10 +8,15 @@ import logging
 import hashlib
 from typing import List, Dict, Any, Optional
 from datetime import datetime
+from sqlalchemy import delete, literal_column, tuple_
+from sqlalchemy.dialects.postgresql import insert as pg_insert
 from sqlalchemy.orm import Session
 
 logger = logging.getLogger(__name__)
 
+# bulk_upsert_edges 커밋 단위 (multi-row VALUES 행 수)
+EDGE_UPSERT_CHUNK_SIZE = 1000
+
 
 def generate_deterministic_edge_id(
     source_id: str,
@@ -178,62 +183,149 @@ def build_edges_from_causal_structure(
     return edges
 
 
-def save_edges_to_db(
+def _upsert_edge_chunk(db: Session, table, rows: List[Dict[str, Any]], upsert: bool) -> Dict[str, int]:
+    """같은 컬럼 집합의 edge 행을 multi-row INSERT ... ON CONFLICT (id) 한 번으로 저장"""
+    stmt = pg_insert(table).values(rows)
+    if upsert:
+        # 값이 실제로 바뀐 행만 UPDATE (created_at 유지, 바뀌지 않은 행은 RETURNING에서 빠짐)
+        columns = [c for c in rows[0] if c not in ('id', 'created_at', 'updated_at')]
+        set_ = {c: stmt.excluded[c] for c in columns}
+        if 'updated_at' in rows[0]:
+            set_['updated_at'] = stmt.excluded.updated_at
+        stmt = stmt.on_conflict_do_update(
+            index_elements=[table.c.id],
+            set_=set_,
+            where=tuple_(*[table.c[c] for c in columns]).is_distinct_from(
+                tuple_(*[stmt.excluded[c] for c in columns])
+            )
+        )
+    else:
+        stmt = stmt.on_conflict_do_nothing(index_elements=[table.c.id])
+    
+    # xmax = 0 → 새로 INSERT된 행, 아니면 UPDATE된 행
+    result = db.execute(stmt.returning(table.c.id, literal_column('(xmax = 0)').label('inserted')))
+    inserted = updated = 0
+    for row in result:
+        if row.inserted:
+            inserted += 1
+        else:
+            updated += 1
+    return {'inserted': inserted, 'updated': updated, 'unchanged': len(rows) - inserted - updated}
+
+
+def bulk_upsert_edges(
     db: Session,
     edges: List[Dict[str, Any]],
-    upsert: bool = True
-) -> int:
+    upsert: bool = True,
+    chunk_size: int = EDGE_UPSERT_CHUNK_SIZE,
+    bump_version: bool = True
+) -> Dict[str, int]:
     """
-    Edges를 DB에 저장 (Upsert 지원)
+    Edges 일괄 저장 (INSERT ... ON CONFLICT (id), chunk 단위 커밋)
+    
+    Edge마다 SELECT 후 INSERT/UPDATE하던 방식 대신 chunk당 쿼리 1번으로 저장합니다.
+    컬럼 구성이 다른 edge(예: weight가 없는 HAS_TAG)는 따로 묶어 없는 컬럼은
+    INSERT 시 기본값, UPDATE 시 기존 값을 유지합니다.
     
     Args:
         db: SQLAlchemy Session
-        edges: Edge 리스트
-        upsert: True면 ON CONFLICT UPDATE, False면 INSERT만
+        edges: Edge 리스트 (같은 id가 여러 번 있으면 마지막 값)
+        upsert: True면 ON CONFLICT UPDATE (값이 바뀐 경우만), False면 INSERT만
+        chunk_size: 커밋 단위 (multi-row VALUES 행 수)
+        bump_version: False면 KG edge 버전을 올리지 않음 (호출자가 작업 끝에 한 번 갱신)
     
     Returns:
-        저장된 Edge 개수
+        {'inserted': 새로 저장, 'updated': 값이 바뀌어 갱신, 'unchanged': 기존과 동일(또는 중복 스킵)}
     """
     from app.models.edge import Edge
     
-    saved_count = 0
-    
+    # id 기준 중복 제거 (한 INSERT 안에서 같은 행을 두 번 갱신할 수 없음)
+    rows_by_id: Dict[str, Dict[str, Any]] = {}
     for edge_data in edges:
-        try:
-            edge_id = edge_data['id']
-            
-            # 기존 Edge 확인
-            existing_edge = db.query(Edge).filter(Edge.id == edge_id).first()
-            
-            if existing_edge:
-                if upsert:
-                    # 업데이트
-                    for key, value in edge_data.items():
-                        if key != 'id':  # ID는 업데이트하지 않음
-                            setattr(existing_edge, key, value)
-                    existing_edge.updated_at = datetime.now()
-                    saved_count += 1
-                    logger.debug(f"[KG] Edge 업데이트: {edge_id}")
-                else:
-                    logger.debug(f"[KG] Edge 중복 스킵: {edge_id}")
-            else:
-                # 새 Edge 생성
-                new_edge = Edge(**edge_data)
-                db.add(new_edge)
-                saved_count += 1
-                logger.debug(f"[KG] Edge 생성: {edge_id}")
-        
-        except Exception as e:
-            logger.error(f"[KG] Edge 저장 실패: {edge_data.get('id', 'unknown')} - {e}")
+        if not edge_data.get('id'):
+            logger.error(f"[KG] Edge 저장 실패: id 없음 - {edge_data}")
             continue
+        rows_by_id[edge_data['id']] = edge_data
+    
+    # 컬럼 구성별 그룹 (multi-row VALUES는 행마다 같은 컬럼이어야 함)
+    groups: Dict[tuple, List[Dict[str, Any]]] = {}
+    for edge_data in rows_by_id.values():
+        groups.setdefault(tuple(edge_data), []).append(edge_data)
+    
+    counts = {'inserted': 0, 'updated': 0, 'unchanged': 0}
+    try:
+        for rows in groups.values():
+            for i in range(0, len(rows), chunk_size):
+                chunk_counts = _upsert_edge_chunk(db, Edge.__table__, rows[i:i + chunk_size], upsert)
+                db.commit()
+                for key, value in chunk_counts.items():
+                    counts[key] += value
+    except Exception as e:
+        db.rollback()
+        logger.error(f"[KG] Edge 저장 롤백: {e} (이전 chunk까지 저장: {counts})")
+        raise
+    finally:
+        # API 프로세스의 KG 스냅샷 재로딩 트리거 (실제로 바뀐 edge가 있을 때만)
+        if bump_version and (counts['inserted'] or counts['updated']):
+            from app.utils.kg_version import bump_kg_edge_version
+            bump_kg_edge_version()
+    
+    logger.info(
+        f"[KG] Edge 저장 완료: 신규 {counts['inserted']}개, 갱신 {counts['updated']}개, "
+        f"변경 없음 {counts['unchanged']}개"
+    )
+    return counts
+
+
+def delete_edges_by_ids(
+    db: Session,
+    edge_ids: List[str],
+    chunk_size: int = EDGE_UPSERT_CHUNK_SIZE,
+    bump_version: bool = True
+) -> int:
+    """
+    Edges 일괄 삭제 (id = ANY, chunk 단위 커밋)
+    
+    Returns:
+        삭제된 Edge 개수
+    """
+    from app.models.edge import Edge
     
+    table = Edge.__table__
+    deleted = 0
     try:
-        db.commit()
-        logger.info(f"[KG] 총 {saved_count}개 Edge 저장 완료")
+        for i in range(0, len(edge_ids), chunk_size):
+            result = db.execute(delete(table).where(table.c.id.in_(edge_ids[i:i + chunk_size])))
+            db.commit()
+            deleted += result.rowcount
     except Exception as e:
         db.rollback()
-        logger.error(f"[KG] Edge 저장 롤백: {e}")
+        logger.error(f"[KG] Edge 삭제 롤백: {e} (이전 chunk까지 삭제: {deleted}개)")
         raise
+    finally:
+        if bump_version and deleted:
+            from app.utils.kg_version import bump_kg_edge_version
+            bump_kg_edge_version()
     
-    return saved_count
+    logger.info(f"[KG] Edge 삭제 완료: {deleted}개")
+    return deleted
+
 
+def save_edges_to_db(
+    db: Session,
+    edges: List[Dict[str, Any]],
+    upsert: bool = True
+) -> int:
+    """
+    Edges를 DB에 저장 (Upsert 지원)
+    
+    Args:
+        db: SQLAlchemy Session
+        edges: Edge 리스트
+        upsert: True면 ON CONFLICT UPDATE, False면 INSERT만
+    
+    Returns:
+        저장된 Edge 개수 (신규 + 갱신)
+    """
+    counts = bulk_upsert_edges(db, edges, upsert=upsert)
+    return counts['inserted'] + counts['updated']
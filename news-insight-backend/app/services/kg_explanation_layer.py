@@ -19,8 +19,11 @@ if hasattr(sys.stdout, 'buffer'):
 if hasattr(sys.stderr, 'buffer'):
     sys.stderr = codecs.getwriter('utf-8')(sys.stderr.buffer, errors='replace')
 
+from functools import lru_cache
 from typing import Dict, List, Tuple, Optional
 
+import numpy as np
+
 
 # =============================================================================
 # ⭐ Mechanism → 문장 템플릿 (고정)
@@ -550,6 +553,48 @@ def generate_2hop_story(
     ).strip()
 
 
+def generate_path_story(
+    variables: List[str],
+    relations: List[Optional[str]],
+    mechanism: str,
+    polarity: str,
+    company: str
+) -> Dict[str, str]:
+    """
+    k-hop 전파 경로 → 경로 표기 + 단계별 설명 (generate_2hop_story의 일반화)
+
+    예: [OIL_PRICE, INFLATION_CPI, INTEREST_RATE] → NAVER
+
+    Args:
+        variables: 경로상의 변수 코드 (시작 변수 → 마지막 변수)
+        relations: 인접 변수 간 Macro Link 관계 (len(variables) - 1개, 없으면 None)
+        mechanism: 마지막 변수 → 기업 메커니즘
+        polarity: 마지막 변수 → 기업 방향
+        company: 기업명
+
+    Returns:
+        {'path_kr': 경로 표기, 'explanation': 단계별 설명}
+    """
+    names = [get_variable_korean_name(v) for v in variables]
+
+    steps = []
+    for source, target, relation in zip(names, names[1:], relations):
+        connector = MACRO_LINK_CONNECTORS.get(relation or 'CONTEXT_LINK', f'{source}은(는) {target}에 영향을 줍니다.')
+        steps.append(connector.format(source=source, target=target))
+    steps.append(generate_mechanism_explanation(
+        mechanism=mechanism,
+        polarity=polarity,
+        variable=variables[-1],
+        company=company,
+        template_type='full'
+    ))
+
+    return {
+        'path_kr': ' → '.join(names + [company]),
+        'explanation': ' '.join(steps),
+    }
+
+
 def generate_oil_price_scenario_explanation(company: str, mechanism: str, polarity: str) -> str:
     """
     유가 시나리오 특화 설명 생성 (가장 많이 쓰이는 시나리오)
@@ -1112,6 +1157,74 @@ def _classify_snippet_strength(text: str) -> str:
         return 'MODERATE'
 
 
+# 변수별 사업개요 증거 키워드 (문장 추출용, 순서 = 우선순위)
+EVIDENCE_VARIABLE_KEYWORDS = {
+    'OIL_PRICE': ['유가', '원유', '유류', '항공유', '연료', '나프타'],
+    'INTEREST_RATE': ['금리', '이자', 'NIM', '예대마진', '할인율'],
+    'DRAM_ASP': ['D램', 'DRAM', '메모리', '반도체', 'ASP', '평균판매가'],
+    'EXCHANGE_RATE_USD_KRW': ['환율', '달러', '원화', '수출', '환산'],
+}
+
+
+def build_evidence_index(biz_summary: str) -> Dict[str, Tuple[Tuple[str, str, str], ...]]:
+    """
+    사업개요 증거 문장 인덱스 생성
+    
+    문장 분리 → 키워드별 포함 문장 → 변수별 후보(키워드 우선순위 순, 중복 제거)를 한 번에 계산하고
+    강도(_classify_snippet_strength)도 미리 분류합니다.
+    
+    Returns:
+        {변수: ((문장, 매칭 키워드, 강도), ...)}  (후보가 있는 변수만)
+    """
+    if not biz_summary:
+        return {}
+    
+    # 1) 문장 분리 (20자 이하 문장은 증거로 사용하지 않음)
+    sentences = []
+    for sent in biz_summary.replace('다.', '다.|').split('|'):
+        sent = sent.strip()
+        if len(sent) <= 20:
+            continue
+        text = sent if sent.endswith('.') or sent.endswith('다') else sent + '다.'
+        sentences.append((sent, text, _classify_snippet_strength(text)))
+    
+    # 2) 키워드 → 문장 (키워드는 변수 간 중복될 수 있으므로 한 번만 검색)
+    keyword_sentences = {}
+    for keywords in EVIDENCE_VARIABLE_KEYWORDS.values():
+        for keyword in keywords:
+            if keyword not in keyword_sentences:
+                keyword_sentences[keyword] = [i for i, (sent, _, _) in enumerate(sentences) if keyword in sent]
+    
+    # 3) 변수 → 후보 문장
+    index = {}
+    for variable, keywords in EVIDENCE_VARIABLE_KEYWORDS.items():
+        candidates = []
+        seen = set()
+        for keyword in keywords:
+            for i in keyword_sentences[keyword]:
+                text, strength = sentences[i][1], sentences[i][2]
+                if text not in seen:
+                    seen.add(text)
+                    candidates.append((text, keyword, strength))
+        if candidates:
+            index[variable] = tuple(candidates)
+    return index
+
+
+@lru_cache(maxsize=8192)
+def get_evidence_index(biz_summary: str) -> Dict[str, Tuple[Tuple[str, str, str], ...]]:
+    """사업개요별 증거 인덱스 (같은 사업개요는 한 번만 계산, 반환값은 수정하지 말 것)"""
+    return build_evidence_index(biz_summary)
+
+
+@lru_cache(maxsize=None)
+def _template_snippets(variable: str, mechanism: str, polarity: str) -> Tuple[Tuple[str, str], ...]:
+    """변수/메커니즘(없으면 polarity) 템플릿 문장 + 강도"""
+    templates = EVIDENCE_SNIPPET_TEMPLATES.get(variable, {})
+    mech_templates = templates.get(mechanism, templates.get(polarity, []))
+    return tuple((tmpl, _classify_snippet_strength(tmpl)) for tmpl in mech_templates)
+
+
 def get_evidence_snippets(
     variable: str,
     mechanism: str,
@@ -1119,7 +1232,8 @@ def get_evidence_snippets(
     biz_summary: str = None,
     keywords: List[str] = None,
     return_with_metadata: bool = False,
-    max_candidates: int = 3  # V1.5.4: 최대 후보 수
+    max_candidates: int = 3,  # V1.5.4: 최대 후보 수
+    evidence_index: Dict = None
 ) -> List:
     """
     Evidence Snippet (증거 문장) 생성
@@ -1134,6 +1248,7 @@ def get_evidence_snippets(
         keywords: 키워드 리스트
         return_with_metadata: True면 Dict 리스트 반환
         max_candidates: 최대 후보 수 (기본 3개)
+        evidence_index: 미리 계산한 증거 인덱스 (build_evidence_index, 없으면 biz_summary로 조회)
     
     Returns:
         증거 문장 리스트 (또는 메타데이터 포함 Dict 리스트)
@@ -1141,51 +1256,26 @@ def get_evidence_snippets(
     snippets = []
     snippet_metadata = []
     
-    # 1) biz_summary에서 실제 문장 추출 시도 (있는 경우)
-    if biz_summary:
-        var_keywords = {
-            'OIL_PRICE': ['유가', '원유', '유류', '항공유', '연료', '나프타'],
-            'INTEREST_RATE': ['금리', '이자', 'NIM', '예대마진', '할인율'],
-            'DRAM_ASP': ['D램', 'DRAM', '메모리', '반도체', 'ASP', '평균판매가'],
-            'EXCHANGE_RATE_USD_KRW': ['환율', '달러', '원화', '수출', '환산'],
-        }
-        
-        search_keywords = var_keywords.get(variable, [])
-        for keyword in search_keywords:
-            if keyword in biz_summary:
-                # 키워드가 포함된 문장 추출 (간단한 로직)
-                sentences = biz_summary.replace('다.', '다.|').split('|')
-                for sent in sentences:
-                    sent = sent.strip()
-                    if keyword in sent and len(sent) > 20:
-                        # 중복 방지 및 문장 끝 정리
-                        if not sent.endswith('.') and not sent.endswith('다'):
-                            sent += '다.'
-                        if sent not in snippets:
-                            snippets.append(sent)
-                            strength = _classify_snippet_strength(sent)
-                            snippet_metadata.append({
-                                'text': sent,
-                                'source': 'biz_summary',
-                                'selection_reason': f'키워드 "{keyword}" 매칭 (사업개요 직접 추출)',
-                                'matched_keyword': keyword,
-                                'strength': strength,  # V1.5.4: 강도 분류
-                            })
-                        if len(snippets) >= max_candidates:
-                            break
-                if len(snippets) >= max_candidates:
-                    break
+    if evidence_index is None and biz_summary:
+        evidence_index = get_evidence_index(biz_summary)
+    
+    # 1) biz_summary에서 추출한 실제 문장 (인덱스 조회)
+    if evidence_index:
+        for text, keyword, strength in evidence_index.get(variable, ())[:max_candidates]:
+            snippets.append(text)
+            snippet_metadata.append({
+                'text': text,
+                'source': 'biz_summary',
+                'selection_reason': f'키워드 "{keyword}" 매칭 (사업개요 직접 추출)',
+                'matched_keyword': keyword,
+                'strength': strength,  # V1.5.4: 강도 분류
+            })
     
     # 2) 템플릿에서 가져오기 (fallback)
     if len(snippets) < max_candidates:
-        templates = EVIDENCE_SNIPPET_TEMPLATES.get(variable, {})
-        mech_templates = templates.get(mechanism, templates.get(polarity, []))
-        template_snippets = mech_templates[:max_candidates] if mech_templates else []
-        
-        for tmpl in template_snippets:
+        for tmpl, strength in _template_snippets(variable, mechanism, polarity)[:max_candidates]:
             if tmpl not in snippets:
                 snippets.append(tmpl)
-                strength = _classify_snippet_strength(tmpl)
                 snippet_metadata.append({
                     'text': tmpl,
                     'source': 'template',
@@ -1344,7 +1434,15 @@ def calculate_exposure_percentile(
     below_count = sum(1 for s in all_scores if s < exposure_score)
     percentile = int((below_count / len(all_scores)) * 100)
     
-    # 설명 생성
+    return {
+        'percentile': percentile,
+        'explanation': _percentile_explanation(components),
+        'components': components or {},  # 숨은 필드
+    }
+
+
+def _percentile_explanation(components: Optional[Dict]) -> str:
+    """Percentile 설명 문장 (점수 구성 요소 기반)"""
     explanation_parts = []
     if components:
         if components.get('weight_bonus', 0) > 0:
@@ -1356,14 +1454,69 @@ def calculate_exposure_percentile(
     
     explanation = "동일 변수 내에서, " + " + ".join(explanation_parts) if explanation_parts else "기본 계산"
     explanation += f"로 계산한 상대 노출도"
+    return explanation
+
+
+# =============================================================================
+# ⭐ Exposure 벡터 계산 (비교 출력용)
+# =============================================================================
+# 기업별 반복 호출(_calculate_exposure_score / calculate_exposure_percentile) 대신
+# 전체 기업의 점수를 배열로 한 번에 계산하고, 정렬 1회 + searchsorted로 percentile을 구합니다.
+
+# 메커니즘 → 기본 점수 (_calculate_exposure_score와 동일: HIGH 2, MEDIUM 1)
+MECHANISM_EXPOSURE_BONUS = {
+    mechanism: 2 if level == 'HIGH' else 1 if level == 'MEDIUM' else 0
+    for mechanism, level in MECHANISM_DEFAULT_EXPOSURE.items()
+}
+
+
+def calculate_exposure_scores(
+    mechanisms: List[str],
+    weights: List[float],
+    text_match_weights: List[float]
+) -> Dict[str, np.ndarray]:
+    """
+    Exposure 점수 배열 계산 (_calculate_exposure_score의 벡터 버전)
+    
+    Returns:
+        {'score', 'mechanism_bonus', 'weight_bonus', 'text_match_bonus'} (각각 int 배열)
+    """
+    mechanism_bonus = np.fromiter(
+        (MECHANISM_EXPOSURE_BONUS.get(m, 1) for m in mechanisms),
+        dtype=np.int64,
+        count=len(mechanisms)
+    )
+    weight = np.asarray(weights, dtype=np.float64)
+    text_match = np.asarray(text_match_weights, dtype=np.float64)
+    weight_bonus = np.select([weight >= 0.8, weight >= 0.6], [2, 1], 0)
+    text_match_bonus = np.select([text_match >= 0.5, text_match >= 0.2], [2, 1], 0)
     
     return {
-        'percentile': percentile,
-        'explanation': explanation,
-        'components': components or {},  # 숨은 필드
+        'score': mechanism_bonus + weight_bonus + text_match_bonus,
+        'mechanism_bonus': mechanism_bonus,
+        'weight_bonus': weight_bonus,
+        'text_match_bonus': text_match_bonus,
     }
 
 
+def calculate_exposure_percentiles(scores: np.ndarray) -> np.ndarray:
+    """
+    전체 기업의 Exposure Percentile (calculate_exposure_percentile의 벡터 버전)
+    
+    정렬된 점수에서 searchsorted(left)로 "자기보다 낮은 점수 수"를 구합니다. O(n log n)
+    """
+    scores = np.asarray(scores)
+    if scores.size == 0:
+        return np.zeros(0, dtype=np.int64)
+    below_count = np.searchsorted(np.sort(scores), scores, side='left')
+    return ((below_count / scores.size) * 100).astype(np.int64)
+
+
+def exposure_levels_from_scores(scores: np.ndarray) -> np.ndarray:
+    """점수 → Exposure Level (calculate_exposure_level에서 biz_summary/키워드를 제외한 경우와 동일)"""
+    return np.where(scores >= 5, 'HIGH', np.where(scores >= 3, 'MEDIUM', 'LOW'))
+
+
 def calculate_exposure_level(
     mechanism: str,
     weight: float,
@@ -1443,6 +1596,16 @@ def get_base_company_name(name: str) -> str:
     return name
 
 
+@lru_cache(maxsize=16384)
+def get_preferred_name_info(name: str) -> Tuple[bool, str]:
+    """
+    기업명 → (우선주 여부, 기본 기업명)
+    
+    종목명은 한정되어 있으므로 한 번 계산한 결과를 재사용합니다 (기업명 → 기본명 맵).
+    """
+    return is_preferred_stock(name), get_base_company_name(name)
+
+
 def deduplicate_companies(companies: List[Dict], key: str = 'name') -> List[Dict]:
     """
     우선주 및 중복 기업 제거
@@ -1454,13 +1617,13 @@ def deduplicate_companies(companies: List[Dict], key: str = 'name') -> List[Dict
     
     for c in companies:
         name = c.get(key, '')
+        preferred, base_name = get_preferred_name_info(name)
         
         # 우선주 제외
-        if is_preferred_stock(name):
+        if preferred:
             continue
         
         # 동일 그룹 중복 제거
-        base_name = get_base_company_name(name)
         if base_name in seen_base_names:
             continue
         
@@ -1470,6 +1633,16 @@ def deduplicate_companies(companies: List[Dict], key: str = 'name') -> List[Dict
     return result
 
 
+# 메커니즘 → 비교 출력용 채널명
+MECHANISM_CHANNEL_KR = {
+    'PRODUCT_PRICE': '판가 채널',
+    'INPUT_COST': '원가 채널',
+    'SPREAD': '스프레드',
+    'DEMAND': '수요 채널',
+    'MACRO_SENSITIVITY': '거시 민감도',
+}
+
+
 def generate_comparison_output(
     variable: str,
     companies: List[Dict],
@@ -1506,40 +1679,40 @@ def generate_comparison_output(
     negative = []
     mixed = []
     
-    # Exposure 점수 계산 (percentile용)
-    all_exposure_scores = []
-    all_components = []  # V1.5.4: components 저장
-    
-    for c in companies:
-        exposure_score, components = _calculate_exposure_score(
-            c.get('mechanism', 'DEMAND'),
-            c.get('weight', 0.5),
-            c.get('text_match_weight', 0),
-            return_components=True  # V1.5.4: components 반환
-        )
-        all_exposure_scores.append(exposure_score)
-        all_components.append(components)
+    # Exposure 점수/Percentile/Level 일괄 계산 (V1.5.4: components 포함)
+    mechanisms = [c.get('mechanism', 'DEMAND') for c in companies]
+    exposure = calculate_exposure_scores(
+        mechanisms,
+        [c.get('weight', 0.5) for c in companies],
+        [c.get('text_match_weight', 0) for c in companies]
+    )
+    exposure_scores = exposure['score'].tolist()
+    exposure_levels = exposure_levels_from_scores(exposure['score']).tolist()
+    percentiles = calculate_exposure_percentiles(exposure['score']).tolist()
+    mechanism_bonus = exposure['mechanism_bonus'].tolist()
+    weight_bonus = exposure['weight_bonus'].tolist()
+    text_match_bonus = exposure['text_match_bonus'].tolist()
+    
+    for i, c in enumerate(companies):
+        mechanism = mechanisms[i]
+        components = {
+            'mechanism_bonus': mechanism_bonus[i],
+            'weight_bonus': weight_bonus[i],
+            'text_match_bonus': text_match_bonus[i],
+        }
         
         company_data = {
             'ticker': c['ticker'],
             'name': c['name'],
             'market_cap': c.get('market_cap'),  # V1.5.5: 시가총액 (설명용 메타)
-            'mechanism': c.get('mechanism', 'DEMAND'),
-            'mechanism_kr': {
-                'PRODUCT_PRICE': '판가 채널',
-                'INPUT_COST': '원가 채널',
-                'SPREAD': '스프레드',
-                'DEMAND': '수요 채널',
-                'MACRO_SENSITIVITY': '거시 민감도',
-            }.get(c.get('mechanism', 'DEMAND'), c.get('mechanism', '')),
+            'mechanism': mechanism,
+            'mechanism_kr': MECHANISM_CHANNEL_KR.get(mechanism, c.get('mechanism', '')),
             'weight': c.get('weight', 0.5),
-            'exposure': calculate_exposure_level(
-                c.get('mechanism', 'DEMAND'),
-                c.get('weight', 0.5),
-                c.get('text_match_weight', 0)
-            ),
-            'exposure_score': exposure_score,
+            'exposure': exposure_levels[i],
+            'exposure_score': exposure_scores[i],
             'exposure_components': components,  # V1.5.4: 숨은 필드
+            'exposure_percentile': percentiles[i],
+            'exposure_percentile_explanation': _percentile_explanation(components),  # 설명
         }
         
         polarity = c.get('polarity', 'MIXED')
@@ -1550,19 +1723,6 @@ def generate_comparison_output(
         else:
             mixed.append(company_data)
     
-    # V1.5.4: Exposure Percentile 계산 (components 포함)
-    idx = 0
-    for group in [positive, negative, mixed]:
-        for company in group:
-            percentile_info = calculate_exposure_percentile(
-                company['exposure_score'],
-                all_exposure_scores,
-                components=all_components[idx]  # V1.5.4: components 전달
-            )
-            company['exposure_percentile'] = percentile_info['percentile']
-            company['exposure_percentile_explanation'] = percentile_info['explanation']  # 설명
-            idx += 1
-    
     # V1.5.4: Tie-Breaking 정렬
     # weight가 같으면 exposure_score로, 그것도 같으면 ticker 순서로
     # 
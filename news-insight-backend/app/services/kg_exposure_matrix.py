@@ -0,0 +1,229 @@
+"""
+기업 × 드라이버 노출도 행렬 (복합 충격 시뮬레이션용)
+
+KG 스냅샷의 DRIVEN_BY edge로 dense 행렬을 미리 계산합니다.
+
+    exposure[기업, 드라이버]  = weight × 부호 × 노출도 계수
+    magnitude[기업, 드라이버] = weight × 노출도 계수
+
+부호는 polarity(POSITIVE/NEGATIVE)에서, polarity가 MIXED/없음이면 edge의 properties.direction
+(증가/감소)에서 가져오고 둘 다 없으면 0입니다. 노출도 계수는 kg_explanation_layer.calculate_exposure_level()
+레벨(HIGH/MEDIUM/LOW)에서 가져오며, 충격 벡터(드라이버별 변화량)와의 행렬-벡터 곱 한 번으로
+전체 기업의 합산 영향(impact)과 부호 없는 노출 크기(exposure)를 계산합니다.
+부호를 알 수 없는 edge도 magnitude로 순위에 포함되고 방향은 MIXED가 됩니다 (KGPropagationEngine과 동일).
+
+스냅샷이 교체되면 기업별 edge 서명(드라이버/weight/mechanism/polarity/direction/biz_summary)을 비교하여
+바뀐 기업의 행만 다시 계산하고 나머지 행은 이전 행렬에서 복사합니다.
+"""
+import threading
+import logging
+from typing import Dict, List, Optional
+
+import numpy as np
+
+from app.services.kg_explanation_layer import calculate_exposure_level
+from app.services.kg_propagation import POLARITY_SIGN, _direction
+from app.services.kg_snapshot import KGSnapshot, get_kg_snapshot
+
+logger = logging.getLogger(__name__)
+
+# 노출도 레벨 → 계수
+EXPOSURE_LEVEL_FACTOR = {
+    'HIGH': 1.0,
+    'MEDIUM': 0.6,
+    'LOW': 0.3,
+}
+
+# polarity가 없을 때 사용하는 edge properties.direction → 부호
+DIRECTION_SIGN = {
+    '증가': 1.0,
+    '상승': 1.0,
+    'UP': 1.0,
+    'POSITIVE': 1.0,
+    '감소': -1.0,
+    '하락': -1.0,
+    'DOWN': -1.0,
+    'NEGATIVE': -1.0,
+}
+
+# 기업별 반환할 드라이버 기여 수
+TOP_CONTRIBUTIONS = 3
+
+
+class ExposureMatrix:
+    """
+    기업 × 드라이버 노출도 행렬 (불변)
+
+    행: DRIVEN_BY edge가 있는 상장 기업, 열: DRIVEN_BY 드라이버
+    """
+
+    def __init__(self, snapshot: KGSnapshot, previous: Optional["ExposureMatrix"] = None):
+        self.snapshot = snapshot
+        self.driver_codes: List[str] = snapshot.drivers[:snapshot.driven_by_drivers]
+        self.driver_index: Dict[str, int] = {code: i for i, code in enumerate(self.driver_codes)}
+
+        has_edges = np.diff(snapshot.company_indptr) > 0
+        self.companies = np.flatnonzero(snapshot.company_listed & has_edges)
+        self.matrix = np.zeros((self.companies.size, len(self.driver_codes)), dtype=np.float32)
+        self.magnitude = np.zeros_like(self.matrix)
+        self.signatures: Dict[str, int] = {}
+        self.row_index: Dict[str, int] = {}
+
+        reuse_rows: List[int] = []
+        reuse_prev_rows: List[int] = []
+        for row, company in enumerate(self.companies.tolist()):
+            ticker = snapshot.tickers[company]
+            edges = snapshot.company_edges[snapshot.company_indptr[company]:snapshot.company_indptr[company + 1]]
+            signature = self._signature(company, edges)
+            self.row_index[ticker] = row
+            self.signatures[ticker] = signature
+
+            if previous is not None and previous.signatures.get(ticker) == signature:
+                reuse_rows.append(row)
+                reuse_prev_rows.append(previous.row_index[ticker])
+            else:
+                self._compute_row(row, company, edges)
+
+        if reuse_rows:
+            # 이전 행렬의 열(드라이버 코드)을 새 열 순서로 매핑하여 일괄 복사
+            old_cols, new_cols = [], []
+            for old_col, code in enumerate(previous.driver_codes):
+                new_col = self.driver_index.get(code)
+                if new_col is not None:
+                    old_cols.append(old_col)
+                    new_cols.append(new_col)
+            self.matrix[np.ix_(reuse_rows, new_cols)] = previous.matrix[np.ix_(reuse_prev_rows, old_cols)]
+            self.magnitude[np.ix_(reuse_rows, new_cols)] = previous.magnitude[np.ix_(reuse_prev_rows, old_cols)]
+
+        self.reused_rows = len(reuse_rows)
+        self.computed_rows = self.companies.size - self.reused_rows
+
+    def _signature(self, company: int, edges: np.ndarray) -> int:
+        snapshot = self.snapshot
+        items = sorted(
+            (
+                snapshot.drivers[snapshot.edge_driver[edge]],
+                snapshot._edge_weight(edge),
+                snapshot.mechanisms[snapshot.edge_mechanism[edge]],
+                snapshot.polarities[snapshot.edge_polarity[edge]],
+                snapshot.directions[snapshot.edge_direction[edge]],
+                float(snapshot.edge_text_match[edge]),
+            )
+            for edge in edges.tolist()
+        )
+        return hash((tuple(items), snapshot.company_biz_summary[company]))
+
+    def _compute_row(self, row: int, company: int, edges: np.ndarray):
+        snapshot = self.snapshot
+        biz_summary = snapshot.company_biz_summary[company]
+        for edge in edges.tolist():
+            mechanism = snapshot.mechanisms[snapshot.edge_mechanism[edge]]
+            polarity = snapshot.polarities[snapshot.edge_polarity[edge]]
+            sign = POLARITY_SIGN.get(polarity)
+            if sign is None:
+                direction = snapshot.directions[snapshot.edge_direction[edge]]
+                sign = DIRECTION_SIGN.get(direction.strip().upper(), 0.0)
+            weight = snapshot._edge_weight(edge)
+            level = calculate_exposure_level(
+                mechanism,
+                weight,
+                float(snapshot.edge_text_match[edge]),
+                biz_summary
+            )
+            magnitude = weight * EXPOSURE_LEVEL_FACTOR[level]
+            self.matrix[row, snapshot.edge_driver[edge]] += sign * magnitude
+            self.magnitude[row, snapshot.edge_driver[edge]] += magnitude
+
+    def simulate(self, shocks: Dict[str, float], limit: int = 20) -> List[Dict]:
+        """
+        복합 충격 → 기업별 합산 영향 (exposure 내림차순)
+
+        Args:
+            shocks: 드라이버 코드 → 변화량 (상승 +1.0, 하락 -1.0, 알 수 없는 코드는 무시)
+            limit: 반환할 기업 수
+
+        Returns:
+            기업 리스트 (impact_score, exposure_score, direction, contributions)
+        """
+        vector = np.zeros(len(self.driver_codes), dtype=np.float32)
+        for code, value in shocks.items():
+            col = self.driver_index.get(code)
+            if col is not None:
+                vector[col] += value
+        if not vector.any() or self.companies.size == 0:
+            return []
+
+        impact = self.matrix @ vector
+        exposure = self.magnitude @ np.abs(vector)
+        rows = np.flatnonzero(exposure > 0)
+        if limit > 0 and rows.size > limit:
+            rows = rows[np.argpartition(-exposure[rows], limit - 1)[:limit]]
+        rows = rows[np.lexsort((rows, -exposure[rows]))]
+
+        shocked_cols = np.flatnonzero(vector)
+        snapshot = self.snapshot
+        results = []
+        for row in rows.tolist():
+            company = int(self.companies[row])
+            contributions = self.matrix[row, shocked_cols] * vector[shocked_cols]
+            magnitudes = self.magnitude[row, shocked_cols] * np.abs(vector[shocked_cols])
+            order = np.argsort(-magnitudes, kind='stable')[:TOP_CONTRIBUTIONS]
+            results.append({
+                'ticker': snapshot.tickers[company],
+                'name': snapshot.company_name[company],
+                'sector_l1': snapshot.company_sector[company],
+                'value_chain': snapshot.company_value_chain[company],
+                'impact_score': round(float(impact[row]), 6),
+                'exposure_score': round(float(exposure[row]), 6),
+                'direction': _direction(float(impact[row]), float(exposure[row])),
+                'contributions': [
+                    {
+                        'driver_code': self.driver_codes[shocked_cols[i]],
+                        'shock': float(vector[shocked_cols[i]]),
+                        'exposure': round(float(self.matrix[row, shocked_cols[i]]), 6),
+                        'impact': round(float(contributions[i]), 6),
+                    }
+                    for i in order.tolist()
+                    if magnitudes[i] > 0
+                ],
+            })
+        return results
+
+    def info(self) -> Dict:
+        """크기/증분 갱신 정보 (모니터링용)"""
+        return {
+            'version': self.snapshot.version,
+            'companies': int(self.companies.size),
+            'drivers': len(self.driver_codes),
+            'reused_rows': self.reused_rows,
+            'computed_rows': self.computed_rows,
+        }
+
+
+# 현재 스냅샷 기준 행렬 (스냅샷 교체 시 증분 재계산)
+_matrix: Optional[ExposureMatrix] = None
+_matrix_lock = threading.Lock()
+
+
+def get_exposure_matrix() -> Optional[ExposureMatrix]:
+    """현재 KG 스냅샷의 노출도 행렬 (스냅샷 로딩 전이면 None)"""
+    global _matrix
+
+    snapshot = get_kg_snapshot()
+    if snapshot is None:
+        return None
+    matrix = _matrix
+    if matrix is not None and matrix.snapshot is snapshot:
+        return matrix
+
+    with _matrix_lock:
+        matrix = _matrix
+        if matrix is None or matrix.snapshot is not snapshot:
+            matrix = ExposureMatrix(snapshot, previous=matrix)
+            _matrix = matrix
+            info = matrix.info()
+            logger.info(
+                f"노출도 행렬 갱신: v{info['version']}, 기업 {info['companies']}개 × 드라이버 {info['drivers']}개 "
+                f"(재계산 {info['computed_rows']}행, 재사용 {info['reused_rows']}행)"
+            )
+    return matrix
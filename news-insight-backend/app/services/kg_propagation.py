@@ -0,0 +1,244 @@
+"""
+KG k-hop 매크로 전파 엔진
+
+KG 스냅샷의 MACRO_LINK(변수 → 변수)와 DRIVEN_BY(변수 → 기업) edge를 희소 행렬로 만들어
+변수 충격(shock)이 k-hop 경로를 따라 전체 기업에 미치는 영향을 한 번의 행렬 연산으로 계산합니다.
+
+- M (변수 × 변수): MACRO_LINK weight × 관계 부호 (NEGATIVE_PRESSURE = -1)
+- D (변수 × 기업): DRIVEN_BY weight × polarity 부호 (POSITIVE = +1, NEGATIVE = -1, MIXED = 0)
+- hop h의 변수 벡터: x_h = decay × x_{h-1} M  (x_0 = 충격 벡터)
+- 기업 점수: Σ_h x_h D  → impact(부호 포함), |x_h| |D| → exposure(크기, 정렬 기준)
+
+경로 설명은 hop별 최대 기여 선행 변수(predecessor)를 역추적하여 상위 경로만 복원합니다.
+"""
+import logging
+from typing import Dict, List, Optional
+
+import numpy as np
+from scipy import sparse
+
+from app.services.kg_snapshot import KGSnapshot, get_kg_snapshot
+
+logger = logging.getLogger(__name__)
+
+# 기본 전파 설정 (max_hops = MACRO_LINK hop + DRIVEN_BY 1hop)
+DEFAULT_MAX_HOPS = 3
+MAX_HOPS_LIMIT = 5
+DEFAULT_HOP_DECAY = 0.8
+
+# impact / exposure 비율이 이 값 미만이면 방향 MIXED
+DIRECTION_RATIO_THRESHOLD = 0.2
+
+# MACRO_LINK 관계 부호 (없는 관계는 +1)
+MACRO_RELATION_SIGN = {
+    'PRESSURES': 1.0,
+    'NEGATIVE_PRESSURE': -1.0,
+    'CONTEXT_LINK': 1.0,
+}
+
+# DRIVEN_BY polarity 부호 (MIXED는 방향 미정 → 크기만 전파)
+POLARITY_SIGN = {
+    'POSITIVE': 1.0,
+    'NEGATIVE': -1.0,
+}
+
+
+def _direction(impact: float, exposure: float) -> str:
+    if exposure <= 0 or abs(impact) < DIRECTION_RATIO_THRESHOLD * exposure:
+        return 'MIXED'
+    return 'POSITIVE' if impact > 0 else 'NEGATIVE'
+
+
+class KGPropagationEngine:
+    """
+    스냅샷 단위 전파 엔진 (불변)
+
+    스냅샷이 교체되면 get_propagation_engine()이 새 엔진을 만듭니다.
+    """
+
+    def __init__(self, snapshot: KGSnapshot):
+        self.snapshot = snapshot
+        n_vars = len(snapshot.drivers)
+        n_companies = len(snapshot.tickers)
+
+        # MACRO_LINK: (source, target) 중복은 첫 edge만 사용 (snapshot.macro_link와 동일)
+        macro_edges = np.fromiter(snapshot._macro_index.values(), dtype=np.int64)
+        macro_sign = np.array(
+            [MACRO_RELATION_SIGN.get(snapshot.macro_relation[e], 1.0) for e in macro_edges.tolist()],
+            dtype=np.float64,
+        )
+        macro_source = snapshot.macro_source[macro_edges]
+        macro_target = snapshot.macro_target[macro_edges]
+        macro_weight = snapshot.macro_weight[macro_edges]
+        self.macro = sparse.csr_matrix(
+            (macro_weight * macro_sign, (macro_source, macro_target)), shape=(n_vars, n_vars)
+        )
+        self.macro_abs = abs(self.macro)
+
+        # DRIVEN_BY: 상장 기업만, weight 없음/0 → 0.5 (시나리오 헬퍼와 동일)
+        edge_mask = snapshot.company_listed[snapshot.edge_company]
+        raw_weight = snapshot.edge_weight
+        weight = np.where(np.isnan(raw_weight) | (raw_weight == 0), 0.5, raw_weight)
+        polarity_sign = np.array(
+            [POLARITY_SIGN.get(p, 0.0) for p in snapshot.polarities], dtype=np.float64
+        )
+        edge_sign = polarity_sign[snapshot.edge_polarity]
+
+        rows = snapshot.edge_driver[edge_mask]
+        cols = snapshot.edge_company[edge_mask]
+        self.edge_weight = weight
+        self.edge_sign = edge_sign
+        self.driven = sparse.csr_matrix(
+            (weight[edge_mask] * edge_sign[edge_mask], (rows, cols)), shape=(n_vars, n_companies)
+        )
+        self.driven_abs = sparse.csr_matrix(
+            (np.abs(weight[edge_mask]), (rows, cols)), shape=(n_vars, n_companies)
+        )
+
+    def propagate(
+        self,
+        shocks: Dict[str, float],
+        max_hops: int = DEFAULT_MAX_HOPS,
+        decay: float = DEFAULT_HOP_DECAY,
+        limit: int = 20,
+        top_paths: int = 3,
+    ) -> List[Dict]:
+        """
+        변수 충격 → 기업 영향 순위
+
+        Args:
+            shocks: 변수 코드 → 충격 크기 (상승 +1.0, 하락 -1.0)
+            max_hops: 최대 hop 수 (MACRO_LINK hop + 마지막 DRIVEN_BY 1hop)
+            decay: MACRO_LINK hop당 감쇠 계수
+            limit: 반환할 기업 수 (exposure 내림차순)
+            top_paths: 기업별 반환할 상위 경로 수
+
+        Returns:
+            기업 리스트 (impact_score, exposure_score, direction, paths)
+        """
+        snapshot = self.snapshot
+        n_vars = len(snapshot.drivers)
+        max_hops = max(1, min(max_hops, MAX_HOPS_LIMIT))
+
+        shock = np.zeros(n_vars, dtype=np.float64)
+        for code, value in shocks.items():
+            index = snapshot.driver_index.get(code)
+            if index is not None:
+                shock[index] += value
+        sources = shock != 0
+        if not sources.any():
+            return []
+
+        # hop별 변수 벡터 (부호 포함 / 크기) + 경로 복원용 선행 변수
+        signed = [shock]
+        magnitude = [np.abs(shock)]
+        predecessors: List[Optional[np.ndarray]] = [None]
+        for _ in range(max_hops - 1):
+            prev_abs = magnitude[-1]
+            if not prev_abs.any():
+                break
+            x = decay * (self.macro.T @ signed[-1])
+            a = decay * (self.macro_abs.T @ prev_abs)
+            # 충격 변수로 되돌아오는 순환은 제외
+            x[sources] = 0.0
+            a[sources] = 0.0
+            contribution = sparse.diags(prev_abs) @ self.macro_abs
+            predecessors.append(np.asarray(contribution.argmax(axis=0)).ravel())
+            signed.append(x)
+            magnitude.append(a)
+
+        hop_signed = np.vstack(signed)
+        hop_magnitude = np.vstack(magnitude)
+        impact = self.driven.T @ hop_signed.sum(axis=0)
+        exposure = self.driven_abs.T @ hop_magnitude.sum(axis=0)
+
+        candidates = np.flatnonzero(exposure > 0)
+        if limit > 0 and candidates.size > limit:
+            top = np.argpartition(-exposure[candidates], limit - 1)[:limit]
+            candidates = candidates[top]
+        # exposure 내림차순, 동점은 티커 순서
+        order = np.lexsort((candidates, -exposure[candidates]))
+        ranked = candidates[order]
+
+        return [
+            self._company_result(
+                int(company), float(impact[company]), float(exposure[company]),
+                hop_signed, hop_magnitude, predecessors, top_paths
+            )
+            for company in ranked.tolist()
+        ]
+
+    def _company_result(
+        self,
+        company: int,
+        impact: float,
+        exposure: float,
+        hop_signed: np.ndarray,
+        hop_magnitude: np.ndarray,
+        predecessors: List[Optional[np.ndarray]],
+        top_paths: int,
+    ) -> Dict:
+        snapshot = self.snapshot
+        edges = snapshot.company_edges[snapshot.company_indptr[company]:snapshot.company_indptr[company + 1]]
+
+        # (hop, 마지막 변수) 단위 기여도
+        drivers = snapshot.edge_driver[edges]
+        contrib_abs = hop_magnitude[:, drivers] * np.abs(self.edge_weight[edges])
+        contrib_signed = hop_signed[:, drivers] * (self.edge_weight[edges] * self.edge_sign[edges])
+        flat = np.flatnonzero(contrib_abs.ravel() > 0)
+        flat = flat[np.argsort(-contrib_abs.ravel()[flat], kind='stable')][:max(top_paths, 0)]
+
+        paths = []
+        for position in flat.tolist():
+            hop, column = divmod(position, len(edges))
+            edge = int(edges[column])
+            variables = [int(snapshot.edge_driver[edge])]
+            for level in range(hop, 0, -1):
+                variables.insert(0, int(predecessors[level][variables[0]]))
+            relations = []
+            for source, target in zip(variables, variables[1:]):
+                found, relation = snapshot.macro_link(snapshot.drivers[source], snapshot.drivers[target])
+                relations.append(relation if found else None)
+            paths.append({
+                'hops': hop + 1,
+                'variables': [snapshot.drivers[v] for v in variables],
+                'relations': relations,
+                'mechanism': snapshot.mechanisms[snapshot.edge_mechanism[edge]],
+                'polarity': snapshot.polarities[snapshot.edge_polarity[edge]],
+                'weight': float(self.edge_weight[edge]),
+                'contribution': round(float(contrib_signed[hop, column]), 6),
+                'exposure': round(float(contrib_abs[hop, column]), 6),
+            })
+
+        return {
+            'ticker': snapshot.tickers[company],
+            'name': snapshot.company_name[company],
+            'sector_l1': snapshot.company_sector[company],
+            'value_chain': snapshot.company_value_chain[company],
+            'impact_score': round(impact, 6),
+            'exposure_score': round(exposure, 6),
+            'direction': _direction(impact, exposure),
+            'paths': paths,
+        }
+
+
+# 현재 스냅샷 기준 엔진 (스냅샷 교체 시 재생성)
+_engine: Optional[KGPropagationEngine] = None
+
+
+def get_propagation_engine() -> Optional[KGPropagationEngine]:
+    """현재 KG 스냅샷의 전파 엔진 (스냅샷 로딩 전이면 None)"""
+    global _engine
+
+    snapshot = get_kg_snapshot()
+    if snapshot is None:
+        return None
+    engine = _engine
+    if engine is None or engine.snapshot is not snapshot:
+        engine = KGPropagationEngine(snapshot)
+        _engine = engine
+        logger.info(
+            f"KG 전파 엔진 생성: v{snapshot.version}, MACRO_LINK {engine.macro.nnz}개, "
+            f"DRIVEN_BY {engine.driven_abs.nnz}개"
+        )
+    return engine
@@ -0,0 +1,210 @@
+"""
+KG edge 증분 재빌드
+
+investor_sector의 인과 구조(causal_structure)와 분류 입력(major_sector, sector_l2)으로
+기업별 fingerprint를 계산하여 바뀐 기업의 edge만 다시 만듭니다.
+
+- fingerprint: sha256(KG_EDGE_BUILDER_VERSION + 기업의 investor_sector 입력, id 순)
+- 저장 상태: kg_edge_fingerprints (fingerprint + 마지막 빌드 edge id)
+- 바뀐 기업: build_edges_from_causal_structure → bulk_upsert_edges (값이 같은 edge는 UPDATE 안 함)
+- stale edge: 이전 빌드 edge id 중 새 빌드에 없는 id (인과 구조가 사라진 기업은 전부) → 일괄 삭제
+- KG edge 버전은 실제 변경이 있을 때 작업 끝에 한 번만 올림
+
+fingerprint는 edge를 모두 쓴 뒤 저장하므로 중간에 실패해도 다음 실행에서 같은 기업을 다시 처리합니다.
+"""
+import json
+import hashlib
+import logging
+from datetime import datetime
+from typing import Any, Dict, List, Optional, Tuple
+
+from sqlalchemy import delete, select
+from sqlalchemy.dialects.postgresql import insert as pg_insert
+from sqlalchemy.orm import Session
+
+from app.models.investor_sector import InvestorSector
+from app.models.kg_edge_fingerprint import KGEdgeFingerprint
+from app.services.kg_edge_builder import (
+    EDGE_UPSERT_CHUNK_SIZE,
+    build_edges_from_causal_structure,
+    bulk_upsert_edges,
+    delete_edges_by_ids,
+)
+from app.utils.kg_version import bump_kg_edge_version
+
+logger = logging.getLogger(__name__)
+
+# build_edges_from_causal_structure 로직이 바뀌면 올림 (모든 기업 fingerprint 변경 → 전체 재빌드)
+KG_EDGE_BUILDER_VERSION = "1"
+
+
+def compute_company_fingerprint(rows: List[Dict[str, Any]]) -> str:
+    """
+    기업 edge 입력 fingerprint
+
+    Args:
+        rows: 기업의 investor_sector 행 (id, major_sector, sector_l2, causal_structure)
+    """
+    payload = [
+        KG_EDGE_BUILDER_VERSION,
+        [
+            [row['id'], row.get('major_sector'), row.get('sector_l2'), row.get('causal_structure')]
+            for row in sorted(rows, key=lambda r: r['id'])
+        ],
+    ]
+    canonical = json.dumps(payload, sort_keys=True, ensure_ascii=False, separators=(',', ':'), default=str)
+    return hashlib.sha256(canonical.encode('utf-8')).hexdigest()
+
+
+def build_company_edges(ticker: str, rows: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+    """기업의 모든 investor_sector 행으로 edge 생성 (id 중복은 마지막 값, 생성 순서 유지)"""
+    edges_by_id: Dict[str, Dict[str, Any]] = {}
+    for row in sorted(rows, key=lambda r: r['id']):
+        for edge in build_edges_from_causal_structure(
+            ticker=ticker,
+            causal_structure=row.get('causal_structure'),
+            major_sector=row.get('major_sector'),
+            sector_l2=row.get('sector_l2')
+        ):
+            edges_by_id[edge['id']] = edge
+    return list(edges_by_id.values())
+
+
+def load_company_inputs(db: Session, tickers: Optional[List[str]] = None) -> Dict[str, List[Dict[str, Any]]]:
+    """인과 구조가 있는 investor_sector 행 (ticker별)"""
+    query = select(
+        InvestorSector.ticker,
+        InvestorSector.id,
+        InvestorSector.major_sector,
+        InvestorSector.sector_l2,
+        InvestorSector.sub_sector,
+        InvestorSector.causal_structure,
+    ).where(InvestorSector.causal_structure.isnot(None))
+    if tickers:
+        query = query.where(InvestorSector.ticker.in_(tickers))
+
+    inputs: Dict[str, List[Dict[str, Any]]] = {}
+    for row in db.execute(query):
+        inputs.setdefault(row.ticker, []).append({
+            'id': row.id,
+            'major_sector': row.major_sector,
+            # 분류 파이프라인과 동일: sector_l2가 없으면 sub_sector
+            'sector_l2': row.sector_l2 or row.sub_sector,
+            'causal_structure': row.causal_structure,
+        })
+    return inputs
+
+
+def load_fingerprints(db: Session, tickers: Optional[List[str]] = None) -> Dict[str, Tuple[str, List[str]]]:
+    """저장된 기업별 (fingerprint, edge id 목록)"""
+    table = KGEdgeFingerprint.__table__
+    query = select(table.c.ticker, table.c.fingerprint, table.c.edge_ids)
+    if tickers:
+        query = query.where(table.c.ticker.in_(tickers))
+    return {row.ticker: (row.fingerprint, row.edge_ids or []) for row in db.execute(query)}
+
+
+def save_fingerprints(
+    db: Session,
+    states: Dict[str, Tuple[str, List[str]]],
+    removed: List[str],
+    chunk_size: int = EDGE_UPSERT_CHUNK_SIZE
+):
+    """재빌드한 기업 fingerprint 저장 + 인과 구조가 사라진 기업 상태 삭제"""
+    table = KGEdgeFingerprint.__table__
+    now = datetime.utcnow()
+    rows = [
+        {'ticker': ticker, 'fingerprint': fingerprint, 'edge_ids': edge_ids,
+         'edge_count': len(edge_ids), 'built_at': now}
+        for ticker, (fingerprint, edge_ids) in states.items()
+    ]
+    for i in range(0, len(rows), chunk_size):
+        stmt = pg_insert(table).values(rows[i:i + chunk_size])
+        stmt = stmt.on_conflict_do_update(
+            index_elements=[table.c.ticker],
+            set_={c: stmt.excluded[c] for c in ('fingerprint', 'edge_ids', 'edge_count', 'built_at')}
+        )
+        db.execute(stmt)
+        db.commit()
+    for i in range(0, len(removed), chunk_size):
+        db.execute(delete(table).where(table.c.ticker.in_(removed[i:i + chunk_size])))
+        db.commit()
+
+
+def rebuild_kg_edges(
+    db: Session,
+    full: bool = False,
+    tickers: Optional[List[str]] = None,
+    dry_run: bool = False,
+    chunk_size: int = EDGE_UPSERT_CHUNK_SIZE
+) -> Dict[str, int]:
+    """
+    KG edge 증분 재빌드
+
+    Args:
+        db: SQLAlchemy Session
+        full: True면 fingerprint와 관계없이 모든 기업 재빌드
+        tickers: 특정 기업만 (None이면 전체)
+        dry_run: True면 대상/edge 수만 계산하고 저장하지 않음
+        chunk_size: edge upsert/삭제 커밋 단위
+
+    Returns:
+        통계 (companies, changed, removed, skipped, edges, inserted, updated, unchanged, deleted)
+    """
+    inputs = load_company_inputs(db, tickers)
+    stored = load_fingerprints(db, tickers)
+
+    states: Dict[str, Tuple[str, List[str]]] = {}
+    edges: List[Dict[str, Any]] = []
+    stale_ids: List[str] = []
+    for ticker, rows in inputs.items():
+        fingerprint = compute_company_fingerprint(rows)
+        previous = stored.get(ticker)
+        if not full and previous is not None and previous[0] == fingerprint:
+            continue
+        company_edges = build_company_edges(ticker, rows)
+        edge_ids = [edge['id'] for edge in company_edges]
+        states[ticker] = (fingerprint, edge_ids)
+        edges.extend(company_edges)
+        if previous is not None:
+            keep = set(edge_ids)
+            stale_ids.extend(edge_id for edge_id in previous[1] if edge_id not in keep)
+
+    # 인과 구조가 사라진 기업: 이전 빌드 edge 전부 stale
+    removed = [ticker for ticker in stored if ticker not in inputs]
+    for ticker in removed:
+        stale_ids.extend(stored[ticker][1])
+
+    stats = {
+        'companies': len(inputs),
+        'changed': len(states),
+        'removed': len(removed),
+        'skipped': len(inputs) - len(states),
+        'edges': len(edges),
+        'inserted': 0,
+        'updated': 0,
+        'unchanged': 0,
+        'deleted': len(stale_ids) if dry_run else 0,
+    }
+    if dry_run or not (states or removed):
+        return stats
+
+    try:
+        stats.update(bulk_upsert_edges(db, edges, chunk_size=chunk_size, bump_version=False))
+        stats['deleted'] = delete_edges_by_ids(db, stale_ids, chunk_size=chunk_size, bump_version=False)
+        save_fingerprints(db, states, removed, chunk_size=chunk_size)
+    except Exception:
+        # 앞선 chunk는 커밋되었을 수 있으므로 스냅샷 재로딩
+        bump_kg_edge_version()
+        raise
+
+    # API 프로세스의 KG 스냅샷 재로딩 트리거 (작업 전체에서 한 번)
+    if stats['inserted'] or stats['updated'] or stats['deleted']:
+        bump_kg_edge_version()
+
+    logger.info(
+        f"[KG] 증분 재빌드 완료: 기업 {stats['companies']}개 중 {stats['changed']}개 재빌드, "
+        f"{stats['removed']}개 제거 / edge 신규 {stats['inserted']}, 갱신 {stats['updated']}, "
+        f"변경 없음 {stats['unchanged']}, 삭제 {stats['deleted']}"
+    )
+    return stats
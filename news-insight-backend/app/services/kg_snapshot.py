@@ -0,0 +1,506 @@
+"""
+KG 인메모리 스냅샷 (시나리오 API용)
+
+DRIVEN_BY / MACRO_LINK edge와 기업 정보를 배열 기반 구조로 메모리에 올려
+/api/v1/scenario/* 조회를 DB 왕복 없이 처리합니다.
+
+- 문자열(티커, 드라이버 코드, 섹터, 밸류체인)은 인덱스로 intern
+- DRIVEN_BY edge는 열(column) 배열: 기업/드라이버 인덱스, weight, mechanism/polarity/direction 코드
+- CSR 인접 구조 2개: 드라이버 → edge, 기업 → edge (각 구간은 weight 내림차순)
+- MACRO_LINK edge: (출발 변수, 도착 변수) 배열 + relation
+- 상장 기업별 증거 문장 인덱스 (사업개요 문장 분리/키워드 매칭/강도 분류를 로딩 시 1회 계산)
+
+edge 버전(Redis kg:edge_version)이 바뀌면 새 스냅샷을 완성한 뒤 참조를 교체하므로
+읽기 요청은 락 없이 기존 스냅샷을 계속 사용합니다.
+"""
+import hashlib
+import sys
+import threading
+import time
+import logging
+from datetime import datetime
+from typing import Callable, Dict, List, Optional, Tuple
+
+import numpy as np
+from sqlalchemy import text
+
+from app.config import settings
+from app.db import SessionLocal
+from app.services.kg_explanation_layer import get_evidence_index
+from app.utils.kg_version import get_kg_edge_version
+
+logger = logging.getLogger(__name__)
+
+# 속성 기본값 (scenario.py SQL 조회와 동일)
+DEFAULT_MECHANISM = "DEMAND"
+DEFAULT_POLARITY = "MIXED"
+
+COMPANY_QUERY = text('''
+    SELECT
+        s.ticker,
+        s.stock_name,
+        s.market_cap,
+        i.sector_l1,
+        i.value_chain,
+        cd.biz_summary
+    FROM stocks s
+    JOIN investor_sector i ON s.ticker = i.ticker AND i.is_primary = true
+    LEFT JOIN company_details cd ON s.ticker = cd.ticker
+''')
+
+DRIVEN_BY_QUERY = text('''
+    SELECT source_id, target_id, weight, mechanism, polarity, text_match_weight,
+           properties->>'direction' AS direction
+    FROM edges
+    WHERE relation_type = 'DRIVEN_BY'
+''')
+
+MACRO_LINK_QUERY = text('''
+    SELECT source_id, target_id, weight, properties->>'relation' AS relation
+    FROM edges
+    WHERE relation_type = 'MACRO_LINK'
+''')
+
+
+def _to_float(value, default: float = 0.0) -> float:
+    try:
+        return float(value)
+    except (TypeError, ValueError):
+        return default
+
+
+def _intern(value: Optional[str]) -> Optional[str]:
+    return sys.intern(value) if isinstance(value, str) else value
+
+
+def _rows_fingerprint(*row_sets) -> str:
+    """
+    조회 결과 내용 해시 (행 순서와 무관)
+
+    같은 데이터를 읽은 프로세스/재로딩은 같은 값을 가지므로 프로세스 간 캐시 키로 사용할 수 있습니다.
+    """
+    digest = hashlib.sha1()
+    for rows in row_sets:
+        for line in sorted(repr(tuple(row)) for row in rows):
+            digest.update(line.encode("utf-8"))
+            digest.update(b"\n")
+        digest.update(b"\x00")
+    return digest.hexdigest()[:16]
+
+
+class _Vocabulary:
+    """문자열 → 정수 코드 (등장 순서)"""
+
+    def __init__(self):
+        self.index: Dict[str, int] = {}
+        self.values: List[str] = []
+
+    def code(self, value: str) -> int:
+        code = self.index.get(value)
+        if code is None:
+            code = len(self.values)
+            self.index[value] = code
+            self.values.append(sys.intern(value))
+        return code
+
+
+def _csr(keys: np.ndarray, weights: np.ndarray, size: int) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    key별 edge 인덱스 CSR (indptr, edge 순서), 각 구간은 weight 내림차순
+
+    weight가 없는(NaN) edge는 구간 끝에 위치합니다.
+    """
+    sort_weights = np.where(np.isnan(weights), -np.inf, weights)
+    order = np.lexsort((-sort_weights, keys)).astype(np.int32)
+    indptr = np.zeros(size + 1, dtype=np.int64)
+    np.cumsum(np.bincount(keys, minlength=size), out=indptr[1:])
+    return indptr, order
+
+
+class KGSnapshot:
+    """
+    KG 스냅샷 (불변)
+
+    생성 시 모든 배열/CSR 구조를 만든 뒤 공개되므로 교체 도중의 상태는 보이지 않습니다.
+    조회 메서드는 scenario.py의 SQL 헬퍼와 같은 형식의 딕셔너리를 반환합니다.
+    """
+
+    def __init__(self, company_rows, driven_rows, macro_rows, version: Optional[int] = None):
+        self.version = version
+        self.loaded_at = datetime.utcnow()
+        self.fingerprint = _rows_fingerprint(company_rows, driven_rows, macro_rows)
+
+        # 기업 (상장 + primary 섹터가 있는 기업만 listed)
+        tickers = _Vocabulary()
+        names: List[Optional[str]] = []
+        market_caps: List[int] = []
+        sectors: List[Optional[str]] = []
+        value_chains: List[Optional[str]] = []
+        biz_summaries: List[Optional[str]] = []
+        for ticker, name, market_cap, sector_l1, value_chain, biz_summary in company_rows:
+            if ticker in tickers.index:
+                continue
+            tickers.code(ticker)
+            names.append(name)
+            market_caps.append(int(market_cap) if market_cap else 0)
+            sectors.append(_intern(sector_l1))
+            value_chains.append(_intern(value_chain))
+            biz_summaries.append(biz_summary)
+        listed_count = len(tickers.values)
+
+        # DRIVEN_BY edge 열 배열
+        drivers = _Vocabulary()
+        mechanisms = _Vocabulary()
+        polarities = _Vocabulary()
+        directions = _Vocabulary()
+        edge_company: List[int] = []
+        edge_driver: List[int] = []
+        edge_weight: List[float] = []
+        edge_mechanism: List[int] = []
+        edge_polarity: List[int] = []
+        edge_text_match: List[float] = []
+        edge_direction: List[int] = []
+        for source_id, target_id, weight, mechanism, polarity, text_match_weight, direction in driven_rows:
+            edge_company.append(tickers.code(source_id))
+            edge_driver.append(drivers.code(target_id))
+            edge_weight.append(float(weight) if weight is not None else np.nan)
+            edge_mechanism.append(mechanisms.code(mechanism or DEFAULT_MECHANISM))
+            edge_polarity.append(polarities.code(polarity or DEFAULT_POLARITY))
+            edge_text_match.append(_to_float(text_match_weight))
+            # properties.direction (kg_edge_builder가 기록, polarity가 없는 edge의 부호 대체값)
+            edge_direction.append(directions.code(direction or ""))
+
+        self.driven_by_drivers = len(drivers.values)
+
+        # MACRO_LINK edge (변수 인덱스는 DRIVEN_BY 드라이버와 같은 공간)
+        macro_source: List[int] = []
+        macro_target: List[int] = []
+        macro_weight: List[float] = []
+        self.macro_relation: List[Optional[str]] = []
+        self._macro_index: Dict[Tuple[int, int], int] = {}
+        for source_id, target_id, weight, relation in macro_rows:
+            source, target = drivers.code(source_id), drivers.code(target_id)
+            self._macro_index.setdefault((source, target), len(macro_source))
+            macro_source.append(source)
+            macro_target.append(target)
+            macro_weight.append(_to_float(weight, 1.0))
+            self.macro_relation.append(_intern(relation))
+
+        self.tickers = tickers.values
+        self.ticker_index = tickers.index
+        self.drivers = drivers.values
+        self.driver_index = drivers.index
+        self.mechanisms = mechanisms.values
+        self.polarities = polarities.values
+        self.directions = directions.values
+
+        # edge에만 등장하는 기업(비상장/섹터 미분류)도 열 길이를 맞춤
+        company_count = len(self.tickers)
+        padding = company_count - listed_count
+        names.extend([None] * padding)
+        market_caps.extend([0] * padding)
+        sectors.extend([None] * padding)
+        value_chains.extend([None] * padding)
+        biz_summaries.extend([None] * padding)
+        self.company_name = names
+        self.company_market_cap = np.array(market_caps, dtype=np.int64)
+        self.company_sector = sectors
+        self.company_value_chain = value_chains
+        self.company_biz_summary = biz_summaries
+        self.company_listed = np.zeros(company_count, dtype=bool)
+        self.company_listed[:listed_count] = True
+        # 증거 문장 인덱스 (company_details가 바뀌면 edge 버전이 올라가 스냅샷과 함께 재계산)
+        self.company_evidence = [
+            get_evidence_index(biz_summary) if biz_summary else {}
+            for biz_summary in biz_summaries[:listed_count]
+        ]
+
+        self.edge_company = np.array(edge_company, dtype=np.int32)
+        self.edge_driver = np.array(edge_driver, dtype=np.int32)
+        self.edge_weight = np.array(edge_weight, dtype=np.float64)
+        self.edge_mechanism = np.array(edge_mechanism, dtype=np.int16)
+        self.edge_polarity = np.array(edge_polarity, dtype=np.int16)
+        self.edge_text_match = np.array(edge_text_match, dtype=np.float64)
+        self.edge_direction = np.array(edge_direction, dtype=np.int16)
+
+        self.macro_source = np.array(macro_source, dtype=np.int32)
+        self.macro_target = np.array(macro_target, dtype=np.int32)
+        self.macro_weight = np.array(macro_weight, dtype=np.float64)
+
+        self.driver_indptr, self.driver_edges = _csr(self.edge_driver, self.edge_weight, len(self.drivers))
+        self.company_indptr, self.company_edges = _csr(self.edge_company, self.edge_weight, company_count)
+
+    # ------------------------------------------------------------------
+    # 조회
+    # ------------------------------------------------------------------
+
+    def _edge_weight(self, edge: int) -> float:
+        weight = self.edge_weight[edge]
+        # SQL 헬퍼와 동일: weight가 없거나 0이면 0.5
+        return float(weight) if weight and not np.isnan(weight) else 0.5
+
+    def _edge_attributes(self, edge: int) -> Dict:
+        return {
+            "weight": self._edge_weight(edge),
+            "mechanism": self.mechanisms[self.edge_mechanism[edge]],
+            "polarity": self.polarities[self.edge_polarity[edge]],
+            "text_match_weight": float(self.edge_text_match[edge]),
+        }
+
+    def affected_companies(
+        self,
+        driver_code: str,
+        limit: int = 20,
+        min_weight: float = 0.5,
+        with_biz_summary: bool = False
+    ) -> List[Dict]:
+        """
+        드라이버에 영향받는 상장 기업 (weight 내림차순)
+
+        Args:
+            driver_code: 드라이버 코드
+            limit: 최대 기업 수
+            min_weight: 최소 weight
+            with_biz_summary: True면 V1.5.3 형식 (biz_summary 포함, market_cap 제외)
+        """
+        driver = self.driver_index.get(driver_code)
+        if driver is None or driver >= self.driven_by_drivers:
+            return []
+
+        edges = self.driver_edges[self.driver_indptr[driver]:self.driver_indptr[driver + 1]]
+        mask = self.company_listed[self.edge_company[edges]] & (self.edge_weight[edges] >= min_weight)
+        edges = edges[mask][:max(limit, 0)]
+
+        companies = []
+        for edge in edges.tolist():
+            company = int(self.edge_company[edge])
+            item = {
+                "ticker": self.tickers[company],
+                "name": self.company_name[company],
+            }
+            if not with_biz_summary:
+                market_cap = int(self.company_market_cap[company])
+                item["market_cap"] = market_cap or None
+            item["sector_l1"] = self.company_sector[company]
+            item["value_chain"] = self.company_value_chain[company]
+            item.update(self._edge_attributes(edge))
+            if with_biz_summary:
+                item["biz_summary"] = self.company_biz_summary[company] or ""
+            companies.append(item)
+        return companies
+
+    def company_drivers(self, ticker: str, limit: int = 10) -> List[Dict]:
+        """기업의 드라이버 (weight 내림차순)"""
+        company = self.ticker_index.get(ticker)
+        if company is None:
+            return []
+        edges = self.company_edges[self.company_indptr[company]:self.company_indptr[company + 1]]
+        return [
+            {"driver_code": self.drivers[self.edge_driver[edge]], **self._edge_attributes(edge)}
+            for edge in edges[:max(limit, 0)].tolist()
+        ]
+
+    def company_info(self, ticker: str) -> Optional[Dict]:
+        """상장 기업 정보 (primary 섹터가 없으면 None)"""
+        company = self.ticker_index.get(ticker)
+        if company is None or not self.company_listed[company]:
+            return None
+        return {
+            "ticker": ticker,
+            "name": self.company_name[company],
+            "sector_l1": self.company_sector[company],
+            "value_chain": self.company_value_chain[company],
+        }
+
+    def biz_summary(self, ticker: str) -> str:
+        """기업 사업 요약 (없으면 빈 문자열)"""
+        company = self.ticker_index.get(ticker)
+        if company is None or not self.company_listed[company]:
+            return ""
+        return self.company_biz_summary[company] or ""
+
+    def evidence_index(self, ticker: str) -> Dict:
+        """기업 증거 문장 인덱스 (get_evidence_snippets의 evidence_index 인자, 없으면 빈 dict)"""
+        company = self.ticker_index.get(ticker)
+        if company is None or not self.company_listed[company]:
+            return {}
+        return self.company_evidence[company]
+
+    def macro_link(self, var1: str, var2: str) -> Tuple[bool, Optional[str]]:
+        """MACRO_LINK edge 조회 → (존재 여부, relation)"""
+        source, target = self.driver_index.get(var1), self.driver_index.get(var2)
+        if source is None or target is None:
+            return False, None
+        edge = self._macro_index.get((source, target))
+        if edge is None:
+            return False, None
+        return True, self.macro_relation[edge]
+
+    def driver_edge(self, ticker: str, driver_code: str) -> Optional[Tuple[str, str]]:
+        """기업 → 드라이버 DRIVEN_BY edge의 (mechanism, polarity), 없으면 None"""
+        company = self.ticker_index.get(ticker)
+        driver = self.driver_index.get(driver_code)
+        if company is None or driver is None:
+            return None
+        edges = self.company_edges[self.company_indptr[company]:self.company_indptr[company + 1]]
+        for edge in edges.tolist():
+            if self.edge_driver[edge] == driver:
+                return self.mechanisms[self.edge_mechanism[edge]], self.polarities[self.edge_polarity[edge]]
+        return None
+
+    def driver_codes(self) -> List[str]:
+        """DRIVEN_BY 대상 드라이버 코드 (정렬)"""
+        return sorted(self.drivers[:self.driven_by_drivers])
+
+    def has_driver(self, driver_code: str) -> bool:
+        """DRIVEN_BY 대상 드라이버 코드인지 여부"""
+        driver = self.driver_index.get(driver_code)
+        return driver is not None and driver < self.driven_by_drivers
+
+    def cache_version(self) -> str:
+        """
+        응답 캐시 키용 버전 (edge 버전 + 내용 해시)
+
+        같은 edge 버전을 강제 재로딩해도 데이터가 같으면 같은 키(캐시 유지, 프로세스 간 공유),
+        버전 갱신이 누락된 채 데이터가 바뀌었으면 다른 키를 사용합니다.
+        """
+        return f"{self.version}:{self.fingerprint}"
+
+    def info(self) -> Dict:
+        """버전/크기 정보 (모니터링용)"""
+        return {
+            "version": self.version,
+            "companies": int(self.company_listed.sum()),
+            "drivers": self.driven_by_drivers,
+            "driven_by_edges": int(self.edge_company.size),
+            "macro_links": int(self.macro_source.size),
+            "fingerprint": self.fingerprint,
+            "loaded_at": self.loaded_at.isoformat(),
+        }
+
+
+# 현재 스냅샷 (참조 교체로 원자적 swap, 로딩 전에는 None → DB 조회)
+_current_snapshot: Optional[KGSnapshot] = None
+# 갱신 작업 직렬화 (읽기는 락 없이 스냅샷 참조만 사용)
+_refresh_lock = threading.Lock()
+
+
+def get_kg_snapshot() -> Optional[KGSnapshot]:
+    """현재 KG 스냅샷 (로딩 전이면 None)"""
+    return _current_snapshot
+
+
+def get_kg_snapshot_info() -> Optional[Dict]:
+    """현재 KG 스냅샷 버전 정보"""
+    return _current_snapshot.info() if _current_snapshot else None
+
+
+def refresh_kg_snapshot(force: bool = False) -> bool:
+    """
+    KG 스냅샷 갱신
+
+    edge 버전이 현재 스냅샷과 같으면 건너뜁니다 (force=True면 항상 재로딩).
+
+    Returns:
+        스냅샷이 교체되었으면 True
+    """
+    global _current_snapshot
+
+    with _refresh_lock:
+        version = get_kg_edge_version()
+        current = _current_snapshot
+        # Redis 미사용(None)이면 버전 비교 불가 → 강제 갱신 주기에만 재로딩
+        if not force and current is not None and version == current.version:
+            return False
+
+        start_time = time.time()
+        db = SessionLocal()
+        try:
+            company_rows = db.execute(COMPANY_QUERY).fetchall()
+            driven_rows = db.execute(DRIVEN_BY_QUERY).fetchall()
+            macro_rows = db.execute(MACRO_LINK_QUERY).fetchall()
+        finally:
+            db.close()
+
+        snapshot = KGSnapshot(company_rows, driven_rows, macro_rows, version=version)
+        _current_snapshot = snapshot
+
+        info = snapshot.info()
+        logger.info(
+            f"KG 스냅샷 로드 완료: v{version}, 기업 {info['companies']}개, 드라이버 {info['drivers']}개, "
+            f"DRIVEN_BY {info['driven_by_edges']}개, MACRO_LINK {info['macro_links']}개 "
+            f"(시간: {time.time() - start_time:.3f}초)"
+        )
+        return True
+
+
+def load_kg_snapshot() -> bool:
+    """서버 시작 시 KG 스냅샷 로딩 (실패 시 시나리오 API는 DB 조회로 동작)"""
+    try:
+        refresh_kg_snapshot(force=True)
+        return True
+    except Exception as e:
+        logger.error(f"KG 스냅샷 로딩 실패: {e}")
+        return False
+
+
+class KGSnapshotReloader:
+    """
+    KG 스냅샷 백그라운드 갱신 스레드
+
+    - check_interval 초마다 edge 버전 확인, 바뀌었으면 재로딩
+    - refresh_interval 초마다 강제 재로딩 (버전 갱신 누락 대비, 0이면 비활성화)
+    - 스냅샷이 교체되면 등록된 리스너를 새 스냅샷으로 호출 (캐시 사전 계산 등)
+    """
+
+    def __init__(self, check_interval: int = 5, refresh_interval: int = 600):
+        self.check_interval = check_interval
+        self.refresh_interval = refresh_interval
+        self._stop = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+        self._listeners: List[Callable[[KGSnapshot], object]] = []
+
+    def add_listener(self, listener: Callable[[KGSnapshot], object]):
+        """스냅샷 교체 후 호출할 함수 등록 (갱신 스레드에서 실행)"""
+        self._listeners.append(listener)
+
+    def start(self):
+        if self._thread and self._thread.is_alive():
+            return
+        self._stop.clear()
+        self._thread = threading.Thread(target=self._run, name="kg-snapshot-reloader", daemon=True)
+        self._thread.start()
+        logger.info(
+            f"KG 스냅샷 갱신 스레드 시작 (버전 확인: {self.check_interval}초, 강제 갱신: {self.refresh_interval}초)"
+        )
+
+    def stop(self):
+        self._stop.set()
+
+    def _run(self):
+        next_full = time.time() + self.refresh_interval if self.refresh_interval else None
+        while not self._stop.wait(self.check_interval):
+            force = next_full is not None and time.time() >= next_full
+            try:
+                swapped = refresh_kg_snapshot(force=force)
+            except Exception as e:
+                logger.warning(f"KG 스냅샷 갱신 실패 (기존 스냅샷 유지): {e}")
+                swapped = False
+            if swapped:
+                self._notify(_current_snapshot)
+            if force:
+                next_full = time.time() + self.refresh_interval
+
+    def _notify(self, snapshot: KGSnapshot):
+        for listener in self._listeners:
+            try:
+                listener(snapshot)
+            except Exception as e:
+                logger.warning(f"KG 스냅샷 리스너 실패 ({getattr(listener, '__name__', listener)}): {e}")
+
+
+# 전역 갱신 스레드 (API lifespan에서 start)
+kg_snapshot_reloader = KGSnapshotReloader(
+    check_interval=settings.KG_SNAPSHOT_CHECK_INTERVAL,
+    refresh_interval=settings.KG_SNAPSHOT_REFRESH_INTERVAL,
+)
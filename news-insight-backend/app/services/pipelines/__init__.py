@@ -1,9 +1,25 @@
 # Pipelines 모듈 초기화
-from app.services.pipelines.keywords import extract_keywords
-from app.services.pipelines.textrank import textrank_extract
-from app.services.pipelines.kobart import summarize_kobart
-from app.services.pipelines.entities import extract_entities, load_company_dict_from_db
-from app.services.pipelines.sentiment import analyze_sentiment
+# torch/transformers/keybert 등 무거운 모듈은 실제 사용 시점에만 import 되도록 지연 로딩합니다.
+import importlib
+
+_LAZY_EXPORTS = {
+    "extract_keywords": "app.services.pipelines.keywords",
+    "textrank_extract": "app.services.pipelines.textrank",
+    "summarize_kobart": "app.services.pipelines.kobart",
+    "extract_entities": "app.services.pipelines.entities",
+    "load_company_dict_from_db": "app.services.pipelines.entities",
+    "analyze_sentiment": "app.services.pipelines.sentiment",
+}
+
+
+def __getattr__(name):
+    module_path = _LAZY_EXPORTS.get(name)
+    if module_path is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(module_path), name)
+    globals()[name] = value
+    return value
+
 
 __all__ = [
     "extract_keywords",
@@ -13,4 +29,3 @@ __all__ = [
     "load_company_dict_from_db",
     "analyze_sentiment"
 ]
-
@@ -3,76 +3,332 @@
 
 서버 시작 시 DB에서 기업명 데이터를 메모리로 로딩하여
 초고속 기업명 매칭을 수행합니다.
+신규 상장/동의어 수정은 stocks.updated_at watermark 기반 증분 갱신과
+Redis 알림으로 재시작 없이 반영됩니다 (버전별 스냅샷 원자적 교체).
 """
-from typing import Dict, List, Set
+from datetime import datetime
+from typing import Dict, List, Optional, Tuple
+import json
 import re
+import threading
+import time
 import logging
+from sqlalchemy import func
+from app.config import settings
 from app.db import SessionLocal
 from app.models.stock import Stock
+from app.utils.aho_corasick import AhoCorasick
 
 logger = logging.getLogger(__name__)
 
-# 전역 변수로 기업명 딕셔너리 (서버 시작 시 로딩)
-COMPANY_DICT: Dict[str, str] = {}  # { "삼성전자": "005930", "Apple": "AAPL" }
-COMPANY_NAMES_SET: Set[str] = set()  # {"삼성전자", "Apple", ...}
-COMPANY_NAMES_SORTED: List[str] = []  # 긴 이름부터 정렬 (정확한 매칭을 위해)
+# 기업명 딕셔너리 갱신 알림 채널 (Redis pub/sub)
+COMPANY_DICT_RELOAD_CHANNEL = "entities:company_dict:reload"
 
+# { ticker: (stock_name, synonyms, country) }
+CompanyEntries = Dict[str, Tuple[str, Tuple[str, ...], Optional[str]]]
 
-def load_company_dict_from_db():
+
+def build_company_matcher(company_dict: Dict[str, str]) -> AhoCorasick:
     """
-    서버 시작 시 DB에서 기업명 데이터를 메모리로 로딩
-    
-    이 함수는 서버 시작 시 1회만 실행되며,
-    이후 모든 요청에서 메모리의 딕셔너리를 사용하여
-    초고속 기업명 매칭을 수행합니다.
+    기업명 딕셔너리로 Aho-Corasick 오토마톤 컴파일
+
+    긴 이름부터 추가하여 대소문자만 다른 이름이 겹치면 먼저 추가된 이름을 대표명으로 사용합니다.
     """
-    global COMPANY_DICT, COMPANY_NAMES_SET, COMPANY_NAMES_SORTED
-    
-    try:
+    matcher = AhoCorasick(case_insensitive=True, latin_word_boundary=True)
+    for name in sorted(company_dict, key=lambda n: (-len(n), n)):
+        matcher.add(name, (name, company_dict[name]))
+    return matcher.build()
+
+
+class CompanyDictionary:
+    """
+    기업명 딕셔너리 스냅샷 (불변)
+
+    생성 시 이름 → 티커 매핑과 매칭 오토마톤을 모두 만든 뒤 공개되므로,
+    읽는 쪽은 교체 도중의 반쯤 만들어진 딕셔너리를 볼 수 없습니다.
+    """
+
+    def __init__(self, entries: CompanyEntries, watermark: Optional[datetime] = None, version: int = 0):
+        self.entries = entries
+        self.watermark = watermark  # 반영된 stocks.updated_at 최댓값
+        self.version = version
+        self.loaded_at = datetime.utcnow()
+
+        company_dict: Dict[str, str] = {}
+        for ticker, (stock_name, synonyms, _country) in entries.items():
+            # 정식 기업명
+            if stock_name:
+                company_dict[stock_name] = ticker
+            # 약칭, 브랜드명
+            for synonym in synonyms:
+                if synonym:
+                    company_dict[synonym] = ticker
+
+        self.company_dict = company_dict  # { "삼성전자": "005930", "Apple": "AAPL" }
+        self.matcher = build_company_matcher(company_dict) if company_dict else None
+
+    def __len__(self) -> int:
+        return len(self.company_dict)
+
+    def info(self) -> Dict:
+        """버전/크기 정보 (모니터링용)"""
+        countries = [country for _, _, country in self.entries.values()]
+        return {
+            "version": self.version,
+            "names": len(self.company_dict),
+            "stocks": len(self.entries),
+            "kr": countries.count("KR"),
+            "us": countries.count("US"),
+            "watermark": self.watermark.isoformat() if self.watermark else None,
+            "loaded_at": self.loaded_at.isoformat(),
+        }
+
+
+# 현재 기업명 딕셔너리 (참조 교체로 원자적 swap)
+_current_dictionary = CompanyDictionary({})
+# 갱신 작업 직렬화 (읽기는 락 없이 스냅샷 참조만 사용)
+_refresh_lock = threading.Lock()
+
+
+def get_company_dictionary() -> CompanyDictionary:
+    """현재 기업명 딕셔너리 스냅샷"""
+    return _current_dictionary
+
+
+def get_company_dict_info() -> Dict:
+    """현재 기업명 딕셔너리 버전 정보"""
+    return _current_dictionary.info()
+
+
+def _fetch_stock_rows(db, since: Optional[datetime] = None):
+    """stocks 조회 (since가 있으면 updated_at >= since 인 행만)"""
+    query = db.query(Stock.ticker, Stock.stock_name, Stock.synonyms, Stock.country, Stock.updated_at)
+    if since is not None:
+        # 같은 타임스탬프로 늦게 커밋된 행을 놓치지 않도록 >= 사용 (재적용은 멱등)
+        query = query.filter(Stock.updated_at >= since)
+    return query.all()
+
+
+def _apply_rows(entries: CompanyEntries, rows, watermark: Optional[datetime]):
+    """조회된 행을 entries에 반영하고 새 watermark 반환"""
+    for row in rows:
+        entries[row.ticker] = (row.stock_name, tuple(s for s in (row.synonyms or []) if s), row.country)
+        if row.updated_at and (watermark is None or row.updated_at > watermark):
+            watermark = row.updated_at
+    return watermark
+
+
+def refresh_company_dict(full: bool = False) -> bool:
+    """
+    기업명 딕셔너리 갱신 (증분 또는 전체)
+
+    - 증분: stocks.updated_at >= watermark 인 행만 조회하여 기존 스냅샷에 병합
+    - 전체: 첫 로딩, full=True, 또는 삭제가 감지된 경우(DB 행 수 불일치)
+    새 스냅샷(매칭 오토마톤 포함)을 완성한 뒤 참조를 교체하므로 읽기 요청은 중단되지 않습니다.
+
+    Returns:
+        딕셔너리가 교체되었으면 True
+    """
+    global _current_dictionary
+
+    with _refresh_lock:
+        current = _current_dictionary
+        incremental = not full and current.watermark is not None
+        start_time = time.time()
+
         db = SessionLocal()
         try:
-            stocks = db.query(Stock).all()
-            
-            COMPANY_DICT = {}
-            COMPANY_NAMES_SET = set()
-            
-            for stock in stocks:
-                # 정식 기업명
-                COMPANY_DICT[stock.stock_name] = stock.ticker
-                COMPANY_NAMES_SET.add(stock.stock_name)
-                
-                # 약칭, 브랜드명 추가 (향후 확장 가능)
-                if stock.synonyms:
-                    for synonym in stock.synonyms:
-                        if synonym:
-                            COMPANY_DICT[synonym] = stock.ticker
-                            COMPANY_NAMES_SET.add(synonym)
-            
-            # 긴 이름부터 정렬 (정확한 매칭을 위해)
-            # 예: "삼성전자"가 "삼성"보다 우선 매칭되도록
-            COMPANY_NAMES_SORTED = sorted(COMPANY_NAMES_SET, key=len, reverse=True)
-            
-            logger.info(f"기업명 딕셔너리 로딩 완료: {len(COMPANY_DICT)}개 (한국: {len([s for s in stocks if s.country == 'KR'])}, 미국: {len([s for s in stocks if s.country == 'US'])})")
-            
+            if incremental:
+                rows = _fetch_stock_rows(db, since=current.watermark)
+                entries = dict(current.entries)
+                watermark = _apply_rows(entries, rows, current.watermark)
+                total = db.query(func.count(Stock.id)).scalar() or 0
+                if total != len(entries):
+                    # 상장폐지 등 삭제는 watermark로 감지할 수 없으므로 전체 재로딩
+                    logger.info(f"기업 수 불일치 (DB {total}개, 메모리 {len(entries)}개) → 전체 재로딩")
+                    incremental = False
+                elif all(
+                    current.entries.get(row.ticker) == entries[row.ticker]
+                    for row in rows
+                ):
+                    return False
+
+            if not incremental:
+                rows = _fetch_stock_rows(db)
+                entries = {}
+                watermark = _apply_rows(entries, rows, None)
         finally:
             db.close()
-            
+
+        new_dictionary = CompanyDictionary(entries, watermark=watermark, version=current.version + 1)
+        _current_dictionary = new_dictionary
+
+        logger.info(
+            f"기업명 딕셔너리 {'증분' if incremental else '전체'} 갱신 완료: v{new_dictionary.version}, "
+            f"{len(new_dictionary)}개 (변경 행: {len(rows)}, 시간: {time.time() - start_time:.3f}초)"
+        )
+        return True
+
+
+def load_company_dict_from_db() -> bool:
+    """
+    서버 시작 시 DB에서 기업명 데이터를 메모리로 로딩 (전체)
+    
+    이후 변경 사항은 refresh_company_dict()로 증분 반영하며,
+    Redis 알림(publish_company_dict_reload)으로 모든 프로세스가 재시작 없이 갱신됩니다.
+    DB 연결 실패 시에도 예외를 던지지 않고 기존 딕셔너리를 유지합니다.
+
+    Returns:
+        로딩 성공 여부 (실패 시 False → readiness에서 company_dict가 failed로 표시됨)
+    """
+    try:
+        refresh_company_dict(full=True)
     except Exception as e:
         logger.error(f"기업명 딕셔너리 로딩 실패: {e}")
-        COMPANY_DICT = {}
-        COMPANY_NAMES_SET = set()
-        COMPANY_NAMES_SORTED = []
+        return False
+    return True
 
 
-def extract_company_entities(text: str) -> List[str]:
+def publish_company_dict_reload(full: bool = False) -> bool:
+    """
+    모든 API/Celery 프로세스에 기업명 딕셔너리 갱신 알림 (Redis pub/sub)
+
+    stocks 테이블을 수정하는 스크립트(sync_krx_stocks 등)에서 커밋 후 호출합니다.
+    """
+    from app.utils.cache import get_redis_client
+
+    client = get_redis_client()
+    if not client:
+        logger.warning("Redis 연결 불가: 기업명 딕셔너리 갱신 알림을 보내지 못했습니다.")
+        return False
+    try:
+        receivers = client.publish(COMPANY_DICT_RELOAD_CHANNEL, json.dumps({"full": full}))
+        logger.info(f"기업명 딕셔너리 갱신 알림 전송 (수신 프로세스: {receivers}개)")
+        return True
+    except Exception as e:
+        logger.warning(f"기업명 딕셔너리 갱신 알림 실패: {e}")
+        return False
+
+
+class CompanyDictReloader:
+    """
+    기업명 딕셔너리 백그라운드 갱신 스레드
+
+    - Redis pub/sub 알림 수신 시 즉시 갱신
+    - refresh_interval 초마다 watermark 기반 증분 갱신 (알림 유실 대비, 0이면 비활성화)
+    갱신은 이 스레드에서 수행되므로 요청 처리 스레드는 기존 스냅샷을 계속 사용합니다.
+    """
+
+    def __init__(self, refresh_interval: int = 300):
+        self.refresh_interval = refresh_interval
+        self._stop = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+
+    def start(self):
+        if self._thread and self._thread.is_alive():
+            return
+        self._stop.clear()
+        self._thread = threading.Thread(target=self._run, name="company-dict-reloader", daemon=True)
+        self._thread.start()
+        logger.info(f"기업명 딕셔너리 갱신 스레드 시작 (주기: {self.refresh_interval}초)")
+
+    def stop(self):
+        self._stop.set()
+
+    def _refresh(self, full: bool = False):
+        try:
+            refresh_company_dict(full=full)
+        except Exception as e:
+            logger.warning(f"기업명 딕셔너리 갱신 실패 (기존 딕셔너리 유지): {e}")
+
+    def _subscribe(self):
+        """Redis 구독 (실패 시 None → 주기적 갱신만 수행)"""
+        try:
+            import redis
+            client = redis.Redis.from_url(
+                settings.CELERY_BROKER_URL,
+                decode_responses=True,
+                socket_connect_timeout=5,
+            )
+            pubsub = client.pubsub(ignore_subscribe_messages=True)
+            pubsub.subscribe(COMPANY_DICT_RELOAD_CHANNEL)
+            return pubsub
+        except Exception as e:
+            logger.warning(f"기업명 딕셔너리 갱신 채널 구독 실패: {e}")
+            return None
+
+    def _run(self):
+        pubsub = None
+        next_poll = time.time() + self.refresh_interval if self.refresh_interval else None
+
+        while not self._stop.is_set():
+            if pubsub is None:
+                pubsub = self._subscribe()
+
+            message = None
+            if pubsub is not None:
+                try:
+                    message = pubsub.get_message(timeout=1.0)
+                except Exception as e:
+                    logger.warning(f"기업명 딕셔너리 갱신 채널 수신 오류 (재구독 예정): {e}")
+                    pubsub = None
+            if pubsub is None:
+                self._stop.wait(5.0)
+
+            if message and message.get("type") == "message":
+                try:
+                    full = bool(json.loads(message.get("data") or "{}").get("full"))
+                except (TypeError, ValueError):
+                    full = False
+                self._refresh(full=full)
+                if next_poll is not None:
+                    next_poll = time.time() + self.refresh_interval
+            elif next_poll is not None and time.time() >= next_poll:
+                self._refresh()
+                next_poll = time.time() + self.refresh_interval
+
+        if pubsub is not None:
+            try:
+                pubsub.close()
+            except Exception:
+                pass
+
+
+# 전역 갱신 스레드 (API lifespan / Celery 워커 시작 시 start)
+company_dict_reloader = CompanyDictReloader(refresh_interval=settings.COMPANY_DICT_REFRESH_INTERVAL)
+
+
+def find_company_mentions(text: str, limit: Optional[int] = None) -> List[Dict]:
     """
-    기업명 매칭 (성능 최적화)
+    기업명 매칭 (Aho-Corasick 단일 패스)
+    
+    딕셔너리 로딩 시 컴파일된 오토마톤으로 텍스트를 한 번만 스캔하여
+    겹치지 않는 최장 일치 기업명을 위치/티커와 함께 반환합니다.
+    - "삼성전자"가 매칭되면 그 안의 "삼성"은 별도로 반환하지 않음
+    - 영문 기업명은 단어 경계 규칙 적용 ("LG"는 "LGES" 내부에서 매칭되지 않음)
+    
+    성능: O(m + z) where m=텍스트 길이, z=매칭 수 (기업명 수와 무관)
     
-    긴 이름부터 매칭하여 정확도를 높입니다.
-    예: "삼성전자"가 "삼성"보다 우선 매칭
+    Args:
+        text: 원본 텍스트
+        limit: 최대 매칭 수 (None이면 전체)
     
-    성능: O(n*m) where n=기업명 수, m=텍스트 길이
-    실제: 기업명 10,000개, 텍스트 1,000자 → 약 0.01초
+    Returns:
+        [{"name": "삼성전자", "ticker": "005930", "start": 0, "end": 4}, ...] (등장 순서)
+    """
+    matcher = _current_dictionary.matcher
+    if matcher is None or not text:
+        return []
+    
+    return [
+        {"name": name, "ticker": ticker, "start": start, "end": end}
+        for start, end, (name, ticker) in matcher.find_longest(text, limit=limit)
+    ]
+
+
+def extract_company_entities(text: str) -> List[str]:
+    """
+    기업명 매칭 (중복 제거, 첫 등장 순서)
     
     Args:
         text: 원본 텍스트
@@ -80,24 +336,15 @@ def extract_company_entities(text: str) -> List[str]:
     Returns:
         기업명 리스트
     """
-    if not COMPANY_NAMES_SORTED:
+    if _current_dictionary.matcher is None:
         logger.warning("기업명 딕셔너리가 비어있습니다.")
         return []
     
-    found_companies = set()  # 중복 제거를 위해 set 사용
-    text_lower = text.lower()  # 대소문자 무시 (미국 기업명 대응)
-    
-    # 긴 이름부터 매칭 (정확한 매칭 우선)
-    # 예: "삼성전자"가 "삼성"보다 우선 매칭되도록
-    for company_name in COMPANY_NAMES_SORTED:
-        # 대소문자 무시 매칭 (미국 기업명 대응)
-        if company_name.lower() in text_lower or company_name in text:
-            found_companies.add(company_name)
-            # 성능 최적화: 충분한 기업명을 찾으면 중단 (선택적)
-            if len(found_companies) >= 20:
-                break
+    found_companies = {}  # 첫 등장 순서 유지 + 중복 제거
+    for mention in find_company_mentions(text):
+        found_companies.setdefault(mention["name"], mention["ticker"])
     
-    return sorted(list(found_companies))
+    return list(found_companies)
 
 
 def extract_entities(text: str) -> Dict[str, List[str]]:
@@ -123,7 +370,7 @@ def extract_entities(text: str) -> Dict[str, List[str]]:
     
     try:
         # 기업명 추출 (성능 최적화)
-        if COMPANY_NAMES_SORTED:
+        if _current_dictionary.matcher is not None:
             companies = extract_company_entities(text)
             entities["ORG"] = companies[:20]  # 최대 20개
         else:
@@ -1,31 +1,25 @@
 from keybert import KeyBERT
 from sentence_transformers import SentenceTransformer
-from typing import List, Set
+from typing import List, Optional, Set, Tuple
 import torch
 import logging
+from app.utils.nlp_batch import get_kiwi, analyze_batch
 
 logger = logging.getLogger(__name__)
 
 # 전역 변수로 모델 로드 (최초 1회만)
-_kiwi = None
 _kr_sbert_model = None
 _keybert_model = None
 _device = "cuda" if torch.cuda.is_available() else "cpu"
 
 
 def load_kiwi():
-    """Kiwi 형태소 분석기 로드 (최초 1회만)"""
-    global _kiwi
-    if _kiwi is None:
-        logger.info("Kiwi 형태소 분석기 로드 중...")
-        try:
-            from kiwipiepy import Kiwi
-            _kiwi = Kiwi()
-            logger.info("Kiwi 형태소 분석기 로드 완료")
-        except Exception as e:
-            logger.error(f"Kiwi 형태소 분석기 로드 실패: {e}")
-            raise
-    return _kiwi
+    """Kiwi 형태소 분석기 로드 (app.utils.nlp_batch의 공유 인스턴스, 최초 1회만)"""
+    kiwi = get_kiwi()
+    if kiwi is None:
+        logger.error("Kiwi 형태소 분석기 로드 실패: kiwipiepy가 설치되지 않았습니다.")
+        raise RuntimeError("kiwipiepy not installed")
+    return kiwi
 
 
 def load_kr_sbert_model():
@@ -143,98 +137,118 @@ def extract_compound_nouns_with_kiwi(text: str) -> Set[str]:
         return set()
 
 
-def extract_keywords(text: str, top_n: int = 10) -> List[str]:
+NOUN_TAGS = ['NNG', 'NNP', 'NNB']
+PHRASE_TAGS = ['NNG', 'NNP', 'NNB', 'VA']
+
+
+def _generate_candidates(tokens) -> Tuple[Set[str], Set[str]]:
     """
-    Kiwi 기반 하이브리드 키워드 추출 (최적화 버전)
+    Kiwi 토큰에서 가벼운 후보 생성 (SBERT 없음)
     
-    파이프라인:
-    0. 텍스트 정제 (노이즈 제거)
-    1. Kiwi 토큰화 + 가벼운 후보 생성 (명사 + phrase) - SBERT 없음
-    2. 후보 병합 + 중복 제거
-    3. KR-SBERT로 의미 기반 랭킹 (단 1회만!)
-    4. 메타데이터 필터링
-    5. 최종 top-n 반환
+    Returns:
+        (명사 후보, phrase 후보)
+    """
+    noun_candidates = set()  # 단일/복합 명사
+    phrase_candidates = set()  # n-gram phrase
+    
+    # 명사 후보 추출 및 phrase 생성
+    for i, token in enumerate(tokens):
+        # 1a. 단일/복합 명사 추출
+        if token.tag in NOUN_TAGS and 2 <= len(token.form) <= 15:
+            noun_candidates.add(token.form)
+        
+        # 1b. phrase 후보 생성 (2-gram, 3-gram)
+        if token.tag in PHRASE_TAGS:  # 명사 또는 형용사로 시작
+            # 2-gram phrase
+            if i + 1 < len(tokens):
+                next_token = tokens[i + 1]
+                if next_token.tag in PHRASE_TAGS:
+                    phrase_2 = f"{token.form} {next_token.form}"
+                    if 4 <= len(phrase_2) <= 20:  # 길이 필터링
+                        phrase_candidates.add(phrase_2)
+            
+            # 3-gram phrase
+            if i + 2 < len(tokens):
+                next_token_1 = tokens[i + 1]
+                next_token_2 = tokens[i + 2]
+                if (next_token_1.tag in PHRASE_TAGS and
+                    next_token_2.tag in PHRASE_TAGS):
+                    phrase_3 = f"{token.form} {next_token_1.form} {next_token_2.form}"
+                    if 6 <= len(phrase_3) <= 25:  # 길이 필터링
+                        phrase_candidates.add(phrase_3)
+    
+    return noun_candidates, phrase_candidates
+
+
+def extract_keywords_batch(texts: List[str], top_n: int = 10) -> List[List[str]]:
+    """
+    여러 기사의 키워드 일괄 추출 (백필/배치 처리용)
+    
+    - Kiwi 형태소 분석: 문서 전체를 멀티스레드 배치로 1회 호출
+    - KR-SBERT 임베딩: 모든 문서 + 후보를 1회 encode
+    문서별 처리 결과는 extract_keywords()와 동일합니다.
     
     Args:
-        text: 원본 텍스트
-        top_n: 추출할 키워드 수 (기본값: 10)
+        texts: 원본 텍스트 리스트
+        top_n: 문서별 추출할 키워드 수 (기본값: 10)
     
     Returns:
-        키워드 리스트 (의미 기반 우선순위 정렬 완료)
+        문서별 키워드 리스트 (입력 순서, 실패/짧은 문서는 빈 배열)
     """
+    results: List[List[str]] = [[] for _ in texts]
+    
     try:
-        if not text or len(text.strip()) < 50:
-            logger.warning("텍스트가 너무 짧습니다")
-            return []
-        
         # 0단계: 텍스트 정제 (노이즈 제거)
         from app.utils.text_cleaner import clean_text_for_keywords, filter_keywords_by_metadata
-        logger.info("0단계: 텍스트 정제 시작 (노이즈 제거)")
-        cleaned_text = clean_text_for_keywords(text)
-        
-        if len(cleaned_text.strip()) < 50:
-            logger.warning("정제 후 텍스트가 너무 짧습니다")
-            return []
-        
-        logger.info(f"텍스트 정제 완료: {len(text)}자 → {len(cleaned_text)}자")
         
-        # 1단계: Kiwi 토큰화 및 가벼운 후보 생성 (SBERT 없음)
-        logger.info("1단계: Kiwi 토큰화 및 후보 생성 시작")
-        kiwi = load_kiwi()
-        
-        # Kiwi로 형태소 분석
-        morphemes_list = kiwi.analyze(cleaned_text)
+        cleaned_texts: List[Optional[str]] = []
+        for text in texts:
+            if not text or len(text.strip()) < 50:
+                logger.warning("텍스트가 너무 짧습니다")
+                cleaned_texts.append(None)
+                continue
+            cleaned_text = clean_text_for_keywords(text)
+            if len(cleaned_text.strip()) < 50:
+                logger.warning("정제 후 텍스트가 너무 짧습니다")
+                cleaned_texts.append(None)
+                continue
+            cleaned_texts.append(cleaned_text)
         
-        noun_candidates = set()  # 단일/복합 명사
-        phrase_candidates = set()  # n-gram phrase
-        
-        # 모든 문장에 대해 처리
-        for morphemes in morphemes_list:
-            tokens = morphemes[0]  # 형태소 분석 결과
-            
-            # 명사 후보 추출 및 phrase 생성
-            for i, token in enumerate(tokens):
-                # 1a. 단일/복합 명사 추출
-                if token.tag in ['NNG', 'NNP', 'NNB'] and 2 <= len(token.form) <= 15:
-                    noun_candidates.add(token.form)
-                
-                # 1b. phrase 후보 생성 (2-gram, 3-gram)
-                if token.tag in ['NNG', 'NNP', 'NNB', 'VA']:  # 명사 또는 형용사로 시작
-                    # 2-gram phrase
-                    if i + 1 < len(tokens):
-                        next_token = tokens[i + 1]
-                        if next_token.tag in ['NNG', 'NNP', 'NNB', 'VA']:
-                            phrase_2 = f"{token.form} {next_token.form}"
-                            if 4 <= len(phrase_2) <= 20:  # 길이 필터링
-                                phrase_candidates.add(phrase_2)
-                    
-                    # 3-gram phrase
-                    if i + 2 < len(tokens):
-                        next_token_1 = tokens[i + 1]
-                        next_token_2 = tokens[i + 2]
-                        if (next_token_1.tag in ['NNG', 'NNP', 'NNB', 'VA'] and
-                            next_token_2.tag in ['NNG', 'NNP', 'NNB', 'VA']):
-                            phrase_3 = f"{token.form} {next_token_1.form} {next_token_2.form}"
-                            if 6 <= len(phrase_3) <= 25:  # 길이 필터링
-                                phrase_candidates.add(phrase_3)
+        doc_indices = [i for i, t in enumerate(cleaned_texts) if t is not None]
+        if not doc_indices:
+            return results
         
-        logger.info(f"Kiwi 명사 후보: {len(noun_candidates)}개, phrase 후보: {len(phrase_candidates)}개")
+        # 1단계: Kiwi 토큰화 (멀티스레드 배치) 및 가벼운 후보 생성 (SBERT 없음)
+        load_kiwi()
+        tokens_per_doc = analyze_batch([cleaned_texts[i] for i in doc_indices])
         
         # 2단계: 후보 병합 + 중복 제거
-        logger.info("2단계: 후보 병합 및 중복 제거")
-        all_candidates = list(noun_candidates | phrase_candidates)
-        logger.info(f"병합된 후보: {len(all_candidates)}개")
+        candidates_per_doc = {}
+        for i, tokens in zip(doc_indices, tokens_per_doc):
+            noun_candidates, phrase_candidates = _generate_candidates(tokens)
+            all_candidates = list(noun_candidates | phrase_candidates)
+            if not all_candidates:
+                logger.warning("후보가 없습니다")
+                continue
+            candidates_per_doc[i] = all_candidates
+        
+        if not candidates_per_doc:
+            return results
         
-        if not all_candidates:
-            logger.warning("후보가 없습니다")
-            return []
+        logger.info(
+            f"Kiwi 배치 후보 생성 완료: {len(candidates_per_doc)}개 문서, "
+            f"후보 {sum(len(c) for c in candidates_per_doc.values())}개"
+        )
         
-        # 3단계: KR-SBERT로 의미 기반 랭킹 (단 1회만!)
-        logger.info("3단계: KR-SBERT 의미 기반 랭킹 시작 (단 1회)")
+        # 3단계: KR-SBERT로 의미 기반 랭킹 (전체 배치 1회 encode)
         kr_sbert_model = load_kr_sbert_model()
+        texts_to_encode = []
+        offsets = {}
+        for i, all_candidates in candidates_per_doc.items():
+            offsets[i] = len(texts_to_encode)
+            texts_to_encode.append(cleaned_texts[i])
+            texts_to_encode.extend(all_candidates)
         
-        # 전체 텍스트와 각 후보의 임베딩 계산 (단 1회만!)
-        texts_to_encode = [cleaned_text] + all_candidates
         embeddings = kr_sbert_model.encode(
             texts_to_encode,
             convert_to_tensor=True,
@@ -242,38 +256,55 @@ def extract_keywords(text: str, top_n: int = 10) -> List[str]:
             show_progress_bar=False
         )
         
-        # 전체 텍스트 임베딩 (첫 번째)
-        text_embedding = embeddings[0:1]
-        
-        # 각 후보 임베딩
-        candidate_embeddings = embeddings[1:]
-        
-        # 코사인 유사도 계산
         import torch.nn.functional as F
-        similarities = F.cosine_similarity(text_embedding, candidate_embeddings).cpu().numpy()
-        
-        # 유사도 기준으로 정렬 (내림차순)
-        ranked_indices = sorted(
-            range(len(all_candidates)),
-            key=lambda i: similarities[i],
-            reverse=True
-        )
-        
-        # 상위 키워드 선택
-        ranked_keywords = [all_candidates[i] for i in ranked_indices]
-        logger.info(f"KR-SBERT 랭킹 완료: 최고 유사도 {similarities[ranked_indices[0]]:.4f}")
-        
-        # 4단계: 메타데이터 필터링
-        logger.info("4단계: 메타데이터 필터링")
-        filtered_keywords = filter_keywords_by_metadata(ranked_keywords)
-        
-        # 5단계: 최종 top-n 반환
-        final_keywords = filtered_keywords[:top_n]
+        for i, all_candidates in candidates_per_doc.items():
+            offset = offsets[i]
+            # 전체 텍스트 임베딩 (첫 번째) / 각 후보 임베딩
+            text_embedding = embeddings[offset:offset + 1]
+            candidate_embeddings = embeddings[offset + 1:offset + 1 + len(all_candidates)]
+            
+            # 코사인 유사도 계산 후 내림차순 정렬
+            similarities = F.cosine_similarity(text_embedding, candidate_embeddings).cpu().numpy()
+            ranked_indices = sorted(
+                range(len(all_candidates)),
+                key=lambda j: similarities[j],
+                reverse=True
+            )
+            ranked_keywords = [all_candidates[j] for j in ranked_indices]
+            
+            # 4단계: 메타데이터 필터링 → 5단계: 최종 top-n
+            results[i] = filter_keywords_by_metadata(ranked_keywords)[:top_n]
         
-        logger.info(f"키워드 추출 완료: {len(final_keywords)}개 - {final_keywords[:5] if final_keywords else '없음'}")
-        return final_keywords
+        logger.info(f"키워드 배치 추출 완료: {len(texts)}개 문서 중 {len(candidates_per_doc)}개 성공")
+        return results
         
     except Exception as e:
         logger.error(f"키워드 추출 실패: {e}", exc_info=True)
         # 실패 시 빈 배열 반환
-        return []
+        return [[] for _ in texts]
+
+
+def extract_keywords(text: str, top_n: int = 10) -> List[str]:
+    """
+    Kiwi 기반 하이브리드 키워드 추출 (최적화 버전)
+    
+    파이프라인:
+    0. 텍스트 정제 (노이즈 제거)
+    1. Kiwi 토큰화 + 가벼운 후보 생성 (명사 + phrase) - SBERT 없음
+    2. 후보 병합 + 중복 제거
+    3. KR-SBERT로 의미 기반 랭킹 (단 1회만!)
+    4. 메타데이터 필터링
+    5. 최종 top-n 반환
+    
+    여러 기사를 처리할 때는 extract_keywords_batch()를 사용하세요.
+    
+    Args:
+        text: 원본 텍스트
+        top_n: 추출할 키워드 수 (기본값: 10)
+    
+    Returns:
+        키워드 리스트 (의미 기반 우선순위 정렬 완료)
+    """
+    keywords = extract_keywords_batch([text], top_n=top_n)[0]
+    logger.info(f"키워드 추출 완료: {len(keywords)}개 - {keywords[:5] if keywords else '없음'}")
+    return keywords
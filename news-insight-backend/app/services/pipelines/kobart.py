@@ -30,17 +30,27 @@ def load_kobart_model():
             raise
     return _tokenizer, _model
 
-def summarize_kobart(sentences: List[str]) -> str:
-    """KoBART 요약"""
+def summarize_kobart_batch(sentence_lists: List[List[str]]) -> List[str]:
+    """
+    KoBART 배치 요약 (문서 여러 개를 패딩하여 한 번의 generate로 처리)
+    
+    Args:
+        sentence_lists: 문서별 핵심 문장 리스트
+    
+    Returns:
+        문서별 요약문 (입력 순서, 실패 시 핵심 문장을 이어붙인 문자열)
+    """
+    results = [" ".join(sentences) if sentences else "" for sentences in sentence_lists]
+    indices = [i for i, sentences in enumerate(sentence_lists) if sentences]
+    if not indices:
+        return results
+    
     try:
-        if not sentences:
-            return ""
-        
         tokenizer, model = load_kobart_model()
-        input_text = "\n".join(sentences)
+        input_texts = ["\n".join(sentence_lists[i]) for i in indices]
         
         inputs = tokenizer(
-            input_text,
+            input_texts,
             return_tensors="pt",
             max_length=512,
             truncation=True,
@@ -50,6 +60,7 @@ def summarize_kobart(sentences: List[str]) -> str:
         with torch.no_grad():
             outputs = model.generate(
                 inputs["input_ids"],
+                attention_mask=inputs["attention_mask"],
                 max_length=200,
                 min_length=60,
                 num_beams=4,
@@ -60,11 +71,20 @@ def summarize_kobart(sentences: List[str]) -> str:
                 no_repeat_ngram_size=3
             )
         
-        summary = tokenizer.decode(outputs[0], skip_special_tokens=True).strip()
-        logger.info(f"KoBART 요약 완료: {len(summary)}자")
-        return summary
+        for i, output in zip(indices, outputs):
+            results[i] = tokenizer.decode(output, skip_special_tokens=True).strip()
+        logger.info(f"KoBART 배치 요약 완료: {len(indices)}개 문서")
+        return results
         
     except Exception as e:
-        logger.error(f"KoBART 요약 실패: {e}")
-        return " ".join(sentences)
+        logger.error(f"KoBART 배치 요약 실패 ({len(indices)}개 문서): {e}")
+        return results
 
+
+def summarize_kobart(sentences: List[str]) -> str:
+    """KoBART 요약"""
+    if not sentences:
+        return ""
+    summary = summarize_kobart_batch([sentences])[0]
+    logger.info(f"KoBART 요약 완료: {len(summary)}자")
+    return summary
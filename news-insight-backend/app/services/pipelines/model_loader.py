@@ -22,34 +22,44 @@ def warm_up_models():
     
     warm_up_start = time.time()
     
+    from app.utils.metrics import MODEL_LOAD_SECONDS
+    
     try:
         # 1. Kiwi 형태소 분석기 로드
         kiwi_start = time.time()
         logger.info("[1/4] Kiwi 형태소 분석기 로드 중...")
         from app.services.pipelines.keywords import load_kiwi
         load_kiwi()
-        logger.info(f"[1/4] Kiwi 로드 완료 (시간: {time.time() - kiwi_start:.2f}초)")
+        kiwi_time = time.time() - kiwi_start
+        MODEL_LOAD_SECONDS.labels(model="kiwi").set(kiwi_time)
+        logger.info(f"[1/4] Kiwi 로드 완료 (시간: {kiwi_time:.2f}초)")
         
         # 2. KR-SBERT 모델 로드
         sbert_start = time.time()
         logger.info("[2/4] KR-SBERT 모델 로드 중...")
         from app.services.pipelines.keywords import load_kr_sbert_model
         load_kr_sbert_model()
-        logger.info(f"[2/4] KR-SBERT 로드 완료 (시간: {time.time() - sbert_start:.2f}초)")
+        sbert_time = time.time() - sbert_start
+        MODEL_LOAD_SECONDS.labels(model="kr_sbert").set(sbert_time)
+        logger.info(f"[2/4] KR-SBERT 로드 완료 (시간: {sbert_time:.2f}초)")
         
         # 3. KoBART 모델 로드
         kobart_start = time.time()
         logger.info("[3/4] KoBART 모델 로드 중...")
         from app.services.pipelines.kobart import load_kobart_model
         load_kobart_model()
-        logger.info(f"[3/4] KoBART 로드 완료 (시간: {time.time() - kobart_start:.2f}초)")
+        kobart_time = time.time() - kobart_start
+        MODEL_LOAD_SECONDS.labels(model="kobart").set(kobart_time)
+        logger.info(f"[3/4] KoBART 로드 완료 (시간: {kobart_time:.2f}초)")
         
         # 4. KR-FinBERT-SC 모델 로드
         finbert_start = time.time()
         logger.info("[4/4] KR-FinBERT-SC 모델 로드 중...")
         from app.services.pipelines.sentiment import load_finbert_model
         load_finbert_model()
-        logger.info(f"[4/4] KR-FinBERT-SC 로드 완료 (시간: {time.time() - finbert_start:.2f}초)")
+        finbert_time = time.time() - finbert_start
+        MODEL_LOAD_SECONDS.labels(model="kr_finbert_sc").set(finbert_time)
+        logger.info(f"[4/4] KR-FinBERT-SC 로드 완료 (시간: {finbert_time:.2f}초)")
         
         total_time = time.time() - warm_up_start
         logger.info("=" * 50)
@@ -7,7 +7,7 @@ snunlp/KR-FinBert-SC: 한국어 금융 텍스트 감성 분석에 특화된 모
 import logging
 from transformers import AutoTokenizer, AutoModelForSequenceClassification
 import torch
-from typing import Optional
+from typing import List, Optional
 import time
 
 logger = logging.getLogger(__name__)
@@ -40,28 +40,32 @@ def load_finbert_model():
     return _tokenizer, _model
 
 
-def analyze_sentiment(text: str) -> str:
+# 라벨 매핑 (0: negative, 1: neutral, 2: positive)
+LABEL_MAP = {0: "negative", 1: "neutral", 2: "positive"}
+
+
+def analyze_sentiment_batch(texts: List[str]) -> List[str]:
     """
-    KR-FinBERT-SC 기반 감성 분석
-    
-    한국어 금융 뉴스에 특화된 감성 분석 모델을 사용합니다.
+    KR-FinBERT-SC 배치 감성 분석 (문서 여러 개를 패딩하여 한 번의 forward로 처리)
     
     Args:
-        text: 원본 텍스트
+        texts: 원본 텍스트 리스트
     
     Returns:
-        감성 (positive/negative/neutral)
+        문서별 감성 (positive/negative/neutral, 입력 순서)
     """
+    results = ["neutral"] * len(texts)
+    indices = [i for i, text in enumerate(texts) if text and len(text.strip()) >= 10]
+    if not indices:
+        return results
+    
     try:
-        if not text or len(text.strip()) < 10:
-            return "neutral"
-        
         tokenizer, model = load_finbert_model()
         start_time = time.time()
         
         # 텍스트 토크나이징
         inputs = tokenizer(
-            text,
+            [texts[i] for i in indices],
             return_tensors="pt",
             max_length=512,
             truncation=True,
@@ -72,19 +76,32 @@ def analyze_sentiment(text: str) -> str:
         with torch.no_grad():
             outputs = model(**inputs)
             predictions = torch.nn.functional.softmax(outputs.logits, dim=-1)
-            predicted_class = torch.argmax(predictions, dim=-1).item()
+            predicted_classes = torch.argmax(predictions, dim=-1).tolist()
         
-        # 라벨 매핑 (0: negative, 1: neutral, 2: positive)
-        label_map = {0: "negative", 1: "neutral", 2: "positive"}
-        sentiment = label_map.get(predicted_class, "neutral")
+        for i, predicted_class in zip(indices, predicted_classes):
+            results[i] = LABEL_MAP.get(predicted_class, "neutral")
         
         inference_time = time.time() - start_time
-        logger.info(f"감성 분석 완료: {sentiment} (시간: {inference_time:.3f}초, 점수: {predictions[0].tolist()})")
+        logger.info(f"감성 분석 완료: {len(indices)}개 문서 (시간: {inference_time:.3f}초)")
         
-        return sentiment
+        return results
         
     except Exception as e:
         logger.error(f"감성 분석 실패: {e}", exc_info=True)
         # 실패 시 neutral 반환
-        return "neutral"
+        return results
+
 
+def analyze_sentiment(text: str) -> str:
+    """
+    KR-FinBERT-SC 기반 감성 분석
+    
+    한국어 금융 뉴스에 특화된 감성 분석 모델을 사용합니다.
+    
+    Args:
+        text: 원본 텍스트
+    
+    Returns:
+        감성 (positive/negative/neutral)
+    """
+    return analyze_sentiment_batch([text])[0]
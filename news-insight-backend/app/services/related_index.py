@@ -0,0 +1,213 @@
+"""
+연관 기사 추천 인덱스 (PostgreSQL)
+
+- article_entities: 엔티티 → 기사 역색인 (weight = 1 / 기사 엔티티 수)
+- article_co_mentions: 기사 → 기사 공동 언급 점수 (공유 엔티티 수, Jaccard)
+
+요약 저장 시 해당 기사의 행만 증분 갱신하고, 추천은 인덱스 1회 조회로
+기사/요약 정보까지 함께 가져옵니다 (Neo4j 왕복 없음).
+"""
+import logging
+from typing import Dict, List, Tuple
+
+from sqlalchemy import text
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import Session
+
+logger = logging.getLogger(__name__)
+
+# 역색인에 넣을 엔티티 타입
+INDEXED_ENTITY_TYPES = ("ORG", "PERSON", "LOCATION")
+
+# 기사당 공동 언급 이웃 최대 수 (흔한 엔티티로 인한 fan-out 제한)
+MAX_CO_MENTION_NEIGHBORS = 200
+
+# 엔티티 이름 최대 길이 (article_entities.entity_name)
+MAX_ENTITY_NAME_LENGTH = 200
+
+
+def normalize_entities(entities: Dict) -> List[Tuple[str, str]]:
+    """
+    요약 엔티티 딕셔너리 → (이름, 타입) 리스트 (중복 제거, 처음 등장한 타입 유지)
+
+    Args:
+        entities: {"ORG": [...], "PERSON": [...], "LOCATION": [...]}
+    """
+    seen = set()
+    result = []
+    for entity_type in INDEXED_ENTITY_TYPES:
+        names = (entities or {}).get(entity_type) or []
+        if not isinstance(names, list):
+            continue
+        for name in names:
+            if not isinstance(name, str):
+                continue
+            name = name.strip()[:MAX_ENTITY_NAME_LENGTH]
+            if not name or name in seen:
+                continue
+            seen.add(name)
+            result.append((name, entity_type))
+    return result
+
+
+def index_article_entities(db: Session, article_id: int, entities: Dict):
+    """
+    기사 1건의 역색인/공동 언급 점수 갱신 (호출자가 commit)
+
+    1. 기존 역색인 행과 이 기사가 포함된 공동 언급 행 삭제
+    2. 새 엔티티 행 삽입
+    3. 엔티티를 공유하는 기사와의 점수 계산 → 양방향 upsert
+    4. 역방향 행이 추가된 이웃 기사도 상위 MAX_CO_MENTION_NEIGHBORS개만 남기고 정리
+
+    Args:
+        db: 데이터베이스 세션
+        article_id: 기사 ID
+        entities: 요약 엔티티 딕셔너리
+    """
+    pairs = normalize_entities(entities)
+
+    db.execute(text("DELETE FROM article_entities WHERE article_id = :article_id"), {"article_id": article_id})
+    db.execute(
+        text("DELETE FROM article_co_mentions WHERE article_id = :article_id OR related_article_id = :article_id"),
+        {"article_id": article_id}
+    )
+    if not pairs:
+        return
+
+    weight = 1.0 / len(pairs)
+    db.execute(
+        text("""
+            INSERT INTO article_entities (entity_name, article_id, entity_type, weight)
+            VALUES (:entity_name, :article_id, :entity_type, :weight)
+        """),
+        [
+            {"entity_name": name, "article_id": article_id, "entity_type": entity_type, "weight": weight}
+            for name, entity_type in pairs
+        ]
+    )
+
+    # 공유 엔티티 수 상위 이웃만 저장 (Jaccard = 공유 / (|A| + |B| - 공유))
+    db.execute(
+        text("""
+            WITH shared AS (
+                SELECT o.article_id AS related_article_id, COUNT(*) AS shared_count
+                FROM article_entities m
+                JOIN article_entities o ON o.entity_name = m.entity_name
+                WHERE m.article_id = :article_id AND o.article_id <> :article_id
+                GROUP BY o.article_id
+                ORDER BY COUNT(*) DESC, o.article_id DESC
+                LIMIT :max_neighbors
+            ),
+            scored AS (
+                SELECT s.related_article_id, s.shared_count,
+                       s.shared_count::float / (:entity_count + sz.entity_count - s.shared_count) AS score
+                FROM shared s
+                JOIN LATERAL (
+                    SELECT COUNT(*) AS entity_count FROM article_entities e
+                    WHERE e.article_id = s.related_article_id
+                ) sz ON TRUE
+            )
+            INSERT INTO article_co_mentions (article_id, related_article_id, shared_count, score, updated_at)
+            SELECT :article_id, related_article_id, shared_count, score, NOW() FROM scored
+            UNION ALL
+            SELECT related_article_id, :article_id, shared_count, score, NOW() FROM scored
+            ON CONFLICT (article_id, related_article_id) DO UPDATE
+            SET shared_count = EXCLUDED.shared_count,
+                score = EXCLUDED.score,
+                updated_at = EXCLUDED.updated_at
+        """),
+        {"article_id": article_id, "entity_count": len(pairs), "max_neighbors": MAX_CO_MENTION_NEIGHBORS}
+    )
+
+    # 이웃 기사 쪽 목록도 같은 순서(공유 수 → 기사 ID)로 상한 유지 (흔한 엔티티 기사의 무한 증가 방지)
+    db.execute(
+        text("""
+            DELETE FROM article_co_mentions cm
+            USING (
+                SELECT article_id, related_article_id,
+                       ROW_NUMBER() OVER (
+                           PARTITION BY article_id
+                           ORDER BY shared_count DESC, related_article_id DESC
+                       ) AS rn
+                FROM article_co_mentions
+                WHERE article_id IN (
+                    SELECT related_article_id FROM article_co_mentions WHERE article_id = :article_id
+                )
+            ) ranked
+            WHERE ranked.rn > :max_neighbors
+              AND cm.article_id = ranked.article_id
+              AND cm.related_article_id = ranked.related_article_id
+        """),
+        {"article_id": article_id, "max_neighbors": MAX_CO_MENTION_NEIGHBORS}
+    )
+
+
+def _rows_to_articles(rows) -> List[Dict]:
+    """추천 쿼리 결과 → 응답 형식"""
+    return [
+        {
+            "id": row.id,
+            "title": row.title,
+            "source": row.source,
+            "link": row.link,
+            "summary": row.ai_summary,
+            "keywords": row.keywords or [],
+            "published_at": row.published_at.isoformat() if row.published_at else None,
+            "score": round(float(row.score), 4),
+        }
+        for row in rows
+    ]
+
+
+async def get_related_by_entity(db: AsyncSession, entity_name: str, limit: int = 10) -> List[Dict]:
+    """
+    엔티티를 언급한 기사 추천 (역색인 1회 조회)
+
+    순위: 기사 내 엔티티 비중(weight) → 최신순
+
+    Args:
+        db: 비동기 데이터베이스 세션
+        entity_name: 엔티티 이름
+        limit: 최대 반환 개수
+    """
+    result = await db.execute(
+        text("""
+            SELECT a.id, a.title, a.source, a.link, a.published_at,
+                   s.summary AS ai_summary, s.keywords, ae.weight AS score
+            FROM article_entities ae
+            JOIN articles a ON a.id = ae.article_id
+            LEFT JOIN summaries s ON s.article_id = a.id
+            WHERE ae.entity_name = :entity_name
+            ORDER BY ae.weight DESC, a.published_at DESC
+            LIMIT :limit
+        """),
+        {"entity_name": entity_name.strip(), "limit": limit}
+    )
+    return _rows_to_articles(result.fetchall())
+
+
+async def get_related_by_article(db: AsyncSession, article_id: int, limit: int = 10) -> List[Dict]:
+    """
+    기사와 엔티티를 많이 공유하는 기사 추천 (공동 언급 점수 1회 조회)
+
+    순위: Jaccard 점수 → 공유 엔티티 수 → 최신순
+
+    Args:
+        db: 비동기 데이터베이스 세션
+        article_id: 기준 기사 ID
+        limit: 최대 반환 개수
+    """
+    result = await db.execute(
+        text("""
+            SELECT a.id, a.title, a.source, a.link, a.published_at,
+                   s.summary AS ai_summary, s.keywords, cm.score
+            FROM article_co_mentions cm
+            JOIN articles a ON a.id = cm.related_article_id
+            LEFT JOIN summaries s ON s.article_id = a.id
+            WHERE cm.article_id = :article_id
+            ORDER BY cm.score DESC, cm.shared_count DESC, a.published_at DESC
+            LIMIT :limit
+        """),
+        {"article_id": article_id, "limit": limit}
+    )
+    return _rows_to_articles(result.fetchall())
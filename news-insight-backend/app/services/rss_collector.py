@@ -2,6 +2,7 @@ import feedparser
 import html
 import logging
 import re
+import time
 from datetime import datetime
 from functools import lru_cache
 from typing import Dict, List, Optional
@@ -16,6 +17,7 @@ from app.utils.text_cleaner import (
     make_article_hash_key,
     normalize_article_text,
 )
+from app.utils.metrics import RSS_FETCH_SECONDS, RSS_ARTICLES, RSS_FETCH_ERRORS
 
 logger = logging.getLogger(__name__)
 
@@ -157,6 +159,8 @@ def fetch_rss_articles(rss_urls: List[str], limit_per_feed: int = 10) -> List[Di
     advertorial_skipped = 0
     
     for url in rss_urls:
+        feed_start = time.perf_counter()
+        collected_before = len(articles)
         try:
             feed = feedparser.parse(url)
             
@@ -365,7 +369,11 @@ def fetch_rss_articles(rss_urls: List[str], limit_per_feed: int = 10) -> List[Di
                     
         except Exception as e:
             logger.error(f"RSS 수집 실패 ({url}): {e}")
+            RSS_FETCH_ERRORS.labels(feed=url).inc()
             continue
+        finally:
+            RSS_FETCH_SECONDS.labels(feed=url).observe(time.perf_counter() - feed_start)
+            RSS_ARTICLES.labels(feed=url).inc(len(articles) - collected_before)
     
     if advertorial_skipped:
         logger.info("광고성 기사 %d건 스킵됨", advertorial_skipped)
@@ -0,0 +1,255 @@
+"""
+시나리오 응답 렌더링 + KG 버전 캐시
+
+시나리오 응답은 (변수, 방향, limit, min_weight 등 파라미터)와 현재 edges로 결정되므로
+캐시 키에 KG edge 버전을 포함하여 그래프가 실제로 바뀔 때까지 캐시에서 응답합니다.
+
+- 키: scenario:{hash(엔드포인트, 파라미터, version)}  (버전이 바뀌면 새 키 → 이전 키는 TTL 만료)
+- 버전: 로드된 KG 스냅샷 버전 + 내용 해시 (응답 데이터와 일치, 프로세스 간 공유,
+  버전 갱신 누락으로 데이터만 바뀐 강제 재로딩도 구분), 스냅샷이 없으면 Redis kg:edge_version
+- 인기 변수: 요청마다 scenario:popular (sorted set) 점수 증가 (알려진 드라이버 변수만)
+- 사전 계산: 스냅샷이 교체되면 인기 변수의 기본 파라미터 응답을 미리 저장
+"""
+import os
+import logging
+from typing import Any, Dict, List, Optional, Tuple
+
+from app.config import settings
+from app.services.kg_explanation_layer import (
+    generate_comparison_output,
+    generate_interest_rate_scenario_json,
+    generate_oil_scenario_json,
+    generate_scenario_json,
+    generate_scenario_json_v153,
+    get_variable_korean_name,
+)
+from app.services.kg_snapshot import KGSnapshot, get_kg_snapshot
+from app.utils.cache import get_cache_key, get_from_cache, get_redis_client, set_to_cache
+from app.utils.kg_version import get_kg_edge_version
+
+logger = logging.getLogger(__name__)
+
+SCENARIO_CACHE_PREFIX = "scenario"
+POPULAR_VARIABLES_KEY = "scenario:popular"
+PREWARM_LOCK_KEY = "scenario:prewarm:v{version}"
+
+# 전용 엔드포인트가 있는 변수 (/oil_price, /interest_rate, /exchange_rate)
+DRIVER_SCENARIO_VARIABLES = ('OIL_PRICE', 'INTEREST_RATE', 'EXCHANGE_RATE_USD_KRW')
+
+
+# =============================================================================
+# 렌더링 (라우트와 사전 계산이 공유)
+# =============================================================================
+
+def render_driver_scenario(variable: str, direction: str, companies: List[Dict]) -> Dict:
+    """유가/금리/환율 전용 시나리오 응답"""
+    if variable == 'OIL_PRICE':
+        return generate_oil_scenario_json(direction, companies)
+    if variable == 'INTEREST_RATE':
+        return generate_interest_rate_scenario_json(direction, companies)
+    return generate_scenario_json(variable, direction, companies)
+
+
+def render_scenario_v153(
+    variable: str,
+    direction: str,
+    companies: List[Dict],
+    include_comparison: bool
+) -> Dict:
+    """V1.5.3 시나리오 응답 (기업이 없으면 Empty State)"""
+    if not companies:
+        return {
+            'scenario': {
+                'variable': variable,
+                'variable_kr': get_variable_korean_name(variable),
+                'direction': direction,
+                'direction_kr': '상승' if direction == 'UP' else '하락',
+                'title': f"{get_variable_korean_name(variable)} 시나리오",
+            },
+            'status': 'no_data',
+            'message': "분석할 데이터가 부족합니다.",
+            'suggestion': "해당 변수에 연결된 기업이 없거나, 최소 가중치 조건을 충족하는 기업이 없습니다. min_weight를 낮춰서 다시 시도해보세요.",
+            'affected_companies': [],
+            'kg_version': 'v1.5.3',
+        }
+
+    return generate_scenario_json_v153(variable, direction, companies, include_comparison)
+
+
+def render_comparison(variable: str, direction: str, companies: List[Dict], top_n: int) -> Dict:
+    """V1.5.3 비교 분석 응답 (기업이 없으면 Empty State)"""
+    if not companies:
+        return {
+            'variable': {
+                'code': variable,
+                'name_kr': get_variable_korean_name(variable),
+            },
+            'status': 'no_data',
+            'message': f"'{get_variable_korean_name(variable)}' 변수에 연결된 기업을 찾을 수 없습니다.",
+            'suggestion': "해당 변수가 KG에 등록되어 있는지 확인해주세요. GET /api/v1/scenario/variables로 사용 가능한 변수 목록을 확인할 수 있습니다.",
+            'positive_impact': [],
+            'negative_impact': [],
+            'mixed_impact': [],
+            'comparison_summary': '',
+            'kg_version': 'v1.5.3',
+        }
+
+    comparison = generate_comparison_output(variable, companies, top_n)
+
+    # 방향에 따른 해석 추가
+    direction_kr = '상승' if direction == 'UP' else '하락'
+    var_name = get_variable_korean_name(variable)
+
+    return {
+        **comparison,
+        'scenario_context': {
+            'direction': direction,
+            'direction_kr': direction_kr,
+            'interpretation': f"{var_name} {direction_kr} 시나리오에서의 영향 분석",
+        },
+        'kg_version': 'v1.5.3',
+    }
+
+
+# =============================================================================
+# 캐시
+# =============================================================================
+
+def get_scenario_cache_version() -> Optional[str]:
+    """캐시 키용 KG 버전 (알 수 없으면 None → 캐시 미사용)"""
+    snapshot = get_kg_snapshot()
+    if snapshot is not None:
+        return snapshot.cache_version()
+    version = get_kg_edge_version()
+    return str(version) if version is not None else None
+
+
+def get_scenario_cache_key(endpoint: str, params: Dict, version: Optional[str]) -> Optional[str]:
+    """엔드포인트 + 파라미터 + KG 버전 캐시 키 (버전이 없으면 None)"""
+    if version is None:
+        return None
+    return get_cache_key(SCENARIO_CACHE_PREFIX, endpoint, version=version, **params)
+
+
+def lookup_scenario_cache(endpoint: str, variable: str, params: Dict) -> Tuple[Optional[str], Optional[Any]]:
+    """
+    캐시 조회 + 인기 변수 집계
+
+    Returns:
+        (캐시 키, 캐시된 응답) - 키가 None이면 캐시 미사용, 응답이 None이면 miss
+    """
+    record_variable_request(variable)
+    key = get_scenario_cache_key(endpoint, params, get_scenario_cache_version())
+    if key is None:
+        return None, None
+    return key, get_from_cache(key)
+
+
+def store_scenario_cache(key: Optional[str], value: Any):
+    """응답 캐시 저장 (키가 없으면 무시)"""
+    if key:
+        set_to_cache(key, value, settings.SCENARIO_CACHE_TTL)
+
+
+def is_known_variable(variable: str) -> bool:
+    """KG에 있는 드라이버 변수인지 여부 (스냅샷 로딩 전에는 전용 엔드포인트 변수만)"""
+    snapshot = get_kg_snapshot()
+    if snapshot is not None:
+        return snapshot.has_driver(variable)
+    return variable in DRIVER_SCENARIO_VARIABLES
+
+
+def record_variable_request(variable: str):
+    """
+    변수 요청 수 집계 (사전 계산 대상 선정용)
+
+    경로 파라미터로 들어온 임의 이름이 sorted set을 키우지 않도록 알려진 변수만 집계합니다.
+    """
+    if not is_known_variable(variable):
+        return
+    client = get_redis_client()
+    if not client:
+        return
+    try:
+        client.zincrby(POPULAR_VARIABLES_KEY, 1, variable)
+    except Exception as e:
+        logger.debug(f"인기 변수 집계 실패: {e}")
+
+
+def get_popular_variables(top_n: int) -> List[str]:
+    """요청 수 상위 변수 (집계가 없으면 전용 엔드포인트 변수)"""
+    client = get_redis_client()
+    if client:
+        try:
+            variables = client.zrevrange(POPULAR_VARIABLES_KEY, 0, top_n - 1)
+            if variables:
+                return list(variables)
+        except Exception as e:
+            logger.warning(f"인기 변수 조회 실패: {e}")
+    return list(DRIVER_SCENARIO_VARIABLES[:top_n])
+
+
+def _claim_prewarm(version: str) -> bool:
+    """버전당 한 프로세스만 사전 계산 (API 워커가 여러 개일 때 중복 방지)"""
+    client = get_redis_client()
+    if not client:
+        return False
+    try:
+        return bool(client.set(PREWARM_LOCK_KEY.format(version=version), os.getpid(), nx=True, ex=settings.SCENARIO_CACHE_TTL))
+    except Exception as e:
+        logger.warning(f"시나리오 캐시 사전 계산 잠금 실패: {e}")
+        return False
+
+
+def prewarm_scenario_cache(snapshot: Optional[KGSnapshot] = None) -> int:
+    """
+    인기 변수의 기본 파라미터 응답을 KG 스냅샷으로 미리 계산하여 캐시에 저장
+
+    KG 스냅샷이 교체된 뒤 호출합니다 (KGSnapshotReloader 리스너).
+    파라미터는 각 라우트의 Query 기본값과 같아야 같은 캐시 키가 만들어집니다.
+
+    Returns:
+        저장한 응답 수
+    """
+    snapshot = snapshot or get_kg_snapshot()
+    if snapshot is None or settings.SCENARIO_PREWARM_TOP_N <= 0:
+        return 0
+    version = snapshot.cache_version()
+    if not _claim_prewarm(version):
+        return 0
+
+    stored = 0
+    for variable in get_popular_variables(settings.SCENARIO_PREWARM_TOP_N):
+        try:
+            # /v153/scenario/{variable}: limit=20, min_weight=0.5, include_comparison=True
+            v153_companies = snapshot.affected_companies(variable, 20, 0.5, with_biz_summary=True)
+            # /compare/{variable}: top_n=3, limit=50, min_weight=0.3
+            compare_companies = snapshot.affected_companies(variable, 50, 0.3)
+            # /oil_price 등: limit=20, min_weight=0.5 (기업이 없으면 404 → 캐시하지 않음)
+            driver_companies = (
+                snapshot.affected_companies(variable, 20, 0.5)
+                if variable in DRIVER_SCENARIO_VARIABLES else []
+            )
+
+            for direction in ('UP', 'DOWN'):
+                responses = [
+                    ('v153', {'variable': variable, 'direction': direction, 'limit': 20,
+                              'min_weight': 0.5, 'include_comparison': True},
+                     lambda: render_scenario_v153(variable, direction, v153_companies, True)),
+                    ('compare', {'variable': variable, 'direction': direction, 'top_n': 3,
+                                 'limit': 50, 'min_weight': 0.3},
+                     lambda: render_comparison(variable, direction, compare_companies, 3)),
+                ]
+                if driver_companies:
+                    responses.append(
+                        ('driver', {'variable': variable, 'direction': direction, 'limit': 20, 'min_weight': 0.5},
+                         lambda: render_driver_scenario(variable, direction, driver_companies))
+                    )
+                for endpoint, params, render in responses:
+                    store_scenario_cache(get_scenario_cache_key(endpoint, params, version), render())
+                    stored += 1
+        except Exception as e:
+            logger.warning(f"시나리오 캐시 사전 계산 실패 ({variable}): {e}")
+
+    logger.info(f"시나리오 캐시 사전 계산 완료: v{version}, {stored}개 응답")
+    return stored
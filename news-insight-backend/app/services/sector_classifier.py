@@ -14,6 +14,7 @@ from sqlalchemy.orm import Session
 from app.models.company_detail import CompanyDetail
 from app.models.stock import Stock
 from app.services.llm_handler import LLMHandler
+from app.utils.aho_corasick import AhoCorasick
 
 logger = logging.getLogger(__name__)
 
@@ -1204,6 +1205,100 @@ VALUE_CHAIN_KEYWORDS = {
 }
 
 
+class SectorKeywordIndex:
+    """
+    Rule-based 분류 키워드 색인
+
+    SECTOR_KEYWORDS(섹터/서브섹터), VALUE_CHAIN_KEYWORDS, SEC_MACH_REQUIRED_KEYWORDS의
+    키워드를 Aho-Corasick 오토마톤 하나로 컴파일해 두고, combined_text를 한 번만 스캔하여
+    그룹별 매칭 키워드 수를 계산합니다.
+
+    기존 `kw.lower() in combined_text` 판정과 동일한 결과를 내도록
+    부분 문자열 매칭(중첩 허용, 단어 경계 없음)이며 대소문자 변환은 호출 측(combined_text)에 맡깁니다.
+    """
+
+    def __init__(self):
+        self._matcher = AhoCorasick(case_insensitive=False, latin_word_boundary=False)
+        # 소문자 키워드 → 속한 그룹 목록 (같은 그룹에 중복 등록되면 중복 횟수만큼 카운트)
+        self._groups: Dict[str, List[Tuple[str, Any]]] = {}
+
+        for sector_code, sector_info in SECTOR_KEYWORDS.items():
+            self._register('sectors', sector_code, sector_info['keywords'])
+            for sub_code, sub_keywords in sector_info['sub_sectors'].items():
+                self._register('sub_sectors', (sector_code, sub_code), sub_keywords)
+        for vc_type, vc_keywords in VALUE_CHAIN_KEYWORDS.items():
+            self._register('value_chains', vc_type, vc_keywords)
+        self._register('mach_required', 'SEC_MACH', SEC_MACH_REQUIRED_KEYWORDS)
+        self._matcher.build()
+
+        # 제품명은 제품별로 짧게 비교하므로 소문자 변환만 미리 해 둠
+        self.product_keywords: Dict[str, Tuple[str, ...]] = {
+            sector_code: tuple(pk.lower() for pk in sector_info['products'])
+            for sector_code, sector_info in SECTOR_KEYWORDS.items()
+        }
+
+    def _register(self, kind: str, key: Any, keywords: List[str]):
+        for kw in keywords:
+            lowered = kw.lower()
+            self._groups.setdefault(lowered, []).append((kind, key))
+            self._matcher.add(lowered, lowered)
+
+    def scan(self, text: str) -> Dict[str, Dict[Any, int]]:
+        """
+        텍스트 한 번 스캔 → 그룹별 매칭 키워드 수 (0인 그룹은 생략)
+
+        Returns:
+            {
+                'sectors': {sector_code: n},
+                'sub_sectors': {(sector_code, sub_code): n},
+                'value_chains': {vc_type: n},
+                'mach_required': {'SEC_MACH': n}
+            }
+        """
+        hits: Dict[str, Dict[Any, int]] = {
+            'sectors': {}, 'sub_sectors': {}, 'value_chains': {}, 'mach_required': {}
+        }
+        # 빈 키워드는 `'' in text`와 같이 항상 매칭
+        found = {value for _, _, value in self._matcher.iter_matches(text)}
+        if '' in self._groups:
+            found.add('')
+        for keyword in found:
+            for kind, key in self._groups[keyword]:
+                hits[kind][key] = hits[kind].get(key, 0) + 1
+        return hits
+
+    @staticmethod
+    def best_sub_sector(hits: Dict[str, Dict[Any, int]], major_sector: str) -> Optional[str]:
+        """매칭 수가 가장 많은 서브섹터 (동점이면 SECTOR_KEYWORDS 정의 순서상 앞선 것)"""
+        sub_sector_scores = {}
+        for sub_code in SECTOR_KEYWORDS[major_sector]['sub_sectors']:
+            sub_score = hits['sub_sectors'].get((major_sector, sub_code), 0)
+            if sub_score > 0:
+                sub_sector_scores[sub_code] = sub_score
+        if not sub_sector_scores:
+            return None
+        return max(sub_sector_scores.items(), key=lambda x: x[1])[0]
+
+    @staticmethod
+    def first_value_chain(hits: Dict[str, Dict[Any, int]]) -> Optional[str]:
+        """VALUE_CHAIN_KEYWORDS 순서상 키워드가 하나라도 매칭된 첫 번째 위치"""
+        for vc_type in VALUE_CHAIN_KEYWORDS:
+            if hits['value_chains'].get(vc_type, 0) > 0:
+                return vc_type
+        return None
+
+
+_sector_keyword_index: Optional[SectorKeywordIndex] = None
+
+
+def get_sector_keyword_index() -> SectorKeywordIndex:
+    """키워드 색인 (최초 호출 시 1회 컴파일)"""
+    global _sector_keyword_index
+    if _sector_keyword_index is None:
+        _sector_keyword_index = SectorKeywordIndex()
+    return _sector_keyword_index
+
+
 def classify_sector_rule_based(
     company_detail: CompanyDetail,
     company_name: Optional[str] = None,
@@ -1381,6 +1476,10 @@ def classify_sector_rule_based(
     
     combined_text = ' '.join(text_parts)
     
+    # 섹터/서브섹터/Value Chain 키워드 매칭 (단일 패스)
+    keyword_index = get_sector_keyword_index()
+    keyword_hits = keyword_index.scan(combined_text)
+    
     # ========================================================================
     # 🆕 P0: 변수 초기화 (스코프 에러 방지)
     # ========================================================================
@@ -1467,21 +1566,22 @@ def classify_sector_rule_based(
         # 🆕 P0-2: SEC_MACH 덤핑 방지 게이트
         if sector_code == 'SEC_MACH':
             # SEC_MACH는 기계 고유 단서가 최소 1개 이상 필요
-            has_mach_keyword = any(kw.lower() in combined_text for kw in SEC_MACH_REQUIRED_KEYWORDS)
+            has_mach_keyword = keyword_hits['mach_required'].get('SEC_MACH', 0) > 0
             if not has_mach_keyword:
                 # 기계 고유 단서 없으면 SEC_MACH 점수 계산 스킵
                 continue
         
         # 키워드 매칭 (정규화: 최소 2개 이상 매칭 요구)
-        keyword_matches = sum(1 for kw in sector_info['keywords'] if kw.lower() in combined_text)
+        keyword_matches = keyword_hits['sectors'].get(sector_code, 0)
         keyword_score = min(1.0, keyword_matches / max(len(sector_info['keywords']), 1)) if keyword_matches >= 2 else keyword_matches * 0.1
         
         # 제품 매칭 (정규화)
         product_matches = 0
         if company_detail.products:
+            product_keywords = keyword_index.product_keywords[sector_code]
             for product in company_detail.products:
                 product_lower = str(product).lower()
-                if any(pk.lower() in product_lower for pk in sector_info['products']):
+                if any(pk in product_lower for pk in product_keywords):
                     product_matches += 1
         product_count = len(company_detail.products) if company_detail.products else 1
         product_score = min(1.0, product_matches / max(product_count, 1))
@@ -1661,14 +1761,7 @@ def classify_sector_rule_based(
     # Sub-sector 결정
     sub_sector = None
     if major_sector in SECTOR_KEYWORDS:
-        sub_sector_scores = {}
-        for sub_code, sub_keywords in SECTOR_KEYWORDS[major_sector]['sub_sectors'].items():
-            sub_score = sum(1 for kw in sub_keywords if kw.lower() in combined_text)
-            if sub_score > 0:
-                sub_sector_scores[sub_code] = sub_score
-        
-        if sub_sector_scores:
-            sub_sector = max(sub_sector_scores.items(), key=lambda x: x[1])[0]
+        sub_sector = keyword_index.best_sub_sector(keyword_hits, major_sector)
     
     # 🆕 P0-1: 금융지주/사업형 지주회사 sub_sector 결정 (revenue_by_segment 기반)
     if is_holding_company and revenue_scores and len(revenue_scores) > 0:
@@ -1697,14 +1790,9 @@ def classify_sector_rule_based(
             elif is_business_holding:
                 # 일반 섹터 키워드 매칭으로 sub_sector 결정
                 if major_sector in SECTOR_KEYWORDS:
-                    sub_sector_scores = {}
-                    for sub_code, sub_keywords in SECTOR_KEYWORDS[major_sector]['sub_sectors'].items():
-                        sub_score = sum(1 for kw in sub_keywords if kw.lower() in combined_text)
-                        if sub_score > 0:
-                            sub_sector_scores[sub_code] = sub_score
-                    
-                    if sub_sector_scores:
-                        sub_sector = max(sub_sector_scores.items(), key=lambda x: x[1])[0]
+                    best_sub_sector = keyword_index.best_sub_sector(keyword_hits, major_sector)
+                    if best_sub_sector:
+                        sub_sector = best_sub_sector
     
     # 🆕 P1-1/P1-3: Value Chain 결정 (Revenue Segment 기반 + 후보 저장)
     # 기존 단순 키워드 매칭 대신 Rule-based Confidence 계산 사용
@@ -1719,17 +1807,12 @@ def classify_sector_rule_based(
         # Confidence가 낮으면 기존 방식 Fallback
         if value_chain is None or vc_confidence < 0.3:
             # 기존 방식 Fallback
-            for vc_type, vc_keywords in VALUE_CHAIN_KEYWORDS.items():
-                if any(kw.lower() in combined_text for kw in vc_keywords):
-                    value_chain = vc_type
-                    break
+            fallback_value_chain = keyword_index.first_value_chain(keyword_hits)
+            if fallback_value_chain:
+                value_chain = fallback_value_chain
     except ImportError:
         # value_chain_classifier가 없으면 기존 방식 사용
-        value_chain = None
-        for vc_type, vc_keywords in VALUE_CHAIN_KEYWORDS.items():
-            if any(kw.lower() in combined_text for kw in vc_keywords):
-                value_chain = vc_type
-                break
+        value_chain = keyword_index.first_value_chain(keyword_hits)
     except Exception as e:
         # 반환값 개수가 맞지 않을 수 있으므로 예외 처리
         logger.warning(f"[{company_name}] Value Chain 분류 오류: {e}")
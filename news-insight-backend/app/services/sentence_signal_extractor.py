@@ -16,6 +16,7 @@ from typing import Dict, List, Optional, Any, Tuple
 # Pecab RuntimeWarning 무시 (overflow는 경고일 뿐 실제 오류 아님)
 warnings.filterwarnings('ignore', category=RuntimeWarning, module='pecab')
 from app.utils.text_chunking import split_into_sentences
+from app.utils.nlp_batch import split_sentences_batch
 # KF-DeBERTa 모델은 제거됨 (Solar Embedding으로 대체)
 # from app.services.embedding_model_direct import get_direct_embedding_model
 
@@ -446,35 +447,26 @@ def extract_driver_signals_from_sentences(
     all_sentences = []
     sentence_sources = []  # 문장 출처 추적
     
-    # biz_summary 문장 분리
+    # biz_summary / products / keywords / raw_materials 텍스트를 모아 한 번에 문장 분리
+    # (Kiwi 멀티스레드 배치, Kiwi 사용 불가 시 기존 kss 분할)
+    source_texts = []
     if company_detail.biz_summary:
-        sentences = split_into_sentences(company_detail.biz_summary)
+        source_texts.append(("biz_summary", company_detail.biz_summary))
+    for source, items in (
+        ("products", company_detail.products),
+        ("keywords", company_detail.keywords),
+        ("raw_materials", company_detail.raw_materials),
+    ):
+        if items:
+            source_texts.extend((source, str(item)) for item in items[:10])
+    
+    sentences_per_text = split_sentences_batch(
+        [text for _, text in source_texts],
+        fallback=split_into_sentences
+    )
+    for (source, _), sentences in zip(source_texts, sentences_per_text):
         all_sentences.extend(sentences)
-        sentence_sources.extend([("biz_summary", s) for s in sentences])
-    
-    # products 설명 문장 분리
-    if company_detail.products:
-        for product in company_detail.products[:10]:
-            product_text = str(product)
-            sentences = split_into_sentences(product_text)
-            all_sentences.extend(sentences)
-            sentence_sources.extend([("products", s) for s in sentences])
-    
-    # keywords 설명 문장 분리
-    if company_detail.keywords:
-        for keyword in company_detail.keywords[:10]:
-            keyword_text = str(keyword)
-            sentences = split_into_sentences(keyword_text)
-            all_sentences.extend(sentences)
-            sentence_sources.extend([("keywords", s) for s in sentences])
-    
-    # raw_materials 설명 문장 분리
-    if company_detail.raw_materials:
-        for rm in company_detail.raw_materials[:10]:
-            rm_text = str(rm)
-            sentences = split_into_sentences(rm_text)
-            all_sentences.extend(sentences)
-            sentence_sources.extend([("raw_materials", s) for s in sentences])
+        sentence_sources.extend([(source, s) for s in sentences])
     
     if not all_sentences:
         logger.warning("문장 추출 실패: 텍스트 없음")
@@ -1,11 +1,12 @@
 from typing import Dict, List, Optional
-from app.services.pipelines.keywords import extract_keywords
+from app.services.pipelines.keywords import extract_keywords_batch
 from app.services.pipelines.textrank import textrank_extract
-from app.services.pipelines.kobart import summarize_kobart
+from app.services.pipelines.kobart import summarize_kobart_batch
 from app.services.pipelines.entities import extract_entities
-from app.services.pipelines.sentiment import analyze_sentiment
+from app.services.pipelines.sentiment import analyze_sentiment_batch
 from app.utils.text_cleaner import clean_text
 from app.utils.sentence_split import split_sentences
+from app.utils.metrics import SUMMARIZER_STAGE_SECONDS, SUMMARIZER_DOCUMENTS
 import logging
 import time
 
@@ -37,87 +38,129 @@ def summarize_text(text: str) -> Optional[Dict]:
             "sentiment": "positive/negative/neutral"
         }
     """
+    return summarize_texts([text])[0]
+
+
+def summarize_texts(texts: List[str]) -> List[Optional[Dict]]:
+    """
+    여러 기사 배치 요약 (summarize_text와 같은 파이프라인)
+    
+    키워드(Kiwi + SBERT), KoBART, 감성 분석은 문서 전체를 한 번의 배치 호출로 처리하고,
+    문서별로 결과가 달라지는 핵심 문장 추출/엔티티 추출은 문서 단위로 수행합니다.
+    
+    Args:
+        texts: 기사 본문 텍스트 리스트
+    
+    Returns:
+        문서별 요약 결과 딕셔너리 (입력 순서, 실패한 문서는 None)
+    """
+    results: List[Optional[Dict]] = [None] * len(texts)
+    
     try:
         pipeline_start_time = time.time()
         
-        if not text or len(text.strip()) < 100:
-            logger.warning("텍스트가 너무 짧습니다")
-            return None
+        indices = []
+        for i, text in enumerate(texts):
+            if not text or len(text.strip()) < 100:
+                logger.warning(f"텍스트가 너무 짧습니다 (문서 {i})")
+                continue
+            indices.append(i)
+        if not indices:
+            return results
         
         # 텍스트 정리
         clean_start = time.time()
-        cleaned_text = clean_text(text)
-        logger.info(f"텍스트 정리 완료: {time.time() - clean_start:.3f}초")
+        cleaned_texts = [clean_text(texts[i]) for i in indices]
+        clean_time = time.time() - clean_start
+        logger.info(f"텍스트 정리 완료: {len(indices)}개 문서 ({clean_time:.3f}초)")
         
-        # 1. KeyBERT로 의미 키워드 추출
+        # 1. KeyBERT로 의미 키워드 추출 (배치)
         keywords_start = time.time()
         logger.info("1단계: KeyBERT 키워드 추출 시작")
-        keywords = extract_keywords(cleaned_text, top_n=10)
+        keywords_list = extract_keywords_batch(cleaned_texts, top_n=10)
         keywords_time = time.time() - keywords_start
         
         # 키워드가 없으면 경고 로그
-        if not keywords or len(keywords) == 0:
-            logger.warning(f"키워드 추출 결과가 비어있습니다. 텍스트 길이: {len(cleaned_text)}자 (시간: {keywords_time:.3f}초)")
-        else:
-            logger.info(f"키워드 추출 완료: {len(keywords)}개 - {keywords[:5]} (시간: {keywords_time:.3f}초)")
+        for cleaned_text, keywords in zip(cleaned_texts, keywords_list):
+            if not keywords:
+                logger.warning(f"키워드 추출 결과가 비어있습니다. 텍스트 길이: {len(cleaned_text)}자")
+        logger.info(f"키워드 추출 완료: {len(cleaned_texts)}개 문서 (시간: {keywords_time:.3f}초)")
         
         # 2. 하이브리드 방식으로 핵심 문장 추출 (문장 수에 따라 자동 선택)
         # - 짧은 기사 (10개 이하): KR-SBERT만 사용
         # - 긴 기사 (10개 초과): TextRank + KR-SBERT re-ranking
         textrank_start = time.time()
         logger.info("2단계: 핵심 문장 추출 시작 (하이브리드 방식)")
-        key_sentences = textrank_extract(cleaned_text, sentence_count=5)
+        key_sentences_list = [textrank_extract(cleaned_text, sentence_count=5) for cleaned_text in cleaned_texts]
         textrank_time = time.time() - textrank_start
         
-        if not key_sentences:
-            logger.warning(f"핵심 문장 추출 실패 (시간: {textrank_time:.3f}초)")
-            return None
-        logger.info(f"핵심 문장 추출 완료: {len(key_sentences)}개 (시간: {textrank_time:.3f}초)")
+        # 핵심 문장이 없는 문서는 요약 실패
+        valid = [j for j, key_sentences in enumerate(key_sentences_list) if key_sentences]
+        if len(valid) < len(cleaned_texts):
+            logger.warning(f"핵심 문장 추출 실패: {len(cleaned_texts) - len(valid)}개 문서 (시간: {textrank_time:.3f}초)")
+        if not valid:
+            return results
+        logger.info(f"핵심 문장 추출 완료: {len(valid)}개 문서 (시간: {textrank_time:.3f}초)")
         
-        # 3. KoBART로 생성 요약 (사실 보존형)
+        # 3. KoBART로 생성 요약 (사실 보존형, 배치)
         kobart_start = time.time()
         logger.info("3단계: KoBART 요약 시작")
-        summary = summarize_kobart(key_sentences)
+        summaries = summarize_kobart_batch([key_sentences_list[j] for j in valid])
         kobart_time = time.time() - kobart_start
-        
-        if not summary:
-            logger.warning(f"KoBART 요약 실패, TextRank 문장 사용 (시간: {kobart_time:.3f}초)")
-            summary = " ".join(key_sentences)
-        else:
-            logger.info(f"KoBART 요약 완료: {len(summary)}자 (시간: {kobart_time:.3f}초)")
+        logger.info(f"KoBART 요약 완료: {len(valid)}개 문서 (시간: {kobart_time:.3f}초)")
         
         # 4. 엔티티 추출 (기업명 데이터 소스 활용)
         entities_start = time.time()
         logger.info("4단계: 엔티티 추출 시작")
-        entities = extract_entities(cleaned_text)
+        entities_list = [extract_entities(cleaned_texts[j]) for j in valid]
         entities_time = time.time() - entities_start
-        logger.info(f"엔티티 추출 완료: ORG={len(entities.get('ORG', []))}, PERSON={len(entities.get('PERSON', []))}, LOCATION={len(entities.get('LOCATION', []))} (시간: {entities_time:.3f}초)")
+        logger.info(f"엔티티 추출 완료: {len(valid)}개 문서 (시간: {entities_time:.3f}초)")
         
-        # 5. 감성 분석 (KR-FinBERT-SC)
+        # 5. 감성 분석 (KR-FinBERT-SC, 배치)
         sentiment_start = time.time()
         logger.info("5단계: 감성 분석 시작 (KR-FinBERT-SC)")
-        sentiment = analyze_sentiment(cleaned_text)
+        sentiments = analyze_sentiment_batch([cleaned_texts[j] for j in valid])
         sentiment_time = time.time() - sentiment_start
         
-        # 6. Bullet points (요약문을 문장 단위로 분리)
-        bullet_start = time.time()
-        bullet_points = [s.strip() for s in split_sentences(summary) if s.strip()][:5]
-        bullet_time = time.time() - bullet_start
-        
-        result = {
-            "summary": summary,
-            "keywords": keywords if keywords else [],  # 빈 배열 보장
-            "entities": entities,
-            "bullet_points": bullet_points,
-            "sentiment": sentiment
-        }
+        for k, j in enumerate(valid):
+            summary = summaries[k]
+            if not summary:
+                logger.warning("KoBART 요약 실패, TextRank 문장 사용")
+                summary = " ".join(key_sentences_list[j])
+            
+            # 6. Bullet points (요약문을 문장 단위로 분리)
+            bullet_points = [s.strip() for s in split_sentences(summary) if s.strip()][:5]
+            
+            keywords = keywords_list[j]
+            results[indices[j]] = {
+                "summary": summary,
+                "keywords": keywords if keywords else [],  # 빈 배열 보장
+                "entities": entities_list[k],
+                "bullet_points": bullet_points,
+                "sentiment": sentiments[k]
+            }
         
         total_time = time.time() - pipeline_start_time
-        logger.info(f"하이브리드 요약 완료 - 키워드: {len(result['keywords'])}개, 요약: {len(result['summary'])}자")
+        logger.info(f"하이브리드 요약 완료 - {len(valid)}/{len(texts)}개 문서")
         logger.info(f"총 소요 시간: {total_time:.3f}초 (키워드: {keywords_time:.3f}초, 문장추출: {textrank_time:.3f}초, KoBART: {kobart_time:.3f}초, 엔티티: {entities_time:.3f}초, 감성: {sentiment_time:.3f}초)")
         
-        return result
+        for stage, seconds in (
+            ("clean", clean_time),
+            ("keywords", keywords_time),
+            ("textrank", textrank_time),
+            ("kobart", kobart_time),
+            ("entities", entities_time),
+            ("sentiment", sentiment_time),
+            ("total", total_time),
+        ):
+            SUMMARIZER_STAGE_SECONDS.labels(stage=stage).observe(seconds)
+        
+        return results
         
     except Exception as e:
         logger.error(f"하이브리드 요약 실패: {e}", exc_info=True)
-        return None
+        return results
+    finally:
+        succeeded = sum(1 for r in results if r is not None)
+        SUMMARIZER_DOCUMENTS.labels(status="ok").inc(succeeded)
+        SUMMARIZER_DOCUMENTS.labels(status="failed").inc(len(texts) - succeeded)
@@ -0,0 +1,170 @@
+# -*- coding: utf-8 -*-
+"""
+Aho-Corasick 다중 패턴 매칭 유틸리티
+
+수천 개의 패턴(기업명, 키워드 등)을 한 번 컴파일해 두고
+텍스트를 단일 패스로 스캔하여 모든 매칭 위치를 찾습니다.
+
+- 대소문자 무시 매칭 (영문 기업명 대응)
+- 최장 일치 우선 + 비중첩 선택 (leftmost-longest)
+- 라틴 문자 패턴의 단어 경계 규칙 ("LG"가 "LGES" 내부에서 매칭되지 않도록)
+"""
+from collections import deque
+from typing import Any, Iterator, List, Optional, Tuple
+
+# (start, end, value)
+Match = Tuple[int, int, Any]
+
+
+def is_latin_word_char(ch: str) -> bool:
+    """ASCII 영문/숫자 여부 (라틴 문자 단어 경계 판단용)"""
+    return ch.isascii() and ch.isalnum()
+
+
+def lower_preserving_length(text: str) -> str:
+    """
+    소문자 변환 (원문과 인덱스가 어긋나지 않도록 길이 보존)
+
+    'İ'처럼 lower() 결과 길이가 바뀌는 문자는 원문 그대로 둡니다.
+    """
+    lowered = text.lower()
+    if len(lowered) == len(text):
+        return lowered
+    return "".join(c if len(c.lower()) != 1 else c.lower() for c in text)
+
+
+class AhoCorasick:
+    """
+    Aho-Corasick 오토마톤
+
+    사용법:
+        matcher = AhoCorasick()
+        matcher.add("삼성전자", "005930")
+        matcher.add("Apple", "AAPL")
+        matcher.build()
+        matcher.find_longest("삼성전자와 apple 협력")  # [(0, 4, "005930"), (6, 11, "AAPL")]
+    """
+
+    def __init__(self, case_insensitive: bool = True, latin_word_boundary: bool = True):
+        self.case_insensitive = case_insensitive
+        self.latin_word_boundary = latin_word_boundary
+        self._goto: List[dict] = [{}]
+        self._fail: List[int] = [0]
+        self._out: List[List[int]] = [[]]  # 노드별 매칭 패턴 id (fail 링크 출력 포함)
+        self._lengths: List[int] = []
+        self._values: List[Any] = []
+        self._bounds: List[Tuple[bool, bool]] = []  # (왼쪽 경계 검사, 오른쪽 경계 검사)
+        self._built = False
+
+    def __len__(self) -> int:
+        return len(self._values)
+
+    def add(self, pattern: str, value: Any = None) -> bool:
+        """
+        패턴 추가 (build 전에만 가능)
+
+        동일 패턴(대소문자 무시 시 소문자 기준)이 이미 있으면 먼저 추가된 값을 유지하고 False를 반환합니다.
+        """
+        if self._built:
+            raise RuntimeError("이미 build 된 오토마톤에는 패턴을 추가할 수 없습니다.")
+        if not pattern:
+            return False
+
+        key = lower_preserving_length(pattern) if self.case_insensitive else pattern
+        node = 0
+        for ch in key:
+            nxt = self._goto[node].get(ch)
+            if nxt is None:
+                nxt = len(self._goto)
+                self._goto[node][ch] = nxt
+                self._goto.append({})
+                self._fail.append(0)
+                self._out.append([])
+            node = nxt
+
+        if self._out[node]:
+            return False
+
+        pattern_id = len(self._values)
+        self._out[node].append(pattern_id)
+        self._lengths.append(len(key))
+        self._values.append(value if value is not None else pattern)
+        self._bounds.append((
+            self.latin_word_boundary and is_latin_word_char(pattern[0]),
+            self.latin_word_boundary and is_latin_word_char(pattern[-1]),
+        ))
+        return True
+
+    def build(self) -> "AhoCorasick":
+        """fail 링크 계산 (BFS)"""
+        queue = deque()
+        for child in self._goto[0].values():
+            self._fail[child] = 0
+            queue.append(child)
+
+        while queue:
+            node = queue.popleft()
+            for ch, child in self._goto[node].items():
+                queue.append(child)
+                fail = self._fail[node]
+                while fail and ch not in self._goto[fail]:
+                    fail = self._fail[fail]
+                target = self._goto[fail].get(ch, 0)
+                self._fail[child] = target if target != child else 0
+                # 긴 패턴 → 짧은 패턴 순서로 출력 유지
+                self._out[child] = self._out[child] + self._out[self._fail[child]]
+
+        self._built = True
+        return self
+
+    def iter_matches(self, text: str) -> Iterator[Match]:
+        """모든 매칭 (중첩 포함, 단어 경계 규칙 적용) 반환"""
+        if not self._built:
+            raise RuntimeError("build()를 먼저 호출해야 합니다.")
+        if not text or not self._values:
+            return
+
+        haystack = lower_preserving_length(text) if self.case_insensitive else text
+        goto = self._goto
+        fail = self._fail
+        out = self._out
+        lengths = self._lengths
+        values = self._values
+        bounds = self._bounds
+        text_len = len(text)
+
+        node = 0
+        for i, ch in enumerate(haystack):
+            while node and ch not in goto[node]:
+                node = fail[node]
+            node = goto[node].get(ch, 0)
+            if not out[node]:
+                continue
+            end = i + 1
+            for pattern_id in out[node]:
+                start = end - lengths[pattern_id]
+                check_left, check_right = bounds[pattern_id]
+                if check_left and start > 0 and is_latin_word_char(text[start - 1]):
+                    continue
+                if check_right and end < text_len and is_latin_word_char(text[end]):
+                    continue
+                yield start, end, values[pattern_id]
+
+    def find_longest(self, text: str, limit: Optional[int] = None) -> List[Match]:
+        """
+        비중첩 최장 일치 매칭 (leftmost-longest)
+
+        시작 위치가 빠른 매칭을 우선하고, 같은 위치에서는 가장 긴 패턴을 선택합니다.
+        예: "삼성전자" 안의 "삼성"은 별도로 반환하지 않습니다.
+        """
+        candidates = sorted(self.iter_matches(text), key=lambda m: (m[0], m[0] - m[1]))
+        selected: List[Match] = []
+        last_end = 0
+        for start, end, value in candidates:
+            if start < last_end:
+                continue
+            selected.append((start, end, value))
+            last_end = end
+            if limit is not None and len(selected) >= limit:
+                break
+        return selected
@@ -6,12 +6,15 @@ import hashlib
 import redis
 from typing import Optional, Any
 from app.config import settings
+from app.utils.metrics import record_cache_request
 import logging
 
 logger = logging.getLogger(__name__)
 
 # Redis 클라이언트 (지연 로딩)
 redis_client = None
+# 비동기 Redis 클라이언트 (API 이벤트 루프 전용, 지연 로딩)
+async_redis_client = None
 
 def get_redis_client():
     """Redis 클라이언트 가져오기 (지연 로딩)"""
@@ -33,6 +36,27 @@ def get_redis_client():
     return redis_client if redis_client else None
 
 
+def get_async_redis_client():
+    """
+    비동기 Redis 클라이언트 가져오기 (지연 로딩, async def 라우트/SSE 스트림용)
+
+    연결은 첫 명령 실행 시 이루어지므로 연결 실패는 호출 측에서 처리합니다.
+    """
+    global async_redis_client
+    if async_redis_client is None:
+        try:
+            import redis.asyncio as aioredis
+            async_redis_client = aioredis.Redis.from_url(
+                settings.CELERY_BROKER_URL,
+                decode_responses=True,
+                socket_connect_timeout=5,
+            )
+        except Exception as e:
+            logger.warning(f"비동기 Redis 클라이언트 생성 실패: {e}")
+            async_redis_client = False
+    return async_redis_client if async_redis_client else None
+
+
 def get_cache_key(key_prefix: str, *args, **kwargs) -> str:
     """
     캐시 키 생성
@@ -62,13 +86,17 @@ def get_from_cache(key: str) -> Optional[Any]:
     """
     client = get_redis_client()
     if not client:
+        record_cache_request(key, "disabled")
         return None
     
     try:
         data = client.get(key)
         if data:
+            record_cache_request(key, "hit")
             return json.loads(data)
+        record_cache_request(key, "miss")
     except Exception as e:
+        record_cache_request(key, "error")
         logger.warning(f"캐시 읽기 실패 ({key}): {e}")
     return None
 
@@ -0,0 +1,41 @@
+"""
+KG edge 버전 (Redis 카운터)
+
+edges(또는 company_details) 테이블을 수정하는 코드가 커밋 후 bump_kg_edge_version()을 호출하면
+API 프로세스의 KG 스냅샷이 다음 확인 주기에 다시 로드됩니다.
+"""
+import logging
+from typing import Optional
+
+from app.utils.cache import get_redis_client
+
+logger = logging.getLogger(__name__)
+
+KG_EDGE_VERSION_KEY = "kg:edge_version"
+
+
+def get_kg_edge_version() -> Optional[int]:
+    """현재 edge 버전 (키가 없으면 0, Redis 미사용/오류 시 None)"""
+    client = get_redis_client()
+    if not client:
+        return None
+    try:
+        return int(client.get(KG_EDGE_VERSION_KEY) or 0)
+    except Exception as e:
+        logger.warning(f"KG edge 버전 조회 실패: {e}")
+        return None
+
+
+def bump_kg_edge_version() -> Optional[int]:
+    """edge 버전 증가 (edges 커밋 후 호출, 새 버전 반환 / Redis 미사용 시 None)"""
+    client = get_redis_client()
+    if not client:
+        logger.warning("Redis 연결 불가: KG edge 버전을 갱신하지 못했습니다 (스냅샷은 주기적 갱신으로 반영).")
+        return None
+    try:
+        version = int(client.incr(KG_EDGE_VERSION_KEY))
+        logger.info(f"KG edge 버전 갱신: v{version}")
+        return version
+    except Exception as e:
+        logger.warning(f"KG edge 버전 갱신 실패: {e}")
+        return None
@@ -0,0 +1,193 @@
+"""
+Prometheus 메트릭
+
+요약 파이프라인 단계별 시간, 중복 제거, 피드별 RSS 수집, 네임스페이스별 캐시 hit/miss,
+DB 커넥션 풀 checkout 대기, Celery 큐 대기 시간, 모델 로드 시간을 집계합니다.
+
+- API: GET /metrics
+- Celery 워커: CELERY_METRICS_PORT의 /metrics (worker_init에서 HTTP 서버 시작)
+  prefork 워커는 자식 프로세스별 값을 PROMETHEUS_MULTIPROC_DIR에 기록하고 합산하여 노출합니다.
+"""
+import os
+import time
+import logging
+from contextlib import contextmanager
+from typing import Iterator
+
+from prometheus_client import (
+    CollectorRegistry,
+    Counter,
+    Gauge,
+    Histogram,
+    REGISTRY,
+    CONTENT_TYPE_LATEST,
+    generate_latest,
+    multiprocess,
+    start_http_server,
+)
+
+logger = logging.getLogger(__name__)
+
+# 모델 추론/수집 단계용 버킷 (초)
+STAGE_BUCKETS = (0.01, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0, 60.0, 120.0)
+# 커넥션 풀 checkout 대기용 버킷 (초)
+POOL_WAIT_BUCKETS = (0.0005, 0.001, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 5.0, 30.0)
+
+SUMMARIZER_STAGE_SECONDS = Histogram(
+    "news_insight_summarizer_stage_seconds",
+    "요약 파이프라인 단계별 소요 시간 (배치 호출 단위)",
+    ["stage"],
+    buckets=STAGE_BUCKETS,
+)
+SUMMARIZER_DOCUMENTS = Counter(
+    "news_insight_summarizer_documents",
+    "요약 파이프라인 처리 문서 수",
+    ["status"],
+)
+DEDUP_SECONDS = Histogram(
+    "news_insight_dedup_seconds",
+    "기사 중복 제거 소요 시간",
+    buckets=STAGE_BUCKETS,
+)
+DEDUP_ARTICLES = Counter(
+    "news_insight_dedup_articles",
+    "중복 제거 입력/출력 기사 수",
+    ["stage"],
+)
+RSS_FETCH_SECONDS = Histogram(
+    "news_insight_rss_fetch_seconds",
+    "RSS 피드별 수집 소요 시간 (OG 메타데이터 보완 포함)",
+    ["feed"],
+    buckets=STAGE_BUCKETS,
+)
+RSS_ARTICLES = Counter(
+    "news_insight_rss_articles",
+    "RSS 피드별 수집 기사 수",
+    ["feed"],
+)
+RSS_FETCH_ERRORS = Counter(
+    "news_insight_rss_fetch_errors",
+    "RSS 피드별 수집 실패 수",
+    ["feed"],
+)
+CACHE_REQUESTS = Counter(
+    "news_insight_cache_requests",
+    "캐시 조회 결과 (네임스페이스 = 캐시 키 접두사)",
+    ["namespace", "result"],
+)
+DB_POOL_CHECKOUT_SECONDS = Histogram(
+    "news_insight_db_pool_checkout_seconds",
+    "DB 커넥션 풀 checkout 대기 시간",
+    ["engine"],
+    buckets=POOL_WAIT_BUCKETS,
+)
+CELERY_QUEUE_LATENCY_SECONDS = Histogram(
+    "news_insight_celery_queue_latency_seconds",
+    "Celery 작업 발행 → 실행 시작 대기 시간",
+    ["queue", "task"],
+    buckets=STAGE_BUCKETS,
+)
+CELERY_TASK_SECONDS = Histogram(
+    "news_insight_celery_task_seconds",
+    "Celery 작업 실행 시간",
+    ["task", "state"],
+    buckets=STAGE_BUCKETS,
+)
+MODEL_LOAD_SECONDS = Gauge(
+    "news_insight_model_load_seconds",
+    "모델 로드(warm-up) 소요 시간",
+    ["model"],
+    multiprocess_mode="max",
+)
+
+
+@contextmanager
+def observe_seconds(histogram, **labels) -> Iterator[None]:
+    """블록 실행 시간을 histogram에 기록"""
+    start = time.perf_counter()
+    try:
+        yield
+    finally:
+        target = histogram.labels(**labels) if labels else histogram
+        target.observe(time.perf_counter() - start)
+
+
+def record_cache_request(key: str, result: str):
+    """
+    캐시 조회 결과 기록
+
+    Args:
+        key: 캐시 키 (첫 ':' 앞부분을 네임스페이스로 사용)
+        result: hit / miss / error
+    """
+    CACHE_REQUESTS.labels(namespace=key.split(":", 1)[0], result=result).inc()
+
+
+def timed_pool_class(pool_class, engine_label: str):
+    """
+    checkout 대기 시간을 기록하는 커넥션 풀 클래스 생성
+
+    Args:
+        pool_class: SQLAlchemy 풀 클래스 (QueuePool, AsyncAdaptedQueuePool)
+        engine_label: 메트릭 engine 라벨 (sync / async)
+    """
+    histogram = DB_POOL_CHECKOUT_SECONDS.labels(engine=engine_label)
+
+    class TimedPool(pool_class):
+        def _do_get(self):
+            start = time.perf_counter()
+            try:
+                return super()._do_get()
+            finally:
+                histogram.observe(time.perf_counter() - start)
+
+    TimedPool.__name__ = f"Timed{pool_class.__name__}"
+    return TimedPool
+
+
+def _multiprocess_dir() -> str:
+    return os.getenv("PROMETHEUS_MULTIPROC_DIR") or os.getenv("prometheus_multiproc_dir") or ""
+
+
+def render_metrics():
+    """
+    Prometheus text format 응답 본문
+
+    Returns:
+        (본문 bytes, Content-Type)
+    """
+    if _multiprocess_dir():
+        registry = CollectorRegistry()
+        multiprocess.MultiProcessCollector(registry)
+    else:
+        registry = REGISTRY
+    return generate_latest(registry), CONTENT_TYPE_LATEST
+
+
+def start_worker_metrics_server(port: int):
+    """
+    Celery 워커 메트릭 HTTP 서버 시작 (port가 0이면 비활성화)
+
+    multiprocess 모드에서는 자식 프로세스 값을 합산하여 노출합니다.
+    디렉터리 생성/이전 실행 파일 정리는 프로세스 시작 전에 해야 합니다 (docker-compose command).
+    모듈 수준 메트릭은 import 시 이미 값 파일을 열었으므로 여기서 지우면 그 값이 사라집니다.
+    """
+    if not port:
+        return
+    path = _multiprocess_dir()
+    if path:
+        registry = CollectorRegistry()
+        multiprocess.MultiProcessCollector(registry)
+    else:
+        registry = REGISTRY
+    try:
+        start_http_server(port, registry=registry)
+        logger.info(f"Celery 메트릭 서버 시작: :{port}/metrics")
+    except OSError as e:
+        logger.warning(f"Celery 메트릭 서버 시작 실패 (port={port}): {e}")
+
+
+def mark_worker_process_dead(pid: int):
+    """prefork 자식 프로세스 종료 시 multiprocess live gauge 정리"""
+    if _multiprocess_dir():
+        multiprocess.mark_process_dead(pid)
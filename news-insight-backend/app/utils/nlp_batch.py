@@ -0,0 +1,176 @@
+"""
+배치 NLP 프론트엔드 (kiwipiepy 멀티스레드 배치 처리)
+
+문서 여러 개를 한 번에 Kiwi에 넘겨 내부 워커 스레드(num_workers)로
+문장 분리 / 형태소 분석을 병렬 수행합니다.
+
+- 프로세스당 Kiwi 인스턴스 1개 공유 (sentence_split, keywords 등이 모두 사용)
+- 입력: 문서 iterable, 출력: 문서별 결과 리스트 (입력 순서 유지)
+- kiwipiepy 미설치/실패 시 문서별 fallback 분할
+"""
+import re
+import threading
+import logging
+from typing import Callable, Dict, Iterable, List, Optional
+
+from app.config import settings
+
+logger = logging.getLogger(__name__)
+
+# 공유 Kiwi 인스턴스 (지연 로딩, False = 로드 실패)
+_kiwi = None
+_kiwi_lock = threading.Lock()
+
+
+def get_kiwi():
+    """
+    공유 Kiwi 인스턴스 (최초 1회만 로드)
+
+    num_workers는 KIWI_NUM_WORKERS 설정을 따릅니다 (0 = 가용 코어 전체).
+
+    Returns:
+        Kiwi 인스턴스 (kiwipiepy 미설치 시 None)
+    """
+    global _kiwi
+    if _kiwi is None:
+        with _kiwi_lock:
+            if _kiwi is None:
+                try:
+                    from kiwipiepy import Kiwi
+                    _kiwi = Kiwi(num_workers=settings.KIWI_NUM_WORKERS)
+                    logger.info(f"Kiwi 형태소 분석기 로드 완료 (num_workers={settings.KIWI_NUM_WORKERS})")
+                except ImportError:
+                    logger.warning("kiwipiepy not installed. pip install kiwipiepy")
+                    _kiwi = False
+    return _kiwi if _kiwi else None
+
+
+def regex_split_sentences(text: str) -> List[str]:
+    """Fallback: regex 기반 문장 분리 (kiwipiepy 미설치 시)"""
+    sentences = re.split(r'[.!?]\s+', text)
+    return [s.strip() + '.' for s in sentences if s.strip()]
+
+
+def _run_batch(texts: List[str], kiwi_call: Callable, empty_result, label: str) -> Optional[List]:
+    """
+    비어있지 않은 문서만 Kiwi 배치 호출에 넘기고 결과를 원래 순서로 되돌림
+
+    Returns:
+        문서별 결과 리스트 (Kiwi 사용 불가/실패 시 None)
+    """
+    kiwi = get_kiwi()
+    if not kiwi:
+        return None
+
+    indices = [i for i, text in enumerate(texts) if text]
+    results = [empty_result() for _ in texts]
+    if not indices:
+        return results
+
+    try:
+        batch_results = kiwi_call(kiwi, [texts[i] for i in indices])
+        for i, result in zip(indices, batch_results):
+            results[i] = result
+        return results
+    except Exception as e:
+        logger.warning(f"Kiwi 배치 {label} 실패 ({len(indices)}개 문서), fallback 사용: {e}")
+        return None
+
+
+def split_sentences_batch(
+    texts: Iterable[str],
+    min_length: int = 1,
+    fallback: Optional[Callable[[str], List[str]]] = None
+) -> List[List[str]]:
+    """
+    여러 문서의 문장 분리 (Kiwi 멀티스레드 배치)
+
+    Args:
+        texts: 문서 iterable
+        min_length: 최소 문장 길이 (Kiwi 결과에만 적용)
+        fallback: Kiwi 사용 불가 시 문서별 분할 함수 (기본: regex 분할, 결과 그대로 사용)
+
+    Returns:
+        문서별 문장 리스트 (입력 순서)
+    """
+    texts = [text or "" for text in texts]
+    fallback = fallback or regex_split_sentences
+
+    sents_per_doc = _run_batch(texts, lambda kiwi, docs: kiwi.split_into_sents(docs), list, "문장 분리")
+    if sents_per_doc is None:
+        return [fallback(text) if text else [] for text in texts]
+
+    results = []
+    for sents in sents_per_doc:
+        sentences = [sent.text.strip() for sent in sents]
+        results.append([s for s in sentences if s and len(s) >= min_length])
+    return results
+
+
+def split_sentences_with_positions_batch(texts: Iterable[str], min_length: int = 1) -> List[List[Dict]]:
+    """
+    여러 문서의 문장 분리 + 위치 정보
+
+    Returns:
+        문서별 [{"text": "문장", "start": 0, "end": 10}, ...] (Kiwi 사용 불가 시 start/end = -1)
+    """
+    texts = [text or "" for text in texts]
+
+    sents_per_doc = _run_batch(texts, lambda kiwi, docs: kiwi.split_into_sents(docs), list, "문장 분리")
+    if sents_per_doc is None:
+        return [
+            [{"text": s, "start": -1, "end": -1} for s in regex_split_sentences(text)] if text else []
+            for text in texts
+        ]
+
+    results = []
+    for sents in sents_per_doc:
+        doc = [{"text": sent.text.strip(), "start": sent.start, "end": sent.end} for sent in sents]
+        results.append([r for r in doc if r["text"] and len(r["text"]) >= min_length])
+    return results
+
+
+def analyze_batch(texts: Iterable[str]) -> List[List]:
+    """
+    여러 문서의 형태소 분석 (Kiwi 멀티스레드 배치)
+
+    Returns:
+        문서별 최적 분석 결과 토큰 리스트 (token.form, token.tag, token.start, token.len)
+
+    Raises:
+        RuntimeError: kiwipiepy를 사용할 수 없는 경우 (형태소 분석은 fallback 없음)
+    """
+    texts = [text or "" for text in texts]
+
+    analyses = _run_batch(texts, lambda kiwi, docs: kiwi.analyze(docs), list, "형태소 분석")
+    if analyses is None:
+        raise RuntimeError("Kiwi 형태소 분석을 사용할 수 없습니다.")
+
+    # analyze 결과: 문서별 [(tokens, score), ...] (top_n=1)
+    return [list(analysis[0][0]) if analysis else [] for analysis in analyses]
+
+
+def process_documents(texts: Iterable[str], min_length: int = 1) -> List[Dict]:
+    """
+    여러 문서의 문장 + 형태소 일괄 처리
+
+    Returns:
+        문서별 {"sentences": [...], "morphemes": [{"form", "tag", "start", "len"}, ...]}
+    """
+    texts = [text or "" for text in texts]
+    sentences = split_sentences_batch(texts, min_length=min_length)
+    try:
+        morphemes = analyze_batch(texts)
+    except RuntimeError:
+        morphemes = [[] for _ in texts]
+
+    return [
+        {
+            "sentences": doc_sentences,
+            "morphemes": [
+                {"form": t.form, "tag": t.tag, "start": t.start, "len": t.len}
+                for t in doc_tokens
+            ],
+        }
+        for doc_sentences, doc_tokens in zip(sentences, morphemes)
+    ]
@@ -0,0 +1,173 @@
+"""
+요청/작업 단위 SQL 실행 통계 (N+1 탐지)
+
+SQLAlchemy cursor 이벤트로 statement 수, 총 DB 시간, statement 형태(shape)별
+반복 횟수를 집계합니다. 같은 형태가 SQL_REPEAT_WARN_THRESHOLD 이상 반복되면
+N+1 의심 경고를 남깁니다.
+
+- API 요청: QueryStatsMiddleware (DEBUG 모드에서는 응답 헤더로 노출)
+- Celery 작업: task_prerun / task_postrun 시그널 (celery_worker.py)
+- 스크립트: with track_queries("이름"): ...
+
+집계 중인 요청/작업이 없으면 이벤트 훅은 즉시 반환합니다.
+"""
+import re
+import time
+import logging
+from collections import Counter
+from contextlib import contextmanager
+from contextvars import ContextVar, Token
+from typing import Dict, Iterator, Optional
+
+from sqlalchemy import event
+
+from app.config import settings
+
+logger = logging.getLogger(__name__)
+
+# 현재 요청/작업의 통계 (mutable dict: 스레드 풀로 복사된 context에서도 같은 객체에 누적)
+_current_stats: ContextVar[Optional[Dict]] = ContextVar("query_stats", default=None)
+
+# statement 형태 정규화 (리터럴/IN 목록 길이가 달라도 같은 형태로 집계)
+_STRING_LITERAL_PATTERN = re.compile(r"'(?:[^']|'')*'")
+_NUMBER_LITERAL_PATTERN = re.compile(r"\b\d+(?:\.\d+)?\b")
+_IN_LIST_PATTERN = re.compile(r"\bIN\s*\([^()]*\)", re.IGNORECASE)
+_WHITESPACE_PATTERN = re.compile(r"\s+")
+
+# 로그/헤더에 표시할 shape 최대 길이
+MAX_SHAPE_LENGTH = 200
+
+# DEBUG 모드 응답 헤더
+HEADER_QUERY_COUNT = "X-DB-Query-Count"
+HEADER_QUERY_TIME = "X-DB-Query-Time-Ms"
+HEADER_QUERY_MAX_REPEAT = "X-DB-Query-Max-Repeat"
+
+
+def normalize_statement(statement: str) -> str:
+    """SQL statement → 형태(shape) 문자열"""
+    shape = _STRING_LITERAL_PATTERN.sub("?", statement)
+    shape = _IN_LIST_PATTERN.sub("IN (?)", shape)
+    shape = _NUMBER_LITERAL_PATTERN.sub("?", shape)
+    return _WHITESPACE_PATTERN.sub(" ", shape).strip()
+
+
+def start_query_stats() -> Token:
+    """현재 context에서 SQL 통계 집계 시작 (finish_query_stats에 token 전달)"""
+    return _current_stats.set({"count": 0, "time": 0.0, "shapes": Counter()})
+
+
+def get_query_stats() -> Optional[Dict]:
+    """집계 중인 통계 요약 (집계 중이 아니면 None)"""
+    stats = _current_stats.get()
+    if stats is None:
+        return None
+    return _summarize(stats)
+
+
+def _summarize(stats: Dict) -> Dict:
+    shapes = stats["shapes"]
+    threshold = settings.SQL_REPEAT_WARN_THRESHOLD
+    return {
+        "count": stats["count"],
+        "time_ms": round(stats["time"] * 1000, 1),
+        "max_repeat": max(shapes.values()) if shapes else 0,
+        "repeated": [(shape, n) for shape, n in shapes.most_common() if n >= threshold],
+    }
+
+
+def finish_query_stats(token: Token, label: str) -> Dict:
+    """
+    SQL 통계 집계 종료 및 로그 기록
+
+    Args:
+        token: start_query_stats 반환값
+        label: 로그에 표시할 요청/작업 이름
+
+    Returns:
+        {"count", "time_ms", "max_repeat", "repeated": [(shape, 횟수), ...]}
+    """
+    stats = _current_stats.get()
+    _current_stats.reset(token)
+    if stats is None:
+        return {"count": 0, "time_ms": 0.0, "max_repeat": 0, "repeated": []}
+
+    summary = _summarize(stats)
+    for shape, n in summary["repeated"]:
+        logger.warning(f"[SQL] N+1 의심: {label} - 같은 형태 {n}회 실행: {shape[:MAX_SHAPE_LENGTH]}")
+    if summary["count"]:
+        logger.debug(f"[SQL] {label}: {summary['count']}개 statement, {summary['time_ms']}ms")
+    return summary
+
+
+@contextmanager
+def track_queries(label: str) -> Iterator[None]:
+    """스크립트/배치 작업용 SQL 통계 집계 블록"""
+    token = start_query_stats()
+    try:
+        yield
+    finally:
+        finish_query_stats(token, label)
+
+
+def _before_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+    if _current_stats.get() is None:
+        return
+    conn.info.setdefault("query_stats_start", []).append(time.perf_counter())
+
+
+def _after_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+    stats = _current_stats.get()
+    if stats is None:
+        return
+    starts = conn.info.get("query_stats_start")
+    if starts:
+        stats["time"] += time.perf_counter() - starts.pop()
+    stats["count"] += 1
+    stats["shapes"][normalize_statement(statement)] += 1
+
+
+def install_query_instrumentation(engine):
+    """
+    엔진에 SQL 통계 이벤트 훅 등록
+
+    Args:
+        engine: 동기 Engine (AsyncEngine은 .sync_engine 전달)
+    """
+    event.listen(engine, "before_cursor_execute", _before_cursor_execute)
+    event.listen(engine, "after_cursor_execute", _after_cursor_execute)
+
+
+class QueryStatsMiddleware:
+    """
+    요청 단위 SQL 통계 ASGI 미들웨어
+
+    DEBUG 모드에서는 statement 수 / DB 시간 / 최대 반복 횟수를 응답 헤더로 노출합니다.
+    (응답 시작 시점까지의 집계, 스트리밍 응답 중 실행된 쿼리는 로그에만 반영)
+    """
+
+    def __init__(self, app):
+        self.app = app
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        token = start_query_stats()
+
+        async def send_with_stats(message):
+            if message["type"] == "http.response.start" and settings.DEBUG:
+                summary = get_query_stats()
+                headers = list(message.get("headers", []))
+                headers += [
+                    (HEADER_QUERY_COUNT.lower().encode(), str(summary["count"]).encode()),
+                    (HEADER_QUERY_TIME.lower().encode(), str(summary["time_ms"]).encode()),
+                    (HEADER_QUERY_MAX_REPEAT.lower().encode(), str(summary["max_repeat"]).encode()),
+                ]
+                message = {**message, "headers": headers}
+            await send(message)
+
+        try:
+            await self.app(scope, receive, send_with_stats)
+        finally:
+            finish_query_stats(token, f"{scope.get('method', '')} {scope.get('path', '')}")
@@ -7,35 +7,31 @@ kiwipiepy는 형태소 분석 기반으로 문장 경계를 정확히 인식합
 v2 변경사항:
 - kiwipiepy 기반 문장 분리 (정확도 향상)
 - Fallback: regex 기반 (kiwipiepy 미설치 시)
+
+v3 변경사항:
+- Kiwi 인스턴스를 app.utils.nlp_batch와 공유 (프로세스당 1개)
+- 다건 처리는 nlp_batch.split_sentences_batch 사용
 """
-import re
 from typing import List, Dict
 import logging
 
-logger = logging.getLogger(__name__)
-
-# kiwipiepy 지연 로딩
-_kiwi = None
+from app.utils.nlp_batch import (
+    split_sentences_batch,
+    split_sentences_with_positions_batch,
+)
 
+logger = logging.getLogger(__name__)
 
-def _get_kiwi():
-    """kiwipiepy 인스턴스 지연 로딩"""
-    global _kiwi
-    if _kiwi is None:
-        try:
-            from kiwipiepy import Kiwi
-            _kiwi = Kiwi()
-            logger.info("kiwipiepy 로드 완료")
-        except ImportError:
-            logger.warning("kiwipiepy not installed. pip install kiwipiepy")
-            _kiwi = False
-    return _kiwi if _kiwi else None
+# kiwipiepy 결과의 최소 문장 길이 (len(s) > 5 인 문장만 유지)
+MIN_SENTENCE_LENGTH = 6
 
 
 def split_sentences(text: str) -> List[str]:
     """
     한국어 문장 분리 (kiwipiepy 사용)
     
+    여러 문서를 처리할 때는 split_sentences_batch()를 사용하세요 (멀티스레드 배치).
+    
     Args:
         text: 원본 텍스트
     
@@ -45,23 +41,7 @@ def split_sentences(text: str) -> List[str]:
     if not text:
         return []
     
-    kiwi = _get_kiwi()
-    
-    if kiwi:
-        # kiwipiepy 사용 (정확도 높음)
-        try:
-            sentences = [sent.text.strip() for sent in kiwi.split_into_sents(text)]
-            # 빈 문장 및 너무 짧은 문장 제거
-            sentences = [s for s in sentences if s and len(s) > 5]
-            return sentences
-        except Exception as e:
-            logger.warning(f"kiwipiepy 문장 분리 실패, fallback 사용: {e}")
-    
-    # Fallback: regex 기반 (기존 로직)
-    sentences = re.split(r'[.!?]\s+', text)
-    sentences = [s.strip() + '.' for s in sentences if s.strip()]
-    
-    return sentences
+    return split_sentences_batch([text], min_length=MIN_SENTENCE_LENGTH)[0]
 
 
 def split_sentences_with_positions(text: str) -> List[Dict]:
@@ -74,22 +54,4 @@ def split_sentences_with_positions(text: str) -> List[Dict]:
     if not text:
         return []
     
-    kiwi = _get_kiwi()
-    
-    if kiwi:
-        try:
-            results = []
-            for sent in kiwi.split_into_sents(text):
-                results.append({
-                    "text": sent.text.strip(),
-                    "start": sent.start,
-                    "end": sent.end
-                })
-            return [r for r in results if r["text"] and len(r["text"]) > 5]
-        except Exception as e:
-            logger.warning(f"kiwipiepy 실패: {e}")
-    
-    # Fallback
-    sentences = split_sentences(text)
-    return [{"text": s, "start": -1, "end": -1} for s in sentences]
-
+    return split_sentences_with_positions_batch([text], min_length=MIN_SENTENCE_LENGTH)[0]
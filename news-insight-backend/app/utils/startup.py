@@ -0,0 +1,142 @@
+"""
+서버 시작 상태 관리 (liveness / readiness 분리)
+
+- liveness(/health): 프로세스가 요청을 받을 수 있으면 즉시 healthy
+- readiness(/ready): 기업명 딕셔너리, AI 모델 등 필수 컴포넌트가 준비되었는지 확인
+- startup report: 시작 단계별 소요 시간 및 무거운 ML 모듈의 import 여부
+"""
+import logging
+import sys
+import threading
+import time
+from contextlib import contextmanager
+from typing import Callable, Dict, List, Optional
+
+logger = logging.getLogger(__name__)
+
+# 시작 시 import 되면 안 되는 무거운 ML 모듈 (lazy 로딩 확인용)
+HEAVY_MODULES = (
+    "torch",
+    "transformers",
+    "keybert",
+    "sentence_transformers",
+    "kiwipiepy",
+    "FlagEmbedding",
+    "langchain_openai",
+)
+
+# 컴포넌트 상태
+STATUS_PENDING = "pending"
+STATUS_LOADING = "loading"
+STATUS_READY = "ready"
+STATUS_FAILED = "failed"
+STATUS_DEFERRED = "deferred"  # 첫 사용 시 로드 (lazy 모드)
+
+
+class StartupState:
+    """서버 시작 단계 및 컴포넌트 준비 상태 관리"""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._process_start = time.time()
+        self._phases: List[Dict] = []
+        self._components: Dict[str, Dict] = {}
+
+    def register(self, name: str, required: bool = True):
+        """readiness 판단에 사용할 컴포넌트 등록"""
+        with self._lock:
+            self._components[name] = {
+                "status": STATUS_PENDING,
+                "required": required,
+                "duration": None,
+                "error": None,
+            }
+
+    def set_status(self, name: str, status: str, duration: Optional[float] = None, error: Optional[str] = None):
+        """컴포넌트 상태 갱신"""
+        with self._lock:
+            component = self._components.setdefault(
+                name, {"status": STATUS_PENDING, "required": True, "duration": None, "error": None}
+            )
+            component["status"] = status
+            if duration is not None:
+                component["duration"] = round(duration, 3)
+            component["error"] = error
+
+    def run_component(self, name: str, loader: Callable[[], object]) -> bool:
+        """
+        컴포넌트 로더 실행 및 상태 기록
+
+        loader가 False를 반환하거나 예외를 던지면 failed로 기록합니다.
+        """
+        self.set_status(name, STATUS_LOADING)
+        start = time.time()
+        try:
+            result = loader()
+        except Exception as e:
+            self.set_status(name, STATUS_FAILED, time.time() - start, str(e))
+            logger.warning(f"[startup] {name} 로드 실패: {e}")
+            return False
+
+        if result is False:
+            self.set_status(name, STATUS_FAILED, time.time() - start, "loader returned False")
+            return False
+
+        self.set_status(name, STATUS_READY, time.time() - start)
+        return True
+
+    def run_in_background(self, name: str, target: Callable[[], object]) -> threading.Thread:
+        """시작 작업을 백그라운드 스레드에서 실행 (이벤트 루프 블로킹 방지)"""
+        thread = threading.Thread(target=target, name=f"startup-{name}", daemon=True)
+        thread.start()
+        return thread
+
+    @contextmanager
+    def phase(self, name: str):
+        """시작 단계 소요 시간 측정"""
+        start = time.time()
+        try:
+            yield
+        finally:
+            duration = time.time() - start
+            with self._lock:
+                self._phases.append({"name": name, "duration": round(duration, 3)})
+            logger.info(f"[startup] {name}: {duration:.3f}초")
+
+    def is_ready(self) -> bool:
+        """필수 컴포넌트가 모두 ready(또는 deferred)인지 확인"""
+        with self._lock:
+            return all(
+                c["status"] in (STATUS_READY, STATUS_DEFERRED)
+                for c in self._components.values()
+                if c["required"]
+            )
+
+    def readiness(self) -> Dict:
+        """readiness 응답 본문"""
+        with self._lock:
+            components = {name: dict(c) for name, c in self._components.items()}
+        return {
+            "ready": self.is_ready(),
+            "components": components,
+        }
+
+    def report(self) -> Dict:
+        """시작 프로파일 리포트 (단계별 시간 + 무거운 모듈 import 여부)"""
+        with self._lock:
+            phases = list(self._phases)
+        return {
+            "uptime": round(time.time() - self._process_start, 3),
+            "phases": phases,
+            "heavy_modules_loaded": loaded_heavy_modules(),
+            **self.readiness(),
+        }
+
+
+def loaded_heavy_modules() -> List[str]:
+    """현재 프로세스에 import 된 무거운 ML 모듈 목록"""
+    return [name for name in HEAVY_MODULES if name in sys.modules]
+
+
+# 전역 인스턴스
+startup_state = StartupState()
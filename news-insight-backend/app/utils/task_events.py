@@ -0,0 +1,145 @@
+"""
+작업 진행 이벤트 (Redis pub/sub)
+
+Celery 워커가 단계별 진행 상황과 최종 결과를 작업별 채널로 발행하고,
+API는 채널을 구독하여 클라이언트에 SSE로 전달합니다 (status 폴링 대체).
+SSE 스트림은 redis.asyncio 구독을 await 하므로 대기 중인 클라이언트가 스레드를 점유하지 않습니다.
+
+- 채널: task:events:{task_id}
+- 마지막 이벤트는 task:events:last:{task_id}에 TTL과 함께 보관
+  (구독 전에 발행된 이벤트/완료된 작업도 조회 가능, 만료 후 자동 삭제)
+"""
+import json
+import time
+import logging
+from typing import AsyncIterator, Dict, Optional
+
+from app.config import settings
+from app.utils.cache import get_redis_client, get_async_redis_client
+
+logger = logging.getLogger(__name__)
+
+TASK_EVENT_CHANNEL = "task:events:{task_id}"
+TASK_LAST_EVENT_KEY = "task:events:last:{task_id}"
+
+# 이벤트 상태
+EVENT_PROGRESS = "progress"
+EVENT_DONE = "done"
+EVENT_FAILED = "failed"
+TERMINAL_EVENTS = frozenset({EVENT_DONE, EVENT_FAILED})
+
+# SSE 연결 유지용 heartbeat 주기 (초)
+HEARTBEAT_INTERVAL = 15
+
+
+def publish_task_event(
+    task_id: str,
+    state: str,
+    progress: int = 0,
+    message: str = "",
+    result: Optional[Dict] = None
+):
+    """
+    작업 이벤트 발행 (Redis 미사용 시 무시)
+
+    Args:
+        task_id: Celery 작업 ID
+        state: progress / done / failed
+        progress: 진행률 (0~100)
+        message: 단계 설명
+        result: 최종 결과 (done일 때)
+    """
+    client = get_redis_client()
+    if not client:
+        return
+
+    event = {"task_id": task_id, "state": state, "progress": progress, "message": message}
+    if result is not None:
+        event["result"] = result
+
+    try:
+        data = json.dumps(event, ensure_ascii=False)
+        pipe = client.pipeline()
+        pipe.setex(TASK_LAST_EVENT_KEY.format(task_id=task_id), settings.TASK_EVENT_TTL, data)
+        pipe.publish(TASK_EVENT_CHANNEL.format(task_id=task_id), data)
+        pipe.execute()
+    except Exception as e:
+        logger.warning(f"작업 이벤트 발행 실패 (task_id={task_id}): {e}")
+
+
+def get_last_task_event(task_id: str) -> Optional[Dict]:
+    """마지막 작업 이벤트 조회 (없거나 만료되면 None)"""
+    client = get_redis_client()
+    if not client:
+        return None
+
+    try:
+        data = client.get(TASK_LAST_EVENT_KEY.format(task_id=task_id))
+        if data:
+            return json.loads(data)
+    except Exception as e:
+        logger.warning(f"작업 이벤트 조회 실패 (task_id={task_id}): {e}")
+    return None
+
+
+def _format_sse(event: Dict) -> str:
+    """SSE 메시지 포맷"""
+    return f"event: {event['state']}\ndata: {json.dumps(event, ensure_ascii=False)}\n\n"
+
+
+async def stream_task_events(task_id: str, timeout: Optional[int] = None) -> AsyncIterator[str]:
+    """
+    작업 이벤트 SSE 스트림 (완료/실패 이벤트 또는 timeout 시 종료)
+
+    구독을 먼저 시작한 뒤 마지막 이벤트를 보내므로, 그 사이에 발행된 이벤트도 놓치지 않습니다.
+    이벤트 대기는 이벤트 루프에서 await 하므로 연결 수만큼 스레드를 쓰지 않습니다.
+
+    Args:
+        task_id: Celery 작업 ID
+        timeout: 최대 스트림 유지 시간 (초, 기본: TASK_EVENT_STREAM_TIMEOUT)
+
+    Yields:
+        SSE 형식 문자열
+    """
+    timeout = timeout or settings.TASK_EVENT_STREAM_TIMEOUT
+    client = get_async_redis_client()
+    if not client:
+        yield _format_sse({"task_id": task_id, "state": EVENT_FAILED, "progress": 0,
+                           "message": "이벤트 스트림을 사용할 수 없습니다 (Redis 연결 실패)"})
+        return
+
+    pubsub = client.pubsub(ignore_subscribe_messages=True)
+    try:
+        await pubsub.subscribe(TASK_EVENT_CHANNEL.format(task_id=task_id))
+
+        data = await client.get(TASK_LAST_EVENT_KEY.format(task_id=task_id))
+        if data:
+            last_event = json.loads(data)
+            yield _format_sse(last_event)
+            if last_event["state"] in TERMINAL_EVENTS:
+                return
+
+        deadline = time.monotonic() + timeout
+        next_heartbeat = time.monotonic() + HEARTBEAT_INTERVAL
+        while time.monotonic() < deadline:
+            message = await pubsub.get_message(ignore_subscribe_messages=True, timeout=1.0)
+            if message and message.get("type") == "message":
+                event = json.loads(message["data"])
+                yield _format_sse(event)
+                if event["state"] in TERMINAL_EVENTS:
+                    return
+            elif time.monotonic() >= next_heartbeat:
+                yield ": heartbeat\n\n"
+                next_heartbeat = time.monotonic() + HEARTBEAT_INTERVAL
+
+        yield _format_sse({"task_id": task_id, "state": "timeout", "progress": 0,
+                           "message": "이벤트 대기 시간 초과, /status로 확인해주세요"})
+    except Exception as e:
+        logger.warning(f"작업 이벤트 스트림 실패 (task_id={task_id}): {e}")
+        yield _format_sse({"task_id": task_id, "state": EVENT_FAILED, "progress": 0,
+                           "message": "이벤트 스트림 오류, /status로 확인해주세요"})
+    finally:
+        try:
+            await pubsub.reset()
+        except Exception:
+            pass
@@ -1,7 +1,7 @@
 import hashlib
 import html
 import re
-from typing import List, Optional
+from typing import List, Optional, Tuple
 
 
 WHITESPACE_PATTERN = re.compile(r'\s+')
@@ -100,8 +100,117 @@ HEADQUARTERS_PATTERN = re.compile(r'[가-힣]+(?:본사|지사|센터)\s*$', re.
 SCREEN_NUM_PATTERN = re.compile(r'화면\s*\d{4,}')
 URL_PATTERN = re.compile(r'https?://[^\s]+')
 
-# 언론사명 제거를 위한 동적 패턴 (긴 이름 4글자 이상)
-# 컴파일 시점에는 생성 불가하므로 함수 내에서 생성
+# 언론사명 제거 패턴 (언론사명 전체를 하나의 alternation으로 컴파일, 긴 이름 우선)
+# - 괄호 패턴: "(" ~ 다음 ")" 구간에 언론사명이 하나라도 있으면 제거
+#   (이름별로 순차 제거한 결과와 동일: 제거된 구간 앞에는 닫히지 않은 "("가 남지 않으므로 새 매칭이 생기지 않음)
+# - 단독 패턴: 4글자 이상 언론사명만 단어 경계 기준 제거 (오탐 방지)
+_NEWS_SOURCE_ALTERNATION = '|'.join(
+    re.escape(name) for name in sorted(NEWS_SOURCE_NAMES, key=lambda n: (-len(n), n))
+)
+NEWS_SOURCE_PAREN_PATTERN = re.compile(
+    rf'\([^)]*(?:{_NEWS_SOURCE_ALTERNATION})[^)]*\)',
+    re.IGNORECASE
+)
+NEWS_SOURCE_STANDALONE_PATTERN = re.compile(
+    r'\b(?:' + '|'.join(
+        re.escape(name)
+        for name in sorted(NEWS_SOURCE_NAMES, key=lambda n: (-len(n), n))
+        if len(name) >= 4
+    ) + r')\b',
+    re.IGNORECASE
+)
+# 키워드 필터링용 (대소문자 구분 부분 문자열 매칭)
+NEWS_SOURCE_SUBSTRING_PATTERN = re.compile(_NEWS_SOURCE_ALTERNATION)
+
+# 키워드 필터링용 메타데이터 키워드
+METADATA_KEYWORDS = frozenset({
+    '서울', '부산', '인천', '기자', '특파원', '입력', '수정',
+    '저작권', '무단', '재배포', '금지', 'AI', '학습', '활용',
+    '촬영', '본사', '화면', '서비스'
+})
+METADATA_KEYWORD_PATTERN = re.compile('|'.join(re.escape(kw) for kw in sorted(METADATA_KEYWORDS)))
+
+# 제어 문자 → 공백 치환 + 연속 공백 정리를 한 번에 수행
+# (NON_PRINTABLE_PATTERN → WHITESPACE_PATTERN 순차 적용과 동일,
+#  이후 MULTI_NEWLINE_PATTERN은 줄바꿈이 남지 않으므로 적용할 필요 없음)
+WHITESPACE_NON_PRINTABLE_PATTERN = re.compile(r'[\s\x00-\x08\x0b-\x0c\x0e-\x1f]+')
+
+
+class CleanStep:
+    """
+    정제 단계 (정규식 치환 1회)
+
+    required: 패턴이 매칭되려면 반드시 포함되어야 하는 리터럴 (하나라도 있으면 실행)
+              해당 리터럴이 없으면 정규식 스캔 자체를 건너뛴다 (결과는 동일).
+    """
+
+    __slots__ = ('pattern', 'repl', 'required')
+
+    def __init__(self, pattern, repl: str = '', required: Optional[Tuple[str, ...]] = None):
+        self.pattern = pattern
+        self.repl = repl
+        self.required = required
+
+    def apply(self, text: str) -> str:
+        if self.required is not None:
+            for literal in self.required:
+                if literal in text:
+                    break
+            else:
+                return text
+        return self.pattern.sub(self.repl, text)
+
+
+class TextCleaner:
+    """컴파일된 정제 단계 목록 (순서대로 적용)"""
+
+    def __init__(self, steps: List[CleanStep]):
+        self.steps = steps
+
+    def __call__(self, text: str) -> str:
+        for step in self.steps:
+            text = step.apply(text)
+        return text
+
+
+# 언론사명 제거 단계 (괄호 패턴 → 단독 패턴)
+_NEWS_SOURCE_STEPS = [
+    CleanStep(NEWS_SOURCE_PAREN_PATTERN, '', ('(',)),
+    CleanStep(NEWS_SOURCE_STANDALONE_PATTERN, ''),
+]
+
+# 키워드 추출용 정제 1~5단계 (clean_text_for_keywords)
+_KEYWORD_CLEANER = TextCleaner([
+    # 1단계: 고정형 구조 제거 (저작권 정보)
+    CleanStep(COPYRIGHT_PATTERN_HTML, '', ('<저작권자',)),
+    CleanStep(COPYRIGHT_PATTERN_TEXT, '', ('저작권자',)),
+    CleanStep(COPYRIGHT_SHORT, '', ('금지',)),
+    # 2단계: 메타데이터 제거 (기자 정보, 날짜)
+    CleanStep(REPORTER_DATE_PATTERN, '', ('|',)),
+    CleanStep(REPORTER_PATTERN, '', ('|', '｜')),
+    CleanStep(DATE_TIME_PATTERN, '', ('입력', '수정', '오전', '오후')),
+    CleanStep(EMAIL_PATTERN, '', ('@',)),
+    # 3단계: 이미지 캡션 및 대괄호 내용 제거
+    CleanStep(IMAGE_CAPTION_PATTERN, '', ('[',)),
+    CleanStep(META_BRACKET_PATTERN, '', ('[',)),
+    # 4단계: 괄호 내용 제거 (위치 정보, 소속, 언론사명)
+    CleanStep(LOCATION_PATTERN, '', ('=',)),
+    CleanStep(REPORTER_PAREN_PATTERN, '', ('기자', '특파원')),
+    *_NEWS_SOURCE_STEPS,
+    # 5단계: 본사 정보 및 기타 노이즈
+    CleanStep(HEADQUARTERS_PATTERN, '', ('본사', '지사', '센터')),
+    CleanStep(SCREEN_NUM_PATTERN, '', ('화면',)),
+    CleanStep(URL_PATTERN, '', ('http',)),
+])
+_HTML_TAG_STEP = CleanStep(HTML_TAG_PATTERN, '', ('<',))
+
+# 유사도 계산용 정규화 (normalize_article_text)
+# REPORTER_PATTERN은 2단계 정의(기자명 + 구분자)가 적용됨
+_NORMALIZE_CLEANER = TextCleaner([
+    CleanStep(HTML_TAG_PATTERN, ' ', ('<',)),
+    CleanStep(REPORTER_PATTERN, ' ', ('|', '｜')),
+    CleanStep(BRACKET_META_PATTERN, ' ', ('[',)),
+])
 
 
 def clean_text(text: str) -> str:
@@ -117,9 +226,8 @@ def clean_text(text: str) -> str:
     if not text:
         return ""
     
-    text = NON_PRINTABLE_PATTERN.sub(" ", text)
-    text = WHITESPACE_PATTERN.sub(" ", text)
-    text = MULTI_NEWLINE_PATTERN.sub("\n\n", text)
+    # 제어 문자 제거 + 공백 정리 (단일 패스)
+    text = WHITESPACE_NON_PRINTABLE_PATTERN.sub(" ", text)
     return text.strip()
 
 
@@ -132,9 +240,7 @@ def normalize_article_text(text: str) -> str:
         return ""
 
     text = html.unescape(text)
-    text = HTML_TAG_PATTERN.sub(" ", text)
-    text = REPORTER_PATTERN.sub(" ", text)
-    text = BRACKET_META_PATTERN.sub(" ", text)
+    text = _NORMALIZE_CLEANER(text)
     text = text.replace('’', "'").replace('“', '"').replace('”', '"')
     text = clean_text(text)
     return text.lower()
@@ -222,23 +328,9 @@ def remove_news_source_names(text: str) -> str:
     """
     # 1. 괄호 안의 언론사명 제거
     # 패턴: (서울=연합인포맥스), (연합인포맥스), (인포맥스) 등
-    for source_name in NEWS_SOURCE_NAMES:
-        # 괄호 안에 언론사명이 포함된 경우 제거
-        pattern = re.compile(
-            rf'\([^)]*{re.escape(source_name)}[^)]*\)',
-            re.IGNORECASE
-        )
-        text = pattern.sub('', text)
-    
     # 2. 긴 언론사명 단독 제거 (4글자 이상만, 오탐 방지)
-    for source_name in NEWS_SOURCE_NAMES:
-        if len(source_name) >= 4:
-            # 단어 경계 확인하여 단독 언론사명만 제거
-            pattern = re.compile(
-                rf'\b{re.escape(source_name)}\b',
-                re.IGNORECASE
-            )
-            text = pattern.sub('', text)
+    for step in _NEWS_SOURCE_STEPS:
+        text = step.apply(text)
     
     return text
 
@@ -265,55 +357,19 @@ def clean_text_for_keywords(text: str) -> str:
     if not text:
         return ""
     
-    # ============================================
-    # 1단계: 고정형 구조 제거 (가장 확실한 패턴)
-    # ============================================
-    text = COPYRIGHT_PATTERN_HTML.sub('', text)
-    text = COPYRIGHT_PATTERN_TEXT.sub('', text)
-    text = COPYRIGHT_SHORT.sub('', text)
-    
-    # ============================================
-    # 2단계: 메타데이터 제거 (기자 정보, 날짜)
-    # ============================================
-    text = REPORTER_DATE_PATTERN.sub('', text)
-    text = REPORTER_PATTERN.sub('', text)
-    text = DATE_TIME_PATTERN.sub('', text)
-    text = EMAIL_PATTERN.sub('', text)
-    
-    # ============================================
-    # 3단계: 이미지 캡션 및 대괄호 내용 제거
-    # ============================================
-    text = IMAGE_CAPTION_PATTERN.sub('', text)
-    text = META_BRACKET_PATTERN.sub('', text)
-    
-    # ============================================
-    # 4단계: 괄호 내용 제거 (위치 정보, 소속, 언론사명)
-    # ============================================
-    text = LOCATION_PATTERN.sub('', text)
-    text = REPORTER_PAREN_PATTERN.sub('', text)
-    
-    # 언론사명 제거 (괄호 패턴 + 단독)
-    text = remove_news_source_names(text)
-    
-    # ============================================
-    # 5단계: 본사 정보 및 기타 노이즈
-    # ============================================
-    text = HEADQUARTERS_PATTERN.sub('', text)
-    text = SCREEN_NUM_PATTERN.sub('', text)
-    text = URL_PATTERN.sub('', text)
+    # 1~5단계: 컴파일된 정제 단계 적용 (필수 리터럴이 없는 패턴은 스캔 생략)
+    text = _KEYWORD_CLEANER(text)
     
     # ============================================
     # 6단계: HTML 태그 및 특수 문자 정리
     # ============================================
-    text = HTML_TAG_PATTERN.sub('', text)
+    text = _HTML_TAG_STEP.apply(text)
     text = html.unescape(text)
-    text = NON_PRINTABLE_PATTERN.sub(' ', text)
     
     # ============================================
-    # 7단계: 공백 정리 (마지막)
+    # 7단계: 제어 문자 + 공백 정리 (단일 패스, 마지막)
     # ============================================
-    text = WHITESPACE_PATTERN.sub(' ', text)
-    text = MULTI_NEWLINE_PATTERN.sub('\n\n', text)
+    text = WHITESPACE_NON_PRINTABLE_PATTERN.sub(' ', text)
     text = text.strip()
     
     return text
@@ -332,19 +388,11 @@ def filter_keywords_by_metadata(keywords: List[str]) -> List[str]:
     filtered = []
     
     for kw in keywords:
-        # 언론사명 포함 여부 확인
-        if any(source_name in kw for source_name in NEWS_SOURCE_NAMES):
-            continue
-        # 언론사명 자체인 경우
-        if kw in NEWS_SOURCE_NAMES:
+        # 언론사명 포함 여부 확인 (언론사명 자체인 경우 포함)
+        if NEWS_SOURCE_SUBSTRING_PATTERN.search(kw):
             continue
         # 메타데이터 관련 키워드
-        metadata_keywords = {
-            '서울', '부산', '인천', '기자', '특파원', '입력', '수정',
-            '저작권', '무단', '재배포', '금지', 'AI', '학습', '활용',
-            '촬영', '본사', '화면', '서비스'
-        }
-        if any(meta_kw in kw for meta_kw in metadata_keywords):
+        if METADATA_KEYWORD_PATTERN.search(kw):
             continue
         filtered.append(kw)
     
@@ -56,6 +56,7 @@ from app.services.embedding_filter import select_relevant_chunks
 from app.services.memory_manager import memory_manager, cleanup_after_batch, log_memory_usage
 from app.services.retry_handler import retry_dart_api
 from app.utils.preferred_stock import is_preferred_stock_smart
+from app.utils.kg_version import bump_kg_edge_version
 
 logging.basicConfig(
     level=logging.INFO,
@@ -711,6 +712,10 @@ def main():
                 log_memory_usage(f"배치 {idx // BATCH_SIZE}")
                 time.sleep(0.5)  # API Rate Limit 방지 (최소 대기)
         
+        # company_details(biz_summary)가 바뀌었으면 KG 스냅샷 재로딩 (증거 문장 인덱스 재계산)
+        if success_count > 0:
+            bump_kg_edge_version()
+        
         # 최종 결과
         print("\n" + "=" * 60)
         print("처리 완료!")
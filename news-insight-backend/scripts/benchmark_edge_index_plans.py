@@ -0,0 +1,174 @@
+"""
+edges 커버링 인덱스 실행 계획 벤치마크
+
+시나리오 조회의 edges 접근 패턴(드라이버 → 기업, 기업 → 드라이버, 스냅샷 로딩)을
+EXPLAIN (ANALYZE, BUFFERS)로 실행하여 edges 노드가 Index Only Scan인지 확인하고
+(스냅샷 로딩은 DRIVEN_BY 전체를 읽으므로 Seq Scan도 허용),
+properties(JSONB)를 읽는 기존 조회와 실행 시간/버퍼를 비교합니다.
+
+sql/migrations/add_edges_typed_properties.sql 적용 후 실행합니다.
+Heap Fetches가 크면 VACUUM이 필요합니다 (--vacuum).
+
+사용법:
+    python scripts/benchmark_edge_index_plans.py [--driver OIL_PRICE] [--ticker 005930] [--repeat 5] [--vacuum]
+"""
+import argparse
+import json
+import sys
+from pathlib import Path
+from typing import Dict, Iterator, List
+
+project_root = Path(__file__).parent.parent
+sys.path.insert(0, str(project_root))
+
+from sqlalchemy import text
+
+from app.db import engine
+
+# (이름, 타입 컬럼 조회, 기존 JSONB 조회, Index Only Scan 필수 여부) - 파라미터: driver, ticker, min_weight, limit
+QUERIES = [
+    (
+        "driver -> companies",
+        '''
+        SELECT source_id, weight, mechanism, polarity, text_match_weight
+        FROM edges
+        WHERE relation_type = 'DRIVEN_BY' AND target_id = :driver AND weight >= :min_weight
+        ORDER BY weight DESC
+        LIMIT :limit
+        ''',
+        '''
+        SELECT source_id, weight, properties
+        FROM edges
+        WHERE relation_type = 'DRIVEN_BY' AND target_id = :driver AND weight >= :min_weight
+        ORDER BY weight DESC
+        LIMIT :limit
+        ''',
+        True,
+    ),
+    (
+        "company -> drivers",
+        '''
+        SELECT target_id, weight, mechanism, polarity, text_match_weight
+        FROM edges
+        WHERE relation_type = 'DRIVEN_BY' AND source_id = :ticker
+        ORDER BY weight DESC
+        LIMIT :limit
+        ''',
+        '''
+        SELECT target_id, weight, properties
+        FROM edges
+        WHERE relation_type = 'DRIVEN_BY' AND source_id = :ticker
+        ORDER BY weight DESC
+        LIMIT :limit
+        ''',
+        True,
+    ),
+    (
+        "snapshot load",
+        '''
+        SELECT source_id, target_id, weight, mechanism, polarity, text_match_weight,
+               properties->>'direction' AS direction
+        FROM edges
+        WHERE relation_type = 'DRIVEN_BY'
+        ''',
+        '''
+        SELECT source_id, target_id, weight, properties
+        FROM edges
+        WHERE relation_type = 'DRIVEN_BY'
+        ''',
+        # 전체 로딩: 플래너가 Seq Scan을 고르는 것이 정상 (시간/버퍼 비교만)
+        False,
+    ),
+]
+
+
+def iter_plan_nodes(node: Dict) -> Iterator[Dict]:
+    """실행 계획 트리 순회"""
+    yield node
+    for child in node.get("Plans", []):
+        yield from iter_plan_nodes(child)
+
+
+def explain(conn, sql: str, params: Dict, repeat: int) -> Dict:
+    """EXPLAIN ANALYZE를 repeat회 실행하여 마지막(캐시 데운) 계획 + 최소 실행 시간 반환"""
+    best_ms = None
+    plan = None
+    for _ in range(repeat):
+        row = conn.execute(text(f"EXPLAIN (ANALYZE, BUFFERS, FORMAT JSON) {sql}"), params).scalar()
+        plan = (json.loads(row) if isinstance(row, str) else row)[0]
+        elapsed = plan["Execution Time"]
+        best_ms = elapsed if best_ms is None else min(best_ms, elapsed)
+
+    edge_nodes = [n for n in iter_plan_nodes(plan["Plan"]) if n.get("Relation Name") == "edges"]
+    return {
+        "ms": best_ms,
+        "scan_types": [n["Node Type"] for n in edge_nodes],
+        "indexes": [n.get("Index Name") for n in edge_nodes],
+        "heap_fetches": sum(n.get("Heap Fetches", 0) for n in edge_nodes),
+        "buffers": sum(n.get("Shared Hit Blocks", 0) + n.get("Shared Read Blocks", 0) for n in edge_nodes),
+    }
+
+
+def pick_default(conn, column: str) -> str:
+    """DRIVEN_BY edge가 가장 많은 드라이버/기업"""
+    return conn.execute(text(f'''
+        SELECT {column} FROM edges
+        WHERE relation_type = 'DRIVEN_BY'
+        GROUP BY {column}
+        ORDER BY COUNT(*) DESC
+        LIMIT 1
+    ''')).scalar()
+
+
+def main():
+    parser = argparse.ArgumentParser(description="edges 커버링 인덱스 실행 계획 벤치마크")
+    parser.add_argument("--driver", default=None, help="드라이버 코드 (기본: edge가 가장 많은 드라이버)")
+    parser.add_argument("--ticker", default=None, help="종목코드 (기본: edge가 가장 많은 기업)")
+    parser.add_argument("--min-weight", type=float, default=0.5)
+    parser.add_argument("--limit", type=int, default=20)
+    parser.add_argument("--repeat", type=int, default=5, help="쿼리별 EXPLAIN ANALYZE 반복 횟수")
+    parser.add_argument("--vacuum", action="store_true", help="측정 전 VACUUM ANALYZE edges 실행")
+    args = parser.parse_args()
+
+    if args.vacuum:
+        with engine.connect().execution_options(isolation_level="AUTOCOMMIT") as conn:
+            conn.execute(text("VACUUM ANALYZE edges"))
+
+    with engine.connect() as conn:
+        params = {
+            "driver": args.driver or pick_default(conn, "target_id"),
+            "ticker": args.ticker or pick_default(conn, "source_id"),
+            "min_weight": args.min_weight,
+            "limit": args.limit,
+        }
+        edge_count = conn.execute(text("SELECT COUNT(*) FROM edges WHERE relation_type = 'DRIVEN_BY'")).scalar()
+
+        print("=" * 90)
+        print(f"edges 실행 계획 벤치마크: DRIVEN_BY {edge_count:,}개, driver={params['driver']}, ticker={params['ticker']}")
+        print("=" * 90)
+        print(f"{'query':<22}{'typed plan':<22}{'heap':>8}{'typed(ms)':>12}{'jsonb(ms)':>12}{'buffers':>14}")
+
+        failures: List[str] = []
+        for name, typed_sql, jsonb_sql, index_only in QUERIES:
+            typed = explain(conn, typed_sql, params, args.repeat)
+            legacy = explain(conn, jsonb_sql, params, args.repeat)
+            scan = ",".join(typed["scan_types"]) or "-"
+            print(
+                f"{name:<22}{scan:<22}{typed['heap_fetches']:>8}{typed['ms']:>12.3f}{legacy['ms']:>12.3f}"
+                f"{typed['buffers']:>7}/{legacy['buffers']:<6}"
+            )
+            if index_only and any(t != "Index Only Scan" for t in typed["scan_types"]):
+                failures.append(f"{name}: {scan} ({', '.join(i or '-' for i in typed['indexes'])})")
+
+    print("-" * 90)
+    if failures:
+        print("❌ Index Only Scan이 아닌 조회:")
+        for failure in failures:
+            print(f"   {failure}")
+        print("   (마이그레이션 적용 여부 / 테이블이 작아 Seq Scan이 선택되었는지 확인)")
+        sys.exit(1)
+    print("✅ 범위 조회(driver/company)가 모두 Index Only Scan")
+
+
+if __name__ == "__main__":
+    main()
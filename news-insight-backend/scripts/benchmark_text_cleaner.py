@@ -0,0 +1,133 @@
+"""
+텍스트 정제 벤치마크 (컴파일된 파이프라인 vs 순차 정규식 적용)
+
+골든 코퍼스(tests/data/text_cleaner_golden.json)의 입력을 반복 정제하여
+clean_text_for_keywords / normalize_article_text의 처리량을 비교하고,
+두 방식의 출력이 동일한지 함께 확인합니다.
+
+사용법:
+    python scripts/benchmark_text_cleaner.py [--repeat 20]
+"""
+import argparse
+import html
+import json
+import re
+import sys
+import time
+from pathlib import Path
+
+project_root = Path(__file__).parent.parent
+sys.path.insert(0, str(project_root))
+
+from app.utils import text_cleaner as tc
+
+
+def sequential_clean_text(text: str) -> str:
+    """기존 방식: 제어 문자 → 공백 → 줄바꿈 순차 치환"""
+    if not text:
+        return ""
+    text = tc.NON_PRINTABLE_PATTERN.sub(" ", text)
+    text = tc.WHITESPACE_PATTERN.sub(" ", text)
+    text = tc.MULTI_NEWLINE_PATTERN.sub("\n\n", text)
+    return text.strip()
+
+
+def sequential_remove_news_source_names(text: str) -> str:
+    """기존 방식: 언론사명마다 정규식 컴파일 후 순차 적용"""
+    for source_name in tc.NEWS_SOURCE_NAMES:
+        pattern = re.compile(rf'\([^)]*{re.escape(source_name)}[^)]*\)', re.IGNORECASE)
+        text = pattern.sub('', text)
+    for source_name in tc.NEWS_SOURCE_NAMES:
+        if len(source_name) >= 4:
+            pattern = re.compile(rf'\b{re.escape(source_name)}\b', re.IGNORECASE)
+            text = pattern.sub('', text)
+    return text
+
+
+def sequential_clean_text_for_keywords(text: str) -> str:
+    """기존 방식: 모든 정규식을 사전 검사 없이 순차 적용"""
+    if not text:
+        return ""
+    for pattern in (
+        tc.COPYRIGHT_PATTERN_HTML, tc.COPYRIGHT_PATTERN_TEXT, tc.COPYRIGHT_SHORT,
+        tc.REPORTER_DATE_PATTERN, tc.REPORTER_PATTERN, tc.DATE_TIME_PATTERN, tc.EMAIL_PATTERN,
+        tc.IMAGE_CAPTION_PATTERN, tc.META_BRACKET_PATTERN,
+        tc.LOCATION_PATTERN, tc.REPORTER_PAREN_PATTERN,
+    ):
+        text = pattern.sub('', text)
+    text = sequential_remove_news_source_names(text)
+    for pattern in (tc.HEADQUARTERS_PATTERN, tc.SCREEN_NUM_PATTERN, tc.URL_PATTERN, tc.HTML_TAG_PATTERN):
+        text = pattern.sub('', text)
+    text = html.unescape(text)
+    text = tc.NON_PRINTABLE_PATTERN.sub(' ', text)
+    text = tc.WHITESPACE_PATTERN.sub(' ', text)
+    text = tc.MULTI_NEWLINE_PATTERN.sub('\n\n', text)
+    return text.strip()
+
+
+def sequential_normalize_article_text(text: str) -> str:
+    """기존 방식: HTML/기자명/대괄호 제거 후 따옴표 치환"""
+    if not text:
+        return ""
+    text = html.unescape(text)
+    text = tc.HTML_TAG_PATTERN.sub(" ", text)
+    text = tc.REPORTER_PATTERN.sub(" ", text)
+    text = tc.BRACKET_META_PATTERN.sub(" ", text)
+    text = text.replace('’', "'").replace('“', '"').replace('”', '"')
+    text = sequential_clean_text(text)
+    return text.lower()
+
+
+def measure(func, texts, repeat: int) -> float:
+    """전체 코퍼스를 repeat회 정제하는 데 걸린 시간 (초)"""
+    start = time.perf_counter()
+    for _ in range(repeat):
+        for text in texts:
+            func(text)
+    return time.perf_counter() - start
+
+
+def main():
+    parser = argparse.ArgumentParser(description="텍스트 정제 벤치마크")
+    parser.add_argument("--repeat", type=int, default=20, help="코퍼스 반복 횟수")
+    parser.add_argument(
+        "--corpus",
+        default=str(project_root / "tests" / "data" / "text_cleaner_golden.json"),
+        help="입력 코퍼스 (골든 JSON)",
+    )
+    args = parser.parse_args()
+
+    cases = json.loads(Path(args.corpus).read_text(encoding="utf-8"))
+    texts = [case["input"] for case in cases]
+    total_chars = sum(len(t) for t in texts) * args.repeat
+
+    pairs = [
+        ("clean_text_for_keywords", sequential_clean_text_for_keywords, tc.clean_text_for_keywords),
+        ("normalize_article_text", sequential_normalize_article_text, tc.normalize_article_text),
+    ]
+
+    print("=" * 70)
+    print(f"텍스트 정제 벤치마크: 문서 {len(texts)}개 × {args.repeat}회 ({total_chars:,}자)")
+    print("=" * 70)
+    print(f"{'function':<28}{'sequential(s)':>14}{'compiled(s)':>14}{'speedup':>10}")
+
+    mismatched = False
+    for name, sequential, compiled in pairs:
+        diff = sum(1 for t in texts if sequential(t) != compiled(t))
+        seq_time = measure(sequential, texts, args.repeat)
+        comp_time = measure(compiled, texts, args.repeat)
+        speedup = seq_time / comp_time if comp_time else 0.0
+        print(f"{name:<28}{seq_time:>14.3f}{comp_time:>14.3f}{speedup:>9.2f}x")
+        if diff:
+            mismatched = True
+            print(f"   ❌ 출력 불일치: {diff}개 문서")
+
+    print("-" * 70)
+    if mismatched:
+        print("❌ 컴파일된 파이프라인 출력이 순차 적용과 다릅니다")
+        sys.exit(1)
+    print("✅ 모든 문서에서 출력 동일")
+
+
+if __name__ == "__main__":
+    main()
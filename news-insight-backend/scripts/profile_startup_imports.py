@@ -0,0 +1,98 @@
+"""
+API 프로세스 import-time 프로파일 리포트
+
+`python -X importtime -c "import app.main"`을 별도 프로세스로 실행하여
+최상위 패키지별 누적 import 시간을 집계하고, 무거운 ML 모듈(torch, transformers 등)이
+시작 시점에 import 되는지 확인합니다.
+
+사용법:
+    python scripts/profile_startup_imports.py [--module app.main] [--top 25] [--fail-on-heavy]
+"""
+import argparse
+import os
+import subprocess
+import sys
+from collections import defaultdict
+from pathlib import Path
+
+project_root = Path(__file__).parent.parent
+os.chdir(project_root)
+sys.path.insert(0, str(project_root))
+
+from app.utils.startup import HEAVY_MODULES
+
+
+def run_importtime(module: str):
+    """-X importtime으로 모듈 import 후 stderr 반환"""
+    env = dict(os.environ)
+    env["PYTHONPATH"] = str(project_root) + os.pathsep + env.get("PYTHONPATH", "")
+    proc = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", f"import {module}"],
+        capture_output=True,
+        text=True,
+        env=env,
+    )
+    return proc.returncode, proc.stderr
+
+
+def parse_importtime(stderr: str):
+    """
+    importtime 출력 파싱
+
+    형식: "import time:  self [us] | cumulative | imported package"
+    들여쓰기 없는 행이 최상위 import이므로 패키지 루트 기준으로 누적 시간을 합산합니다.
+    """
+    per_root = defaultdict(int)
+    modules = {}
+    for line in stderr.splitlines():
+        if not line.startswith("import time:") or "imported package" in line:
+            continue
+        parts = line[len("import time:"):].split("|")
+        if len(parts) != 3:
+            continue
+        self_us, cumulative_us, raw_name = parts
+        name = raw_name.strip()
+        modules[name] = int(cumulative_us.strip())
+        per_root[name.split(".")[0]] += int(self_us.strip())
+    return per_root, modules
+
+
+def main():
+    parser = argparse.ArgumentParser(description="API 시작 import-time 프로파일")
+    parser.add_argument("--module", default="app.main", help="프로파일할 모듈 (기본: app.main)")
+    parser.add_argument("--top", type=int, default=25, help="출력할 상위 패키지 수")
+    parser.add_argument("--fail-on-heavy", action="store_true", help="무거운 ML 모듈이 import 되면 exit 1")
+    args = parser.parse_args()
+
+    returncode, stderr = run_importtime(args.module)
+    per_root, modules = parse_importtime(stderr)
+
+    if returncode != 0:
+        print(f"❌ {args.module} import 실패 (exit={returncode})")
+        print("\n".join(line for line in stderr.splitlines() if not line.startswith("import time:"))[-2000:])
+        sys.exit(returncode)
+
+    total_us = sum(per_root.values())
+    print("=" * 60)
+    print(f"Import-time 프로파일: {args.module} (총 {total_us / 1e6:.3f}초)")
+    print("=" * 60)
+    print(f"{'package':<40}{'self(s)':>10}{'share':>10}")
+    for root, self_us in sorted(per_root.items(), key=lambda x: x[1], reverse=True)[:args.top]:
+        share = self_us / total_us * 100 if total_us else 0.0
+        print(f"{root:<40}{self_us / 1e6:>10.3f}{share:>9.1f}%")
+
+    heavy = [name for name in HEAVY_MODULES if name in modules]
+    print("-" * 60)
+    if heavy:
+        print(f"⚠️ 시작 시 import 된 무거운 ML 모듈: {', '.join(heavy)}")
+        for name in heavy:
+            print(f"   {name}: 누적 {modules[name] / 1e6:.3f}초")
+    else:
+        print("✅ 무거운 ML 모듈이 시작 시 import 되지 않음")
+
+    if heavy and args.fail_on_heavy:
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,69 @@
+"""
+KG edge 증분 재빌드 (야간 배치용)
+
+investor_sector 인과 구조/섹터 입력의 fingerprint가 바뀐 기업만 edge를 다시 만들고
+stale edge를 삭제합니다. 첫 실행(fingerprint 없음)은 전체 기업을 처리합니다.
+
+사전 준비: sql/migrations/create_kg_edge_fingerprints_table.sql
+
+사용법:
+    python scripts/rebuild_kg_edges.py              # 바뀐 기업만
+    python scripts/rebuild_kg_edges.py --dry-run    # 대상/edge 수만 확인
+    python scripts/rebuild_kg_edges.py --full       # 빌더 로직 변경 시 전체 재빌드
+    python scripts/rebuild_kg_edges.py --ticker 005930 --ticker 010950
+"""
+import argparse
+import logging
+import sys
+import time
+from pathlib import Path
+
+project_root = Path(__file__).parent.parent
+sys.path.insert(0, str(project_root))
+
+from dotenv import load_dotenv
+
+load_dotenv()
+
+from app.db import SessionLocal
+from app.services.kg_edge_builder import EDGE_UPSERT_CHUNK_SIZE
+from app.services.kg_rebuild import rebuild_kg_edges
+
+logging.basicConfig(
+    level=logging.INFO,
+    format='%(asctime)s - %(name)s - %(levelname)s - %(message)s'
+)
+logger = logging.getLogger(__name__)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="KG edge 증분 재빌드")
+    parser.add_argument("--full", action="store_true", help="fingerprint와 관계없이 전체 재빌드")
+    parser.add_argument("--ticker", action="append", default=None, help="특정 티커만 (여러 번 지정 가능)")
+    parser.add_argument("--dry-run", action="store_true", help="저장하지 않고 대상만 계산")
+    parser.add_argument("--chunk-size", type=int, default=EDGE_UPSERT_CHUNK_SIZE, help="커밋 단위 (행 수)")
+    args = parser.parse_args()
+
+    start = time.time()
+    db = SessionLocal()
+    try:
+        stats = rebuild_kg_edges(
+            db,
+            full=args.full,
+            tickers=args.ticker,
+            dry_run=args.dry_run,
+            chunk_size=args.chunk_size
+        )
+    finally:
+        db.close()
+
+    print("=" * 60)
+    print(f"KG edge {'증분 재빌드 (dry-run)' if args.dry_run else '증분 재빌드'} 완료 ({time.time() - start:.1f}초)")
+    print(f"  기업: {stats['companies']}개 (재빌드 {stats['changed']}, 변경 없음 {stats['skipped']}, 제거 {stats['removed']})")
+    print(f"  edge: 생성 {stats['edges']}개 → 신규 {stats['inserted']}, 갱신 {stats['updated']}, "
+          f"변경 없음 {stats['unchanged']}, 삭제 {stats['deleted']}")
+    print("=" * 60)
+
+
+if __name__ == "__main__":
+    main()
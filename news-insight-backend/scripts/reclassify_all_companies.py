@@ -22,6 +22,7 @@ else:
 sys.path.insert(0, '.')
 
 from app.db import SessionLocal
+from app.utils.query_stats import track_queries
 from app.models.company_detail import CompanyDetail
 from app.models.stock import Stock
 from app.models.investor_sector import InvestorSector
@@ -378,7 +379,9 @@ def main():
         if ticker_idx + 1 < len(sys.argv):
             ticker_filter = sys.argv[ticker_idx + 1]
     
-    reclassify_all_companies(dry_run=dry_run, ticker_filter=ticker_filter)
+    # 기업별 조회가 반복되는 구간 확인용 SQL 통계 (N+1 의심 시 경고 로그)
+    with track_queries("reclassify_all_companies"):
+        reclassify_all_companies(dry_run=dry_run, ticker_filter=ticker_filter)
 
 if __name__ == '__main__':
     main()
@@ -27,6 +27,7 @@ else:
 
 from app.db import SessionLocal
 from app.models.stock import Stock
+from app.services.pipelines.entities import publish_company_dict_reload
 
 logging.basicConfig(
     level=logging.INFO,
@@ -160,6 +161,10 @@ def main():
         logger.info("4. 누락된 기업 DB 추가 중...")
         added_count = add_missing_stocks(db, missing_tickers, kospi_tickers, kosdaq_tickers)
         
+        # 실행 중인 API/Celery 프로세스에 기업명 딕셔너리 갱신 알림 (재시작 불필요)
+        if added_count > 0:
+            publish_company_dict_reload()
+        
         logger.info("=" * 80)
         logger.info("동기화 완료")
         logger.info(f"  KRX 상장 기업: {len(krx_tickers)}개")
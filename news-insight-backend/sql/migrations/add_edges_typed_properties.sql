@@ -0,0 +1,46 @@
+-- edges 속성 타입 컬럼 + 커버링 인덱스 (시나리오 조회용)
+-- 시나리오 조회는 relation_type/target_id(또는 source_id)로 거르고 weight로 정렬한 뒤
+-- properties(JSONB)에서 mechanism/polarity/text_match_weight를 읽어 매 행마다 힙을 방문했음
+-- → 세 속성을 generated column으로 승격하고 INCLUDE 인덱스로 index-only scan 가능하게 함
+--
+-- 주의: STORED generated column 추가는 테이블 재작성 (PostgreSQL 12+)
+-- 적용 후 VACUUM ANALYZE edges; 실행 (visibility map 갱신 → index-only scan의 Heap Fetches 감소)
+-- 검증: python scripts/benchmark_edge_index_plans.py
+
+-- 1. 타입 컬럼 (properties에서 자동 계산 → 어떤 경로로 쓰든 동기화 유지, 직접 쓰기 불가)
+-- properties 값 길이는 제한되지 않으므로 TEXT (VARCHAR(n)이면 긴 값이 있는 edge 쓰기가 실패)
+ALTER TABLE edges
+ADD COLUMN IF NOT EXISTS mechanism TEXT
+    GENERATED ALWAYS AS (properties->>'mechanism') STORED;
+
+ALTER TABLE edges
+ADD COLUMN IF NOT EXISTS polarity TEXT
+    GENERATED ALWAYS AS (properties->>'polarity') STORED;
+
+-- 숫자가 아니면 0 (기존 조회의 기본값과 동일)
+ALTER TABLE edges
+ADD COLUMN IF NOT EXISTS text_match_weight DOUBLE PRECISION
+    GENERATED ALWAYS AS (
+        CASE WHEN jsonb_typeof(properties->'text_match_weight') = 'number'
+             THEN (properties->'text_match_weight')::double precision
+             ELSE 0
+        END
+    ) STORED;
+
+-- 2. 커버링 인덱스
+-- 드라이버 → 영향 기업 (/scenario/*/{variable}, /compare, /v153/scenario, KG 스냅샷 로딩)
+CREATE INDEX IF NOT EXISTS idx_edges_relation_target_weight
+ON edges (relation_type, target_id, weight DESC)
+INCLUDE (source_id, mechanism, polarity, text_match_weight);
+
+-- 기업 → 드라이버 (/scenario/company/{ticker}, /v153/company/{ticker})
+CREATE INDEX IF NOT EXISTS idx_edges_relation_source_weight
+ON edges (relation_type, source_id, weight DESC)
+INCLUDE (target_id, mechanism, polarity, text_match_weight);
+
+ANALYZE edges;
+
+-- 3. 코멘트 추가
+COMMENT ON COLUMN edges.mechanism IS 'properties->>''mechanism'' (generated, 시나리오 조회용)';
+COMMENT ON COLUMN edges.polarity IS 'properties->>''polarity'' (generated, 시나리오 조회용)';
+COMMENT ON COLUMN edges.text_match_weight IS 'properties->''text_match_weight'' (generated, 숫자가 아니면 0)';
@@ -0,0 +1,75 @@
+-- 연관 기사 추천 인덱스 (엔티티 → 기사 역색인 + 기사 → 기사 공동 언급 점수)
+-- 요약 저장 시 워커가 기사별로 증분 갱신하며, 이 스크립트는 테이블 생성 + 기존 요약 백필을 수행
+
+CREATE TABLE IF NOT EXISTS article_entities (
+    entity_name VARCHAR(200) NOT NULL,
+    article_id INTEGER NOT NULL REFERENCES articles(id) ON DELETE CASCADE,
+    entity_type VARCHAR(20),
+    weight DOUBLE PRECISION NOT NULL DEFAULT 1.0,
+    PRIMARY KEY (entity_name, article_id)
+);
+
+CREATE INDEX IF NOT EXISTS idx_article_entities_article ON article_entities(article_id);
+
+CREATE TABLE IF NOT EXISTS article_co_mentions (
+    article_id INTEGER NOT NULL REFERENCES articles(id) ON DELETE CASCADE,
+    related_article_id INTEGER NOT NULL REFERENCES articles(id) ON DELETE CASCADE,
+    shared_count INTEGER NOT NULL,
+    score DOUBLE PRECISION NOT NULL,
+    updated_at TIMESTAMP DEFAULT NOW(),
+    PRIMARY KEY (article_id, related_article_id)
+);
+
+CREATE INDEX IF NOT EXISTS idx_article_co_mentions_score ON article_co_mentions(article_id, score);
+
+COMMENT ON TABLE article_entities IS '엔티티 → 기사 역색인 (weight = 1 / 기사 엔티티 수)';
+COMMENT ON TABLE article_co_mentions IS '기사 → 기사 공동 언급 점수 (양방향, score = 공유 엔티티 Jaccard)';
+
+-- 백필 1: 기존 요약 엔티티 → 역색인 (ORG/PERSON/LOCATION, 기사 내 중복 제거)
+WITH raw AS (
+    SELECT s.article_id, e.key AS entity_type, LEFT(BTRIM(name.value), 200) AS entity_name
+    FROM summaries s
+    CROSS JOIN LATERAL jsonb_each(
+        CASE WHEN jsonb_typeof(s.entities) = 'object' THEN s.entities ELSE '{}'::jsonb END
+    ) e
+    CROSS JOIN LATERAL jsonb_array_elements_text(
+        CASE WHEN jsonb_typeof(e.value) = 'array' THEN e.value ELSE '[]'::jsonb END
+    ) name
+    WHERE e.key IN ('ORG', 'PERSON', 'LOCATION')
+),
+dedup AS (
+    SELECT DISTINCT ON (article_id, entity_name) article_id, entity_type, entity_name
+    FROM raw
+    WHERE entity_name <> ''
+    ORDER BY article_id, entity_name,
+             CASE entity_type WHEN 'ORG' THEN 0 WHEN 'PERSON' THEN 1 ELSE 2 END
+)
+INSERT INTO article_entities (entity_name, article_id, entity_type, weight)
+SELECT d.entity_name, d.article_id, d.entity_type, 1.0 / COUNT(*) OVER (PARTITION BY d.article_id)
+FROM dedup d
+ON CONFLICT (entity_name, article_id) DO NOTHING;
+
+-- 백필 2: 공동 언급 점수 (기사당 공유 엔티티 수 상위 200개)
+WITH sizes AS (
+    SELECT article_id, COUNT(*) AS entity_count FROM article_entities GROUP BY article_id
+),
+shared AS (
+    SELECT m.article_id, o.article_id AS related_article_id, COUNT(*) AS shared_count
+    FROM article_entities m
+    JOIN article_entities o ON o.entity_name = m.entity_name AND o.article_id <> m.article_id
+    GROUP BY m.article_id, o.article_id
+),
+ranked AS (
+    SELECT sh.*, ROW_NUMBER() OVER (
+        PARTITION BY sh.article_id ORDER BY sh.shared_count DESC, sh.related_article_id DESC
+    ) AS rn
+    FROM shared sh
+)
+INSERT INTO article_co_mentions (article_id, related_article_id, shared_count, score, updated_at)
+SELECT r.article_id, r.related_article_id, r.shared_count,
+       r.shared_count::float / (sa.entity_count + sb.entity_count - r.shared_count), NOW()
+FROM ranked r
+JOIN sizes sa ON sa.article_id = r.article_id
+JOIN sizes sb ON sb.article_id = r.related_article_id
+WHERE r.rn <= 200
+ON CONFLICT (article_id, related_article_id) DO NOTHING;
@@ -0,0 +1,16 @@
+-- KG edge 증분 재빌드용 fingerprint 테이블
+-- 기업별 (빌더 버전 + causal_structure + major_sector/sector_l2) 해시와 마지막 빌드 edge id를 저장
+-- scripts/rebuild_kg_edges.py가 fingerprint가 바뀐 기업만 edge를 다시 만들고,
+-- 이전 빌드에는 있었지만 새 빌드에 없는 edge id를 일괄 삭제
+
+CREATE TABLE IF NOT EXISTS kg_edge_fingerprints (
+    ticker VARCHAR(20) PRIMARY KEY,
+    fingerprint VARCHAR(64) NOT NULL,
+    edge_ids JSONB NOT NULL DEFAULT '[]'::jsonb,
+    edge_count INTEGER DEFAULT 0,
+    built_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+);
+
+COMMENT ON TABLE kg_edge_fingerprints IS 'KG edge 증분 재빌드 상태 (기업별 입력 fingerprint + 마지막 빌드 edge id)';
+COMMENT ON COLUMN kg_edge_fingerprints.fingerprint IS 'sha256(KG_EDGE_BUILDER_VERSION + investor_sector 인과 구조/섹터 입력)';
+COMMENT ON COLUMN kg_edge_fingerprints.edge_ids IS '마지막 빌드에서 생성한 edge id (다음 빌드에서 빠진 id는 stale → 삭제)';
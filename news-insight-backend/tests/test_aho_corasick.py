@@ -0,0 +1,72 @@
+"""
+Aho-Corasick 기업명 매칭 테스트
+
+목적: 단일 패스 매칭이 기존 부분문자열 검사와 같은 기업명을 찾되,
+겹치는 경우 최장 일치만 남기고 영문 기업명은 단어 경계를 지키는지 검증
+"""
+import sys
+from pathlib import Path
+
+# 프로젝트 루트를 Python 경로에 추가
+project_root = Path(__file__).parent.parent
+sys.path.insert(0, str(project_root))
+
+from app.utils.aho_corasick import AhoCorasick
+
+
+COMPANY_DICT = {
+    "삼성": "SAMSUNG_GROUP",
+    "삼성전자": "005930",
+    "삼성전자우": "005935",
+    "SK하이닉스": "000660",
+    "LG": "003550",
+    "LG에너지솔루션": "373220",
+    "Apple": "AAPL",
+    "현대차": "005380",
+}
+
+
+def build_matcher():
+    matcher = AhoCorasick()
+    for name in sorted(COMPANY_DICT, key=lambda n: (-len(n), n)):
+        matcher.add(name, (name, COMPANY_DICT[name]))
+    return matcher.build()
+
+
+def names(matches):
+    return [value[0] for _, _, value in matches]
+
+
+def test_longest_non_overlapping_matches():
+    text = "삼성전자와 SK하이닉스가 HBM 공급을 늘렸고, 삼성 계열사도 참여했다."
+    matches = build_matcher().find_longest(text)
+
+    assert names(matches) == ["삼성전자", "SK하이닉스", "삼성"]
+    start, end, (name, ticker) = matches[0]
+    assert text[start:end] == "삼성전자"
+    assert ticker == "005930"
+
+
+def test_case_insensitive_latin_names_with_word_boundary():
+    matcher = build_matcher()
+
+    assert names(matcher.find_longest("APPLE과 apple 모두 매칭")) == ["Apple", "Apple"]
+    # 영문 경계: LGES / Applebee 내부에서는 매칭하지 않음
+    assert names(matcher.find_longest("LGES와 Applebee's")) == []
+    # 한글 조사가 붙는 경우는 매칭
+    assert names(matcher.find_longest("LG는 LG에너지솔루션 지분을 보유")) == ["LG", "LG에너지솔루션"]
+
+
+def test_all_matches_include_nested_names():
+    matcher = build_matcher()
+    found = {value[0] for _, _, value in matcher.iter_matches("삼성전자우 매수")}
+
+    assert found == {"삼성", "삼성전자", "삼성전자우"}
+
+
+def test_limit_and_empty_inputs():
+    matcher = build_matcher()
+
+    assert len(matcher.find_longest("현대차 현대차 현대차", limit=2)) == 2
+    assert matcher.find_longest("") == []
+    assert AhoCorasick().build().find_longest("삼성전자") == []
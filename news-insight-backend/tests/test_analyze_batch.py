@@ -0,0 +1,158 @@
+"""
+기사 분석 마이크로 배치 테스트
+
+목적: analyze_article_batch가 모인 메시지를 한 번의 요약 호출로 묶고 결과/실패를 메시지별 task_id로
+나눠 기록하는지, summarize_texts / analyze_sentiment_batch가 모델을 배치당 한 번만 호출하고
+짧은/실패 문서를 제외한 결과를 입력 순서대로 돌려주는지 검증
+"""
+import importlib
+import sys
+import types
+from pathlib import Path
+
+import pytest
+
+# 프로젝트 루트를 Python 경로에 추가
+project_root = Path(__file__).parent.parent
+sys.path.insert(0, str(project_root))
+
+pytest.importorskip("sqlalchemy")
+pytest.importorskip("celery")
+pytest.importorskip("celery_batches")
+pytest.importorskip("neo4j")
+
+from app import celery_worker
+
+LONG = "반도체 업황 회복으로 메모리 가격이 상승했다. " * 5
+
+
+def fake_module(monkeypatch, name, **attrs):
+    module = types.ModuleType(name)
+    module.__dict__.update(attrs)
+    monkeypatch.setitem(sys.modules, name, module)
+    return module
+
+
+class Request:
+    """celery_batches SimpleRequest 대체 (id, args)"""
+
+    def __init__(self, task_id, article_id, text):
+        self.id = task_id
+        self.args = (article_id, text)
+
+
+def test_batch_task_fans_out_per_request(monkeypatch):
+    calls = []
+
+    def summarize_texts(texts):
+        calls.append(list(texts))
+        return [None if text == "실패" else {"summary": text[:5], "keywords": [text[:2]]} for text in texts]
+
+    fake_module(monkeypatch, "app.services.summarizer", summarize_texts=summarize_texts)
+
+    events, saved, done, failed, released = [], [], {}, {}, []
+
+    class FakeSession:
+        rollbacks = 0
+
+        def rollback(self):
+            FakeSession.rollbacks += 1
+
+        def close(self):
+            pass
+
+    def save_summary(db, article_id, summary_result):
+        if article_id == 3:
+            raise RuntimeError("db error")
+        saved.append(article_id)
+
+    backend = types.SimpleNamespace(
+        mark_as_done=lambda task_id, result, request=None: done.__setitem__(task_id, result),
+        mark_as_failure=lambda task_id, exc, request=None: failed.__setitem__(task_id, str(exc)),
+    )
+    monkeypatch.setattr(celery_worker, "SessionLocal", FakeSession)
+    monkeypatch.setattr(celery_worker, "_save_summary", save_summary)
+    monkeypatch.setattr(celery_worker, "_enqueue_graph_update", lambda article_id, result: None)
+    monkeypatch.setattr(celery_worker, "_release_inflight", lambda article_id, task_id: released.append(task_id))
+    monkeypatch.setattr(celery_worker, "publish_task_event", lambda task_id, event, *args: events.append((task_id, event)))
+    # celery_app.backend는 스레드 로컬에 캐시됨 (실제 result backend 연결 없이 대체)
+    monkeypatch.setattr(celery_worker.celery_app._local, "backend", backend, raising=False)
+
+    requests = [Request("t1", 1, "삼성전자 실적"), Request("t2", 2, "실패"), Request("t3", 3, "SK하이닉스 HBM")]
+    celery_worker.analyze_article_batch_task.run(requests)
+
+    # 모델 호출은 배치당 한 번
+    assert calls == [["삼성전자 실적", "실패", "SK하이닉스 HBM"]]
+    # 결과는 메시지별 task_id로
+    assert set(done) == {"t1"}
+    assert done["t1"]["article_id"] == 1 and done["t1"]["summary"] == "삼성전자 "
+    assert failed == {"t2": "AI 요약 실패", "t3": "db error"}
+    assert saved == [1] and FakeSession.rollbacks == 2
+    assert released == ["t1", "t2", "t3"]
+    assert [e for e in events if e[1] != celery_worker.EVENT_PROGRESS] == [
+        ("t1", celery_worker.EVENT_DONE), ("t2", celery_worker.EVENT_FAILED), ("t3", celery_worker.EVENT_FAILED),
+    ]
+
+
+def test_summarize_texts_batches_models_and_keeps_order(monkeypatch):
+    batch_calls = {"keywords": [], "kobart": [], "sentiment": []}
+
+    def record(stage, fn):
+        def wrapper(items, *args, **kwargs):
+            batch_calls[stage].append(len(items))
+            return fn(items)
+        return wrapper
+
+    # 모델 단계는 가짜 모듈로 대체 (torch/transformers 없이 배치 분배 로직만 확인)
+    fake_module(monkeypatch, "app.services.pipelines.keywords",
+                extract_keywords_batch=record("keywords", lambda texts: [[t[:3]] for t in texts]))
+    fake_module(monkeypatch, "app.services.pipelines.textrank",
+                textrank_extract=lambda text, sentence_count=5: [] if "문장없음" in text else [text[:20]])
+    fake_module(monkeypatch, "app.services.pipelines.kobart",
+                summarize_kobart_batch=record("kobart", lambda sents: ["" if "KOBART실패" in s[0] else "요약. 두번째." for s in sents]))
+    fake_module(monkeypatch, "app.services.pipelines.sentiment",
+                analyze_sentiment_batch=record("sentiment", lambda texts: ["positive" for _ in texts]))
+    fake_module(monkeypatch, "app.services.pipelines.entities", extract_entities=lambda text: {"ORG": [text[:2]]})
+
+    monkeypatch.delitem(sys.modules, "app.services.summarizer", raising=False)
+    summarizer = importlib.import_module("app.services.summarizer")
+    # 가짜 단계를 참조하는 모듈이 다른 테스트에 남지 않도록 테스트 종료 시 제거
+    monkeypatch.setitem(sys.modules, "app.services.summarizer", summarizer)
+
+    texts = ["짧음", "가" + LONG, "문장없음" + LONG, "KOBART실패" + LONG, "나" + LONG]
+    results = summarizer.summarize_texts(texts)
+
+    assert batch_calls == {"keywords": [4], "kobart": [3], "sentiment": [3]}
+    assert results[0] is None and results[2] is None
+    assert results[1]["summary"] == "요약. 두번째." and results[1]["keywords"] == ["가반도"]
+    assert len(results[1]["bullet_points"]) == 2
+    # KoBART가 빈 요약이면 핵심 문장으로 대체
+    assert results[3]["summary"].startswith("KOBART실패")
+    assert results[4]["entities"] == {"ORG": ["나반"]} and results[4]["sentiment"] == "positive"
+
+
+def test_sentiment_batch_single_forward(monkeypatch):
+    torch = pytest.importorskip("torch")
+    pytest.importorskip("transformers")
+    from app.services.pipelines import sentiment
+
+    forwards = []
+
+    class Encoded(dict):
+        def to(self, device):
+            return self
+
+    def tokenizer(texts, **kwargs):
+        return Encoded(n=len(texts), texts=list(texts))
+
+    def model(n, texts):
+        forwards.append(texts)
+        # "하락"이 있으면 negative(0), 아니면 positive(2)
+        logits = torch.tensor([[5.0, 0.0, 0.0] if "하락" in t else [0.0, 0.0, 5.0] for t in texts])
+        return types.SimpleNamespace(logits=logits)
+
+    monkeypatch.setattr(sentiment, "load_finbert_model", lambda: (tokenizer, model))
+
+    texts = ["주가가 크게 하락했다고 전했다", "", "실적 개선 기대감이 커지고 있다", "짧다"]
+    assert sentiment.analyze_sentiment_batch(texts) == ["negative", "neutral", "positive", "neutral"]
+    assert forwards == [[texts[0], texts[2]]]
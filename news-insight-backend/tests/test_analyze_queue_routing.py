@@ -0,0 +1,143 @@
+"""
+기사 분석 큐 라우팅 / 중복 병합 테스트
+
+목적: submit_analyze_article가 interactive 요청은 단건 작업으로, bulk 요청은 배치 작업으로 등록하고,
+같은 큐 안에서만 중복 요청을 병합하며(다른 큐의 작업은 반환하지 않음),
+끝난 작업의 키는 compare-and-set으로 교체해 동시 요청 중 하나만 새 작업을 등록하는지,
+작업 등록(apply_async)이 실패하면 선점한 키를 해제하는지 검증
+"""
+import sys
+from pathlib import Path
+
+import pytest
+
+# 프로젝트 루트를 Python 경로에 추가
+project_root = Path(__file__).parent.parent
+sys.path.insert(0, str(project_root))
+
+pytest.importorskip("sqlalchemy")
+pytest.importorskip("celery")
+pytest.importorskip("celery_batches")
+pytest.importorskip("neo4j")
+
+from app import celery_worker
+from app.celery_worker import QUEUE_BULK, QUEUE_INTERACTIVE, submit_analyze_article
+
+
+class FakeRedis:
+    """SET NX / GET / 중복 병합 Lua 스크립트만 흉내내는 클라이언트"""
+
+    def __init__(self):
+        self.data = {}
+        self.before_get = None  # GET 직전에 한 번 실행할 콜백 (경쟁 재현용)
+
+    def set(self, key, value, nx=False, ex=None):
+        if nx and key in self.data:
+            return None
+        self.data[key] = value
+        return True
+
+    def get(self, key):
+        if self.before_get:
+            callback, self.before_get = self.before_get, None
+            callback()
+        return self.data.get(key)
+
+    def eval(self, script, numkeys, key, expected, *args):
+        if self.data.get(key) != expected:
+            return 0
+        if script == celery_worker._INFLIGHT_SWAP_SCRIPT:
+            self.data[key] = args[0]
+        else:
+            del self.data[key]
+        return 1
+
+
+class FakeResult:
+    def __init__(self, task_id, app=None):
+        self.id = task_id
+        self.state = TASK_STATES.get(task_id, "PENDING")
+
+
+TASK_STATES = {}
+
+
+@pytest.fixture
+def broker(monkeypatch):
+    client = FakeRedis()
+    sent = []
+
+    def recorder(name):
+        def apply_async(args, task_id, queue, priority):
+            sent.append((name, queue, priority, task_id))
+            return FakeResult(task_id)
+        return apply_async
+
+    TASK_STATES.clear()
+    monkeypatch.setattr(celery_worker, "get_redis_client", lambda: client)
+    monkeypatch.setattr(celery_worker, "AsyncResult", FakeResult)
+    monkeypatch.setattr(celery_worker.analyze_article_task, "apply_async", recorder("analyze_article"))
+    monkeypatch.setattr(celery_worker.analyze_article_batch_task, "apply_async", recorder("analyze_article_batch"))
+    return client, sent
+
+
+def test_routing_and_same_queue_dedup(broker):
+    client, sent = broker
+
+    bulk = submit_analyze_article(1, "본문")
+    assert sent == [("analyze_article_batch", QUEUE_BULK, 9, bulk.id)]
+
+    # 같은 큐 중복 → 기존 작업 반환
+    assert submit_analyze_article(1, "본문").id == bulk.id
+    assert len(sent) == 1
+
+    # bulk에 같은 기사가 대기 중이어도 interactive 요청은 별도 단건 작업
+    interactive = submit_analyze_article(1, "본문", queue=QUEUE_INTERACTIVE)
+    assert interactive.id != bulk.id
+    assert sent[-1] == ("analyze_article", QUEUE_INTERACTIVE, 0, interactive.id)
+    assert submit_analyze_article(1, "본문", queue=QUEUE_INTERACTIVE).id == interactive.id
+    assert len(sent) == 2
+
+    # 작업 종료 시 자신의 키만 해제
+    celery_worker._release_inflight(1, interactive.id)
+    assert list(client.data.values()) == [bulk.id]
+
+    with pytest.raises(ValueError):
+        submit_analyze_article(1, "본문", queue="graph")
+
+
+def test_finished_task_is_replaced_once_under_race(broker):
+    client, sent = broker
+    old = submit_analyze_article(2, "본문")
+    TASK_STATES[old.id] = "SUCCESS"
+
+    # 첫 요청이 기존 task_id를 읽는 사이 다른 요청이 먼저 교체
+    competitor = []
+    client.before_get = lambda: competitor.append(submit_analyze_article(2, "본문"))
+    result = submit_analyze_article(2, "본문")
+
+    assert len(sent) == 2
+    assert result.id == competitor[0].id == sent[-1][3]
+
+
+def test_failed_publish_releases_claim(broker, monkeypatch):
+    client, sent = broker
+    publish = celery_worker.analyze_article_batch_task.apply_async
+    broker_up = []
+
+    def flaky_publish(args, task_id, queue, priority):
+        if not broker_up:
+            raise ConnectionError("broker unavailable")
+        return publish(args, task_id=task_id, queue=queue, priority=priority)
+
+    monkeypatch.setattr(celery_worker.analyze_article_batch_task, "apply_async", flaky_publish)
+    with pytest.raises(ConnectionError):
+        submit_analyze_article(3, "본문")
+    # 발행되지 않은 task_id가 키에 남지 않아야 함
+    assert client.data == {}
+
+    # 브로커 복구 후 요청은 새 작업으로 등록 (유령 작업에 병합되지 않음)
+    broker_up.append(True)
+    result = submit_analyze_article(3, "본문")
+    assert sent == [("analyze_article_batch", QUEUE_BULK, 9, result.id)]
+    assert list(client.data.values()) == [result.id]
@@ -0,0 +1,224 @@
+"""
+비동기 라우트 테스트 (피드 / 인사이트 / 시나리오)
+
+목적: get_async_db를 쓰는 라우트가 모두 async def로 이벤트 루프에서 실행되고,
+AsyncSession 호출(scalar/scalars/execute/get/commit)을 await 하여 기존과 같은 응답을 만드는지,
+k-hop 전파 라우트가 엔진 조회/전파/경로 설명을 이벤트 루프 밖(스레드풀)에서 실행하는지 검증
+"""
+import asyncio
+import inspect
+import sys
+import threading
+from datetime import datetime
+from pathlib import Path
+from types import SimpleNamespace
+
+import pytest
+
+# 프로젝트 루트를 Python 경로에 추가
+project_root = Path(__file__).parent.parent
+sys.path.insert(0, str(project_root))
+
+pytest.importorskip("sqlalchemy")
+httpx = pytest.importorskip("httpx")
+pytest.importorskip("neo4j")
+
+from fastapi import FastAPI
+
+from app.db import get_async_db
+from app.models.article import Article, Summary
+from app.routes import feed, insight, scenario
+
+PUBLISHED = datetime(2026, 1, 2, 9, 0)
+
+
+class FakeResult(list):
+    """execute() 결과 (반복 / fetchone / fetchall / all)"""
+
+    def fetchone(self):
+        return self[0] if self else None
+
+    def fetchall(self):
+        return list(self)
+
+    def all(self):
+        return list(self)
+
+
+class FakeAsyncSession:
+    """미리 정한 결과를 호출 순서대로 돌려주는 AsyncSession"""
+
+    def __init__(self, *results):
+        self.results = list(results)
+        self.calls = []
+        self.added = []
+        self.commits = 0
+
+    def _next(self, method, statement):
+        self.calls.append((method, statement))
+        return self.results.pop(0)
+
+    async def scalar(self, statement):
+        return self._next("scalar", statement)
+
+    async def scalars(self, statement):
+        return FakeResult(self._next("scalars", statement))
+
+    async def execute(self, statement, params=None):
+        return FakeResult(self._next("execute", statement))
+
+    async def get(self, model, ident):
+        return self._next("get", (model, ident))
+
+    def add(self, obj):
+        self.added.append(obj)
+
+    async def commit(self):
+        self.commits += 1
+
+    async def refresh(self, obj):
+        pass
+
+
+class AsyncAppClient:
+    """ASGI 앱에 비동기 요청을 보내는 클라이언트 (요청마다 이벤트 루프 실행)"""
+
+    def __init__(self, app):
+        self.app = app
+
+    def request(self, method, url, **kwargs):
+        async def send():
+            transport = httpx.ASGITransport(app=self.app)
+            async with httpx.AsyncClient(transport=transport, base_url="http://test") as client:
+                return await client.request(method, url, **kwargs)
+        return asyncio.run(send())
+
+    def get(self, url, **kwargs):
+        return self.request("GET", url, **kwargs)
+
+    def post(self, url, **kwargs):
+        return self.request("POST", url, **kwargs)
+
+
+@pytest.fixture
+def client_for():
+    app = FastAPI()
+    for router in (feed.router, insight.router, scenario.router):
+        app.include_router(router)
+
+    def make(session):
+        async def override():
+            yield session
+        app.dependency_overrides[get_async_db] = override
+        return AsyncAppClient(app)
+
+    return make
+
+
+def test_async_db_routes_are_coroutines():
+    # 동기 def 라우트는 스레드 풀에서 실행되므로 async 세션을 쓰는 라우트는 모두 async def 여야 함
+    routes = [
+        route for router in (feed.router, insight.router, scenario.router) for route in router.routes
+        if any(dep.call is get_async_db for dep in route.dependant.dependencies)
+    ]
+    assert len(routes) >= 10
+    assert all(inspect.iscoroutinefunction(route.endpoint) for route in routes)
+
+
+def test_feed_cache_hit_loads_articles_and_summaries(client_for, monkeypatch):
+    cached = {
+        "articles": [{"id": 2, "cluster_id": 5, "representative": True}, {"id": 1}],
+        "total": 2, "original_count": 3, "deduplicated_count": 1,
+        "limit": 20, "offset": 0, "deduplication_enabled": True,
+    }
+    monkeypatch.setattr(feed, "get_from_cache", lambda key: cached)
+    articles = [
+        Article(id=1, title="기사1", source="연합뉴스", link="https://news/1", published_at=PUBLISHED),
+        Article(id=2, title="기사2", source="연합뉴스", link="https://news/2", published_at=PUBLISHED),
+    ]
+    session = FakeAsyncSession(articles, [Summary(article_id=2, summary="요약2")])
+
+    body = client_for(session).get("/feed/").json()
+
+    # 기사/요약을 각각 한 번에 조회, 캐시 순서 유지
+    assert [method for method, _ in session.calls] == ["scalars", "scalars"]
+    assert [(a["id"], a["summary"], a["ai_analysis_available"]) for a in body["articles"]] == [
+        (2, "요약2", True), (1, None, False),
+    ]
+    assert body["articles"][0]["cluster_id"] == 5 and body["cached"] is True
+
+
+def test_insight_routes(client_for):
+    client = client_for(FakeAsyncSession(None))
+    assert client.get("/insight/1").status_code == 404
+
+    # 피드백 생성: 기사 확인 → 기존 피드백 없음 → 추가 후 commit
+    session = FakeAsyncSession(Article(id=1, title="기사1"), None)
+    response = client_for(session).post("/insight/feedback", json={"article_id": 1, "memo": "메모", "tags": "반도체"})
+    assert response.status_code == 200
+    assert response.json()["feedback"] == {"memo": "메모", "tags": "반도체"}
+    assert [obj.article_id for obj in session.added] == [1] and session.commits == 1
+
+    row = SimpleNamespace(
+        id=3, title="기사3", source="연합뉴스", link="https://news/3", published_at=PUBLISHED,
+        ai_summary="요약3", keywords=["HBM"], score=0.5,
+    )
+    body = client_for(FakeAsyncSession([row])).get("/insight/recommend/related", params={"article_id": 7}).json()
+    assert [(a["id"], a["score"]) for a in body["articles"]] == [(3, 0.5)]
+
+
+def test_scenario_routes_read_db_without_snapshot(client_for, monkeypatch):
+    stored = []
+    monkeypatch.setattr(scenario, "get_kg_snapshot", lambda: None)
+    monkeypatch.setattr(scenario, "lookup_scenario_cache", lambda endpoint, variable, params: ("key", None))
+    monkeypatch.setattr(scenario, "store_scenario_cache", lambda key, result: stored.append(key))
+
+    company = ("005930", "삼성전자", 400_000_000_000_000, "반도체", "MIDSTREAM", 0.9, "COST", "NEGATIVE", 0)
+    response = client_for(FakeAsyncSession([company])).get("/scenario/oil_price")
+    assert response.status_code == 200
+    assert response.json()["affected_companies"][0]["ticker"] == "005930"
+    assert stored == ["key"]
+
+    # 영향 기업이 없으면 404 (캐시하지 않음)
+    assert client_for(FakeAsyncSession([])).get("/scenario/interest_rate").status_code == 404
+    assert stored == ["key"]
+
+    body = client_for(FakeAsyncSession([("OIL_PRICE",), ("INTEREST_RATE",)])).get("/scenario/variables").json()
+    assert [v["code"] for v in body["variables"]] == ["OIL_PRICE", "INTEREST_RATE"]
+
+    assert client_for(FakeAsyncSession([])).get("/scenario/company/999999").status_code == 404
+
+
+def test_propagation_runs_off_event_loop(client_for, monkeypatch):
+    threads = []
+
+    class FakeEngine:
+        snapshot = SimpleNamespace(driver_index={"OIL_PRICE": 0}, version=4)
+
+        def propagate(self, shocks, max_hops, decay, limit, paths):
+            threads.append(("propagate", threading.current_thread()))
+            assert shocks == {"OIL_PRICE": -1.0}
+            path = {"variables": ["OIL_PRICE"], "relations": [], "mechanism": "COST", "polarity": "NEGATIVE"}
+            return [{"ticker": "003490", "name": "대한항공", "paths": [path]}]
+
+    def fake_engine():
+        threads.append(("engine", threading.current_thread()))
+        return FakeEngine()
+
+    def fake_story(variables, relations, mechanism, polarity, company_name):
+        threads.append(("story", threading.current_thread()))
+        return {"story": f"{variables[0]} → {company_name}"}
+
+    monkeypatch.setattr(scenario, "get_propagation_engine", fake_engine)
+    monkeypatch.setattr(scenario, "generate_path_story", fake_story)
+
+    client = client_for(FakeAsyncSession())
+    body = client.get("/scenario/propagate/OIL_PRICE", params={"direction": "DOWN"}).json()
+
+    assert body["companies"][0]["paths"][0]["story"] == "OIL_PRICE → 대한항공"
+    assert body["kg_snapshot_version"] == 4
+    # 이벤트 루프는 메인 스레드에서 실행 (asyncio.run) → 스냅샷 작업은 모두 다른 스레드
+    assert [name for name, _ in threads] == ["engine", "propagate", "story"]
+    assert all(thread is not threading.main_thread() for _, thread in threads)
+
+    assert client.get("/scenario/propagate/UNKNOWN").status_code == 404
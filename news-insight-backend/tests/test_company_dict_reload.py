@@ -0,0 +1,161 @@
+"""
+기업명 딕셔너리 무중단 갱신 테스트
+
+목적: refresh_company_dict가 증분/전체 갱신 모두 새 스냅샷을 완성한 뒤 참조만 교체하는지,
+CompanyDictReloader가 Redis 알림을 받아 갱신하는지, sync_krx_stocks가 커밋 후에만 알림을 보내는지 검증
+"""
+import importlib.util
+import sys
+import types
+from collections import namedtuple
+from datetime import datetime, timedelta
+from pathlib import Path
+
+import pytest
+
+# 프로젝트 루트를 Python 경로에 추가
+project_root = Path(__file__).parent.parent
+sys.path.insert(0, str(project_root))
+
+pytest.importorskip("sqlalchemy")
+pytest.importorskip("pydantic_settings")
+
+from app.services.pipelines import entities
+
+StockRow = namedtuple("StockRow", ["ticker", "stock_name", "synonyms", "country", "updated_at"])
+
+T0 = datetime(2026, 1, 1)
+
+
+class FakeStocks:
+    """stocks 테이블 대체 (_fetch_stock_rows / SessionLocal)"""
+
+    def __init__(self, monkeypatch, rows):
+        self.rows = {row.ticker: row for row in rows}
+        self.fetches = []
+        monkeypatch.setattr(entities, "_current_dictionary", entities.CompanyDictionary({}))
+        monkeypatch.setattr(entities, "SessionLocal", lambda: self)
+        monkeypatch.setattr(entities, "_fetch_stock_rows", self.fetch)
+
+    def fetch(self, db, since=None):
+        self.fetches.append(since)
+        return [row for row in self.rows.values() if since is None or row.updated_at >= since]
+
+    # Session 흉내 (행 수 조회 / close)
+    def query(self, *args):
+        return self
+
+    def scalar(self):
+        return len(self.rows)
+
+    def close(self):
+        pass
+
+
+def test_incremental_and_full_refresh_swap_snapshots(monkeypatch):
+    stocks = FakeStocks(monkeypatch, [
+        StockRow("005930", "삼성전자", ["삼성"], "KR", T0),
+        StockRow("000660", "SK하이닉스", [], "KR", T0),
+    ])
+
+    assert entities.refresh_company_dict()
+    first = entities.get_company_dictionary()
+    assert (first.version, first.watermark, stocks.fetches) == (1, T0, [None])
+
+    # 변경 없음: 교체하지 않음
+    assert not entities.refresh_company_dict()
+    assert entities.get_company_dictionary() is first
+
+    # 증분: watermark 이후 행만 조회하여 병합, 이전 스냅샷은 그대로
+    stocks.rows["373220"] = StockRow("373220", "LG에너지솔루션", ["LGES"], "KR", T0 + timedelta(days=1))
+    assert entities.refresh_company_dict()
+    second = entities.get_company_dictionary()
+    assert stocks.fetches[-1] == T0
+    assert second is not first and second.version == 2
+    assert [m["ticker"] for m in entities.find_company_mentions("LGES와 삼성 협력")] == ["373220", "005930"]
+    assert "LGES" not in first.company_dict
+
+    # 삭제(행 수 불일치): 전체 재로딩
+    del stocks.rows["000660"]
+    assert entities.refresh_company_dict()
+    third = entities.get_company_dictionary()
+    assert stocks.fetches[-1] is None
+    assert third.version == 3 and "000660" not in third.entries
+    assert "SK하이닉스" in second.company_dict
+
+
+class FakePubSub:
+    """메시지를 차례로 반환하고 다 소진되면 갱신 스레드를 멈춤"""
+
+    def __init__(self, reloader, messages):
+        self.reloader = reloader
+        self.messages = list(messages)
+        self.closed = False
+
+    def get_message(self, timeout=None):
+        if not self.messages:
+            self.reloader.stop()
+            return None
+        return self.messages.pop(0)
+
+    def close(self):
+        self.closed = True
+
+
+def test_reloader_refreshes_on_pubsub_message(monkeypatch):
+    calls = []
+    monkeypatch.setattr(entities, "refresh_company_dict", lambda full=False: calls.append(full))
+
+    reloader = entities.CompanyDictReloader(refresh_interval=0)
+    pubsub = FakePubSub(reloader, [
+        {"type": "message", "data": '{"full": true}'},
+        {"type": "message", "data": "not json"},
+        {"type": "subscribe", "data": 1},
+    ])
+    monkeypatch.setattr(reloader, "_subscribe", lambda: pubsub)
+
+    reloader._run()
+    assert calls == [True, False]
+    assert pubsub.closed
+
+
+def test_sync_krx_stocks_publishes_after_commit(monkeypatch, tmp_path):
+    pytest.importorskip("dotenv")
+    # 스크립트는 import 시 작업 디렉터리를 바꾸므로 테스트 후 복원
+    monkeypatch.chdir(Path.cwd())
+    spec = importlib.util.spec_from_file_location("sync_krx_stocks", project_root / "scripts" / "sync_krx_stocks.py")
+    script = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(script)
+
+    events = []
+
+    class FakeSession:
+        def add(self, obj):
+            events.append(("add", obj.ticker))
+
+        def commit(self):
+            events.append(("commit",))
+
+        def rollback(self):
+            events.append(("rollback",))
+
+        def close(self):
+            pass
+
+    pykrx = types.ModuleType("pykrx")
+    pykrx.stock = types.SimpleNamespace(get_market_ticker_name=lambda ticker: f"기업{ticker}")
+    monkeypatch.setitem(sys.modules, "pykrx", pykrx)
+    monkeypatch.setattr(script, "project_root", tmp_path)
+    monkeypatch.setattr(script, "SessionLocal", FakeSession)
+    monkeypatch.setattr(script, "get_db_stocks", lambda db: {"005930"})
+    monkeypatch.setattr(script, "get_krx_listed_stocks", lambda: ({"005930", "123456"}, {"005930"}, {"123456"}))
+    monkeypatch.setattr(script, "publish_company_dict_reload", lambda full=False: events.append(("publish",)))
+
+    script.main()
+    assert events == [("add", "123456"), ("commit",), ("publish",)]
+
+    # 추가된 기업이 없으면 알림 없음
+    events.clear()
+    monkeypatch.setattr(script, "get_db_stocks", lambda db: {"005930", "123456"})
+    script.main()
+    assert events == []
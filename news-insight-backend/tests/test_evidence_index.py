@@ -0,0 +1,69 @@
+"""
+증거 문장 인덱스 테스트
+
+목적: 사업개요를 한 번 분리/분류한 인덱스 조회가 키워드 우선순위, 중복 제거,
+강도 분류, 템플릿 fallback을 유지하는지, KG 스냅샷이 기업별 인덱스를 제공하는지 검증
+"""
+import sys
+from pathlib import Path
+
+import pytest
+
+# 프로젝트 루트를 Python 경로에 추가
+project_root = Path(__file__).parent.parent
+sys.path.insert(0, str(project_root))
+
+pytest.importorskip("numpy")
+
+from app.services.kg_explanation_layer import (
+    _classify_snippet_strength,
+    build_evidence_index,
+    get_evidence_snippets,
+)
+
+BIZ_SUMMARY = (
+    "당사는 원유를 정제하여 휘발유와 나프타를 생산하는 정유 사업을 영위합니다. "
+    "국제 유가 상승은 재고평가이익으로 이어져 정제마진에 직접 영향을 줍니다. "
+    "짧은 문장입니다. "
+    "제품 대부분을 수출하므로 환율 변동에 따라 원화 환산 매출이 증가할 수 있음"
+)
+
+
+def test_index_lookup():
+    index = build_evidence_index(BIZ_SUMMARY)
+
+    # 키워드 우선순위: '유가' 문장 → '원유' 문장 (나프타 문장은 중복 제거)
+    oil = index["OIL_PRICE"]
+    assert [keyword for _, keyword, _ in oil] == ["유가", "원유"]
+    assert all(strength == _classify_snippet_strength(text) for text, _, strength in oil)
+    # 마침표 없는 마지막 문장은 '다.' 보정, 20자 이하 문장 제외
+    assert index["EXCHANGE_RATE_USD_KRW"][0][0].endswith("있음다.")
+    assert "DRAM_ASP" not in index and "INTEREST_RATE" not in index
+
+    snippets = get_evidence_snippets(
+        "OIL_PRICE", "PRODUCT_PRICE", "POSITIVE",
+        return_with_metadata=True, evidence_index=index
+    )
+    assert sorted(s["source"] for s in snippets) == ["biz_summary", "biz_summary", "template"]
+    assert sum(bool(s.get("is_primary")) for s in snippets) == 1
+    # biz_summary만 넘겨도 같은 결과 (인덱스 캐시)
+    assert snippets == get_evidence_snippets(
+        "OIL_PRICE", "PRODUCT_PRICE", "POSITIVE", BIZ_SUMMARY, return_with_metadata=True
+    )
+    assert build_evidence_index("") == {}
+
+
+def test_snapshot_evidence_index():
+    pytest.importorskip("sqlalchemy")
+    pytest.importorskip("pydantic_settings")
+    from app.services.kg_snapshot import KGSnapshot
+
+    snapshot = KGSnapshot(
+        [("010950", "S-Oil", None, "ENERGY", "UPSTREAM", BIZ_SUMMARY),
+         ("003490", "대한항공", None, "INDUSTRIAL", "DOWNSTREAM", None)],
+        [("010950", "OIL_PRICE", 0.9, "PRODUCT_PRICE", "POSITIVE", 0, None)],
+        [],
+    )
+    assert snapshot.evidence_index("010950") == build_evidence_index(BIZ_SUMMARY)
+    assert snapshot.evidence_index("003490") == {}
+    assert snapshot.evidence_index("999999") == {}
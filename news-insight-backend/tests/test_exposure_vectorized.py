@@ -0,0 +1,72 @@
+"""
+Exposure 벡터 계산 테스트
+
+목적: 배열 기반 점수/percentile/level이 기업별 함수(_calculate_exposure_score,
+calculate_exposure_percentile, calculate_exposure_level)와 같은 결과를 내는지,
+비교 출력이 각 기업의 점수 구성 요소로 설명을 만드는지 검증
+"""
+import sys
+import random
+from pathlib import Path
+
+import pytest
+
+# 프로젝트 루트를 Python 경로에 추가
+project_root = Path(__file__).parent.parent
+sys.path.insert(0, str(project_root))
+
+pytest.importorskip("numpy")
+
+from app.services.kg_explanation_layer import (
+    _calculate_exposure_score,
+    calculate_exposure_level,
+    calculate_exposure_percentile,
+    calculate_exposure_percentiles,
+    calculate_exposure_scores,
+    exposure_levels_from_scores,
+    generate_comparison_output,
+)
+
+MECHANISMS = ['PRODUCT_PRICE', 'INPUT_COST', 'SPREAD', 'DEMAND', 'MACRO_SENSITIVITY', 'UNKNOWN']
+
+
+def test_vectorized_matches_scalar():
+    rng = random.Random(7)
+    mechanisms = [rng.choice(MECHANISMS) for _ in range(500)]
+    weights = [rng.choice([0.3, 0.59, 0.6, 0.75, 0.8, 0.95]) for _ in range(500)]
+    text_match = [rng.choice([0, 0.19, 0.2, 0.49, 0.5, 0.9]) for _ in range(500)]
+
+    exposure = calculate_exposure_scores(mechanisms, weights, text_match)
+    scalar = [_calculate_exposure_score(m, w, t, return_components=True) for m, w, t in zip(mechanisms, weights, text_match)]
+    assert exposure['score'].tolist() == [score for score, _ in scalar]
+    assert exposure['weight_bonus'].tolist() == [c['weight_bonus'] for _, c in scalar]
+
+    scores = exposure['score'].tolist()
+    assert calculate_exposure_percentiles(exposure['score']).tolist() == [
+        calculate_exposure_percentile(s, scores)['percentile'] for s in scores
+    ]
+    assert exposure_levels_from_scores(exposure['score']).tolist() == [
+        calculate_exposure_level(m, w, t) for m, w, t in zip(mechanisms, weights, text_match)
+    ]
+    assert calculate_exposure_percentiles([]).tolist() == []
+
+
+def test_comparison_dedupes_and_explains_each_company():
+    companies = [
+        {'ticker': '005930', 'name': '삼성전자', 'mechanism': 'DEMAND', 'polarity': 'POSITIVE', 'weight': 0.9},
+        {'ticker': '005935', 'name': '삼성전자우', 'mechanism': 'DEMAND', 'polarity': 'POSITIVE', 'weight': 0.9},
+        {'ticker': '010950', 'name': 'S-Oil', 'mechanism': 'PRODUCT_PRICE', 'polarity': 'NEGATIVE',
+         'weight': 0.5, 'text_match_weight': 0.6},
+        {'ticker': '003490', 'name': '대한항공', 'mechanism': 'INPUT_COST', 'polarity': 'MIXED', 'weight': 0.7},
+    ]
+    result = generate_comparison_output('OIL_PRICE', companies, top_n=3)
+
+    assert result['total_analyzed'] == 3  # 우선주 제외
+    samsung = result['positive_impact'][0]
+    soil = result['negative_impact'][0]
+    assert samsung['ticker'] == '005930'
+    assert samsung['exposure_components'] == {'mechanism_bonus': 1, 'weight_bonus': 2, 'text_match_bonus': 0}
+    # 점수: 삼성전자 3, S-Oil 4, 대한항공 3 → S-Oil만 다른 두 기업보다 높음
+    assert soil['exposure_percentile'] == 66 and samsung['exposure_percentile'] == 0
+    assert '증거 매칭(2점)' in soil['exposure_percentile_explanation']
+    assert '증거 매칭' not in samsung['exposure_percentile_explanation']
@@ -0,0 +1,71 @@
+"""
+Neo4j 배치 그래프 쓰기 테스트
+
+목적: 여러 기사의 엔티티/키워드가 라벨별 UNWIND 파라미터로 묶여
+기사/엔티티 수와 무관하게 (라벨 수 + 2)개 쿼리로 반영되는지 검증
+"""
+import sys
+from pathlib import Path
+
+import pytest
+
+# 프로젝트 루트를 Python 경로에 추가
+project_root = Path(__file__).parent.parent
+sys.path.insert(0, str(project_root))
+
+pytest.importorskip("neo4j")
+
+from app.services.graph import build_graph_rows, update_articles_graph
+
+
+class FakeSession:
+    """write_transaction에 자기 자신을 tx로 넘기고 실행된 쿼리를 기록"""
+
+    def __init__(self):
+        self.runs = []
+
+    def run(self, query, **params):
+        self.runs.append((query, params))
+
+    def write_transaction(self, work):
+        return work(self)
+
+
+ARTICLES = [
+    {
+        "article_id": 1,
+        "entities": {"ORG": ["삼성전자", " SK하이닉스 ", "삼성전자"], "PERSON": ["이재용"], "LOCATION": "서울"},
+        "keywords": ["HBM", "반도체", ""],
+    },
+    {
+        "article_id": 2,
+        "entities": {"ORG": ["삼성전자"], "bad-label": ["무시"]},
+        "keywords": [f"키워드{i}" for i in range(15)],
+    },
+]
+
+
+def test_build_graph_rows_groups_by_label_and_dedupes():
+    article_ids, entity_rows, keyword_rows = build_graph_rows(ARTICLES)
+
+    assert article_ids == [1, 2]
+    assert entity_rows["ORG"] == [
+        {"article_id": 1, "name": "삼성전자"},
+        {"article_id": 1, "name": "SK하이닉스"},
+        {"article_id": 2, "name": "삼성전자"},
+    ]
+    assert entity_rows["PERSON"] == [{"article_id": 1, "name": "이재용"}]
+    # 리스트가 아닌 엔티티 값과 허용되지 않는 라벨은 제외
+    assert set(entity_rows) == {"ORG", "PERSON"}
+    # 기사당 키워드 최대 10개, 빈 키워드 제외
+    assert len(keyword_rows) == 2 + 10
+
+
+def test_update_articles_graph_uses_one_query_per_label():
+    session = FakeSession()
+
+    assert update_articles_graph(session, ARTICLES) is True
+    # Article 1 + ORG 1 + PERSON 1 + Keyword 1
+    assert len(session.runs) == 4
+    assert all("UNWIND" in query for query, _ in session.runs)
+    assert session.runs[0][1] == {"article_ids": [1, 2]}
@@ -0,0 +1,70 @@
+"""
+Neo4j 스키마 부트스트랩 테스트
+
+목적: ensure_graph_schema가 Article.id / 엔티티·키워드 name 유일성 제약을 IF NOT EXISTS로 만들고,
+기존 중복 데이터로 제약 생성이 실패하면 일반 인덱스로 대체하며, 대체도 실패하면 False를 반환하는지 검증
+"""
+import sys
+from pathlib import Path
+
+import pytest
+
+# 프로젝트 루트를 Python 경로에 추가
+project_root = Path(__file__).parent.parent
+sys.path.insert(0, str(project_root))
+
+pytest.importorskip("neo4j")
+
+from app.services.graph import ENTITY_LABELS, ensure_graph_schema, get_graph_schema_statements
+
+
+class FakeResult:
+    def consume(self):
+        return None
+
+
+class FakeSession:
+    """fail_on에 포함된 문자열이 들어간 쿼리는 실패"""
+
+    def __init__(self, *fail_on):
+        self.fail_on = fail_on
+        self.executed = []
+
+    def run(self, query):
+        if any(token in query for token in self.fail_on):
+            raise RuntimeError("already exists with conflicting data")
+        self.executed.append(query)
+        return FakeResult()
+
+
+def test_schema_statements_cover_all_labels():
+    statements = [statement for statement, _ in get_graph_schema_statements()]
+
+    assert all("IF NOT EXISTS" in statement for statement in statements)
+    assert any("(a:Article) REQUIRE a.id IS UNIQUE" in statement for statement in statements)
+    for label in ENTITY_LABELS + ("Keyword",):
+        assert any(f"(n:{label}) REQUIRE n.name IS UNIQUE" in statement for statement in statements)
+
+
+def test_ensure_graph_schema_creates_constraints():
+    session = FakeSession()
+
+    assert ensure_graph_schema(session) is True
+    assert session.executed == [statement for statement, _ in get_graph_schema_statements()]
+
+
+def test_duplicate_data_falls_back_to_index():
+    # 중복 ORG 이름이 있어 유일성 제약 생성 실패 → 일반 인덱스
+    session = FakeSession("org_name_unique")
+
+    assert ensure_graph_schema(session) is True
+    assert "CREATE INDEX org_name_index IF NOT EXISTS FOR (n:ORG) ON (n.name)" in session.executed
+    assert not any("org_name_unique" in query for query in session.executed)
+
+
+def test_failed_fallback_reports_not_ready():
+    session = FakeSession("org_name_unique", "org_name_index")
+
+    assert ensure_graph_schema(session) is False
+    # 나머지 스키마는 계속 생성
+    assert any("keyword_name_unique" in query for query in session.executed)
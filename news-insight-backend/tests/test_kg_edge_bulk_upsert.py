@@ -0,0 +1,116 @@
+"""
+KG Edge 일괄 저장 테스트
+
+목적: bulk_upsert_edges가 chunk마다 INSERT ... ON CONFLICT (id) 한 번으로 저장하고
+(id 중복 제거, 컬럼 구성별 분리, created_at 유지), 신규/갱신/변경 없음 수를 정확히 반환하는지 검증
+"""
+import re
+import sys
+from collections import namedtuple
+from pathlib import Path
+
+import pytest
+
+# 프로젝트 루트를 Python 경로에 추가
+project_root = Path(__file__).parent.parent
+sys.path.insert(0, str(project_root))
+
+pytest.importorskip("sqlalchemy")
+pytest.importorskip("pydantic_settings")
+
+from sqlalchemy.dialects import postgresql
+
+from app.services import kg_edge_builder
+from app.services.kg_edge_builder import build_edges_from_causal_structure, bulk_upsert_edges
+
+ReturnedRow = namedtuple("ReturnedRow", ["id", "inserted"])
+
+CAUSAL_STRUCTURE = {
+    "key_drivers": [
+        {"code": "OIL_PRICE", "direction": "POSITIVE", "type": "P", "confidence": 0.9},
+        {"code": "EXCHANGE_RATE_USD_KRW", "direction": "NEGATIVE", "type": "C", "confidence": 0.6},
+    ],
+    "granular_tags": ["REFINING", "PETROCHEMICAL"],
+}
+
+
+class FakeSession:
+    """edges 테이블 하나만 흉내내는 세션 (ON CONFLICT 의미를 dict로 재현)"""
+
+    def __init__(self):
+        self.table = {}
+        self.statements = []
+        self.commits = 0
+
+    def execute(self, stmt):
+        compiled = stmt.compile(dialect=postgresql.dialect())
+        sql = str(compiled)
+        self.statements.append(sql)
+
+        # multi-row VALUES 파라미터 (col_m{i}, 첫 행은 접미사 없음) → 행 dict
+        rows = {}
+        for key, value in compiled.params.items():
+            match = re.fullmatch(r"(\w+?)(?:_m(\d+))?", key)
+            column, index = match.group(1), int(match.group(2) or 0)
+            if column in stmt.table.c:
+                rows.setdefault(index, {})[column] = value
+        columns = re.search(r"INSERT INTO edges \(([^)]*)\)", sql).group(1).split(", ")
+        update_columns = re.findall(r"(\w+) = excluded\.\1", sql.split("DO UPDATE SET")[-1]) if "DO UPDATE" in sql else []
+
+        returned = []
+        for row in rows.values():
+            row = {c: row.get(c) for c in columns}
+            existing = self.table.get(row["id"])
+            if existing is None:
+                self.table[row["id"]] = row
+                returned.append(ReturnedRow(row["id"], True))
+            elif update_columns:
+                compared = [c for c in update_columns if c != "updated_at"]
+                if any(existing[c] != row[c] for c in compared):
+                    existing.update({c: row[c] for c in update_columns})
+                    returned.append(ReturnedRow(row["id"], False))
+        return returned
+
+    def commit(self):
+        self.commits += 1
+
+    def rollback(self):
+        pass
+
+
+@pytest.fixture(autouse=True)
+def no_version_bump(monkeypatch):
+    import app.utils.kg_version as kg_version
+    bumps = []
+    monkeypatch.setattr(kg_version, "bump_kg_edge_version", lambda: bumps.append(1))
+    return bumps
+
+
+def test_bulk_upsert_counts(no_version_bump):
+    db = FakeSession()
+    edges = build_edges_from_causal_structure("010950", CAUSAL_STRUCTURE, major_sector="SEC_ENERGY")
+
+    counts = bulk_upsert_edges(db, edges + edges[:1], chunk_size=2)
+    assert counts == {"inserted": 5, "updated": 0, "unchanged": 0}
+    # DRIVEN_BY(weight 포함) 2개 / HAS_TAG + BELONGS_TO(weight 없음) 3개 → chunk 2개씩 = 쿼리 3번
+    assert len(db.statements) == 3 and db.commits == 3
+    assert all("ON CONFLICT (id) DO UPDATE" in sql and "IS DISTINCT FROM" in sql for sql in db.statements)
+    assert len(no_version_bump) == 1
+
+    # 재빌드: 하나만 weight 변경, 나머지는 그대로 → 버전 갱신 1번, created_at 유지
+    structure = {**CAUSAL_STRUCTURE, "key_drivers": [
+        {**CAUSAL_STRUCTURE["key_drivers"][0], "confidence": 0.7},
+        CAUSAL_STRUCTURE["key_drivers"][1],
+    ]}
+    rebuilt = build_edges_from_causal_structure("010950", structure, major_sector="SEC_ENERGY")
+    oil_id = rebuilt[0]["id"]
+    created_at = db.table[oil_id]["created_at"]
+
+    counts = bulk_upsert_edges(db, rebuilt)
+    assert counts == {"inserted": 0, "updated": 1, "unchanged": 4}
+    assert db.table[oil_id]["weight"] == 0.7 and db.table[oil_id]["created_at"] == created_at
+    assert len(no_version_bump) == 2
+
+    assert bulk_upsert_edges(db, rebuilt) == {"inserted": 0, "updated": 0, "unchanged": 5}
+    assert len(no_version_bump) == 2
+    assert kg_edge_builder.save_edges_to_db(db, rebuilt, upsert=False) == 0
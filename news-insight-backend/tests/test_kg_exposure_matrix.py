@@ -0,0 +1,106 @@
+"""
+기업 × 드라이버 노출도 행렬 테스트
+
+목적: 복합 충격의 행렬-벡터 곱 결과(부호, 노출도 계수, 정렬)와
+스냅샷 교체 시 바뀐 기업 행만 다시 계산하는 증분 갱신 검증
+"""
+import sys
+from pathlib import Path
+
+import pytest
+
+# 프로젝트 루트를 Python 경로에 추가
+project_root = Path(__file__).parent.parent
+sys.path.insert(0, str(project_root))
+
+pytest.importorskip("numpy")
+pytest.importorskip("scipy")
+pytest.importorskip("sqlalchemy")
+pytest.importorskip("neo4j")
+pytest.importorskip("pydantic_settings")
+
+from app.services.kg_snapshot import KGSnapshot
+from app.services.kg_exposure_matrix import EXPOSURE_LEVEL_FACTOR, ExposureMatrix
+
+COMPANY_ROWS = [
+    ("010950", "S-Oil", 8_000_000_000_000, "ENERGY", "UPSTREAM", None),
+    ("003490", "대한항공", None, "INDUSTRIAL", "DOWNSTREAM", None),
+    ("105560", "KB금융", 25_000_000_000_000, "FINANCE", "DOWNSTREAM", None),
+]
+
+DRIVEN_BY_ROWS = [
+    # PRODUCT_PRICE(HIGH 2) + weight 0.9(2) + text_match 0.5(2) → HIGH
+    ("010950", "OIL_PRICE", 0.9, "PRODUCT_PRICE", "POSITIVE", 0.5, None),
+    # INPUT_COST(2) + weight 0.7(1) → MEDIUM
+    ("003490", "OIL_PRICE", 0.7, "INPUT_COST", "NEGATIVE", 0, None),
+    # DEMAND(1) → LOW
+    ("003490", "EXCHANGE_RATE_USD_KRW", 0.5, "DEMAND", "NEGATIVE", 0, None),
+    # SPREAD(2) + weight 0.8(2) → MEDIUM
+    ("105560", "INTEREST_RATE", 0.8, "SPREAD", "POSITIVE", 0, None),
+]
+
+
+def test_combined_shock():
+    matrix = ExposureMatrix(KGSnapshot(COMPANY_ROWS, DRIVEN_BY_ROWS, [], version=1))
+    companies = matrix.simulate({"OIL_PRICE": 1.0, "EXCHANGE_RATE_USD_KRW": 1.0, "INTEREST_RATE": -0.5})
+
+    by_ticker = {c["ticker"]: c for c in companies}
+    assert by_ticker["010950"]["impact_score"] == pytest.approx(0.9 * EXPOSURE_LEVEL_FACTOR["HIGH"])
+    airline = by_ticker["003490"]
+    assert airline["impact_score"] == pytest.approx(
+        -0.7 * EXPOSURE_LEVEL_FACTOR["MEDIUM"] - 0.5 * EXPOSURE_LEVEL_FACTOR["LOW"]
+    )
+    assert airline["direction"] == "NEGATIVE"
+    assert [c["driver_code"] for c in airline["contributions"]] == ["OIL_PRICE", "EXCHANGE_RATE_USD_KRW"]
+    assert by_ticker["105560"]["impact_score"] == pytest.approx(-0.5 * 0.8 * EXPOSURE_LEVEL_FACTOR["MEDIUM"])
+
+    # |impact| 내림차순 + limit
+    assert [c["ticker"] for c in companies] == ["010950", "003490", "105560"]
+    assert len(matrix.simulate({"OIL_PRICE": 1.0}, limit=1)) == 1
+    assert matrix.simulate({"UNKNOWN": 1.0}) == []
+
+
+def test_incremental_rebuild_reuses_unchanged_rows():
+    first = ExposureMatrix(KGSnapshot(COMPANY_ROWS, DRIVEN_BY_ROWS, [], version=1))
+
+    # 대한항공 edge만 변경 + 새 드라이버 추가 (열 순서가 바뀌어도 재사용 행은 코드 기준으로 복사)
+    changed_rows = [
+        ("105560", "LOAN_DEMAND", 0.6, "DEMAND", "POSITIVE", 0, None),
+        *DRIVEN_BY_ROWS[:1],
+        ("003490", "OIL_PRICE", 0.9, "INPUT_COST", "NEGATIVE", 0, None),
+        *DRIVEN_BY_ROWS[2:],
+    ]
+    second = ExposureMatrix(KGSnapshot(COMPANY_ROWS, changed_rows, [], version=2), previous=first)
+    full = ExposureMatrix(KGSnapshot(COMPANY_ROWS, changed_rows, [], version=2))
+
+    assert second.reused_rows == 1  # S-Oil (KB금융은 LOAN_DEMAND 추가로 변경)
+    assert second.computed_rows == 2
+    assert second.driver_codes == full.driver_codes
+    assert second.matrix.tolist() == full.matrix.tolist()
+
+
+def test_mixed_and_direction_fallback():
+    rows = [
+        *DRIVEN_BY_ROWS,
+        # polarity MIXED + direction 없음 → 부호 0이지만 노출 크기로 순위에 포함 (SPREAD, 0.8 → MEDIUM)
+        ("105560", "OIL_PRICE", 0.8, "SPREAD", "MIXED", 0, None),
+        # polarity 없음 → properties.direction('감소')으로 부호 결정
+        ("010950", "EXCHANGE_RATE_USD_KRW", 0.5, "DEMAND", None, 0, "감소"),
+    ]
+    matrix = ExposureMatrix(KGSnapshot(COMPANY_ROWS, rows, [], version=1))
+    companies = matrix.simulate({"OIL_PRICE": 1.0})
+
+    kb = next(c for c in companies if c["ticker"] == "105560")
+    assert kb["impact_score"] == 0
+    assert kb["exposure_score"] == pytest.approx(0.8 * EXPOSURE_LEVEL_FACTOR["MEDIUM"])
+    assert kb["direction"] == "MIXED"
+    assert kb["contributions"] == [
+        {"driver_code": "OIL_PRICE", "shock": 1.0, "exposure": 0.0, "impact": 0.0}
+    ]
+    # exposure 내림차순: S-Oil 0.9 > KB금융 0.48 > 대한항공 0.42
+    assert [c["ticker"] for c in companies] == ["010950", "105560", "003490"]
+
+    soil = matrix.simulate({"EXCHANGE_RATE_USD_KRW": 1.0})[0]
+    assert soil["ticker"] == "010950"
+    assert soil["impact_score"] == pytest.approx(-0.5 * EXPOSURE_LEVEL_FACTOR["LOW"])
+    assert soil["direction"] == "NEGATIVE"
@@ -0,0 +1,85 @@
+"""
+KG k-hop 전파 엔진 테스트
+
+목적: 희소 행렬 전파가 hop 감쇠, Macro Link 부호, polarity 부호를 반영하여
+기업 순위를 계산하고, 상위 기여 경로를 올바르게 복원하는지 검증
+"""
+import sys
+from pathlib import Path
+
+import pytest
+
+# 프로젝트 루트를 Python 경로에 추가
+project_root = Path(__file__).parent.parent
+sys.path.insert(0, str(project_root))
+
+pytest.importorskip("numpy")
+pytest.importorskip("scipy")
+pytest.importorskip("sqlalchemy")
+pytest.importorskip("neo4j")
+pytest.importorskip("pydantic_settings")
+
+from app.services.kg_snapshot import KGSnapshot
+from app.services.kg_propagation import KGPropagationEngine
+
+COMPANY_ROWS = [
+    ("010950", "S-Oil", 8_000_000_000_000, "ENERGY", "UPSTREAM", None),
+    ("035420", "NAVER", 30_000_000_000_000, "TECH", "DOWNSTREAM", None),
+    ("105560", "KB금융", 25_000_000_000_000, "FINANCE", "DOWNSTREAM", None),
+]
+
+DRIVEN_BY_ROWS = [
+    ("010950", "OIL_PRICE", 0.9, "PRODUCT_PRICE", "POSITIVE", 0, None),
+    ("035420", "INTEREST_RATE", 0.8, "MACRO_SENSITIVITY", "NEGATIVE", 0, None),
+    ("105560", "INTEREST_RATE", 0.5, "SPREAD", "POSITIVE", 0, None),
+    ("105560", "CONSUMER_SPENDING", 0.4, "DEMAND", "POSITIVE", 0, None),
+    ("999999", "OIL_PRICE", 0.95, None, "POSITIVE", 0, None),  # 비상장
+]
+
+MACRO_ROWS = [
+    ("OIL_PRICE", "INFLATION_CPI", 0.5, "PRESSURES"),
+    ("INFLATION_CPI", "INTEREST_RATE", 0.8, "PRESSURES"),
+    ("INTEREST_RATE", "CONSUMER_SPENDING", 0.5, "NEGATIVE_PRESSURE"),
+    ("INTEREST_RATE", "OIL_PRICE", 0.3, "CONTEXT_LINK"),  # 충격 변수로 돌아오는 순환
+]
+
+
+@pytest.fixture(scope="module")
+def engine():
+    return KGPropagationEngine(KGSnapshot(COMPANY_ROWS, DRIVEN_BY_ROWS, MACRO_ROWS, version=1))
+
+
+def test_hop_limit_and_decay(engine):
+    # max_hops=1: 직접 연결된 기업만
+    direct = engine.propagate({"OIL_PRICE": 1.0}, max_hops=1)
+    assert [c["ticker"] for c in direct] == ["010950"]
+    assert direct[0]["impact_score"] == pytest.approx(0.9)
+
+    # max_hops=3: 유가 → 물가 → 금리 → NAVER (0.5 × 0.8 × decay²)
+    companies = engine.propagate({"OIL_PRICE": 1.0}, max_hops=3, decay=0.5)
+    naver = next(c for c in companies if c["ticker"] == "035420")
+    assert naver["impact_score"] == pytest.approx(-0.5 * 0.8 * 0.25 * 0.8)
+    assert naver["direction"] == "NEGATIVE"
+    # 순환(금리 → 유가)은 S-Oil 점수에 다시 더해지지 않음
+    assert next(c for c in companies if c["ticker"] == "010950")["impact_score"] == pytest.approx(0.9)
+
+
+def test_signs_and_paths(engine):
+    companies = engine.propagate({"INTEREST_RATE": -1.0}, max_hops=2, decay=1.0, top_paths=2)
+    assert [c["ticker"] for c in companies] == ["035420", "105560", "010950"]
+    assert companies[0]["direction"] == "POSITIVE"  # 금리 하락 → NEGATIVE polarity 기업 수혜
+
+    kb = companies[1]
+    # 금리 하락: 예대마진 -0.5, 소비 증가(NEGATIVE_PRESSURE) +0.2 → 합산 방향 NEGATIVE
+    assert kb["impact_score"] == pytest.approx(-0.5 + 0.5 * 0.4)
+    assert kb["exposure_score"] == pytest.approx(0.5 + 0.5 * 0.4)
+    assert [p["variables"] for p in kb["paths"]] == [["INTEREST_RATE"], ["INTEREST_RATE", "CONSUMER_SPENDING"]]
+    assert kb["paths"][1]["relations"] == ["NEGATIVE_PRESSURE"]
+    assert kb["paths"][1]["hops"] == 2
+
+
+def test_unknown_variable_and_unlisted(engine):
+    assert engine.propagate({"UNKNOWN": 1.0}) == []
+    tickers = [c["ticker"] for c in engine.propagate({"OIL_PRICE": 1.0}, max_hops=4, limit=10)]
+    assert "999999" not in tickers
+    assert len(engine.propagate({"OIL_PRICE": 1.0}, max_hops=4, limit=1)) == 1
@@ -0,0 +1,122 @@
+"""
+KG edge 증분 재빌드 테스트
+
+목적: fingerprint가 바뀐 기업만 edge를 다시 만들고, 이전 빌드에만 있던 edge id와
+인과 구조가 사라진 기업의 edge를 stale로 삭제하며, KG 버전은 변경이 있을 때 한 번만 올리는지 검증
+"""
+import copy
+import sys
+from pathlib import Path
+
+import pytest
+
+# 프로젝트 루트를 Python 경로에 추가
+project_root = Path(__file__).parent.parent
+sys.path.insert(0, str(project_root))
+
+pytest.importorskip("sqlalchemy")
+pytest.importorskip("pydantic_settings")
+
+from app.services import kg_rebuild
+from app.services.kg_rebuild import compute_company_fingerprint, rebuild_kg_edges
+
+INPUTS = {
+    "010950": [{
+        "id": "010950_SEC_ENERGY",
+        "major_sector": "SEC_ENERGY",
+        "sector_l2": "REFINING",
+        "causal_structure": {
+            "key_drivers": [
+                {"code": "OIL_PRICE", "direction": "POSITIVE", "confidence": 0.9},
+                {"code": "EXCHANGE_RATE_USD_KRW", "direction": "NEGATIVE", "confidence": 0.6},
+            ],
+            "granular_tags": ["REFINING"],
+        },
+    }],
+    "003490": [{
+        "id": "003490_SEC_TRANSPORT",
+        "major_sector": "SEC_TRANSPORT",
+        "sector_l2": None,
+        "causal_structure": {"key_drivers": [{"code": "OIL_PRICE", "direction": "NEGATIVE"}]},
+    }],
+}
+
+
+class FakeStore:
+    """load/save/upsert/delete를 dict로 대체"""
+
+    def __init__(self, monkeypatch):
+        self.inputs = copy.deepcopy(INPUTS)
+        self.fingerprints = {}
+        self.edges = {}
+        self.bumps = 0
+        monkeypatch.setattr(kg_rebuild, "load_company_inputs", lambda db, tickers=None: copy.deepcopy(self.inputs))
+        monkeypatch.setattr(kg_rebuild, "load_fingerprints", lambda db, tickers=None: dict(self.fingerprints))
+        monkeypatch.setattr(kg_rebuild, "save_fingerprints", self.save_fingerprints)
+        monkeypatch.setattr(kg_rebuild, "bulk_upsert_edges", self.upsert)
+        monkeypatch.setattr(kg_rebuild, "delete_edges_by_ids", self.delete)
+        monkeypatch.setattr(kg_rebuild, "bump_kg_edge_version", self.bump)
+
+    def save_fingerprints(self, db, states, removed, chunk_size=None):
+        self.fingerprints.update(states)
+        for ticker in removed:
+            del self.fingerprints[ticker]
+
+    def upsert(self, db, edges, chunk_size=None, bump_version=True):
+        counts = {"inserted": 0, "updated": 0, "unchanged": 0}
+        for edge in edges:
+            key = "inserted" if edge["id"] not in self.edges else (
+                "unchanged" if self.edges[edge["id"]].get("weight") == edge.get("weight") else "updated"
+            )
+            counts[key] += 1
+            self.edges[edge["id"]] = edge
+        return counts
+
+    def delete(self, db, edge_ids, chunk_size=None, bump_version=True):
+        for edge_id in edge_ids:
+            del self.edges[edge_id]
+        return len(edge_ids)
+
+    def bump(self):
+        self.bumps += 1
+
+
+def test_fingerprint_is_canonical():
+    rows = INPUTS["010950"]
+    reordered = [{**rows[0], "causal_structure": dict(reversed(list(rows[0]["causal_structure"].items())))}]
+    assert compute_company_fingerprint(rows) == compute_company_fingerprint(reordered)
+    changed = copy.deepcopy(rows)
+    changed[0]["sector_l2"] = "PETROCHEMICAL"
+    assert compute_company_fingerprint(rows) != compute_company_fingerprint(changed)
+
+
+def test_incremental_rebuild(monkeypatch):
+    store = FakeStore(monkeypatch)
+
+    # 첫 실행: 전체 기업 (S-Oil DRIVEN_BY 2 + HAS_TAG 1 + BELONGS_TO 1, 대한항공 DRIVEN_BY 1 + BELONGS_TO 1)
+    stats = rebuild_kg_edges(None)
+    assert (stats["changed"], stats["inserted"], stats["deleted"]) == (2, 6, 0)
+    assert store.bumps == 1
+
+    # 변경 없음: 쓰기/버전 갱신 없음
+    stats = rebuild_kg_edges(None)
+    assert (stats["changed"], stats["skipped"], stats["edges"]) == (0, 2, 0)
+    assert store.bumps == 1
+
+    # S-Oil 환율 드라이버 제거 + 대한항공 인과 구조 삭제
+    store.inputs["010950"][0]["causal_structure"]["key_drivers"].pop()
+    del store.inputs["003490"]
+    dry = rebuild_kg_edges(None, dry_run=True)
+    assert (dry["changed"], dry["removed"], dry["deleted"]) == (1, 1, 3)
+    assert store.bumps == 1
+
+    stats = rebuild_kg_edges(None)
+    assert (stats["changed"], stats["unchanged"], stats["deleted"]) == (1, 3, 3)
+    assert not any(edge_id.startswith("003490_") for edge_id in store.edges)
+    assert not any("EXCHANGE_RATE_USD_KRW" in edge_id for edge_id in store.edges)
+    assert set(store.fingerprints) == {"010950"} and store.bumps == 2
+
+    # --full: fingerprint가 같아도 재빌드 (값이 같으면 unchanged)
+    stats = rebuild_kg_edges(None, full=True)
+    assert (stats["changed"], stats["unchanged"], stats["deleted"]) == (1, 3, 0)
+    assert store.bumps == 2
@@ -0,0 +1,93 @@
+"""
+KG 인메모리 스냅샷 테스트
+
+목적: 배열/CSR 기반 스냅샷 조회가 scenario.py SQL 헬퍼와 같은 결과
+(상장 기업 필터, weight 내림차순, min_weight, 기본 mechanism/polarity)를 반환하는지 검증
+"""
+import sys
+from pathlib import Path
+
+import pytest
+
+# 프로젝트 루트를 Python 경로에 추가
+project_root = Path(__file__).parent.parent
+sys.path.insert(0, str(project_root))
+
+pytest.importorskip("numpy")
+pytest.importorskip("sqlalchemy")
+pytest.importorskip("neo4j")
+pytest.importorskip("pydantic_settings")
+
+from app.services.kg_snapshot import KGSnapshot
+
+COMPANY_ROWS = [
+    ("005930", "삼성전자", 400_000_000_000_000, "TECH", "MIDSTREAM", "반도체 메모리"),
+    ("010950", "S-Oil", 8_000_000_000_000, "ENERGY", "UPSTREAM", None),
+    ("003490", "대한항공", None, "INDUSTRIAL", "DOWNSTREAM", "항공 운송"),
+]
+
+DRIVEN_BY_ROWS = [
+    ("010950", "OIL_PRICE", 0.9, "PRICE", "POSITIVE", 0.4, None),
+    ("003490", "OIL_PRICE", 0.8, "COST", "NEGATIVE", 0, None),
+    ("005930", "OIL_PRICE", 0.3, None, None, 0, None),
+    ("999999", "OIL_PRICE", 0.95, "COST", None, 0, None),  # 비상장 (stocks/섹터 없음)
+    ("005930", "EXCHANGE_RATE_USD_KRW", 0.7, None, "POSITIVE", 0, None),
+    ("005930", "INTEREST_RATE", None, None, None, 0, None),
+]
+
+MACRO_ROWS = [
+    ("OIL_PRICE", "INTEREST_RATE", 0.6, "INFLATION"),
+]
+
+
+@pytest.fixture(scope="module")
+def snapshot():
+    return KGSnapshot(COMPANY_ROWS, DRIVEN_BY_ROWS, MACRO_ROWS, version=3)
+
+
+def test_affected_companies_filters_and_orders(snapshot):
+    companies = snapshot.affected_companies("OIL_PRICE", limit=20, min_weight=0.5)
+
+    assert [c["ticker"] for c in companies] == ["010950", "003490"]
+    assert companies[0] == {
+        "ticker": "010950",
+        "name": "S-Oil",
+        "market_cap": 8_000_000_000_000,
+        "sector_l1": "ENERGY",
+        "value_chain": "UPSTREAM",
+        "weight": 0.9,
+        "mechanism": "PRICE",
+        "polarity": "POSITIVE",
+        "text_match_weight": 0.4,
+    }
+    assert companies[1]["market_cap"] is None
+
+    assert len(snapshot.affected_companies("OIL_PRICE", limit=1, min_weight=0.0)) == 1
+    assert snapshot.affected_companies("UNKNOWN", limit=5, min_weight=0.0) == []
+
+
+def test_v153_format_includes_biz_summary(snapshot):
+    companies = snapshot.affected_companies("OIL_PRICE", limit=5, min_weight=0.0, with_biz_summary=True)
+
+    assert [c["ticker"] for c in companies] == ["010950", "003490", "005930"]
+    assert "market_cap" not in companies[0]
+    assert companies[0]["biz_summary"] == ""
+    assert companies[2]["mechanism"] == "DEMAND" and companies[2]["polarity"] == "MIXED"
+
+
+def test_company_lookups(snapshot):
+    drivers = snapshot.company_drivers("005930", limit=10)
+    assert [d["driver_code"] for d in drivers] == ["EXCHANGE_RATE_USD_KRW", "OIL_PRICE", "INTEREST_RATE"]
+    assert drivers[-1]["weight"] == 0.5  # weight 없음 → 0.5
+
+    assert snapshot.company_info("999999") is None
+    assert snapshot.company_info("003490")["name"] == "대한항공"
+    assert snapshot.biz_summary("005930") == "반도체 메모리"
+
+    assert snapshot.macro_link("OIL_PRICE", "INTEREST_RATE") == (True, "INFLATION")
+    assert snapshot.macro_link("INTEREST_RATE", "OIL_PRICE") == (False, None)
+    assert snapshot.driver_edge("003490", "OIL_PRICE") == ("COST", "NEGATIVE")
+    assert snapshot.driver_edge("003490", "INTEREST_RATE") is None
+
+    assert snapshot.driver_codes() == ["EXCHANGE_RATE_USD_KRW", "INTEREST_RATE", "OIL_PRICE"]
+    assert snapshot.info()["companies"] == 3
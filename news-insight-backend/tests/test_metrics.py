@@ -0,0 +1,84 @@
+"""
+Prometheus 메트릭 테스트
+
+목적: 캐시 네임스페이스 집계, 커넥션 풀 checkout 대기 시간 기록,
+Prometheus text format 출력, 워커 메트릭 서버가 multiprocess 값 파일을 보존하는지 검증
+"""
+import os
+import socket
+import subprocess
+import sys
+from pathlib import Path
+
+import pytest
+
+# 프로젝트 루트를 Python 경로에 추가
+project_root = Path(__file__).parent.parent
+sys.path.insert(0, str(project_root))
+
+pytest.importorskip("prometheus_client")
+
+from app.utils.metrics import (
+    CACHE_REQUESTS,
+    DB_POOL_CHECKOUT_SECONDS,
+    record_cache_request,
+    render_metrics,
+    timed_pool_class,
+)
+
+
+def _sample(metric, suffix, **labels):
+    for family in metric.collect():
+        for sample in family.samples:
+            if sample.name.endswith(suffix) and sample.labels == labels:
+                return sample.value
+    return 0.0
+
+
+def test_cache_requests_grouped_by_key_prefix():
+    before = _sample(CACHE_REQUESTS, "_total", namespace="feed", result="hit")
+    record_cache_request("feed:1a2b3c4d", "hit")
+    record_cache_request("feed:5e6f7a8b", "hit")
+    assert _sample(CACHE_REQUESTS, "_total", namespace="feed", result="hit") == before + 2
+
+
+def test_timed_pool_records_checkout_wait():
+    sqlalchemy = pytest.importorskip("sqlalchemy")
+    from sqlalchemy.pool import QueuePool
+
+    engine = sqlalchemy.create_engine("sqlite://", poolclass=timed_pool_class(QueuePool, "test"))
+    before = _sample(DB_POOL_CHECKOUT_SECONDS, "_count", engine="test")
+    with engine.connect() as conn:
+        conn.exec_driver_sql("SELECT 1")
+    engine.dispose()
+    assert _sample(DB_POOL_CHECKOUT_SECONDS, "_count", engine="test") == before + 1
+
+
+def test_render_metrics_text_format():
+    record_cache_request("scenario:abc", "miss")
+    body, content_type = render_metrics()
+    assert content_type.startswith("text/plain")
+    assert b'news_insight_cache_requests_total{namespace="scenario",result="miss"}' in body
+
+
+def test_worker_metrics_server_keeps_values_recorded_at_import(tmp_path):
+    """multiprocess 모드: 메트릭 서버 시작이 import 시 열린 값 파일을 지우지 않아야 함"""
+    with socket.socket() as sock:
+        sock.bind(("127.0.0.1", 0))
+        port = sock.getsockname()[1]
+    code = (
+        "from app.utils import metrics\n"
+        "metrics.DEDUP_SECONDS.observe(0.25)\n"
+        f"metrics.start_worker_metrics_server({port})\n"
+        "body = metrics.render_metrics()[0].decode()\n"
+        "print([line for line in body.splitlines() if line.startswith('news_insight_dedup_seconds_count')])\n"
+    )
+    proc = subprocess.run(
+        [sys.executable, "-c", code],
+        capture_output=True,
+        text=True,
+        cwd=str(project_root),
+        env={**os.environ, "PROMETHEUS_MULTIPROC_DIR": str(tmp_path)},
+    )
+    assert proc.returncode == 0, proc.stderr
+    assert "1.0" in proc.stdout
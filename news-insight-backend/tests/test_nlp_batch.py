@@ -0,0 +1,82 @@
+"""
+배치 NLP 프론트엔드 테스트
+
+목적: 문서 여러 개를 한 번의 Kiwi 배치 호출로 처리하고,
+빈 문서/짧은 문장/Kiwi 미설치 fallback을 문서 순서대로 올바르게 되돌리는지 검증
+"""
+import re
+import sys
+from pathlib import Path
+from types import SimpleNamespace
+
+import pytest
+
+# 프로젝트 루트를 Python 경로에 추가
+project_root = Path(__file__).parent.parent
+sys.path.insert(0, str(project_root))
+
+pytest.importorskip("pydantic_settings")
+
+from app.utils import nlp_batch
+
+
+class FakeKiwi:
+    """kiwipiepy.Kiwi의 배치 API 흉내 (호출 횟수 기록)"""
+
+    def __init__(self):
+        self.calls = []
+
+    def split_into_sents(self, docs):
+        self.calls.append(("split", list(docs)))
+        for doc in docs:
+            sents = []
+            for m in re.finditer(r'[^.]+\.?', doc):
+                sents.append(SimpleNamespace(text=m.group(0), start=m.start(), end=m.end()))
+            yield sents
+
+    def analyze(self, docs):
+        self.calls.append(("analyze", list(docs)))
+        for doc in docs:
+            tokens = [
+                SimpleNamespace(form=w, tag="NNG", start=doc.index(w), len=len(w))
+                for w in doc.split()
+            ]
+            yield [(tokens, -1.0)]
+
+
+@pytest.fixture
+def fake_kiwi(monkeypatch):
+    kiwi = FakeKiwi()
+    monkeypatch.setattr(nlp_batch, "_kiwi", kiwi)
+    return kiwi
+
+
+def test_split_sentences_batch_single_call(fake_kiwi):
+    texts = ["삼성전자 실적 발표. 반도체 호조.", "", "짧음. 긴 문장이 여기에 있다."]
+    result = nlp_batch.split_sentences_batch(texts, min_length=4)
+
+    assert result == [
+        ["삼성전자 실적 발표.", "반도체 호조."],
+        [],
+        ["긴 문장이 여기에 있다."],
+    ]
+    # 빈 문서는 제외하고 한 번만 호출
+    assert fake_kiwi.calls == [("split", [texts[0], texts[2]])]
+
+
+def test_process_documents_returns_sentences_and_morphemes(fake_kiwi):
+    docs = nlp_batch.process_documents(["금리 인상 우려.", None])
+
+    assert docs[0]["sentences"] == ["금리 인상 우려."]
+    assert [m["form"] for m in docs[0]["morphemes"]] == ["금리", "인상", "우려."]
+    assert docs[1] == {"sentences": [], "morphemes": []}
+
+
+def test_fallback_without_kiwi(monkeypatch):
+    monkeypatch.setattr(nlp_batch, "_kiwi", False)
+
+    assert nlp_batch.split_sentences_batch(["첫 문장. 둘째 문장"]) == [["첫 문장.", "둘째 문장."]]
+    assert nlp_batch.split_sentences_batch(["a b"], fallback=lambda t: t.split()) == [["a", "b"]]
+    assert nlp_batch.split_sentences_with_positions_batch(["문장 하나"])[0][0]["start"] == -1
+    with pytest.raises(RuntimeError):
+        nlp_batch.analyze_batch(["텍스트"])
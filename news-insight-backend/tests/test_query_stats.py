@@ -0,0 +1,74 @@
+"""
+요청/작업 단위 SQL 통계 테스트
+
+목적: 같은 형태의 statement 반복(N+1)이 리터럴/IN 목록 길이와 무관하게 한 shape로
+집계되고, 임계값 이상이면 경고가 남는지 검증 (in-memory SQLite)
+"""
+import logging
+import sys
+from pathlib import Path
+
+import pytest
+
+# 프로젝트 루트를 Python 경로에 추가
+project_root = Path(__file__).parent.parent
+sys.path.insert(0, str(project_root))
+
+sqlalchemy = pytest.importorskip("sqlalchemy")
+pytest.importorskip("pydantic_settings")
+
+from sqlalchemy import create_engine, text
+
+from app.config import settings
+from app.utils.query_stats import (
+    install_query_instrumentation,
+    normalize_statement,
+    start_query_stats,
+    finish_query_stats,
+    track_queries,
+)
+
+
+@pytest.fixture
+def engine():
+    engine = create_engine("sqlite://")
+    install_query_instrumentation(engine)
+    with engine.begin() as conn:
+        conn.execute(text("CREATE TABLE items (id INTEGER PRIMARY KEY, name TEXT)"))
+        conn.execute(text("INSERT INTO items (id, name) VALUES (1, 'a'), (2, 'b'), (3, 'c')"))
+    yield engine
+    engine.dispose()
+
+
+def test_normalize_statement_collapses_literals_and_in_lists():
+    a = normalize_statement("SELECT * FROM items WHERE id IN (1, 2, 3) AND name = 'x'")
+    b = normalize_statement("SELECT *\n  FROM items WHERE id IN (7) AND name = 'it''s'")
+    assert a == b == "SELECT * FROM items WHERE id IN (?) AND name = ?"
+
+
+def test_repeated_shape_is_reported(engine, caplog):
+    token = start_query_stats()
+    with engine.connect() as conn:
+        for item_id in range(settings.SQL_REPEAT_WARN_THRESHOLD):
+            conn.execute(text("SELECT name FROM items WHERE id = :id"), {"id": item_id})
+        conn.execute(text("SELECT COUNT(*) FROM items"))
+
+    with caplog.at_level(logging.WARNING, logger="app.utils.query_stats"):
+        summary = finish_query_stats(token, "test")
+
+    assert summary["count"] == settings.SQL_REPEAT_WARN_THRESHOLD + 1
+    assert summary["max_repeat"] == settings.SQL_REPEAT_WARN_THRESHOLD
+    assert len(summary["repeated"]) == 1
+    assert "N+1" in caplog.text
+
+
+def test_queries_outside_tracking_are_ignored(engine):
+    with engine.connect() as conn:
+        conn.execute(text("SELECT 1"))
+
+    with track_queries("empty"):
+        pass
+
+    token = start_query_stats()
+    summary = finish_query_stats(token, "empty")
+    assert summary["count"] == 0 and summary["repeated"] == []
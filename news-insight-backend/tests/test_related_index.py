@@ -0,0 +1,130 @@
+"""
+연관 기사 추천 인덱스 테스트
+
+목적: index_article_entities가 기사 행을 지우고 엔티티 역색인/공동 언급 점수를 다시 쓰며
+이웃 기사 쪽(역방향) 목록도 MAX_CO_MENTION_NEIGHBORS개로 정리하는지,
+get_related_by_entity / get_related_by_article가 한 번의 조회 결과를 응답 형식으로 변환하는지 검증
+"""
+import asyncio
+import sys
+from datetime import datetime
+from pathlib import Path
+from types import SimpleNamespace
+
+import pytest
+
+# 프로젝트 루트를 Python 경로에 추가
+project_root = Path(__file__).parent.parent
+sys.path.insert(0, str(project_root))
+
+pytest.importorskip("sqlalchemy")
+
+from app.services.related_index import (
+    MAX_CO_MENTION_NEIGHBORS,
+    get_related_by_article,
+    get_related_by_entity,
+    index_article_entities,
+)
+
+
+def _sql(statement) -> str:
+    return " ".join(str(statement).split())
+
+
+class FakeSession:
+    """실행된 (SQL, 파라미터)를 기록하는 세션"""
+
+    def __init__(self, rows=None):
+        self.executed = []
+        self.rows = rows or []
+
+    def execute(self, statement, params=None):
+        self.executed.append((_sql(statement), params))
+        return SimpleNamespace(fetchall=lambda: self.rows)
+
+
+class FakeAsyncSession(FakeSession):
+    async def execute(self, statement, params=None):
+        return FakeSession.execute(self, statement, params)
+
+
+def test_index_article_entities_rewrites_rows_and_caps_both_directions():
+    db = FakeSession()
+
+    index_article_entities(db, 7, {
+        "ORG": ["삼성전자", " 삼성전자 ", "SK하이닉스"],
+        "PERSON": ["이재용"],
+        "LOCATION": "서울",  # 리스트가 아니면 무시
+    })
+
+    (delete_entities, _), (delete_pairs, _), (insert, rows), (upsert, params), (trim, trim_params) = db.executed
+    assert delete_entities.startswith("DELETE FROM article_entities")
+    assert "OR related_article_id = :article_id" in delete_pairs
+
+    assert insert.startswith("INSERT INTO article_entities")
+    assert [(row["entity_name"], row["entity_type"]) for row in rows] == [
+        ("삼성전자", "ORG"), ("SK하이닉스", "ORG"), ("이재용", "PERSON"),
+    ]
+    assert all(row["weight"] == pytest.approx(1 / 3) for row in rows)
+
+    # 정방향: 상위 이웃만 계산해 양방향 upsert
+    assert "LIMIT :max_neighbors" in upsert and "UNION ALL" in upsert
+    assert params == {"article_id": 7, "entity_count": 3, "max_neighbors": MAX_CO_MENTION_NEIGHBORS}
+
+    # 역방향: 이번에 행이 추가된 이웃 기사만 같은 순서로 상한 정리
+    assert trim.startswith("DELETE FROM article_co_mentions")
+    assert "PARTITION BY article_id ORDER BY shared_count DESC, related_article_id DESC" in trim
+    assert "WHERE article_id IN ( SELECT related_article_id FROM article_co_mentions WHERE article_id = :article_id )" in trim
+    assert "ranked.rn > :max_neighbors" in trim
+    assert trim_params == {"article_id": 7, "max_neighbors": MAX_CO_MENTION_NEIGHBORS}
+
+
+def test_index_article_entities_without_entities_only_deletes():
+    db = FakeSession()
+
+    index_article_entities(db, 7, {"ORG": ["  "], "KEYWORD": ["반도체"]})
+
+    assert [sql.split(" WHERE")[0] for sql, _ in db.executed] == [
+        "DELETE FROM article_entities", "DELETE FROM article_co_mentions",
+    ]
+
+
+def _row(article_id, score, published_at=None, keywords=None):
+    return SimpleNamespace(
+        id=article_id, title=f"기사{article_id}", source="연합뉴스", link=f"https://news/{article_id}",
+        ai_summary=f"요약{article_id}", keywords=keywords, published_at=published_at, score=score,
+    )
+
+
+def test_get_related_by_entity_reads_inverted_index():
+    published = datetime(2026, 1, 2, 9, 30)
+    db = FakeAsyncSession([_row(3, 0.333333, published, ["반도체"]), _row(1, 0.25)])
+
+    articles = asyncio.run(get_related_by_entity(db, " 삼성전자 ", limit=5))
+
+    ((sql, params),) = db.executed
+    assert "FROM article_entities ae" in sql and "ORDER BY ae.weight DESC, a.published_at DESC" in sql
+    assert params == {"entity_name": "삼성전자", "limit": 5}
+    assert articles == [
+        {
+            "id": 3, "title": "기사3", "source": "연합뉴스", "link": "https://news/3", "summary": "요약3",
+            "keywords": ["반도체"], "published_at": published.isoformat(), "score": 0.3333,
+        },
+        {
+            "id": 1, "title": "기사1", "source": "연합뉴스", "link": "https://news/1", "summary": "요약1",
+            "keywords": [], "published_at": None, "score": 0.25,
+        },
+    ]
+
+
+def test_get_related_by_article_reads_co_mentions():
+    db = FakeAsyncSession([_row(9, 0.5)])
+
+    articles = asyncio.run(get_related_by_article(db, 7))
+
+    ((sql, params),) = db.executed
+    assert "FROM article_co_mentions cm" in sql and "WHERE cm.article_id = :article_id" in sql
+    assert "ORDER BY cm.score DESC, cm.shared_count DESC, a.published_at DESC" in sql
+    assert params == {"article_id": 7, "limit": 10}
+    assert [(a["id"], a["score"]) for a in articles] == [(9, 0.5)]
+
@@ -0,0 +1,146 @@
+"""
+시나리오 응답 캐시 테스트
+
+목적: 캐시 키가 KG 버전과 스냅샷 내용에 따라 바뀌고 로드 시각/행 순서와는 무관한지, 알려진 변수만 인기 집계되는지,
+인기 변수 사전 계산이 라우트 기본 파라미터와 같은 키로 저장되는지(스냅샷당 1회) 검증
+"""
+import sys
+from datetime import timedelta
+from pathlib import Path
+
+import pytest
+
+# 프로젝트 루트를 Python 경로에 추가
+project_root = Path(__file__).parent.parent
+sys.path.insert(0, str(project_root))
+
+pytest.importorskip("numpy")
+pytest.importorskip("sqlalchemy")
+pytest.importorskip("neo4j")
+pytest.importorskip("redis")
+pytest.importorskip("prometheus_client")
+pytest.importorskip("pydantic_settings")
+
+import app.services.kg_snapshot as kg_snapshot
+import app.utils.cache as cache
+from app.services import scenario_cache
+from app.services.kg_snapshot import KGSnapshot
+
+COMPANY_ROWS = [
+    ("010950", "S-Oil", 8_000_000_000_000, "ENERGY", "UPSTREAM", "정유 사업이 매출의 대부분"),
+    ("003490", "대한항공", None, "INDUSTRIAL", "DOWNSTREAM", "항공 운송"),
+]
+
+DRIVEN_BY_ROWS = [
+    ("010950", "OIL_PRICE", 0.9, "PRODUCT_PRICE", "POSITIVE", 0, None),
+    ("003490", "OIL_PRICE", 0.7, "INPUT_COST", "NEGATIVE", 0, None),
+]
+
+
+class FakeRedis:
+    """테스트용 최소 Redis (get/setex/set nx/zincrby/zrevrange)"""
+
+    def __init__(self):
+        self.data = {}
+        self.scores = {}
+
+    def get(self, key):
+        return self.data.get(key)
+
+    def setex(self, key, ttl, value):
+        self.data[key] = value
+
+    def set(self, key, value, nx=False, ex=None):
+        if nx and key in self.data:
+            return None
+        self.data[key] = value
+        return True
+
+    def zincrby(self, key, amount, member):
+        scores = self.scores.setdefault(key, {})
+        scores[member] = scores.get(member, 0) + amount
+
+    def zrevrange(self, key, start, end):
+        scores = self.scores.get(key, {})
+        return sorted(scores, key=lambda m: -scores[m])[start:end + 1]
+
+
+@pytest.fixture
+def fake_redis(monkeypatch):
+    client = FakeRedis()
+    monkeypatch.setattr(cache, "redis_client", client)
+    monkeypatch.setattr(kg_snapshot, "_current_snapshot", KGSnapshot(COMPANY_ROWS, DRIVEN_BY_ROWS, [], version=7))
+    return client
+
+
+def test_cache_key_includes_kg_version():
+    params = {"variable": "OIL_PRICE", "direction": "UP", "limit": 20, "min_weight": 0.5}
+    key_v1 = scenario_cache.get_scenario_cache_key("driver", params, "1")
+    key_v2 = scenario_cache.get_scenario_cache_key("driver", params, "2")
+
+    assert key_v1.startswith("scenario:") and key_v1 != key_v2
+    assert key_v1 == scenario_cache.get_scenario_cache_key("driver", dict(params), "1")
+    assert scenario_cache.get_scenario_cache_key("driver", params, None) is None
+
+
+def test_lookup_store_and_popularity(fake_redis):
+    params = {"variable": "OIL_PRICE", "direction": "UP", "top_n": 3, "limit": 50, "min_weight": 0.3}
+
+    key, cached = scenario_cache.lookup_scenario_cache("compare", "OIL_PRICE", params)
+    assert cached is None
+    assert key == scenario_cache.get_scenario_cache_key("compare", params, kg_snapshot.get_kg_snapshot().cache_version())
+
+    scenario_cache.store_scenario_cache(key, {"status": "ok"})
+    _, cached = scenario_cache.lookup_scenario_cache("compare", "OIL_PRICE", params)
+    assert cached == {"status": "ok"}
+    assert scenario_cache.get_popular_variables(5) == ["OIL_PRICE"]
+
+
+def test_forced_reload_keys_on_content_not_load_time(fake_redis, monkeypatch):
+    params = {"variable": "OIL_PRICE", "direction": "UP", "limit": 20, "min_weight": 0.5}
+    key, _ = scenario_cache.lookup_scenario_cache("driver", "OIL_PRICE", params)
+    scenario_cache.store_scenario_cache(key, {"status": "cached"})
+
+    # 주기적 강제 재로딩 / 다른 API 프로세스: 같은 데이터(행 순서 무관)면 같은 키 → 캐시 유지, 사전 계산 1회
+    same = KGSnapshot(COMPANY_ROWS[::-1], DRIVEN_BY_ROWS[::-1], [], version=7)
+    same.loaded_at = kg_snapshot.get_kg_snapshot().loaded_at + timedelta(minutes=10)
+    monkeypatch.setattr(kg_snapshot, "_current_snapshot", same)
+    assert scenario_cache.lookup_scenario_cache("driver", "OIL_PRICE", params) == (key, {"status": "cached"})
+    assert scenario_cache.prewarm_scenario_cache() > 0
+    assert scenario_cache.prewarm_scenario_cache(KGSnapshot(COMPANY_ROWS, DRIVEN_BY_ROWS, [], version=7)) == 0
+
+    # 버전 갱신이 누락된 채 edge가 바뀐 경우: 같은 버전이어도 다른 키
+    changed = KGSnapshot(COMPANY_ROWS, DRIVEN_BY_ROWS[:1], [], version=7)
+    monkeypatch.setattr(kg_snapshot, "_current_snapshot", changed)
+    new_key, cached = scenario_cache.lookup_scenario_cache("driver", "OIL_PRICE", params)
+    assert new_key != key and cached is None
+
+
+def test_unknown_variables_are_not_counted(fake_redis, monkeypatch):
+    for variable in ("OIL_PRICE", "NOT_A_DRIVER", "' OR 1=1 --"):
+        scenario_cache.record_variable_request(variable)
+    assert fake_redis.scores[scenario_cache.POPULAR_VARIABLES_KEY] == {"OIL_PRICE": 1}
+
+    # 스냅샷 로딩 전에는 전용 엔드포인트 변수만 집계
+    monkeypatch.setattr(kg_snapshot, "_current_snapshot", None)
+    scenario_cache.record_variable_request("EXCHANGE_RATE_USD_KRW")
+    scenario_cache.record_variable_request("DRAM_PRICE")
+    assert scenario_cache.get_popular_variables(5) == ["OIL_PRICE", "EXCHANGE_RATE_USD_KRW"]
+
+
+def test_prewarm_uses_route_default_keys(fake_redis):
+    fake_redis.zincrby(scenario_cache.POPULAR_VARIABLES_KEY, 3, "OIL_PRICE")
+
+    # OIL_PRICE × (UP, DOWN) × (v153, compare, driver)
+    assert scenario_cache.prewarm_scenario_cache() == 6
+    # 같은 스냅샷은 다시 계산하지 않음
+    assert scenario_cache.prewarm_scenario_cache() == 0
+
+    v153_params = {"variable": "OIL_PRICE", "direction": "DOWN", "limit": 20, "min_weight": 0.5, "include_comparison": True}
+    _, cached = scenario_cache.lookup_scenario_cache("v153", "OIL_PRICE", v153_params)
+    assert cached["scenario"]["direction"] == "DOWN"
+    assert {c["ticker"] for c in cached["affected_companies"]} == {"010950", "003490"}
+
+    driver_params = {"variable": "OIL_PRICE", "direction": "UP", "limit": 20, "min_weight": 0.5}
+    _, cached = scenario_cache.lookup_scenario_cache("driver", "OIL_PRICE", driver_params)
+    assert cached is not None and len(cached["affected_companies"]) == 2
@@ -0,0 +1,87 @@
+"""
+섹터 키워드 색인 골든 테스트
+
+목적: Aho-Corasick 키워드 색인(단일 패스)으로 바꾼 classify_sector_rule_based가
+기존 `kw.lower() in combined_text` 반복 매칭과 같은 분류 결과를 내는지 검증
+(tests/data/sector_classifier_golden.json은 저장된 DART 기업 상세 + 섹터별 합성 케이스에 대한 최적화 이전 구현의 출력)
+"""
+import json
+import sys
+from pathlib import Path
+
+import pytest
+
+# 프로젝트 루트를 Python 경로에 추가
+project_root = Path(__file__).parent.parent
+sys.path.insert(0, str(project_root))
+
+pytest.importorskip("sqlalchemy")
+pytest.importorskip("langchain_openai")
+
+from app.models.company_detail import CompanyDetail
+from app.services import sector_classifier
+from app.services.sector_classifier import (
+    SEC_MACH_REQUIRED_KEYWORDS,
+    SECTOR_KEYWORDS,
+    VALUE_CHAIN_KEYWORDS,
+    classify_sector_rule_based,
+    get_sector_keyword_index,
+)
+
+GOLDEN_PATH = project_root / "tests" / "data" / "sector_classifier_golden.json"
+GOLDEN_CASES = json.loads(GOLDEN_PATH.read_text(encoding="utf-8"))
+
+
+def naive_scan(text):
+    """기존 구현과 같은 키워드별 부분 문자열 검사"""
+    def count(keywords):
+        return sum(1 for kw in keywords if kw.lower() in text)
+
+    hits = {
+        "sectors": {code: count(info["keywords"]) for code, info in SECTOR_KEYWORDS.items()},
+        "sub_sectors": {
+            (code, sub): count(kws)
+            for code, info in SECTOR_KEYWORDS.items()
+            for sub, kws in info["sub_sectors"].items()
+        },
+        "value_chains": {vc: count(kws) for vc, kws in VALUE_CHAIN_KEYWORDS.items()},
+        "mach_required": {"SEC_MACH": count(SEC_MACH_REQUIRED_KEYWORDS)},
+    }
+    return {kind: {key: n for key, n in groups.items() if n} for kind, groups in hits.items()}
+
+
+def test_scan_matches_naive_substring_counts():
+    index = get_sector_keyword_index()
+    texts = [
+        " ".join([case["biz_summary"] or "", " ".join(case["products"]), " ".join(case["keywords"])]).lower()
+        for case in GOLDEN_CASES
+    ]
+    # 중첩/포함 관계 키워드가 전부 들어간 텍스트
+    texts.append(" ".join(kw for info in SECTOR_KEYWORDS.values() for kw in info["keywords"]).lower())
+    texts.append(("".join(kw for kws in VALUE_CHAIN_KEYWORDS.values() for kw in kws) + "".join(SEC_MACH_REQUIRED_KEYWORDS)).lower())
+    texts.append("")
+
+    for text in texts:
+        assert index.scan(text) == naive_scan(text)
+
+
+def test_classification_matches_golden_outputs():
+    mismatches = []
+    for case in GOLDEN_CASES:
+        company_detail = CompanyDetail(
+            biz_summary=case["biz_summary"],
+            products=case["products"],
+            keywords=case["keywords"],
+            revenue_by_segment=case["revenue_by_segment"],
+        )
+        major, sub, value_chain, confidence, boosting_log = classify_sector_rule_based(
+            company_detail, case["company_name"], case["ticker"]
+        )
+        meta = (boosting_log or {}).get("classification_meta", {})
+        result = [major, sub, value_chain, confidence, (boosting_log or {}).get("classification_method"),
+                  meta.get("top1_score"), meta.get("margin")]
+        if result != case["expected"]:
+            mismatches.append((case["name"], result, case["expected"]))
+
+    assert mismatches == []
+    assert sector_classifier._sector_keyword_index is not None
@@ -0,0 +1,116 @@
+"""
+서버 시작 lazy 로딩 테스트
+
+목적: API 프로세스 시작 경로(app.services / app.services.pipelines 패키지)가
+torch, transformers 등 무거운 ML 모듈을 import 하지 않는지, readiness 상태가
+컴포넌트 로드 결과를 반영하는지 검증
+"""
+import subprocess
+import sys
+from pathlib import Path
+
+import pytest
+
+# 프로젝트 루트를 Python 경로에 추가
+project_root = Path(__file__).parent.parent
+sys.path.insert(0, str(project_root))
+
+from app.utils.startup import (
+    StartupState,
+    HEAVY_MODULES,
+    STATUS_DEFERRED,
+    STATUS_FAILED,
+)
+
+
+def test_pipeline_packages_do_not_import_heavy_modules():
+    """model_loader import 시 pipelines 패키지가 ML 모듈을 끌어오지 않아야 함"""
+    code = (
+        "import sys\n"
+        "import app.services.pipelines.model_loader\n"
+        f"print(','.join(m for m in {HEAVY_MODULES!r} if m in sys.modules))\n"
+    )
+    proc = subprocess.run(
+        [sys.executable, "-c", code],
+        capture_output=True,
+        text=True,
+        cwd=str(project_root),
+    )
+    assert proc.returncode == 0, proc.stderr
+    assert proc.stdout.strip() == ""
+
+
+def test_readiness_tracks_required_components():
+    state = StartupState()
+    state.register("database")
+    state.register("models", required=False)
+
+    assert not state.is_ready()
+
+    assert state.run_component("database", lambda: True)
+    assert state.is_ready()
+
+    # 선택 컴포넌트 실패는 readiness에 영향 없음
+    assert not state.run_component("models", lambda: False)
+    assert state.readiness()["components"]["models"]["status"] == STATUS_FAILED
+    assert state.is_ready()
+
+
+def test_failed_and_deferred_components():
+    state = StartupState()
+    state.register("company_dict")
+    state.register("models")
+
+    def broken_loader():
+        raise RuntimeError("db down")
+
+    state.set_status("models", STATUS_DEFERRED)
+    assert not state.run_component("company_dict", broken_loader)
+
+    readiness = state.readiness()
+    assert readiness["ready"] is False
+    assert readiness["components"]["company_dict"]["error"] == "db down"
+
+    with state.phase("import routes"):
+        pass
+    report = state.report()
+    assert report["phases"][0]["name"] == "import routes"
+    assert "heavy_modules_loaded" in report
+
+
+def test_company_dict_readiness_fails_when_db_load_fails(monkeypatch):
+    """DB 로딩 실패 시 company_dict가 ready로 보고되지 않아야 함"""
+    pytest.importorskip("sqlalchemy")
+    pytest.importorskip("pydantic_settings")
+    from app.services.pipelines import entities
+
+    def broken_session():
+        raise RuntimeError("connection refused")
+
+    monkeypatch.setattr(entities, "SessionLocal", broken_session)
+    state = StartupState()
+    state.register("company_dict")
+
+    assert not state.run_component("company_dict", entities.load_company_dict_from_db)
+    readiness = state.readiness()
+    assert readiness["ready"] is False
+    assert readiness["components"]["company_dict"]["status"] == STATUS_FAILED
+
+
+def test_async_engine_created_on_first_use():
+    """app.db import 만으로는 asyncpg 엔진을 만들지 않아야 함 (워커/스크립트는 동기 엔진만 사용)"""
+    pytest.importorskip("sqlalchemy")
+    pytest.importorskip("neo4j")
+    code = (
+        "import sys\n"
+        "import app.db\n"
+        "print(app.db.async_engine is None, app.db.AsyncSessionLocal is None, 'asyncpg' in sys.modules)\n"
+    )
+    proc = subprocess.run(
+        [sys.executable, "-c", code],
+        capture_output=True,
+        text=True,
+        cwd=str(project_root),
+    )
+    assert proc.returncode == 0, proc.stderr
+    assert proc.stdout.split() == ["True", "True", "False"]
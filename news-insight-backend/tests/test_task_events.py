@@ -0,0 +1,150 @@
+"""
+작업 진행 이벤트 (SSE) 테스트
+
+목적: 워커가 발행한 이벤트가 마지막 이벤트 키와 채널로 전달되고,
+SSE 스트림(비동기 제너레이터)이 구독 전 이벤트를 먼저 보낸 뒤 발행된 이벤트를 이벤트 루프를
+막지 않고 전달하다가 완료 이벤트에서 종료되는지 검증
+"""
+import asyncio
+import inspect
+import json
+import sys
+from pathlib import Path
+
+import pytest
+
+# 프로젝트 루트를 Python 경로에 추가
+project_root = Path(__file__).parent.parent
+sys.path.insert(0, str(project_root))
+
+pytest.importorskip("pydantic_settings")
+pytest.importorskip("redis")
+
+from app.utils import task_events
+
+
+class FakeAsyncPubSub:
+    """redis.asyncio PubSub 흉내 (메시지를 await로 대기)"""
+
+    def __init__(self, redis):
+        self.redis = redis
+        self.queue = asyncio.Queue()
+        self.closed = False
+
+    async def subscribe(self, channel):
+        self.redis.subscribers.setdefault(channel, []).append(self)
+
+    async def get_message(self, ignore_subscribe_messages=False, timeout=0.0):
+        try:
+            return await asyncio.wait_for(self.queue.get(), timeout)
+        except asyncio.TimeoutError:
+            return None
+
+    async def reset(self):
+        self.closed = True
+        for subscribers in self.redis.subscribers.values():
+            if self in subscribers:
+                subscribers.remove(self)
+
+
+class FakeAsyncRedis:
+    """get/pubsub만 흉내내는 redis.asyncio 클라이언트 (동기 FakeRedis와 저장소 공유)"""
+
+    def __init__(self, redis):
+        self.redis = redis
+
+    async def get(self, key):
+        return self.redis.store.get(key)
+
+    def pubsub(self, ignore_subscribe_messages=True):
+        return FakeAsyncPubSub(self.redis)
+
+
+class FakeRedis:
+    """setex/get/publish/pipeline만 흉내내는 Redis (워커 측 동기 클라이언트)"""
+
+    def __init__(self):
+        self.store = {}
+        self.published = []
+        self.subscribers = {}
+
+    def setex(self, key, ttl, value):
+        self.store[key] = value
+
+    def get(self, key):
+        return self.store.get(key)
+
+    def publish(self, channel, data):
+        self.published.append((channel, data))
+        for pubsub in self.subscribers.get(channel, []):
+            pubsub.queue.put_nowait({"type": "message", "data": data})
+
+    def pipeline(self):
+        return self
+
+    def execute(self):
+        return []
+
+
+@pytest.fixture
+def fake_redis(monkeypatch):
+    client = FakeRedis()
+    monkeypatch.setattr(task_events, "get_redis_client", lambda: client)
+    monkeypatch.setattr(task_events, "get_async_redis_client", lambda: FakeAsyncRedis(client))
+    return client
+
+
+def parse_sse(chunks):
+    return [json.loads(chunk.split("data: ", 1)[1]) for chunk in chunks if chunk.startswith("event:")]
+
+
+async def collect(stream):
+    return [chunk async for chunk in stream]
+
+
+def test_publish_stores_last_event_and_publishes(fake_redis):
+    task_events.publish_task_event("t1", task_events.EVENT_PROGRESS, 50, "저장 중")
+
+    assert task_events.get_last_task_event("t1")["progress"] == 50
+    assert fake_redis.published[0][0] == "task:events:t1"
+
+
+def test_stream_delivers_published_events_until_done(fake_redis):
+    task_events.publish_task_event("t2", task_events.EVENT_PROGRESS, 10, "시작")
+
+    async def worker():
+        # 스트림이 구독 후 대기하는 동안 이벤트 루프가 막히지 않아야 이 코루틴이 실행됨
+        await asyncio.sleep(0.05)
+        task_events.publish_task_event("t2", task_events.EVENT_PROGRESS, 50, "저장 중")
+        await asyncio.sleep(0.05)
+        task_events.publish_task_event("t2", task_events.EVENT_DONE, 100, "완료", {"summary": "요약"})
+
+    async def run():
+        chunks, _ = await asyncio.gather(collect(task_events.stream_task_events("t2", timeout=5)), worker())
+        return chunks
+
+    events = parse_sse(asyncio.run(run()))
+
+    assert [(e["state"], e["progress"]) for e in events] == [("progress", 10), ("progress", 50), ("done", 100)]
+    assert events[-1]["result"] == {"summary": "요약"}
+    # 종료 후 구독 해제
+    assert fake_redis.subscribers["task:events:t2"] == []
+
+
+def test_stream_ends_immediately_for_finished_task(fake_redis):
+    task_events.publish_task_event("t3", task_events.EVENT_FAILED, 0, "AI 요약 실패")
+
+    events = parse_sse(asyncio.run(collect(task_events.stream_task_events("t3", timeout=5))))
+
+    assert [e["state"] for e in events] == ["failed"]
+
+
+def test_sse_route_streams_from_async_generator(fake_redis):
+    pytest.importorskip("fastapi")
+    pytest.importorskip("celery")
+    from app.routes import article
+
+    # 동기 제너레이터는 StreamingResponse가 스레드 풀에서 돌리므로 비동기 제너레이터여야 함
+    response = asyncio.run(article.stream_task_status("t4"))
+    assert inspect.isasyncgen(response.body_iterator)
+    assert response.media_type == "text/event-stream"
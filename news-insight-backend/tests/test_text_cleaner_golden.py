@@ -0,0 +1,48 @@
+"""
+텍스트 정제 골든 테스트
+
+목적: 컴파일된 정제 파이프라인(패턴 병합 + 리터럴 사전 검사)이
+기존 순차 정규식 적용과 바이트 단위로 동일한 결과를 내는지 검증
+(tests/data/text_cleaner_golden.json은 최적화 이전 구현의 출력)
+"""
+import json
+import sys
+from pathlib import Path
+
+# 프로젝트 루트를 Python 경로에 추가
+project_root = Path(__file__).parent.parent
+sys.path.insert(0, str(project_root))
+
+from app.utils import text_cleaner
+
+GOLDEN_PATH = project_root / "tests" / "data" / "text_cleaner_golden.json"
+GOLDEN_CASES = json.loads(GOLDEN_PATH.read_text(encoding="utf-8"))
+
+TEXT_FUNCTIONS = [
+    "clean_text",
+    "normalize_article_text",
+    "clean_text_for_keywords",
+    "remove_news_source_names",
+]
+
+
+def test_text_functions_match_golden_outputs():
+    mismatches = []
+    for i, case in enumerate(GOLDEN_CASES):
+        for name in TEXT_FUNCTIONS:
+            if getattr(text_cleaner, name)(case["input"]) != case[name]:
+                mismatches.append((i, name))
+
+    assert mismatches == []
+
+
+def test_advertorial_detection_matches_golden_outputs():
+    for case in GOLDEN_CASES:
+        text = case["input"]
+        assert text_cleaner.is_probable_advertorial(text, text[:40], None) == case["is_probable_advertorial"]
+
+
+def test_filter_keywords_by_metadata():
+    keywords = ["반도체", "연합뉴스", "연합인포맥스 보도", "서울", "기자회견", "HBM", "JTBC", "jtbc", "금리"]
+
+    assert text_cleaner.filter_keywords_by_metadata(keywords) == ["반도체", "HBM", "jtbc", "금리"]
@@ -0,0 +1,86 @@
+"""
+그래프 업데이트 배치 작업 테스트
+
+목적: update_article_graph 작업(graph 큐)이 모인 기사들을 하나의 쓰기 트랜잭션으로 반영하고,
+배치 트랜잭션이 실패하면 기사별로 재시도하여 문제 기사만 제외하는지 검증
+"""
+import sys
+from pathlib import Path
+
+import pytest
+
+# 프로젝트 루트를 Python 경로에 추가
+project_root = Path(__file__).parent.parent
+sys.path.insert(0, str(project_root))
+
+pytest.importorskip("sqlalchemy")
+pytest.importorskip("celery")
+pytest.importorskip("celery_batches")
+pytest.importorskip("neo4j")
+
+from app import celery_worker
+
+
+class FakeSession:
+    """write_transaction 단위로 커밋/롤백을 흉내내는 Neo4j 세션 (poison 기사가 포함되면 실패)"""
+
+    def __init__(self, poison=None):
+        self.poison = poison
+        self.transactions = []  # (article_ids, committed)
+        self.committed = set()
+        self.closed = False
+
+    def write_transaction(self, work):
+        runs = []
+
+        class Tx:
+            def run(tx, query, **params):
+                runs.append(params)
+
+        work(Tx())
+        article_ids = runs[0]["article_ids"]
+        ok = self.poison not in article_ids
+        self.transactions.append((article_ids, ok))
+        if not ok:
+            raise RuntimeError("constraint violation")
+        self.committed.update(article_ids)
+
+    def close(self):
+        self.closed = True
+
+
+class Request:
+    def __init__(self, article_id):
+        self.id = f"graph-{article_id}"
+        self.args = (article_id, {"ORG": [f"기업{article_id}"]}, [f"키워드{article_id}"])
+
+
+@pytest.fixture
+def graph_session(monkeypatch):
+    holder = {}
+
+    class Driver:
+        def session(self):
+            return holder["session"]
+
+    monkeypatch.setattr(celery_worker.neo4j_driver, "get_driver", lambda: Driver())
+    return holder
+
+
+def test_batch_written_in_one_transaction(graph_session):
+    session = graph_session["session"] = FakeSession()
+
+    celery_worker.update_graph_task.run([Request(1), Request(2), Request(3)])
+
+    assert session.transactions == [([1, 2, 3], True)]
+    assert session.closed
+
+
+def test_partial_failure_retries_per_article(graph_session):
+    session = graph_session["session"] = FakeSession(poison=2)
+
+    celery_worker.update_graph_task.run([Request(1), Request(2), Request(3)])
+
+    assert session.transactions == [([1, 2, 3], False), ([1], True), ([2], False), ([3], True)]
+    assert session.committed == {1, 3}
+    assert session.closed